@@ -0,0 +1,174 @@
+"""
+Chrome DevTools Protocol frame subscription module for streaming_server.py refactoring
+Connects straight to Chrome's remote debugging endpoint and pushes each
+Network.webSocketFrameReceived payload as soon as it arrives, instead of
+polling driver.get_log('performance') every 100 ms.
+"""
+
+import json
+import threading
+import time
+import urllib.request
+from typing import Any, Callable, Dict, List, Optional
+
+import websocket  # websocket-client
+
+
+class CDPFrameStream:
+    """Push-based WebSocket frame source attached to a Chrome page target"""
+
+    FRAME_EVENT = "Network.webSocketFrameReceived"
+
+    def __init__(self, on_frame: Callable[[str], None], host: str = "127.0.0.1",
+                 port: int = 9222, url_hint: str = "pocketoption", opcode: int = 2,
+                 verbose: bool = True, reconnect_delay: float = 2.0):
+        self.on_frame = on_frame
+        self.host = host
+        self.port = port
+        self.url_hint = url_hint
+        self.opcode = opcode
+        self.verbose = verbose
+        self.reconnect_delay = reconnect_delay
+
+        self.ws = None
+        self.target_url: Optional[str] = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._next_id = 0
+
+        # Counters for diagnostics
+        self.frames_received = 0
+        self.frames_dispatched = 0
+        self.events_skipped = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return self.ws is not None and self.ws.connected
+
+    def list_targets(self) -> List[Dict[str, Any]]:
+        """Return the debuggable targets reported by Chrome's /json endpoint"""
+        with urllib.request.urlopen(f"http://{self.host}:{self.port}/json", timeout=2) as resp:
+            return json.loads(resp.read().decode('utf-8'))
+
+    def find_target_url(self) -> Optional[str]:
+        """Pick the page target to attach to, preferring the PocketOption tab"""
+        try:
+            targets = self.list_targets()
+        except Exception as e:
+            if self.verbose:
+                print(f"[CDP] ✗ Could not list targets on {self.host}:{self.port}: {e}")
+            return None
+
+        pages = [t for t in targets if t.get('type') == 'page' and t.get('webSocketDebuggerUrl')]
+        for target in pages:
+            if self.url_hint and self.url_hint in target.get('url', ''):
+                return target['webSocketDebuggerUrl']
+
+        return pages[0]['webSocketDebuggerUrl'] if pages else None
+
+    def connect(self) -> bool:
+        """Open the DevTools WebSocket and enable Network domain events"""
+        self.target_url = self.find_target_url()
+        if not self.target_url:
+            if self.verbose:
+                print("[CDP] ✗ No page target available")
+            return False
+
+        try:
+            # Chrome rejects DevTools connections carrying a foreign Origin header
+            self.ws = websocket.create_connection(self.target_url, timeout=5, suppress_origin=True)
+            self._send('Network.enable')
+            self.ws.settimeout(1.0)
+            if self.verbose:
+                print(f"[CDP] ✓ Subscribed to {self.FRAME_EVENT} on {self.target_url}")
+            return True
+        except Exception as e:
+            if self.verbose:
+                print(f"[CDP] ✗ Failed to connect to {self.target_url}: {e}")
+            self.ws = None
+            return False
+
+    def _send(self, method: str, params: Optional[Dict[str, Any]] = None):
+        self._next_id += 1
+        self.ws.send(json.dumps({'id': self._next_id, 'method': method, 'params': params or {}}))
+
+    def handle_message(self, raw: str) -> bool:
+        """
+        Dispatch one DevTools message if it carries a WebSocket frame.
+
+        Network.enable cannot be narrowed to a single event, so every other
+        Network.* event is dropped by a substring check before any JSON decoding.
+
+        Returns:
+            True if a frame payload was handed to on_frame
+        """
+        if self.FRAME_EVENT not in raw:
+            self.events_skipped += 1
+            return False
+
+        message = json.loads(raw)
+        if message.get('method') != self.FRAME_EVENT:
+            self.events_skipped += 1
+            return False
+
+        self.frames_received += 1
+        response = message.get('params', {}).get('response', {})
+        if response.get('opcode', 0) != self.opcode:
+            return False
+
+        payload_data = response.get('payloadData')
+        if not payload_data:
+            return False
+
+        self.on_frame(payload_data)
+        self.frames_dispatched += 1
+        return True
+
+    def start(self) -> threading.Thread:
+        """Run the receive loop in a background thread"""
+        self._running = True
+        self._thread = threading.Thread(target=self.run_forever, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """Stop the receive loop and close the DevTools connection"""
+        self._running = False
+        self._close()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=3)
+
+    def _close(self):
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+            finally:
+                self.ws = None
+
+    def run_forever(self):
+        """Receive and dispatch frames, reconnecting when the target goes away"""
+        self._running = True
+        while self._running:
+            if not self.is_connected and not self.connect():
+                time.sleep(self.reconnect_delay)
+                continue
+
+            try:
+                raw = self.ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            except Exception as e:
+                if self._running and self.verbose:
+                    print(f"[CDP] Connection lost: {e}")
+                self._close()
+                continue
+
+            if not raw:
+                continue
+
+            try:
+                self.handle_message(raw)
+            except Exception as e:
+                print(f"[CDP] Error handling frame: {e}")
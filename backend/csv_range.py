@@ -0,0 +1,388 @@
+"""
+CSV range serving module for streaming_server.py refactoring
+Backs /api/csv-data with a per-file timestamp index so a client can ask for a
+window of a large candle/tick CSV instead of downloading the whole file:
+
+    from / to   Unix seconds (or 'YYYY-MM-DD HH:MM:SS') bounds, inclusive
+    limit       Max rows; the newest rows of the range unless only 'from' is given
+    columns     Comma-separated subset, e.g. timestamp,close
+    format      csv (default) | json (column list + row arrays) | binary (float64 rows)
+    max_points  OHLC-aggregate the selected rows into at most this many buckets
+
+Responses are gzip (or brotli, if installed) compressed when the client accepts it.
+The index holds one timestamp and byte offset per row; a file that grew is
+extended from its previous end, so collectors appending rows stay cheap to serve.
+"""
+
+import gzip
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.data_catalog import parse_timestamp
+from backend.downsample import aggregate_ohlc, parse_max_points
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+FORMATS = ('csv', 'json', 'binary')
+MIN_COMPRESS_BYTES = 1024
+DEFAULT_INDEX_CACHE = 32
+DEFAULT_RESPONSE_CACHE = 16
+
+_EPOCH = pd.Timestamp(0, tz='UTC')
+
+
+class CsvRangeError(ValueError):
+    """Invalid query parameters (reported to the client as HTTP 400)"""
+
+
+def _parse_timestamps(fields: Sequence[bytes]) -> np.ndarray:
+    """Unix seconds for first-column values (epoch s/ms or ISO strings); unparseable rows get -1"""
+    if not fields:
+        return np.empty(0, dtype=np.int64)
+    try:
+        values = np.array(fields, dtype=np.float64)
+        return np.where(values > 1e11, values / 1000, values).astype(np.int64)
+    except ValueError:
+        pass
+    text = pd.Index([f.decode('utf-8', errors='replace').strip().strip('"') for f in fields])
+    parsed = pd.to_datetime(text, format='ISO8601', utc=True, errors='coerce')
+    seconds = np.asarray((parsed - _EPOCH) // pd.Timedelta(seconds=1), dtype=np.float64)
+    return np.where(np.isnan(seconds), -1, seconds).astype(np.int64)
+
+
+class CsvTimestampIndex:
+    """Row start/end byte offsets and timestamps of one CSV (first column = timestamp)"""
+
+    def __init__(self, path: str):
+        self.path = str(path)
+        self.size = 0
+        self.mtime = 0.0
+        self.header: List[str] = []
+        self.data_start = 0
+        # Offset up to which rows are final; a trailing row without newline is re-read on extend
+        self.indexed_to = 0
+        self.timestamps = np.empty(0, dtype=np.int64)
+        self.starts = np.empty(0, dtype=np.int64)
+        self.ends = np.empty(0, dtype=np.int64)
+        self.sorted = True
+        self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def rebuild(self) -> None:
+        with open(self.path, 'rb') as f:
+            header = f.readline()
+        self.header = [h.strip() for h in header.decode('utf-8', errors='replace').strip().split(',')]
+        self.data_start = self.indexed_to = len(header)
+        self.timestamps = np.empty(0, dtype=np.int64)
+        self.starts = np.empty(0, dtype=np.int64)
+        self.ends = np.empty(0, dtype=np.int64)
+        self._index_from(self.data_start)
+
+    def refresh(self) -> bool:
+        """Pick up appended rows (or rebuild if the file was rewritten); True if anything changed"""
+        stat = os.stat(self.path)
+        if stat.st_size == self.size and stat.st_mtime == self.mtime:
+            return False
+        if stat.st_size >= self.size:
+            keep = int(np.searchsorted(self.starts, self.indexed_to))
+            self.timestamps, self.starts, self.ends = (
+                self.timestamps[:keep], self.starts[:keep], self.ends[:keep])
+            self._index_from(self.indexed_to)
+        else:
+            self.rebuild()
+        return True
+
+    def _index_from(self, offset: int) -> None:
+        stat = os.stat(self.path)
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(stat.st_size - offset)
+        self.size, self.mtime = offset + len(data), stat.st_mtime
+
+        raw = np.frombuffer(data, dtype=np.uint8)
+        newlines = np.flatnonzero(raw == 10)
+        starts = np.concatenate(([0], newlines + 1))
+        ends = np.concatenate((newlines, [len(data)]))
+        # Drop the empty remainder after a final newline and blank lines
+        keep = ends > starts
+        if keep.any():
+            keep[keep] = [bool(data[s:e].strip()) for s, e in zip(starts[keep], ends[keep])]
+        starts, ends = starts[keep], ends[keep]
+        self.indexed_to = offset + (int(newlines[-1]) + 1 if len(newlines) else 0)
+
+        fields = [data[s:e].split(b',', 1)[0] for s, e in zip(starts, ends)]
+        timestamps = _parse_timestamps(fields)
+        self.timestamps = np.concatenate((self.timestamps, timestamps))
+        self.starts = np.concatenate((self.starts, starts + offset))
+        self.ends = np.concatenate((self.ends, ends + offset))
+        self.sorted = bool(np.all(np.diff(self.timestamps) >= 0))
+
+    def resolve(self, start: Optional[int] = None, end: Optional[int] = None,
+                limit: Optional[int] = None) -> np.ndarray:
+        """Row numbers with start <= ts <= end; limit keeps the newest, or the oldest if only start is set"""
+        if self.sorted:
+            lo = int(np.searchsorted(self.timestamps, start, 'left')) if start is not None else 0
+            hi = int(np.searchsorted(self.timestamps, end, 'right')) if end is not None else len(self)
+            rows = np.arange(lo, max(lo, hi))
+        else:
+            mask = np.ones(len(self), dtype=bool)
+            if start is not None:
+                mask &= self.timestamps >= start
+            if end is not None:
+                mask &= self.timestamps <= end
+            rows = np.flatnonzero(mask)
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit] if start is not None and end is None else rows[len(rows) - limit:]
+        return rows
+
+    def read_lines(self, rows: np.ndarray) -> List[bytes]:
+        if not len(rows):
+            return []
+        with open(self.path, 'rb') as f:
+            if self.sorted:
+                base = int(self.starts[rows[0]])
+                f.seek(base)
+                block = f.read(int(self.ends[rows[-1]]) - base)
+                return [block[s - base:e - base] for s, e in zip(self.starts[rows].tolist(), self.ends[rows].tolist())]
+            lines = []
+            for s, e in zip(self.starts[rows].tolist(), self.ends[rows].tolist()):
+                f.seek(s)
+                lines.append(f.read(e - s))
+            return lines
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """'br' (when brotli is installed) or 'gzip' from an Accept-Encoding header, else None"""
+    accepted = {}
+    for item in (accept_encoding or '').split(','):
+        name, _, params = item.strip().partition(';')
+        q = 1.0
+        if params.strip().startswith('q='):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+    if BROTLI_AVAILABLE and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', 0) > 0 or accepted.get('*', 0) > 0:
+        return 'gzip'
+    return None
+
+
+def _compress(body: bytes, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    if encoding is None or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    if encoding == 'br':
+        return brotli.compress(body, quality=5), 'br'
+    return gzip.compress(body, compresslevel=6), 'gzip'
+
+
+def _parse_bound(value: Optional[str], name: str) -> Optional[int]:
+    if value in (None, ''):
+        return None
+    try:
+        return parse_timestamp(value)
+    except ValueError:
+        raise CsvRangeError(f"'{name}' must be unix seconds or 'YYYY-MM-DD HH:MM:SS'")
+
+
+class CsvRangeService:
+    """Cached per-file indexes plus rendering of range queries"""
+
+    def __init__(self, index_cache: int = DEFAULT_INDEX_CACHE, response_cache: int = DEFAULT_RESPONSE_CACHE):
+        self._lock = threading.Lock()
+        self._indexes: 'OrderedDict[str, CsvTimestampIndex]' = OrderedDict()
+        self._responses: 'OrderedDict[Tuple, Tuple[bytes, Dict[str, str]]]' = OrderedDict()
+        self.index_cache = max(1, index_cache)
+        self.response_cache = max(0, response_cache)
+
+        # Counters
+        self.index_builds = 0
+        self.bytes_raw = 0
+        self.bytes_sent = 0
+
+    def index(self, path) -> CsvTimestampIndex:
+        """Up-to-date index for a file (built on first use, extended when the file grows)"""
+        path = str(path)
+        with self._lock:
+            idx = self._indexes.get(path)
+            if idx is None:
+                idx = CsvTimestampIndex(path)
+                self.index_builds += 1
+                self._indexes[path] = idx
+                while len(self._indexes) > self.index_cache:
+                    self._indexes.popitem(last=False)
+            else:
+                idx.refresh()
+                self._indexes.move_to_end(path)
+            return idx
+
+    def render(self, path, params: Mapping[str, str], accept_encoding: str = '') -> Tuple[bytes, Dict[str, str]]:
+        """
+        Body and response headers for a range query.
+
+        Raises:
+            CsvRangeError: invalid from/to/limit/columns/format
+        """
+        fmt = (params.get('format') or 'csv').lower()
+        if fmt not in FORMATS:
+            raise CsvRangeError(f"'format' must be one of {', '.join(FORMATS)}")
+        start = _parse_bound(params.get('from'), 'from')
+        end = _parse_bound(params.get('to'), 'to')
+        limit = None
+        if params.get('limit') not in (None, ''):
+            try:
+                limit = int(params['limit'])
+            except ValueError:
+                raise CsvRangeError("'limit' must be a positive integer")
+            if limit <= 0:
+                raise CsvRangeError("'limit' must be a positive integer")
+        try:
+            max_points = parse_max_points(params.get('max_points'))
+        except ValueError as e:
+            raise CsvRangeError(str(e))
+
+        idx = self.index(path)
+        columns = idx.header
+        if params.get('columns'):
+            columns = [c.strip() for c in params['columns'].split(',') if c.strip()]
+            unknown = [c for c in columns if c not in idx.header]
+            if unknown:
+                raise CsvRangeError(f"Unknown column(s) {', '.join(unknown)}; available: {', '.join(idx.header)}")
+        encoding = negotiate_encoding(accept_encoding)
+
+        key = (idx.path, idx.size, idx.mtime, fmt, start, end, limit, max_points, tuple(columns), encoding)
+        with self._lock:
+            cached = self._responses.get(key)
+            if cached is not None:
+                self._responses.move_to_end(key)
+                return cached
+
+        rows = idx.resolve(start, end, limit)
+        lines = idx.read_lines(rows)
+        timestamps = idx.timestamps[rows]
+        if max_points and len(lines) > max_points:
+            lines, timestamps = self._downsample(lines, idx.header, timestamps, max_points)
+        positions = [idx.header.index(c) for c in columns]
+        if fmt == 'csv':
+            body = self._render_csv(lines, columns, positions, columns == idx.header)
+            content_type = 'text/csv'
+        elif fmt == 'json':
+            body = self._render_json(lines, columns, positions, timestamps)
+            content_type = 'application/json'
+        else:
+            body = self._render_binary(lines, positions, timestamps)
+            content_type = 'application/octet-stream'
+
+        raw_size = len(body)
+        body, applied = _compress(body, encoding)
+        headers = {
+            'Content-Type': content_type,
+            'X-Columns': ','.join(columns),
+            'X-Rows': str(len(lines)),
+            'X-Total-Rows': str(len(idx)),
+            'Vary': 'Accept-Encoding',
+        }
+        if len(rows):
+            headers['X-First-Timestamp'] = str(int(idx.timestamps[rows[0]]))
+            headers['X-Last-Timestamp'] = str(int(idx.timestamps[rows[-1]]))
+        if len(lines) < len(rows):
+            headers['X-Source-Rows'] = str(len(rows))
+        if applied:
+            headers['Content-Encoding'] = applied
+
+        with self._lock:
+            self.bytes_raw += raw_size
+            self.bytes_sent += len(body)
+            if self.response_cache:
+                self._responses[key] = (body, headers)
+                while len(self._responses) > self.response_cache:
+                    self._responses.popitem(last=False)
+        return body, headers
+
+    @classmethod
+    def _downsample(cls, lines: List[bytes], header: List[str], timestamps: np.ndarray,
+                    max_points: int) -> Tuple[List[bytes], np.ndarray]:
+        """Bucket-aggregated rows (first timestamp, max high, min low, last close...) as CSV lines"""
+        rows = cls._numeric_rows(lines, list(range(len(header))), timestamps)
+        columns = {name: np.array([row[i] for row in rows], dtype=object if i else np.int64)
+                   for i, name in enumerate(header)}
+        for name, values in columns.items():
+            if values.dtype == object and all(isinstance(v, float) for v in values):
+                columns[name] = values.astype(np.float64)
+        starts, merged = aggregate_ohlc(columns, max_points)
+        first_fields = [lines[i].rstrip(b'\r').split(b',', 1)[0] for i in starts.tolist()]
+        out = []
+        for i, ts_field in enumerate(first_fields):
+            fields = [ts_field]
+            for name in header[1:]:
+                value = merged[name][i]
+                fields.append(np.format_float_positional(value, trim='-').encode()
+                              if isinstance(value, (float, np.floating)) else str(value).encode())
+            out.append(b','.join(fields))
+        return out, timestamps[starts]
+
+    @staticmethod
+    def _render_csv(lines: List[bytes], columns: List[str], positions: List[int], all_columns: bool) -> bytes:
+        header = ','.join(columns).encode() + b'\n'
+        if all_columns:
+            return header + b'\n'.join(line.rstrip(b'\r') for line in lines) + (b'\n' if lines else b'')
+        out = [header]
+        for line in lines:
+            fields = line.rstrip(b'\r').split(b',')
+            out.append(b','.join(fields[p] if p < len(fields) else b'' for p in positions) + b'\n')
+        return b''.join(out)
+
+    @staticmethod
+    def _numeric_rows(lines: List[bytes], positions: List[int], timestamps: np.ndarray) -> List[List]:
+        """Rows as numbers; the timestamp column becomes unix seconds, other text stays as-is"""
+        rows = []
+        for line, ts in zip(lines, timestamps.tolist()):
+            fields = line.rstrip(b'\r').split(b',')
+            row = []
+            for p in positions:
+                if p == 0:
+                    row.append(ts)
+                    continue
+                value = fields[p].decode('utf-8', errors='replace') if p < len(fields) else ''
+                try:
+                    row.append(float(value))
+                except ValueError:
+                    row.append(value)
+            rows.append(row)
+        return rows
+
+    def _render_json(self, lines, columns, positions, timestamps) -> bytes:
+        rows = self._numeric_rows(lines, positions, timestamps)
+        return json.dumps({'columns': columns, 'rows': rows}, separators=(',', ':')).encode()
+
+    def _render_binary(self, lines, positions, timestamps) -> bytes:
+        """Row-major little-endian float64 matrix (X-Columns names the columns; text cells become NaN)"""
+        rows = self._numeric_rows(lines, positions, timestamps)
+        matrix = np.array([[v if isinstance(v, (int, float)) else np.nan for v in row] for row in rows],
+                          dtype='<f8').reshape(len(rows), len(positions))
+        return matrix.tobytes()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'indexed_files': len(self._indexes),
+                'index_builds': self.index_builds,
+                'cached_responses': len(self._responses),
+                'bytes_raw': self.bytes_raw,
+                'bytes_sent': self.bytes_sent,
+            }
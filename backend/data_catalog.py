@@ -0,0 +1,505 @@
+"""
+Data catalog module for streaming_server.py refactoring
+One shared index of the candle/tick CSVs used by /api/available-csv-files,
+the start_stream seed loader and DataLoader. Each file is scanned once for
+asset, timeframe, row count, first/last timestamp and size:
+
+    - a directory is only re-listed when its mtime changes
+    - files matched by a query are re-stat'ed, and a file that grew is updated
+      by reading only the appended bytes
+    - queries go through (asset, timeframe) indexes, so cost is O(matches)
+    - an optional JSON manifest lets a warm restart skip re-reading files
+      whose mtime and size are unchanged
+
+Directories may be glob patterns in their last component (data_collect/*_candles);
+a pattern is re-expanded whenever its parent directory's mtime changes, so a new
+30M_candles directory is picked up without a restart.
+"""
+
+import fnmatch
+import glob
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+MANIFEST_VERSION = 1
+READ_BLOCK_SIZE = 1024 * 1024
+
+TIMEFRAME_SECONDS = {
+    'tick': 0, '1m': 60, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '4h': 14400, '1d': 86400,
+}
+# Filename tokens that name a timeframe (and end the asset part)
+_FILE_TIMEFRAMES = {
+    '1m': '1m', '5m': '5m', '15m': '15m', '30m': '30m', '60m': '1h', '240m': '4h',
+    '1h': '1h', '4h': '4h', '1d': '1d', 'ticks': 'tick', 'tick': 'tick',
+}
+# Directory names: 1M_candles, 4H_candles_utc, 1M_candle_data, 1M_tick_data, 0M_candles, data_5m
+_DIR_TIMEFRAME = re.compile(r'^(\d+)([MHD])_|^data_(\d+[mhd])$', re.IGNORECASE)
+_TIMESTAMP_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M')
+
+
+def normalize_asset(asset: str) -> str:
+    """EURUSD_otc / EURUSD-OTC / eurusd otc -> EURUSDOTC"""
+    return re.sub(r'[^A-Za-z0-9]', '', str(asset or '')).upper()
+
+
+def timeframe_label(timeframe: Union[str, int, None]) -> Optional[str]:
+    """'5m' / '5M' / 300 -> '5m'; None stays None"""
+    if timeframe is None:
+        return None
+    if isinstance(timeframe, (int, float)):
+        seconds = int(timeframe)
+        for label, value in TIMEFRAME_SECONDS.items():
+            if value == seconds:
+                return label
+        return f"{seconds // 3600}h" if seconds % 3600 == 0 else f"{seconds // 60}m"
+    text = str(timeframe).strip().lower()
+    return _FILE_TIMEFRAMES.get(text, text)
+
+
+def timeframe_from_dir(name: str) -> Optional[str]:
+    """Timeframe label of a data directory (1M_candles -> '1m', 1M_tick_data / 0M_candles -> 'tick')"""
+    if 'tick' in name.lower():
+        return 'tick'
+    match = _DIR_TIMEFRAME.match(name)
+    if not match:
+        return None
+    if match.group(3):
+        return timeframe_label(match.group(3))
+    value, unit = int(match.group(1)), match.group(2).lower()
+    if value == 0:
+        return 'tick'
+    return timeframe_label(f"{value}{unit}")
+
+
+def parse_filename(filename: str) -> Tuple[str, Optional[str]]:
+    """
+    Asset and timeframe encoded in a CSV name.
+
+    AUDCAD_otc_1m_2025_10_25_09_50_19.csv -> ('AUDCAD_otc', '1m')
+    EURUSD_otc_ticks_2025_10_25_part001.csv -> ('EURUSD_otc', 'tick')
+    """
+    parts = Path(filename).stem.split('_')
+    for i, part in enumerate(parts):
+        label = _FILE_TIMEFRAMES.get(part.lower())
+        if label:
+            return '_'.join(parts[:i]) or parts[0], label
+        if part.isdigit():
+            return '_'.join(parts[:i]) or parts[0], None
+    return parts[0], None
+
+
+def parse_timestamp(value: str) -> int:
+    """Unix seconds from an epoch number (s or ms) or a UTC 'YYYY-MM-DD HH:MM:SS[Z]' string"""
+    value = value.strip().strip('"')
+    try:
+        ts = float(value)
+        return int(ts / 1000) if ts > 1e11 else int(ts)
+    except ValueError:
+        pass
+    text = value.rstrip('Z').replace('+00:00', '')
+    for fmt in _TIMESTAMP_FORMATS:
+        try:
+            return int(datetime.strptime(text, fmt).replace(tzinfo=timezone.utc).timestamp())
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised timestamp '{value}'")
+
+
+def _line_timestamp(line: bytes) -> Optional[int]:
+    try:
+        return parse_timestamp(line.decode('utf-8', errors='replace').split(',', 1)[0])
+    except ValueError:
+        return None
+
+
+@dataclass
+class CatalogEntry:
+    path: str
+    filename: str
+    asset: str
+    timeframe: str
+    size: int
+    mtime: float
+    rows: int = 0
+    first_timestamp: Optional[int] = None
+    last_timestamp: Optional[int] = None
+    # Newlines after the header, kept so appended bytes can be counted on their own
+    newlines: int = 0
+
+    @property
+    def asset_key(self) -> str:
+        return normalize_asset(self.asset)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        del data['newlines']
+        return data
+
+
+class DataCatalog:
+    """Incrementally refreshed index of CSV files under a set of directories"""
+
+    def __init__(self, directories: Iterable, recursive: bool = False, manifest_path=None):
+        """
+        Args:
+            directories: Roots to index, or glob patterns of roots (missing ones are skipped until they appear)
+            recursive: Also index subdirectories
+            manifest_path: Optional JSON file to load on start and keep up to date
+        """
+        self.directories = [Path(d) for d in directories]
+        self.recursive = recursive
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self._lock = threading.RLock()
+        self._dir_mtimes: Dict[str, float] = {}
+        self._dir_files: Dict[str, Set[str]] = {}
+        self._dir_children: Dict[str, List[str]] = {}
+        # Glob pattern -> (parent mtime, matching directories)
+        self._patterns: Dict[str, Tuple[float, List[str]]] = {}
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._by_key: Dict[Tuple[str, str], Set[str]] = {}
+        self._by_asset: Dict[str, Set[str]] = {}
+        self._by_timeframe: Dict[str, Set[str]] = {}
+        # Entries from the manifest, reused while their (mtime, size) match
+        self._known: Dict[str, CatalogEntry] = {}
+        self._dirty = False
+
+        # Counters
+        self.dir_scans = 0
+        self.files_read = 0
+        self.files_appended = 0
+
+        if self.manifest_path:
+            self._load_manifest()
+
+    # ---- Queries ----
+    def query(self, asset: Optional[str] = None, timeframe: Union[str, int, None] = None,
+              revalidate: bool = True, within: Optional[Iterable] = None) -> List[CatalogEntry]:
+        """
+        Files for an asset and/or timeframe, newest first.
+
+        Args:
+            asset: Any spelling (EURUSD_otc, EURUSDOTC); None = all assets
+            timeframe: Label ('5m') or seconds (300); None = all timeframes
+            revalidate: Re-stat matches so appended or deleted files are reflected
+            within: Only files directly in these directories (glob patterns allowed); None = all
+        """
+        self.refresh()
+        label = timeframe_label(timeframe)
+        with self._lock:
+            if asset is not None and label is not None:
+                paths = set(self._by_key.get((normalize_asset(asset), label), ()))
+            elif asset is not None:
+                paths = set(self._by_asset.get(normalize_asset(asset), ()))
+            elif label is not None:
+                paths = set(self._by_timeframe.get(label, ()))
+            else:
+                paths = set(self._entries)
+            if within is not None:
+                patterns = [str(d) for d in within]
+                paths = {p for p in paths
+                         if any(fnmatch.fnmatchcase(os.path.dirname(p), pattern) for pattern in patterns)}
+            entries = []
+            for path in paths:
+                entry = self._revalidate(path) if revalidate else self._entries.get(path)
+                if entry is not None:
+                    entries.append(entry)
+            self._save_if_dirty()
+        return sorted(entries, key=lambda e: (e.mtime, e.filename), reverse=True)
+
+    def get(self, path) -> Optional[CatalogEntry]:
+        """Entry for one indexed file (re-stat'ed)"""
+        self.refresh()
+        with self._lock:
+            if str(path) not in self._entries:
+                return None
+            entry = self._revalidate(str(path))
+            self._save_if_dirty()
+            return entry
+
+    def assets(self, timeframe: Union[str, int, None] = None) -> List[str]:
+        """Asset names (as spelled in the filenames) with at least one file"""
+        self.refresh()
+        label = timeframe_label(timeframe)
+        with self._lock:
+            paths = self._by_timeframe.get(label, ()) if label else self._entries
+            return sorted({self._entries[p].asset for p in paths})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ---- Refresh ----
+    def refresh(self) -> None:
+        """Re-list directories whose mtime changed; one stat per directory otherwise"""
+        with self._lock:
+            seen: Set[str] = set()
+            for root in self._roots():
+                self._refresh_dir(root, seen)
+            for gone in set(self._dir_files) - seen:
+                self._forget_dir(gone)
+            self._save_if_dirty()
+
+    def _roots(self) -> List[str]:
+        """Configured directories with glob patterns expanded (re-globbed only when the parent changed)"""
+        roots = []
+        for directory in map(str, self.directories):
+            if not glob.has_magic(directory):
+                roots.append(directory)
+                continue
+            try:
+                mtime = os.stat(os.path.dirname(directory)).st_mtime
+            except OSError:
+                continue
+            cached = self._patterns.get(directory)
+            if cached is None or cached[0] != mtime:
+                cached = self._patterns[directory] = (mtime, sorted(d for d in glob.glob(directory) if os.path.isdir(d)))
+            roots.extend(cached[1])
+        return roots
+
+    def _refresh_dir(self, directory: str, seen: Set[str]) -> None:
+        try:
+            mtime = os.stat(directory).st_mtime
+        except OSError:
+            return
+        seen.add(directory)
+        if self._dir_mtimes.get(directory) != mtime:
+            self._scan_dir(directory, mtime)
+        if self.recursive:
+            for child in self._dir_children.get(directory, ()):
+                self._refresh_dir(child, seen)
+
+    def _scan_dir(self, directory: str, mtime: float) -> None:
+        self.dir_scans += 1
+        files, children = set(), []
+        try:
+            with os.scandir(directory) as entries:
+                for item in entries:
+                    if item.is_dir():
+                        children.append(item.path)
+                    elif item.name.endswith('.csv') and item.is_file():
+                        files.add(item.path)
+        except OSError:
+            return
+        for path in self._dir_files.get(directory, set()) - files:
+            self._remove(path)
+        for path in files:
+            if path not in self._entries:
+                self._revalidate(path, directory)
+        self._dir_files[directory] = files
+        self._dir_children[directory] = sorted(children)
+        self._dir_mtimes[directory] = mtime
+        self._dirty = True
+
+    def _forget_dir(self, directory: str) -> None:
+        for path in self._dir_files.pop(directory, ()):
+            self._remove(path)
+        self._dir_mtimes.pop(directory, None)
+        self._dir_children.pop(directory, None)
+        self._dirty = True
+
+    def _revalidate(self, path: str, directory: Optional[str] = None) -> Optional[CatalogEntry]:
+        """Bring one file's entry up to date with the disk (None if it is gone or not data)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._remove(path)
+            return None
+        entry = self._entries.get(path) or self._known.pop(path, None)
+        if entry is not None and entry.mtime == stat.st_mtime and entry.size == stat.st_size:
+            if path not in self._entries:
+                self._add(entry)
+            return entry
+
+        if entry is None:
+            asset, timeframe = parse_filename(os.path.basename(path))
+            timeframe = timeframe or timeframe_from_dir(os.path.basename(directory or os.path.dirname(path)))
+            if not timeframe:
+                return None
+            entry = CatalogEntry(path=path, filename=os.path.basename(path), asset=asset,
+                                 timeframe=timeframe, size=0, mtime=0.0)
+        else:
+            self._remove(path)
+
+        try:
+            if 0 < entry.size < stat.st_size:
+                self._read_appended(entry, stat.st_size)
+                self.files_appended += 1
+            else:
+                self._read_full(entry)
+                self.files_read += 1
+        except OSError:
+            return None
+        entry.size, entry.mtime = stat.st_size, stat.st_mtime
+        self._add(entry)
+        self._dirty = True
+        return entry
+
+    @staticmethod
+    def _read_full(entry: CatalogEntry) -> None:
+        with open(entry.path, 'rb') as f:
+            f.readline()  # header
+            first_line = f.readline()
+            newlines = first_line.count(b'\n')
+            while True:
+                block = f.read(READ_BLOCK_SIZE)
+                if not block:
+                    break
+                newlines += block.count(b'\n')
+        entry.newlines = newlines
+        entry.first_timestamp = _line_timestamp(first_line) if first_line.strip() else None
+        DataCatalog._read_last(entry)
+
+    @staticmethod
+    def _read_appended(entry: CatalogEntry, size: int) -> None:
+        with open(entry.path, 'rb') as f:
+            f.seek(entry.size)
+            remaining = size - entry.size
+            while remaining > 0:
+                block = f.read(min(READ_BLOCK_SIZE, remaining))
+                if not block:
+                    break
+                entry.newlines += block.count(b'\n')
+                remaining -= len(block)
+        DataCatalog._read_last(entry)
+
+    @staticmethod
+    def _read_last(entry: CatalogEntry) -> None:
+        """Last row's timestamp, and rows = newlines (+1 for an unterminated last row)"""
+        with open(entry.path, 'rb') as f:
+            header = f.readline()
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            start = max(len(header), end - 4096)
+            f.seek(start)
+            tail = f.read(end - start)
+        lines = [line for line in tail.splitlines() if line.strip()]
+        partial = bool(tail) and not tail.endswith(b'\n')
+        entry.rows = entry.newlines + (1 if partial else 0)
+        entry.last_timestamp = _line_timestamp(lines[-1]) if lines else None
+        if entry.rows == 0:
+            entry.first_timestamp = entry.last_timestamp = None
+
+    # ---- Index bookkeeping ----
+    def _add(self, entry: CatalogEntry) -> None:
+        self._entries[entry.path] = entry
+        self._by_key.setdefault((entry.asset_key, entry.timeframe), set()).add(entry.path)
+        self._by_asset.setdefault(entry.asset_key, set()).add(entry.path)
+        self._by_timeframe.setdefault(entry.timeframe, set()).add(entry.path)
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        for index, key in ((self._by_key, (entry.asset_key, entry.timeframe)),
+                           (self._by_asset, entry.asset_key),
+                           (self._by_timeframe, entry.timeframe)):
+            paths = index.get(key)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del index[key]
+        self._dirty = True
+
+    # ---- Manifest ----
+    def _load_manifest(self) -> None:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if manifest.get('version') != MANIFEST_VERSION:
+            return
+        for data in manifest.get('entries', []):
+            try:
+                entry = CatalogEntry(**data)
+            except TypeError:
+                continue
+            self._known[entry.path] = entry
+        # Directories whose mtime still matches adopt their manifest listing without scandir
+        for directory, info in manifest.get('directories', {}).items():
+            try:
+                if os.stat(directory).st_mtime != info['mtime']:
+                    continue
+            except OSError:
+                continue
+            self._dir_mtimes[directory] = info['mtime']
+            self._dir_files[directory] = set(info['files'])
+            self._dir_children[directory] = list(info.get('children', []))
+            for path in info['files']:
+                entry = self._known.pop(path, None)
+                if entry is not None:
+                    self._add(entry)
+        print(f"[Catalog] Loaded manifest: {len(self._entries)} files ({self.manifest_path})")
+
+    def _save_if_dirty(self) -> None:
+        if self._dirty and self.manifest_path:
+            self.save_manifest()
+        self._dirty = False
+
+    def save_manifest(self) -> None:
+        """Write the catalog to manifest_path (atomically)"""
+        if not self.manifest_path:
+            return
+        with self._lock:
+            manifest = {
+                'version': MANIFEST_VERSION,
+                'directories': {d: {'mtime': m, 'files': sorted(self._dir_files.get(d, ())),
+                                    'children': self._dir_children.get(d, [])}
+                                for d, m in self._dir_mtimes.items()},
+                'entries': [asdict(e) for e in self._entries.values()],
+            }
+        tmp_path = self.manifest_path.with_suffix(self.manifest_path.suffix + '.tmp')
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"[Catalog] Could not write manifest {self.manifest_path}: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'files': len(self._entries),
+            'directories': len(self._dir_mtimes),
+            'dir_scans': self.dir_scans,
+            'files_read': self.files_read,
+            'files_appended': self.files_appended,
+        }
+
+
+def listing_directories(root: Path) -> Sequence[Path]:
+    """CSV directories (glob patterns) served by /api/available-csv-files"""
+    assets_dir = Path(root) / 'data' / 'data_output' / 'assets_data'
+    return [
+        assets_dir / 'realtime_stream' / '1M_candle_data',
+        assets_dir / 'realtime_stream' / '1M_tick_data',
+        assets_dir / 'data_collect' / '*_candles',
+        assets_dir / 'data_collect' / '*_candles_utc',
+    ]
+
+
+def default_catalog_directories(root: Path) -> Sequence[Path]:
+    """Listed CSV directories plus data_collect/1M_candle_data, which only feeds chart seeds"""
+    collect = Path(root) / 'data' / 'data_output' / 'assets_data' / 'data_collect'
+    return [*listing_directories(root), collect / '1M_candle_data']
+
+
+_shared_catalogs: Dict[Tuple, DataCatalog] = {}
+_shared_lock = threading.Lock()
+
+
+def get_catalog(directories: Iterable, recursive: bool = False, manifest_path=None) -> DataCatalog:
+    """Process-wide catalog for a set of directories (created on first use)"""
+    key = (tuple(str(d) for d in directories), recursive)
+    with _shared_lock:
+        catalog = _shared_catalogs.get(key)
+        if catalog is None:
+            catalog = _shared_catalogs[key] = DataCatalog(key[0], recursive=recursive,
+                                                          manifest_path=manifest_path)
+        return catalog
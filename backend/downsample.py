@@ -0,0 +1,170 @@
+"""
+Downsampling module for streaming_server.py refactoring
+Reduces historical candle / indicator payloads to what a chart viewport can
+draw (a `max_points` request parameter), so long-range views stay light while
+zoomed-in requests (max_points >= rows) get full resolution:
+
+    - aggregate_ohlc: contiguous buckets -> first open, max high, min low,
+      last close, summed volume (candles stay valid candles)
+    - lttb_indices: Largest-Triangle-Three-Buckets point selection for a
+      single series (close prices, indicator values)
+
+Both are NumPy-vectorised; payload helpers wrap them for the candle dict and
+{time, value} formats the server emits.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+METHODS = ('ohlc', 'lttb')
+
+# Column name -> bucket reduction (everything else keeps the bucket's last value)
+_FIRST = ('timestamp', 'time', 'open', 'date')
+_MAX = ('high',)
+_MIN = ('low',)
+_SUM = ('volume',)
+
+
+def parse_max_points(value: Any) -> Optional[int]:
+    """Validated max_points request value; None/''/0 means no downsampling"""
+    if value in (None, '', 0, '0'):
+        return None
+    try:
+        points = int(value)
+    except (TypeError, ValueError):
+        raise ValueError("'max_points' must be a positive integer")
+    if points < 0:
+        raise ValueError("'max_points' must be a positive integer")
+    return points or None
+
+
+def bucket_starts(n: int, max_points: int) -> np.ndarray:
+    """Start index of each of min(n, max_points) contiguous, near-equal buckets"""
+    buckets = max(1, min(n, max_points))
+    return np.unique(np.linspace(0, n, buckets, endpoint=False).astype(np.int64))
+
+
+def aggregate_ohlc(columns: Mapping[str, np.ndarray], max_points: int) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    OHLC-aware bucket aggregation of equal-length columns.
+
+    Returns:
+        (bucket start indices, aggregated columns)
+    """
+    n = len(next(iter(columns.values()))) if columns else 0
+    if n == 0:
+        return np.empty(0, dtype=np.int64), {name: np.asarray(values)[:0] for name, values in columns.items()}
+    starts = bucket_starts(n, max_points)
+    lasts = np.append(starts[1:], n) - 1
+    out = {}
+    for name, values in columns.items():
+        values = np.asarray(values)
+        key = name.lower()
+        if key in _FIRST or values.dtype.kind not in 'fiu':
+            out[name] = values[starts] if key in _FIRST else values[lasts]
+        elif key in _MAX:
+            out[name] = np.fmax.reduceat(values.astype(np.float64), starts)
+        elif key in _MIN:
+            out[name] = np.fmin.reduceat(values.astype(np.float64), starts)
+        elif key in _SUM:
+            out[name] = np.add.reduceat(np.nan_to_num(values.astype(np.float64)), starts)
+        else:
+            out[name] = values[lasts]
+    return starts, out
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Indices of the points Largest-Triangle-Three-Buckets keeps (first and last always).
+
+    Each bucket keeps the point forming the largest triangle with the previously
+    kept point and the next bucket's mean; per-bucket work is vectorised, the
+    loop runs once per output point.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if max_points >= n or n <= 2:
+        return np.arange(n)
+    if max_points <= 2:
+        return np.array([0, n - 1][:max(1, max_points)])
+
+    # max_points - 2 inner buckets over points 1 .. n-2
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    y_filled = np.where(np.isnan(y), np.nanmean(y) if np.isfinite(y).any() else 0.0, y)
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y_filled)))
+
+    # Mean of the following bucket (the last point for the final bucket)
+    next_lo = np.append(edges[1:-1], n - 1)
+    next_hi = np.append(edges[2:], n)
+    counts = np.maximum(next_hi - next_lo, 1)
+    mean_x = (cum_x[next_hi] - cum_x[next_lo]) / counts
+    mean_y = (cum_y[next_hi] - cum_y[next_lo]) / counts
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], max(edges[i + 1], edges[i] + 1)
+        bx, by = x[lo:hi], y_filled[lo:hi]
+        area = np.abs((x[a] - mean_x[i]) * (by - y_filled[a]) - (x[a] - bx) * (mean_y[i] - y_filled[a]))
+        a = lo + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_candles(candles: List[Dict], max_points: Optional[int], method: str = 'ohlc') -> List[Dict]:
+    """
+    Candle dicts (historical_candles_loaded format) reduced to at most max_points.
+
+    'ohlc' merges neighbouring candles; 'lttb' keeps the candles LTTB picks on close.
+    """
+    if not max_points or len(candles) <= max_points:
+        return candles
+    if method not in METHODS:
+        raise ValueError(f"'method' must be one of {', '.join(METHODS)}")
+    timestamps = np.array([c.get('timestamp', c.get('time', 0)) for c in candles], dtype=np.float64)
+    closes = np.array([c.get('close', np.nan) for c in candles], dtype=np.float64)
+    if method == 'lttb':
+        return [candles[i] for i in lttb_indices(timestamps, closes, max_points).tolist()]
+
+    numeric = {name: np.array([c.get(name, np.nan) for c in candles], dtype=np.float64)
+               for name in ('open', 'high', 'low', 'close', 'volume') if name in candles[0]}
+    starts, merged = aggregate_ohlc(numeric, max_points)
+    lasts = np.append(starts[1:], len(candles)) - 1
+    out = []
+    for i, (first, last) in enumerate(zip(starts.tolist(), lasts.tolist())):
+        # Bucket keeps the first candle's identity (timestamp/date) with merged prices
+        candle = dict(candles[last])
+        for key in ('timestamp', 'time', 'date'):
+            if key in candles[first]:
+                candle[key] = candles[first][key]
+        for name, values in merged.items():
+            value = values[i]
+            candle[name] = int(value) if name == 'volume' and isinstance(candles[first].get(name), int) else float(value)
+        out.append(candle)
+    return out
+
+
+def downsample_series(points: List[Dict], max_points: Optional[int]) -> List[Dict]:
+    """[{time, value}, ...] indicator series reduced with LTTB"""
+    if not max_points or len(points) <= max_points:
+        return points
+    x = np.array([p['time'] for p in points], dtype=np.float64)
+    y = np.array([p['value'] for p in points], dtype=np.float64)
+    return [points[i] for i in lttb_indices(x, y, max_points).tolist()]
+
+
+def downsample_indicator_result(result: Dict[str, Any], max_points: Optional[int]) -> Dict[str, Any]:
+    """calculate_indicators result with every series (including MACD/BB/Stoch sub-series) downsampled"""
+    if not max_points or not result.get('series'):
+        return result
+    series = {}
+    for name, data in result['series'].items():
+        if isinstance(data, dict):
+            series[name] = {key: downsample_series(points, max_points) for key, points in data.items()}
+        else:
+            series[name] = downsample_series(data, max_points)
+    return {**result, 'series': series, 'max_points': max_points}
@@ -0,0 +1,176 @@
+"""
+Emit coalescing module for streaming_server.py refactoring
+Rate-limits candle_update emission: updates for the same forming candle are
+coalesced per (asset, timeframe) into at most one emit per interval, while
+candle_closed (and every other event) is delivered immediately. Clients can
+negotiate their own interval; they are then served individually by sid.
+Updates emitted to a room (to=room) are coalesced per room.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+COALESCED_EVENT = 'candle_update'
+MIN_CLIENT_INTERVAL = 0.016  # ~60 updates/s
+MAX_CLIENT_INTERVAL = 5.0
+
+
+class _Target:
+    """Throttle state for one audience (the broadcast group or a single client)"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        # Keyed by (asset, timeframe, room)
+        self.last_sent: Dict[Tuple[str, Any, Any], float] = {}
+        self.last_ts: Dict[Tuple[str, Any, Any], Any] = {}
+        self.pending: Dict[Tuple[str, Any, Any], Dict] = {}
+
+
+class CandleEmitCoalescer:
+    """Drop-in emit callable for FrameIngestPipeline"""
+
+    def __init__(self, emit: Callable[..., None], interval: float = 0.1,
+                 clock: Callable[[], float] = time.monotonic,
+                 members: Optional[Callable[[str], Set[str]]] = None):
+        """
+        Args:
+            emit: socketio.emit-compatible callable (event, data, to=..., skip_sid=...)
+            interval: Default seconds between candle_update emits per (asset, timeframe); 0 disables coalescing
+            clock: Monotonic time source (overridable for tests)
+            members: Returns the sids in a room (SubscriptionManager.members), so clients
+                with their own rate only get updates for rooms they joined
+        """
+        self._emit = emit
+        self.clock = clock
+        self.members = members
+        self._lock = threading.Lock()
+        self._broadcast = _Target(max(0.0, interval))
+        self._clients: Dict[str, _Target] = {}
+        self._running = False
+
+        # Counters for diagnostics
+        self.updates_received = 0
+        self.updates_emitted = 0
+
+    @property
+    def interval(self) -> float:
+        return self._broadcast.interval
+
+    # ---- Client negotiation ----
+    def set_client_interval(self, sid: str, interval: Optional[float]) -> float:
+        """
+        Give one client its own max update rate (None reverts to the default).
+
+        Returns:
+            The interval applied, clamped to [MIN_CLIENT_INTERVAL, MAX_CLIENT_INTERVAL]
+        """
+        with self._lock:
+            if interval is None:
+                self._clients.pop(sid, None)
+                return self._broadcast.interval
+            interval = min(MAX_CLIENT_INTERVAL, max(MIN_CLIENT_INTERVAL, float(interval)))
+            target = self._clients.get(sid)
+            if target is None:
+                self._clients[sid] = _Target(interval)
+            else:
+                target.interval = interval
+            return interval
+
+    def remove_client(self, sid: str) -> None:
+        with self._lock:
+            self._clients.pop(sid, None)
+
+    # ---- Emission ----
+    def __call__(self, event: str, data: Dict, **kwargs) -> None:
+        """Emit now, or coalesce if this is a candle_update inside its interval"""
+        if event != COALESCED_EVENT or set(kwargs) - {'to'}:
+            self._send_immediate(event, data, **kwargs)
+            return
+
+        room = kwargs.get('to')
+        key = (data.get('asset'), data.get('timeframe'), room)
+        now = self.clock()
+        with self._lock:
+            self.updates_received += 1
+            in_room = self.members(room) if room is not None and self.members else None
+            for sid, target in self._targets():
+                if sid is not None and in_room is not None and sid not in in_room:
+                    continue
+                self._offer(target, sid, key, data, now)
+
+    def _send_immediate(self, event: str, data: Dict, **kwargs) -> None:
+        if event == 'candle_closed' and isinstance(data, dict):
+            # A close supersedes any pending update of the same candle
+            asset, timeframe = data.get('asset'), data.get('timeframe')
+            with self._lock:
+                for _, target in self._targets():
+                    for pending_key, pending in list(target.pending.items()):
+                        if (pending_key[0] == asset and pending_key[1] in (timeframe, None)
+                                and pending.get('timestamp') == data.get('timestamp')):
+                            del target.pending[pending_key]
+        self._emit(event, data, **kwargs)
+
+    def _targets(self):
+        yield None, self._broadcast
+        yield from self._clients.items()
+
+    def _offer(self, target: _Target, sid: Optional[str], key, data: Dict, now: float) -> None:
+        new_candle = target.last_ts.get(key) != data.get('timestamp')
+        if new_candle or now - target.last_sent.get(key, float('-inf')) >= target.interval:
+            target.pending.pop(key, None)
+            self._send(target, sid, key, data, now)
+        else:
+            target.pending[key] = data
+
+    def _send(self, target: _Target, sid: Optional[str], key, data: Dict, now: float) -> None:
+        target.last_sent[key] = now
+        target.last_ts[key] = data.get('timestamp')
+        self.updates_emitted += 1
+        if sid is not None:
+            self._emit(COALESCED_EVENT, data, to=sid)
+            return
+        kwargs = {}
+        if key[2] is not None:
+            kwargs['to'] = key[2]
+        if self._clients:
+            kwargs['skip_sid'] = list(self._clients)
+        self._emit(COALESCED_EVENT, data, **kwargs)
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Emit pending updates whose interval has elapsed (all of them if force).
+
+        Returns:
+            Number of updates emitted
+        """
+        now = self.clock()
+        sent = 0
+        with self._lock:
+            for sid, target in self._targets():
+                for key, data in list(target.pending.items()):
+                    if force or now - target.last_sent.get(key, float('-inf')) >= target.interval:
+                        del target.pending[key]
+                        self._send(target, sid, key, data, now)
+                        sent += 1
+        return sent
+
+    def reset(self) -> None:
+        """Drop pending updates and throttle history (client rates are kept)"""
+        with self._lock:
+            for _, target in self._targets():
+                target.pending.clear()
+                target.last_sent.clear()
+                target.last_ts.clear()
+
+    def run(self, sleep: Callable[[float], None] = time.sleep) -> None:
+        """Flush loop for a background thread; trailing updates go out within one interval"""
+        self._running = True
+        while self._running:
+            self.flush()
+            with self._lock:
+                shortest = min(target.interval for _, target in self._targets())
+            sleep(max(MIN_CLIENT_INTERVAL / 2, shortest / 2))
+
+    def stop(self) -> None:
+        self._running = False
@@ -0,0 +1,341 @@
+"""
+Frame ingest module for streaming_server.py refactoring
+Applies raw PocketOption WebSocket frames to the streaming capability, the
+optional CSV persistence and the candle_update emitter. Shared by every
+ingest source (performance-log polling and the CDP push subscription).
+"""
+
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+from backend import metrics
+from capabilities.frame_decoder import (
+    FRAME_CHART_SETTINGS,
+    FRAME_CONTROL,
+    FRAME_HISTORY,
+    FRAME_INVALID,
+    FRAME_PLACEHOLDER,
+    FRAME_TICKS,
+    DecodedFrame,
+)
+
+
+def iter_performance_log_frames(logs: Iterable[Dict[str, Any]],
+                                processed_messages: Optional[Set[str]] = None) -> Iterator[str]:
+    """
+    Yield payloadData of opcode-2 frames from a batch of Chrome performance log entries.
+
+    Args:
+        logs: Entries returned by driver.get_log('performance')
+        processed_messages: Optional set of already seen message ids (updated in place)
+    """
+    for log_entry in logs:
+        if processed_messages is not None:
+            msg_id = f"{log_entry.get('timestamp', 0)}_{hash(log_entry.get('message', ''))}"
+            if msg_id in processed_messages:
+                continue
+            processed_messages.add(msg_id)
+
+        message = json.loads(log_entry['message'])['message']
+        response = message.get('params', {}).get('response', {})
+
+        if response.get('opcode', 0) == 2:
+            payload_data = response.get('payloadData')
+            if payload_data:
+                yield payload_data
+
+
+def candle_to_emit_payload(asset: str, candle) -> Dict[str, Any]:
+    """Format a [timestamp, open, close, high, low] candle as a candle_update payload"""
+    timestamp, open_price, close_price, high_price, low_price = candle[:5]
+    return {
+        'asset': asset,
+        'timestamp': timestamp,
+        'open': open_price,
+        'high': high_price,
+        'low': low_price,
+        'close': close_price,
+        'volume': 0,
+        'date': datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+    }
+
+
+class FrameIngestPipeline:
+    """Processes opcode-2 WebSocket payloads from any ingest source"""
+
+    def __init__(self, data_streamer, ctx,
+                 emit: Callable[[str, Dict], None],
+                 extract_candle: Callable[[str], Optional[Dict]],
+                 persistence_manager=None,
+                 collect_stream_mode: str = "none",
+                 recorder=None,
+                 subscriptions=None,
+                 update_log=None,
+                 indicator_stream=None):
+        self.data_streamer = data_streamer
+        self.ctx = ctx
+        self.emit = emit
+        self.extract_candle = extract_candle
+        self.persistence_manager = persistence_manager
+        self.collect_stream_mode = collect_stream_mode
+        # Optional FrameRecorder: raw payloads are written before decoding
+        self.recorder = recorder
+        # Optional SubscriptionManager: updates go to per-(asset, timeframe) rooms instead of
+        # a broadcast for the focused asset
+        self.subscriptions = subscriptions
+        # Optional UpdateLog: room-targeted events get a per-stream sequence number
+        # so reconnecting clients can resume from the last one they saw
+        self.update_log = update_log
+        # Optional IndicatorStream: tracked rooms get an indicators_calculated delta
+        # alongside each candle_update
+        self.indicator_stream = indicator_stream
+
+        # Closed-candle marks per (asset, timeframe): (next sequence number, last timestamp)
+        self._persisted: Dict[Tuple[str, int], Tuple[int, float]] = {}
+        self._emitted: Dict[Tuple[str, int], Tuple[int, float]] = {}
+
+    def reset(self):
+        """Forget persisted/emitted candle positions (called on backend state reset)"""
+        self._persisted.clear()
+        self._emitted.clear()
+
+    def process_payload_data(self, payload_data: str) -> Optional[Dict]:
+        """
+        Decode one base64 payload and run it through the capability.
+
+        Returns:
+            The candle_update payload that was emitted, or None
+        """
+        if self.recorder is not None:
+            self.recorder.record(payload_data)
+        with metrics.FRAME_DECODE_SECONDS.time():
+            frame = self.data_streamer.frame_decoder.decode(payload_data)
+        return self.process_frame(frame)
+
+    def process_payload(self, payload: Any) -> Optional[Dict]:
+        """Run an already decoded payload through candle formation, persistence and emit"""
+        return self.process_frame(self.data_streamer.frame_decoder.classify(payload))
+
+    def process_frame(self, frame: DecodedFrame) -> Optional[Dict]:
+        """Dispatch a classified frame by kind; no re-serialisation or str() scans"""
+        metrics.FRAMES_TOTAL.inc(kind=frame.kind)
+        if frame.kind in (FRAME_INVALID, FRAME_CONTROL, FRAME_PLACEHOLDER):
+            return None
+        if metrics.REGISTRY.enabled:
+            with metrics.CANDLE_UPDATE_SECONDS.time():
+                return self._apply_frame(frame)
+        return self._apply_frame(frame)
+
+    def _apply_frame(self, frame: DecodedFrame) -> Optional[Dict]:
+        if frame.kind == FRAME_TICKS:
+            if metrics.REGISTRY.enabled:
+                self._observe_ticks(frame.ticks)
+            for tick in frame.ticks:
+                self.data_streamer._process_tick(tick.asset, int(tick.ts), tick.price, frame.data, self.ctx)
+        elif frame.kind == FRAME_CHART_SETTINGS:
+            self.data_streamer._process_chart_settings(frame.data, self.ctx)
+        elif frame.kind == FRAME_HISTORY:
+            if isinstance(frame.data, dict) and 'history' in frame.data:
+                self.data_streamer._process_historical_data(frame.data, self.ctx)
+        else:
+            self.data_streamer._process_realtime_update(frame.data, self.ctx)
+
+        current_focused_asset = self.data_streamer.get_current_asset()
+        if self.subscriptions is not None:
+            return self._emit_to_subscribers(frame, current_focused_asset)
+
+        if current_focused_asset:
+            tick_asset = self._payload_asset(frame.data, current_focused_asset)
+            if self.persistence_manager and self.collect_stream_mode in ['tick', 'both']:
+                self._persist_tick(frame.data, tick_asset)
+            if tick_asset:
+                self._flush_closed_candles(tick_asset)
+
+            # Extract processed candle and emit to frontend
+            candle_data = self.extract_candle(current_focused_asset)
+            if candle_data:
+                self.emit('candle_update', candle_data)
+                return candle_data
+
+        return None
+
+    @staticmethod
+    def _observe_ticks(ticks) -> None:
+        now = time.time()
+        for tick in ticks:
+            metrics.TICKS_TOTAL.inc(asset=tick.asset)
+            metrics.TICK_LAG_SECONDS.observe(max(0.0, now - tick.ts))
+
+    def _emit_to_subscribers(self, frame: DecodedFrame, current_focused_asset: Optional[str]) -> Optional[Dict]:
+        """Persist, flush closes and send candle_update to each subscribed room of the frame's assets"""
+        if frame.kind == FRAME_TICKS:
+            assets = list(dict.fromkeys(tick.asset for tick in frame.ticks))
+        else:
+            assets = [self._payload_asset(frame.data, current_focused_asset)]
+
+        if current_focused_asset and self.persistence_manager and self.collect_stream_mode in ['tick', 'both']:
+            if frame.kind == FRAME_TICKS:
+                self._persist_ticks(frame.ticks)
+            elif assets[0] and not self.data_streamer._is_outside_focus(assets[0]):
+                self._persist_tick(frame.data, assets[0])
+
+        candle_data = None
+        for asset in assets:
+            if not asset:
+                continue
+            self._flush_closed_candles(asset)
+
+            for timeframe, room in self.subscriptions.rooms_for(asset):
+                candles = None
+                payload = self.extract_candle(asset) if timeframe == self.data_streamer.PERIOD else None
+                if payload is None:
+                    candles = self.data_streamer.get_timeframe_candles(asset, timeframe)
+                    if not candles:
+                        continue
+                    payload = candle_to_emit_payload(asset, candles[-1])
+                payload['timeframe'] = timeframe
+                self._emit_to_room('candle_update', payload, room)
+                candle_data = payload
+                if self.indicator_stream is not None:
+                    self._emit_indicator_delta(asset, timeframe, room, candles)
+
+        return candle_data
+
+    def _emit_indicator_delta(self, asset: str, timeframe: int, room: str, candles=None) -> None:
+        """Send the room's new indicator points (closed candles plus the forming one), if it tracks any"""
+        if candles is None:
+            candles = self.data_streamer.get_timeframe_candles(asset, timeframe)
+        try:
+            delta = self.indicator_stream.update(asset, timeframe, candles)
+        except Exception as e:
+            print(f"[Indicators] Live update failed for {asset} {timeframe}s: {e}")
+            return
+        if delta:
+            self.emit('indicators_calculated', delta, to=room)
+
+    def _emit_to_room(self, event: str, payload: Dict, room: str) -> None:
+        if self.update_log is not None:
+            self.update_log.record(room, event, payload)
+        self.emit(event, payload, to=room)
+
+    @staticmethod
+    def _payload_asset(payload: Any, current_focused_asset: str) -> Optional[str]:
+        if isinstance(payload, list) and len(payload) > 0 and isinstance(payload[0], list) and len(payload[0]) >= 3:
+            # Only [[asset, ts, price], ...] tick lists name an asset; other list frames carry numbers
+            return payload[0][0] if isinstance(payload[0][0], str) else current_focused_asset
+        if isinstance(payload, dict):
+            return payload.get('asset') or payload.get('symbol') or current_focused_asset
+        return current_focused_asset
+
+    def _persist_tick(self, payload: Any, tick_asset: Optional[str]):
+        """Write the payload's tick to the tick CSV"""
+        try:
+            tick_value = None
+            tick_timestamp = None
+
+            if isinstance(payload, list) and len(payload) > 0:
+                if isinstance(payload[0], list) and len(payload[0]) >= 3:
+                    tick_timestamp = int(float(payload[0][1]))
+                    tick_value = payload[0][2]
+                else:
+                    tick_value = payload[-1] if isinstance(payload[-1], (int, float)) else None
+                    tick_timestamp = int(time.time())
+            elif isinstance(payload, dict):
+                tick_value = payload.get('quote') or payload.get('price') or payload.get('value')
+                tick_timestamp = payload.get('timestamp', int(time.time()))
+                if isinstance(tick_timestamp, str):
+                    tick_timestamp = int(float(tick_timestamp))
+            else:
+                tick_value = float(payload) if isinstance(payload, (int, float, str)) else None
+                tick_timestamp = int(time.time())
+
+            if tick_asset and tick_value is not None and tick_timestamp:
+                self._write_tick(tick_asset, tick_timestamp, tick_value)
+
+        except Exception as e:
+            print(f"[Persistence] Error saving data: {e}")
+
+    def _persist_ticks(self, ticks):
+        """Write every decoded tick of a focused asset under its own asset, timestamp and price"""
+        try:
+            for tick in ticks:
+                if not self.data_streamer._is_outside_focus(tick.asset):
+                    self._write_tick(tick.asset, int(tick.ts), tick.price)
+        except Exception as e:
+            print(f"[Persistence] Error saving data: {e}")
+
+    def _write_tick(self, asset: str, timestamp: int, value: Any):
+        timestamp_str = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        self.persistence_manager.add_tick(asset, timestamp_str, value)
+
+    @staticmethod
+    def _take_closed(marks: Dict[Tuple[str, int], Tuple[int, float]], key: Tuple[str, int], candles) -> Any:
+        """
+        Return closed candles not yet taken for key and advance its mark.
+
+        Sequence numbers stay valid once the candle store's retention cap is
+        reached; the timestamp guard skips candles re-sequenced by a history reload.
+        """
+        seq, last_ts = marks.get(key, (0, None))
+        closed, next_seq = candles.closed_since(seq)
+        if last_ts is not None and len(closed):
+            closed = closed[closed[:, 0] > last_ts]
+        marks[key] = (next_seq, closed[-1, 0] if len(closed) else last_ts)
+        return closed
+
+    def _flush_closed_candles(self, asset: str):
+        """Persist and emit newly closed candles for every timeframe being aggregated"""
+        persist = self.persistence_manager is not None and self.collect_stream_mode in ['candle', 'both']
+        rooms = dict(self.subscriptions.rooms_for(asset)) if self.subscriptions is not None else None
+
+        for timeframe in self.data_streamer.get_timeframes():
+            candles = self.data_streamer.get_timeframe_candles(asset, timeframe)
+            if not candles:
+                continue
+            key = (asset, timeframe)
+            if key not in self._emitted:
+                # First sight (e.g. right after a history load): only later closes are emitted
+                self._emitted[key] = (candles.closed_seq, candles[-2][0] if len(candles) >= 2 else None)
+            if len(candles) < 2:
+                continue
+
+            if persist:
+                try:
+                    tfm = max(1, int(timeframe // 60))
+                    for c in self._take_closed(self._persisted, key, candles).tolist():
+                        self.persistence_manager.add_candle(
+                            asset=asset,
+                            timeframe_minutes=tfm,
+                            candle_ts=int(c[0]),
+                            open_price=c[1],
+                            close_price=c[2],
+                            high_price=c[3],
+                            low_price=c[4]
+                        )
+                except Exception as e:
+                    print(f"[Persistence] Error saving data: {e}")
+
+            closed = self._take_closed(self._emitted, key, candles).tolist()
+            room = rooms.get(timeframe) if rooms is not None else None
+            if rooms is not None and room is None:
+                continue  # Nobody follows this stream
+            if closed:
+                metrics.CANDLES_CLOSED_TOTAL.inc(len(closed), timeframe=timeframe)
+            for c in closed:
+                payload = {
+                    'asset': asset,
+                    'timeframe': timeframe,
+                    'timestamp': int(c[0]),
+                    'open': c[1],
+                    'high': c[3],
+                    'low': c[4],
+                    'close': c[2],
+                    'volume': 0,
+                    'date': datetime.fromtimestamp(int(c[0]), tz=timezone.utc).isoformat()
+                }
+                if room:
+                    self._emit_to_room('candle_closed', payload, room)
+                else:
+                    self.emit('candle_closed', payload)
@@ -0,0 +1,184 @@
+"""
+Frame recording module for streaming_server.py refactoring
+Writes the raw opcode-2 payloads seen by the ingest pipeline to an append-only,
+timestamped file and plays them back through the same pipeline, so a live
+session can be reproduced offline without Chrome or network.
+
+File format (one JSON value per line, optionally gzip-compressed by a .gz suffix):
+    {"format": "quflx-frames", "version": 1, "started_at": <epoch seconds>}
+    [<seconds since started_at>, "<payloadData>"]
+    ...
+A new header line starts each recording session appended to the same file.
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Tuple, Union
+
+RECORDING_FORMAT = "quflx-frames"
+RECORDING_VERSION = 1
+
+
+def _open_text(path: Path, mode: str):
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class FrameRecorder:
+    """Append-only writer for raw WebSocket payloads"""
+
+    def __init__(self, path: Union[str, Path], flush_every: int = 100, started_at: Optional[float] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = max(1, flush_every)
+        self.frames_written = 0
+        self._lock = threading.Lock()
+        self._started_at = started_at if started_at is not None else time.time()
+        self._file = _open_text(self.path, 'a')
+        self._file.write(json.dumps({
+            "format": RECORDING_FORMAT,
+            "version": RECORDING_VERSION,
+            "started_at": self._started_at,
+        }) + "\n")
+
+    def record(self, payload_data: str, received_at: Optional[float] = None) -> None:
+        """Append one payload with its receive time (defaults to now)"""
+        offset = (received_at if received_at is not None else time.time()) - self._started_at
+        line = json.dumps([round(offset, 6), payload_data], separators=(',', ':'))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self.frames_written += 1
+            if self.frames_written % self.flush_every == 0:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FrameReplayer:
+    """Reads a recording and feeds its payloads to a callback"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.frames_replayed = 0
+
+    def frames(self) -> Iterator[Tuple[float, str]]:
+        """
+        Yield (receive time, payloadData) in recorded order.
+
+        Receive times are absolute epoch seconds, so gaps between appended
+        sessions are preserved.
+        """
+        started_at = 0.0
+        with _open_text(self.path, 'r') as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a partial last line
+                    print(f"[Replay] Skipping malformed line {line_no} in {self.path}")
+                    continue
+                if isinstance(entry, dict):
+                    if entry.get("format") != RECORDING_FORMAT:
+                        raise ValueError(f"{self.path} is not a {RECORDING_FORMAT} recording")
+                    started_at = float(entry.get("started_at", 0.0))
+                    continue
+                yield started_at + entry[0], entry[1]
+
+    def replay(self, on_frame: Callable[[str], Any], speed: float = 1.0,
+               should_continue: Optional[Callable[[], bool]] = None) -> int:
+        """
+        Feed every payload to on_frame.
+
+        Args:
+            on_frame: Called with each payloadData (e.g. FrameIngestPipeline.process_payload_data)
+            speed: Playback rate relative to the recording (1.0 = real time, 10.0 = 10x);
+                0 or less replays as fast as possible
+            should_continue: Optional predicate checked before each frame; replay stops when it returns False
+
+        Returns:
+            Number of frames replayed
+        """
+        replayed = 0
+        first_ts = None
+        wall_start = time.perf_counter()
+
+        for received_at, payload_data in self.frames():
+            if should_continue is not None and not should_continue():
+                break
+            if speed > 0:
+                if first_ts is None:
+                    first_ts = received_at
+                delay = (received_at - first_ts) / speed - (time.perf_counter() - wall_start)
+                if delay > 0:
+                    time.sleep(delay)
+            on_frame(payload_data)
+            replayed += 1
+
+        self.frames_replayed += replayed
+        return replayed
+
+
+def convert_capture(capture_path: Union[str, Path], output_path: Union[str, Path]) -> int:
+    """
+    Convert a detailed_websocket_data_*.json capture into a recording.
+
+    Only received frames are kept, using their full_payload_raw and timestamp.
+
+    Returns:
+        Number of frames written
+    """
+    with open(capture_path, 'r', encoding='utf-8') as f:
+        capture = json.load(f)
+
+    messages = [m for m in capture.get('websocket_messages', [])
+                if m.get('frame_type', 'received') == 'received' and m.get('full_payload_raw')]
+    started_at = float(messages[0]['timestamp']) if messages else None
+    with FrameRecorder(output_path, started_at=started_at) as recorder:
+        for message in messages:
+            recorder.record(message['full_payload_raw'], received_at=float(message['timestamp']))
+        return recorder.frames_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inspect or convert WebSocket frame recordings')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    info = sub.add_parser('info', help='Print frame count and duration of a recording')
+    info.add_argument('recording')
+
+    convert = sub.add_parser('convert', help='Convert a detailed_websocket_data_*.json capture')
+    convert.add_argument('capture')
+    convert.add_argument('output')
+
+    args = parser.parse_args()
+    if args.command == 'info':
+        frames = list(FrameReplayer(args.recording).frames())
+        duration = frames[-1][0] - frames[0][0] if frames else 0.0
+        print(f"[Replay] {args.recording}: {len(frames)} frames over {duration:.1f}s")
+    else:
+        written = convert_capture(args.capture, args.output)
+        print(f"[Replay] Wrote {written} frames to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
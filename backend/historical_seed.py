@@ -0,0 +1,142 @@
+"""
+Historical seed module for streaming_server.py refactoring
+Serves the candles that seed a chart on start_stream without rescanning the
+CSV directories or parsing whole files each time:
+
+    - files come from the shared DataCatalog (directories re-listed only on mtime change)
+    - read_tail_rows reads the last N rows by seeking backwards from the end
+    - HistoricalSeedService caches built payloads in an LRU keyed by
+      (asset, timeframe, count, source file mtimes)
+"""
+
+import csv
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+from backend.data_catalog import DataCatalog, parse_timestamp
+
+DEFAULT_SEED_COUNT = 200
+DEFAULT_CACHE_SIZE = 64
+READ_BLOCK_SIZE = 64 * 1024
+
+# Rotating persistence parts: EURUSD_otc_1m_<session>_part002.csv
+_PART_SUFFIX = re.compile(r'_part\d+$')
+
+
+def read_tail_rows(path, count: int) -> Tuple[List[str], List[List[str]]]:
+    """
+    Header and last `count` data rows of a CSV, reading backwards from the end
+    in READ_BLOCK_SIZE blocks (cost depends on count, not on file size).
+    """
+    with open(path, 'rb') as f:
+        header_line = f.readline()
+        data_start = f.tell()
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        chunk = b''
+        # count rows need count + 1 newlines when the last row is newline-terminated
+        while position > data_start and chunk.count(b'\n') <= count:
+            step = min(READ_BLOCK_SIZE, position - data_start)
+            position -= step
+            f.seek(position)
+            chunk = f.read(step) + chunk
+
+    lines = [line for line in chunk.decode('utf-8', errors='replace').splitlines() if line.strip()]
+    if position > data_start:
+        lines = lines[1:]  # first line may be cut mid-row
+    header = next(csv.reader([header_line.decode('utf-8', errors='replace')]), [])
+    return [h.strip() for h in header], list(csv.reader(lines[-count:] if count > 0 else []))
+
+
+class Seed(NamedTuple):
+    candles: List[Dict]
+    files: List[str]
+    cached: bool
+
+
+class HistoricalSeedService:
+    """Latest `count` candles for an asset/timeframe from the indexed CSVs, LRU-cached"""
+
+    def __init__(self, catalog: DataCatalog, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.catalog = catalog
+        self.cache_size = max(1, cache_size)
+        self._cache: 'OrderedDict[Tuple, Seed]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, asset: str, timeframe: int = 60, count: int = DEFAULT_SEED_COUNT) -> Seed:
+        """
+        Seed candles (candle_update payload format, oldest first).
+
+        Rows are taken from the newest file, then from earlier parts of the same
+        session until count is reached (rotating persistence parts hold only a
+        slice of the history each); other sessions are not mixed in.
+        """
+        candidates = [f for f in self.catalog.query(asset=asset, timeframe=int(timeframe)) if f.rows]
+        if not candidates:
+            return Seed([], [], False)
+        session = _PART_SUFFIX.sub('', Path(candidates[0].path).stem)
+        candidates = [f for f in candidates if _PART_SUFFIX.sub('', Path(f.path).stem) == session]
+
+        key = (asset, int(timeframe), count, tuple((f.path, f.mtime, f.size) for f in candidates))
+        with self._lock:
+            seed = self._cache.get(key)
+            if seed is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return seed._replace(cached=True)
+            self.misses += 1
+
+        rows: Dict[int, Dict] = {}
+        used = []
+        for seed_file in candidates:
+            if len(rows) >= count:
+                break
+            try:
+                new_rows = self._read_candles(seed_file.path, count - len(rows), asset)
+            except (OSError, ValueError, KeyError, IndexError) as e:
+                print(f"[Seed] Skipping {os.path.basename(seed_file.path)}: {e}")
+                continue
+            for candle in new_rows:
+                rows.setdefault(candle['timestamp'], candle)
+            used.append(os.path.basename(seed_file.path))
+
+        candles = [rows[ts] for ts in sorted(rows)][-count:]
+        seed = Seed(candles, used, False)
+        with self._lock:
+            self._cache[key] = seed
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return seed
+
+    @staticmethod
+    def _read_candles(path: str, count: int, asset: str) -> List[Dict]:
+        header, rows = read_tail_rows(path, count)
+        columns = {name.lower(): i for i, name in enumerate(header)}
+        ts_i, open_i, high_i = columns['timestamp'], columns['open'], columns['high']
+        low_i, close_i, volume_i = columns['low'], columns['close'], columns.get('volume')
+        candles = []
+        for row in rows:
+            timestamp = parse_timestamp(row[ts_i])
+            candles.append({
+                'asset': asset,
+                'timestamp': timestamp,
+                'open': float(row[open_i]),
+                'high': float(row[high_i]),
+                'low': float(row[low_i]),
+                'close': float(row[close_i]),
+                'volume': int(float(row[volume_i] or 0)) if volume_i is not None and volume_i < len(row) else 0,
+                'date': datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+            })
+        return candles
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._cache), 'hits': self.hits, 'misses': self.misses}
+
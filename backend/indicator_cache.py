@@ -0,0 +1,306 @@
+"""
+Indicator cache module for streaming_server.py refactoring
+Serves repeated calculate_indicators requests (panel re-renders, reconnects,
+several clients on one stream) without recomputing every series from scratch:
+
+- one entry per (asset, timeframe, instance type + params) holds the series up
+  to the last closed candle, tagged with the candle store's closed sequence
+- a moving forming candle only recomputes its own point (one incremental step,
+  strategies/streaming_indicators.py)
+- newly closed candles extend the entry's tail instead of invalidating it
+- built payloads (after downsampling and the requested series format) are
+  kept per request, so a repeat over unchanged candles returns the same object
+
+Entries and payloads share a byte budget (estimated from point counts) and are
+evicted least recently used first.
+"""
+
+import json
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend import metrics
+from backend.downsample import downsample_indicator_result
+from backend.indicator_stream import DEFAULT_SEED_CANDLES, _rows
+from backend.subscriptions import normalize_asset
+from capabilities.candle_store import CLOSE, HIGH, LOW, TS
+from strategies.indicator_adapter import IndicatorAdapter, columnar_result
+from strategies.indicator_planner import request_key
+from strategies.streaming_indicators import StreamingIndicator, create_stream
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Approximate footprint of one {'time': int, 'value': float} series point
+POINT_BYTES = sys.getsizeof({'time': 0, 'value': 0.0}) + 56
+# calculate_indicators_for_instances refuses shorter histories
+MIN_CANDLES = 20
+
+
+def _points(series: Any) -> int:
+    if isinstance(series, dict):
+        return sum(len(points) for points in series.values())
+    return len(series)
+
+
+class _Entry:
+    """One instance's series on one stream, valid for closed_seq plus the forming candle"""
+    __slots__ = ('indicator_type', 'params', 'fields', 'closed_seq', 'last_ts', 'boundary', 'closed',
+                 'stream', 'forming', 'values', 'series', 'nbytes')
+
+    def __init__(self, indicator_type: str, params: Dict[str, Any], fields: Tuple[str, ...]):
+        self.indicator_type = indicator_type
+        self.params = params
+        self.fields = fields
+        self.closed_seq: Optional[int] = None
+        self.last_ts: Optional[float] = None
+        # Last closed candle as a tuple: detects history replaced under the same timestamps
+        self.boundary: Optional[Tuple[float, ...]] = None
+        # Points on closed candles, field -> [{time, value}, ...]
+        self.closed: Dict[str, List[Dict[str, float]]] = {}
+        # Incremental indicator committed up to last_ts (built on first tail update)
+        self.stream: Optional[StreamingIndicator] = None
+        # Forming candle the values/series below were computed for
+        self.forming: Optional[Tuple[float, ...]] = None
+        self.values: Dict[str, Optional[float]] = {}
+        self.series: Any = None
+        self.nbytes = 0
+
+
+class IndicatorCache:
+    """calculate_indicators results cached per stream and instance, memory-bounded LRU"""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, seed_candles: int = DEFAULT_SEED_CANDLES,
+                 adapter: Optional[IndicatorAdapter] = None):
+        """
+        Args:
+            max_bytes: Estimated memory budget for entries and payloads together (0 = cache nothing)
+            seed_candles: Closed candles replayed into an entry's incremental indicator on its first tail update
+            adapter: Computes misses (defaults to a new IndicatorAdapter)
+        """
+        self.max_bytes = max(0, max_bytes)
+        self.seed_candles = seed_candles
+        self.adapter = adapter or IndicatorAdapter()
+        self._lock = threading.Lock()
+        # (asset, timeframe) + request key -> entry
+        self._entries: 'OrderedDict[Tuple, _Entry]' = OrderedDict()
+        # (asset, timeframe, instances, max_points, series format) -> (candle version, payload, nbytes)
+        self._payloads: 'OrderedDict[Tuple, Tuple[Tuple, Dict[str, Any], int]]' = OrderedDict()
+        self.bytes = 0
+
+        # Counters
+        self.payload_hits = 0
+        self.hits = 0
+        self.tail_updates = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def calculate(self, asset: str, candles: Any, instances: Dict[str, Dict[str, Any]],
+                  timeframe_seconds: int = 60, max_points: Optional[int] = None,
+                  series_format: str = 'points') -> Dict[str, Any]:
+        """
+        calculate_indicators payload for instances over candles (downsampled to max_points),
+        in the format IndicatorAdapter.calculate_indicators_for_instances returns for series_format.
+
+        Only instances without a usable entry are computed; errors are returned, not cached.
+        """
+        if len(candles) < MIN_CANDLES:
+            return self.adapter.calculate_indicators_for_instances(asset, candles, instances, timeframe_seconds,
+                                                                   series_format)
+
+        rows = _rows(candles)
+        forming = tuple(rows[-1].tolist())
+        closed_seq = candles.closed_seq if hasattr(candles, 'closed_seq') else len(rows) - 1
+        version = (closed_seq, forming)
+        stream_key = (normalize_asset(asset), int(timeframe_seconds))
+        payload_key = stream_key + (json.dumps(instances, sort_keys=True, default=str), max_points, series_format)
+
+        with self._lock:
+            cached = self._payloads.get(payload_key)
+            if cached is not None and cached[0] == version:
+                self._payloads.move_to_end(payload_key)
+                self.payload_hits += 1
+                metrics.INDICATOR_CACHE_TOTAL.inc(result='payload')
+                return cached[1]
+
+            entries: Dict[str, _Entry] = {}
+            missing: Dict[str, Dict[str, Any]] = {}
+            for instance_name, instance_config in instances.items():
+                key = stream_key + request_key(instance_config.get('type'), instance_config.get('params', {}) or {})
+                entry = self._entries.get(key)
+                nbytes = entry.nbytes if entry is not None else 0
+                if entry is not None and self._refresh(entry, rows, closed_seq, forming):
+                    self._entries.move_to_end(key)
+                    self.bytes += entry.nbytes - nbytes
+                    entries[instance_name] = entry
+                else:
+                    missing[instance_name] = instance_config
+            self._evict()
+
+        if missing:
+            self.misses += len(missing)
+            metrics.INDICATOR_CACHE_TOTAL.inc(len(missing), result='miss')
+            computed = self.adapter.calculate_indicators_for_instances(asset, candles, missing, timeframe_seconds)
+            if 'error' in computed:
+                return computed
+            with self._lock:
+                for instance_name, series in computed['series'].items():
+                    instance_config = missing[instance_name]
+                    entry = self._entry_from_series(instance_config, series, rows, closed_seq, forming)
+                    key = stream_key + request_key(instance_config.get('type'), instance_config.get('params', {}) or {})
+                    self._store(self._entries, key, entry, entry.nbytes)
+                    entries[instance_name] = entry
+
+        last = candles[-1]
+        result = {
+            "asset": asset,
+            "timeframe_minutes": timeframe_seconds // 60,
+            "data_points": len(candles),
+            "latest_timestamp": last[TS],
+            "latest_price": last[CLOSE],
+            "indicators": {},
+            "series": {},
+            "signals": {},
+            "timestamp": datetime.now().isoformat()
+        }
+        for instance_name, instance_config in instances.items():
+            entry = entries.get(instance_name)
+            if entry is None:
+                continue
+            formatted = self.adapter.format_latest(entry.indicator_type, instance_config.get('params', {}) or {},
+                                                   entry.values)
+            result['indicators'][instance_name] = formatted['indicator']
+            result['series'][instance_name] = entry.series
+            if 'signal' in formatted:
+                result['signals'][instance_name] = formatted['signal']
+
+        payload = downsample_indicator_result(result, max_points)
+        points = sum(_points(s) for s in payload['series'].values())
+        if series_format == 'columns':
+            payload = columnar_result(payload)
+        # Payload lists reference the entries' point dicts (or their time/value objects)
+        nbytes = points * (16 if series_format == 'columns' else 8)
+        with self._lock:
+            self._store(self._payloads, payload_key, (version, payload, nbytes), nbytes)
+        return payload
+
+    def invalidate(self, asset: Optional[str] = None) -> None:
+        """Drop every entry and payload (of one asset, if given)"""
+        with self._lock:
+            for cache in (self._entries, self._payloads):
+                for key in [k for k in cache if asset is None or k[0] == normalize_asset(asset)]:
+                    self.bytes -= self._nbytes(cache.pop(key))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'payloads': len(self._payloads),
+                'bytes': self.bytes,
+                'max_bytes': self.max_bytes,
+                'payload_hits': self.payload_hits,
+                'hits': self.hits,
+                'tail_updates': self.tail_updates,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def _refresh(self, entry: _Entry, rows: np.ndarray, closed_seq: int, forming: Tuple[float, ...]) -> bool:
+        """Bring entry up to the candles (True), or report it unusable (history replaced or older)"""
+        if entry.closed_seq == closed_seq:
+            if entry.forming == forming:
+                self.hits += 1
+                metrics.INDICATOR_CACHE_TOTAL.inc(result='hit')
+                return True
+        elif entry.closed_seq is None or closed_seq < entry.closed_seq:
+            return False
+
+        closed = rows[:-1]
+        if entry.boundary is None:
+            return False
+        i = int(np.searchsorted(closed[:, TS], entry.last_ts))
+        if i >= len(closed) or tuple(closed[i].tolist()) != entry.boundary:
+            return False
+
+        if entry.stream is None:
+            entry.stream = create_stream(entry.indicator_type, entry.params)
+            if entry.stream is None:
+                return False
+            for row in closed[max(0, i + 1 - self.seed_candles):i + 1].tolist():
+                entry.stream.commit(row[HIGH], row[LOW], row[CLOSE])
+
+        # Newly closed candles: append their final points
+        for row in closed[i + 1:].tolist():
+            values = entry.stream.commit(row[HIGH], row[LOW], row[CLOSE])
+            for field, value in zip(entry.fields, values):
+                if value == value:
+                    entry.closed[field].append({'time': int(row[TS]), 'value': value})
+        if i + 1 < len(closed):
+            # Points older than the retained candles (ring buffer wrapped) go too
+            first_ts = rows[0, TS]
+            for field, points in entry.closed.items():
+                if points and points[0]['time'] < first_ts:
+                    entry.closed[field] = [p for p in points if p['time'] >= first_ts]
+            entry.last_ts = closed[-1, TS]
+            entry.boundary = tuple(closed[-1].tolist())
+        entry.closed_seq = closed_seq
+
+        values = entry.stream.update(forming[HIGH], forming[LOW], forming[CLOSE])
+        self._set_forming(entry, forming, dict(zip(entry.fields, values)))
+        self.tail_updates += 1
+        metrics.INDICATOR_CACHE_TOTAL.inc(result='tail')
+        return True
+
+    @staticmethod
+    def _entry_from_series(instance_config: Dict[str, Any], series: Any, rows: np.ndarray, closed_seq: int,
+                           forming: Tuple[float, ...]) -> _Entry:
+        """Entry from a freshly computed instance series (split into closed points and the forming one)"""
+        lines = series if isinstance(series, dict) else {'value': series}
+        entry = _Entry(instance_config.get('type'), instance_config.get('params', {}) or {}, tuple(lines))
+        forming_ts = int(forming[TS])
+        values = {}
+        for field, points in lines.items():
+            at_forming = bool(points) and points[-1]['time'] == forming_ts
+            entry.closed[field] = points[:-1] if at_forming else list(points)
+            values[field] = points[-1]['value'] if at_forming else None
+        entry.closed_seq = closed_seq
+        if len(rows) > 1:
+            entry.last_ts = rows[-2, TS]
+            entry.boundary = tuple(rows[-2].tolist())
+        entry.forming, entry.values, entry.series = forming, values, series
+        entry.nbytes = (POINT_BYTES + 16) * _points(series)
+        return entry
+
+    @staticmethod
+    def _set_forming(entry: _Entry, forming: Tuple[float, ...], values: Dict[str, float]) -> None:
+        forming_ts = int(forming[TS])
+        lines = {}
+        for field, points in entry.closed.items():
+            value = values[field]
+            lines[field] = points + [{'time': forming_ts, 'value': value}] if value == value else list(points)
+        entry.forming = forming
+        entry.values = {field: value if value == value else None for field, value in values.items()}
+        entry.series = lines['value'] if entry.fields == ('value',) else lines
+        entry.nbytes = (POINT_BYTES + 16) * _points(entry.series)
+
+    @staticmethod
+    def _nbytes(item: Any) -> int:
+        return item.nbytes if isinstance(item, _Entry) else item[2]
+
+    def _store(self, cache: OrderedDict, key: Tuple, item: Any, nbytes: int) -> None:
+        """Insert under the lock, then evict down to max_bytes"""
+        if key in cache:
+            self.bytes -= self._nbytes(cache.pop(key))
+        cache[key] = item
+        self.bytes += nbytes
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used payloads, then entries, until within max_bytes (under the lock)"""
+        while self.bytes > self.max_bytes and (self._payloads or self._entries):
+            victims = self._payloads if self._payloads else self._entries
+            self.bytes -= self._nbytes(victims.popitem(last=False)[1])
+            self.evictions += 1
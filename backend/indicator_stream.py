@@ -0,0 +1,259 @@
+"""
+Indicator stream module for streaming_server.py refactoring
+Keeps incremental indicators (strategies/streaming_indicators.py) for the
+instances clients requested on each (asset, timeframe) stream and turns candle
+updates into indicators_calculated deltas instead of full recomputes:
+
+- track() seeds a stream's instances once from its candle history
+- update() commits newly closed candles and folds the forming candle in
+  provisionally, returning only the new points
+
+Identical (type, params) instances on a stream share one indicator. Provisional
+deltas are rate-limited per stream (provisional_interval); closes are never held back.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend import metrics
+from backend.subscriptions import ROOM_PREFIX, normalize_asset, room_name
+from capabilities.candle_store import CLOSE, HIGH, LOW, TS
+from strategies.indicator_adapter import IndicatorAdapter
+from strategies.indicator_planner import request_key
+from strategies.streaming_indicators import StreamingIndicator, create_stream
+
+# EMA-style memory older than this is below (1 - alpha) ** 2000 of the value
+DEFAULT_SEED_CANDLES = 2000
+
+
+def _rows(candles: Any) -> np.ndarray:
+    """(n, 5) array of [timestamp, open, close, high, low] from a CandleSeries or list of rows"""
+    if hasattr(candles, 'array'):
+        return candles.array()
+    if not len(candles):
+        return np.empty((0, 5), dtype=np.float64)
+    return np.asarray([row[:5] for row in candles], dtype=np.float64)
+
+
+class _TrackedStream:
+    __slots__ = ('asset', 'timeframe', 'instances', 'indicators', 'seq', 'last_ts', 'last_sent')
+
+    def __init__(self, asset: str, timeframe: int):
+        self.asset = asset
+        self.timeframe = timeframe
+        # instance name -> (type, params, request key)
+        self.instances: Dict[str, Tuple[str, Dict[str, Any], Tuple]] = {}
+        # request key -> shared incremental indicator
+        self.indicators: Dict[Tuple, StreamingIndicator] = {}
+        # Closed-candle position: candle store sequence number and last committed timestamp
+        self.seq: Optional[int] = None
+        self.last_ts: Optional[float] = None
+        self.last_sent = float('-inf')
+
+
+class IndicatorStream:
+    """Per-stream incremental indicators and their delta payloads"""
+
+    def __init__(self, seed_candles: int = DEFAULT_SEED_CANDLES, provisional_interval: float = 0.0,
+                 clock: Callable[[], float] = time.monotonic, adapter: Optional[IndicatorAdapter] = None):
+        """
+        Args:
+            seed_candles: Closed candles replayed into new indicators when a stream is tracked
+            provisional_interval: Minimum seconds between forming-candle deltas per stream (0 = every update)
+            clock: Monotonic time source (overridable for tests)
+            adapter: Formats latest values and signals like calculate_indicators results
+        """
+        self.seed_candles = seed_candles
+        self.provisional_interval = provisional_interval
+        self.clock = clock
+        self.adapter = adapter or IndicatorAdapter()
+        self._lock = threading.Lock()
+        self._streams: Dict[str, _TrackedStream] = {}  # room -> stream
+
+        # Counters
+        self.seeded = 0
+        self.reseeds = 0
+        self.commits = 0
+        self.deltas = 0
+        self.provisional_skipped = 0
+
+    def track(self, asset: str, timeframe: int, instances: Dict[str, Dict[str, Any]], candles: Any) -> int:
+        """
+        Start (or replace) live updates for a stream's indicator instances.
+
+        Args:
+            instances: Same format as calculate_indicators ({'SMA-20': {'type': 'sma', 'params': {...}}})
+            candles: The stream's candles (CandleSeries, or a list of [ts, open, close, high, low])
+
+        Returns:
+            Number of instances tracked (unknown types are skipped)
+        """
+        stream = _TrackedStream(asset, timeframe)
+        for instance_name, instance_config in (instances or {}).items():
+            indicator_type = instance_config.get('type')
+            params = instance_config.get('params', {}) or {}
+            key = request_key(indicator_type, params)
+            if key not in stream.indicators:
+                indicator = create_stream(indicator_type, params)
+                if indicator is None:
+                    continue
+                stream.indicators[key] = indicator
+            stream.instances[instance_name] = (indicator_type, params, key)
+
+        if not stream.instances:
+            self.untrack(asset, timeframe)
+            return 0
+        self._seed(stream, candles)
+        with self._lock:
+            self._streams[room_name(asset, timeframe)] = stream
+        return len(stream.instances)
+
+    def untrack(self, asset: str, timeframe: Optional[int] = None) -> None:
+        """Stop live updates for one stream, or every stream of asset"""
+        with self._lock:
+            if timeframe is not None:
+                self._streams.pop(room_name(asset, timeframe), None)
+                return
+            prefix = f"{ROOM_PREFIX}:{normalize_asset(asset)}:"
+            for room in [r for r in self._streams if r.startswith(prefix)]:
+                del self._streams[room]
+
+    def retain(self, rooms) -> List[str]:
+        """Drop streams whose room is not in rooms (nobody subscribed); returns the dropped rooms"""
+        rooms = set(rooms)
+        with self._lock:
+            dropped = [room for room in self._streams if room not in rooms]
+            for room in dropped:
+                del self._streams[room]
+            return dropped
+
+    def reset(self) -> None:
+        with self._lock:
+            self._streams.clear()
+
+    def tracked(self) -> List[str]:
+        with self._lock:
+            return sorted(self._streams)
+
+    def update(self, asset: str, timeframe: int, candles: Any) -> Optional[Dict[str, Any]]:
+        """
+        Advance a tracked stream to its latest candles.
+
+        Returns:
+            indicators_calculated delta (new points only), or None if the stream is
+            untracked, unchanged or its provisional update is rate-limited
+        """
+        with self._lock:
+            stream = self._streams.get(room_name(asset, timeframe))
+        if stream is None or not len(candles):
+            return None
+
+        with metrics.INDICATOR_STREAM_SECONDS.time():
+            closed = self._new_closed(stream, candles)
+            if closed is None:
+                # The history was reloaded under the stream: start over from the new candles
+                self.reseeds += 1
+                self._seed(stream, candles, fresh=True)
+                closed_rows = []
+            else:
+                closed_rows = closed.tolist()
+
+            committed: Dict[Tuple, List[Tuple[int, Tuple[float, ...]]]] = {key: [] for key in stream.indicators}
+            for row in closed_rows:
+                ts = int(row[TS])
+                for key, indicator in stream.indicators.items():
+                    committed[key].append((ts, indicator.commit(row[HIGH], row[LOW], row[CLOSE])))
+            if closed_rows:
+                self.commits += len(closed_rows)
+                stream.last_ts = closed_rows[-1][TS]
+
+            now = self.clock()
+            if not closed_rows and now - stream.last_sent < self.provisional_interval:
+                self.provisional_skipped += 1
+                return None
+            stream.last_sent = now
+
+            forming = _rows(candles)[-1].tolist()
+            provisional = {key: indicator.update(forming[HIGH], forming[LOW], forming[CLOSE])
+                           for key, indicator in stream.indicators.items()}
+            self.deltas += 1
+            return self._delta(stream, committed, int(forming[TS]), forming[CLOSE], provisional, len(closed_rows))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            streams = list(self._streams.values())
+        return {
+            'streams': len(streams),
+            'instances': sum(len(s.instances) for s in streams),
+            'indicators': sum(len(s.indicators) for s in streams),
+            'seeded': self.seeded,
+            'reseeds': self.reseeds,
+            'commits': self.commits,
+            'deltas': self.deltas,
+            'provisional_skipped': self.provisional_skipped,
+        }
+
+    def _seed(self, stream: _TrackedStream, candles: Any, fresh: bool = False) -> None:
+        """Replay the stream's closed candles (the last seed_candles) into its indicators"""
+        if fresh:
+            stream.indicators = {key: create_stream(indicator_type, params)
+                                 for indicator_type, params, key in stream.instances.values()}
+        closed = _rows(candles)[:-1][-self.seed_candles:].tolist() if self.seed_candles > 0 else []
+        indicators = list(stream.indicators.values())
+        for row in closed:
+            for indicator in indicators:
+                indicator.commit(row[HIGH], row[LOW], row[CLOSE])
+        stream.last_ts = closed[-1][TS] if closed else None
+        stream.seq = candles.closed_seq if hasattr(candles, 'closed_seq') else None
+        self.seeded += 1
+
+    @staticmethod
+    def _new_closed(stream: _TrackedStream, candles: Any) -> Optional[np.ndarray]:
+        """
+        Candles closed since the last commit, or None when the history was replaced
+        (the store re-sequenced candles at or before the last committed one).
+        """
+        if stream.seq is not None and hasattr(candles, 'closed_since'):
+            closed, stream.seq = candles.closed_since(stream.seq)
+            if stream.last_ts is not None and len(closed) and closed[0, TS] <= stream.last_ts:
+                return None
+            return closed
+        closed = _rows(candles)[:-1]
+        if stream.last_ts is not None:
+            closed = closed[closed[:, TS] > stream.last_ts]
+        return closed
+
+    def _delta(self, stream: _TrackedStream, committed: Dict[Tuple, List], forming_ts: int, forming_close: float,
+               provisional: Dict[Tuple, Tuple[float, ...]], closed_count: int) -> Dict[str, Any]:
+        """indicators_calculated payload carrying only new points (closed candles, then the forming one)"""
+        result = {
+            'asset': stream.asset,
+            'timeframe': stream.timeframe,
+            'delta': True,
+            'closed': closed_count,
+            'latest_timestamp': forming_ts,
+            'latest_price': forming_close,
+            'indicators': {},
+            'series': {},
+            'signals': {},
+            'timestamp': datetime.now().isoformat()
+        }
+        for instance_name, (indicator_type, params, key) in stream.instances.items():
+            fields = stream.indicators[key].fields
+            lines = {field: [] for field in fields}
+            for ts, values in committed[key] + [(forming_ts, provisional[key])]:
+                for field, value in zip(fields, values):
+                    if value == value:
+                        lines[field].append({'time': ts, 'value': value})
+
+            latest = {field: value if value == value else None for field, value in zip(fields, provisional[key])}
+            formatted = self.adapter.format_latest(indicator_type, params, latest)
+            result['indicators'][instance_name] = formatted['indicator']
+            result['series'][instance_name] = lines['value'] if fields == ('value',) else lines
+            if 'signal' in formatted:
+                result['signals'][instance_name] = formatted['signal']
+        return result
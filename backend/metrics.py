@@ -0,0 +1,296 @@
+"""
+Metrics module for streaming_server.py refactoring
+Small Prometheus-compatible registry (counters, gauges, histograms) for the
+hot paths: frame decode, candle update/close, persistence writes, Redis push,
+indicator calculation, backtests and Socket.IO emits. Rendered in the text
+exposition format at /metrics.
+
+Disabled by default (--metrics turns it on): every update starts with one
+attribute check and returns, and Histogram.time() hands back a shared no-op context.
+
+Usage:
+    from backend import metrics
+    metrics.REGISTRY.enable()
+    with metrics.FRAME_DECODE_SECONDS.time():
+        frame = decoder.decode(payload)
+    metrics.TICKS_TOTAL.inc(asset='EURUSD_otc')
+    text = metrics.REGISTRY.render()
+"""
+
+import bisect
+import math
+import threading
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds; spans sub-millisecond decode up to multi-second backtests
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP_TIMER = _NoopTimer()
+
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'started')
+
+    def __init__(self, histogram: 'Histogram', labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+        return False
+
+
+def _label_key(labels: Dict[str, str]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items())) if labels else ()
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    escaped = (v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, v in pairs)
+    return '{' + ','.join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + '}'
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ''
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.kind}']
+
+
+class Counter(_Metric):
+    """Monotonic total per label set (use rate() for per-second values)"""
+    kind = 'counter'
+
+    def __init__(self, registry, name, documentation):
+        super().__init__(registry, name, documentation)
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if not self.registry.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [f'{self.name}{_format_labels(k)} {_format_value(v)}' for k, v in items]
+
+
+class Gauge(Counter):
+    """Current value per label set"""
+    kind = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        if not self.registry.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket latency distribution per label set"""
+    kind = 'histogram'
+
+    def __init__(self, registry, name, documentation, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(registry, name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[LabelKey, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        if not self.registry.enabled:
+            return
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels):
+        """Context manager observing the elapsed seconds (no-op while disabled)"""
+        if not self.registry.enabled:
+            return _NOOP_TIMER
+        return _Timer(self, labels)
+
+    def count(self, **labels) -> int:
+        series = self._series.get(_label_key(labels))
+        return series[2] if series else 0
+
+    def quantile(self, q: float, **labels) -> Optional[float]:
+        """Bucket-interpolated quantile estimate (same method as PromQL histogram_quantile)"""
+        series = self._series.get(_label_key(labels))
+        if not series or not series[2]:
+            return None
+        rank = q * series[2]
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets + (math.inf,), series[0]):
+            if count and seen + count >= rank:
+                if math.isinf(upper):
+                    return lower
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        return lower
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, [list(s[0]), s[1], s[2]]) for k, s in self._series.items())
+        lines = self._header()
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for upper, n in zip(self.buckets + (math.inf,), counts):
+                cumulative += n
+                lines.append(f'{self.name}_bucket{_format_labels(key, ("le", _format_value(upper)))} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(key)} {_format_value(total)}')
+            lines.append(f'{self.name}_count{_format_labels(key)} {count}')
+        return lines
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """{label string: {count, p50_ms, p95_ms, p99_ms}} for JSON stats"""
+        out = {}
+        for key in list(self._series):
+            labels = dict(key)
+            out[_format_labels(key) or 'all'] = {
+                'count': self.count(**labels),
+                **{f'p{int(q * 100)}_ms': round(self.quantile(q, **labels) * 1000, 3) for q in (0.5, 0.95, 0.99)},
+            }
+        return out
+
+
+class MetricsRegistry:
+    """Named metrics plus the enabled switch they all check"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._metrics: Dict[str, _Metric] = {}
+
+    def enable(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+
+    def _register(self, metric: _Metric) -> _Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            if type(existing) is not type(metric):
+                raise ValueError(f"Metric '{metric.name}' already registered as a {existing.kind}")
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        return self._register(Counter(self, name, documentation))
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        return self._register(Gauge(self, name, documentation))
+
+    def histogram(self, name: str, documentation: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(self, name, documentation, buckets))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.reset()
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return '\n'.join(lines) + '\n'
+
+    def latency_summary(self) -> Dict[str, Dict]:
+        """Percentiles of every histogram that has observations"""
+        return {name: metric.summary() for name, metric in sorted(self._metrics.items())
+                if isinstance(metric, Histogram) and metric._series}
+
+
+REGISTRY = MetricsRegistry()
+
+# Ingest
+FRAMES_TOTAL = REGISTRY.counter('quflx_frames_total', 'WebSocket frames decoded, by frame kind')
+FRAME_DECODE_SECONDS = REGISTRY.histogram('quflx_frame_decode_seconds', 'Time to decode one WebSocket frame')
+TICKS_TOTAL = REGISTRY.counter('quflx_ticks_total', 'Price ticks applied to candle formation, by asset')
+TICK_LAG_SECONDS = REGISTRY.histogram('quflx_tick_lag_seconds',
+                                      'Delay from tick timestamp to candle formation (end-to-end ingest lag)',
+                                      buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+CANDLE_UPDATE_SECONDS = REGISTRY.histogram('quflx_candle_update_seconds',
+                                           'Time to apply a frame to candles and queue its emits')
+CANDLES_CLOSED_TOTAL = REGISTRY.counter('quflx_candles_closed_total', 'Closed candles emitted, by timeframe')
+STAGE_LAG_SECONDS = REGISTRY.histogram('quflx_stage_queue_seconds', 'Time items wait in a pipeline stage queue')
+STAGE_DEPTH = REGISTRY.gauge('quflx_stage_queue_depth', 'Items queued per pipeline stage')
+
+# Outputs
+PERSIST_WRITE_SECONDS = REGISTRY.histogram('quflx_persist_write_seconds', 'CSV persistence write time, by kind')
+REDIS_PUSH_SECONDS = REGISTRY.histogram('quflx_redis_push_seconds', 'Time to push a candle to the Redis buffer')
+EMITS_TOTAL = REGISTRY.counter('quflx_socket_emits_total', 'Socket.IO events emitted, by event')
+EMIT_SECONDS = REGISTRY.histogram('quflx_socket_emit_seconds', 'Socket.IO emit call time, by event')
+
+# Requests
+INDICATOR_SECONDS = REGISTRY.histogram('quflx_indicator_calculation_seconds',
+                                       'calculate_indicators time per request')
+INDICATOR_STREAM_SECONDS = REGISTRY.histogram('quflx_indicator_stream_update_seconds',
+                                              'Incremental indicator update time per stream delta')
+INDICATOR_CACHE_TOTAL = REGISTRY.counter('quflx_indicator_cache_total',
+                                         'calculate_indicators cache lookups, by result (payload, hit, tail, miss)')
+BACKTEST_SECONDS = REGISTRY.histogram('quflx_backtest_seconds', 'Backtest run time, by strategy',
+                                      buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+
+# Server state
+STREAMING_ACTIVE = REGISTRY.gauge('quflx_streaming_active', '1 while at least one client is streaming')
+SUBSCRIBED_STREAMS = REGISTRY.gauge('quflx_subscribed_streams', 'Subscribed (asset, timeframe) streams')
@@ -7,6 +7,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional, Dict
 
+from backend import metrics
+
 
 class StreamPersistenceManager:
     """Manages CSV persistence for streaming data"""
@@ -31,8 +33,9 @@ class StreamPersistenceManager:
         try:
             current_file = self._get_tick_file(asset)
             if current_file:
-                with open(current_file['path'], 'a', encoding='utf-8') as f:
-                    f.write(f"{asset},{timestamp_str},{value}\n")
+                with metrics.PERSIST_WRITE_SECONDS.time(kind='tick'):
+                    with open(current_file['path'], 'a', encoding='utf-8') as f:
+                        f.write(f"{asset},{timestamp_str},{value}\n")
 
                 current_file['count'] += 1
 
@@ -52,8 +55,9 @@ class StreamPersistenceManager:
             if current_file:
                 timestamp_str = datetime.fromtimestamp(candle_ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
-                with open(current_file['path'], 'a', encoding='utf-8') as f:
-                    f.write(f"{asset},{timestamp_str},{open_price},{high_price},{low_price},{close_price}\n")
+                with metrics.PERSIST_WRITE_SECONDS.time(kind='candle'):
+                    with open(current_file['path'], 'a', encoding='utf-8') as f:
+                        f.write(f"{asset},{timestamp_str},{open_price},{high_price},{low_price},{close_price}\n")
 
                 current_file['count'] += 1
 
@@ -0,0 +1,319 @@
+"""
+Staged ingest module for streaming_server.py refactoring
+Splits the Chrome stream loop into ingest, persistence and emit stages, each
+with its own worker thread behind a bounded queue, so a slow disk or a slow
+Socket.IO client no longer delays decoding of the next frames.
+
+Queue policies:
+    block        Producer waits for space (used for ingest: frames are never dropped)
+    drop_newest  Incoming item is dropped when full
+    drop_oldest  Oldest droppable item is evicted when full (blocks if none is droppable)
+
+Items put with a key replace a still-queued item with the same key (merge),
+e.g. successive candle_update payloads for the same asset and timeframe. An
+item put with seal=key closes that slot: later items with the key queue behind
+it instead of merging forward past it (a candle_closed keeps its place between
+the updates before and after it).
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from backend import metrics
+
+POLICY_BLOCK = 'block'
+POLICY_DROP_NEWEST = 'drop_newest'
+POLICY_DROP_OLDEST = 'drop_oldest'
+POLICIES = (POLICY_BLOCK, POLICY_DROP_NEWEST, POLICY_DROP_OLDEST)
+
+
+class _Entry:
+    __slots__ = ('item', 'key', 'droppable', 'enqueued_at')
+
+    def __init__(self, item, key, droppable, enqueued_at):
+        self.item = item
+        self.key = key
+        self.droppable = droppable
+        self.enqueued_at = enqueued_at
+
+
+class PipelineStage:
+    """Bounded queue plus a worker thread that applies handler to each item"""
+
+    def __init__(self, name: str, handler: Callable[[Any], None], maxsize: int = 1000,
+                 policy: str = POLICY_BLOCK):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy '{policy}' (expected one of {', '.join(POLICIES)})")
+        self.name = name
+        self.handler = handler
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+
+        self._queue: deque = deque()
+        self._pending: Dict[Hashable, _Entry] = {}
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Counters
+        self.enqueued = 0
+        self.processed = 0
+        self.merged = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.blocked_s = 0.0
+        self.busy_s = 0.0
+        self.last_lag_s = 0.0
+        self.max_lag_s = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    def put(self, item: Any, key: Optional[Hashable] = None, droppable: bool = True,
+            seal: Optional[Hashable] = None) -> bool:
+        """
+        Queue an item for the worker.
+
+        Args:
+            item: Passed to handler
+            key: Merge key; a queued item with the same key is replaced in place
+            droppable: False exempts the item from drop_oldest eviction
+            seal: Merge key whose queued item may no longer be replaced, as this item must follow it
+
+        Returns:
+            False if the item was dropped
+        """
+        with self._cond:
+            if seal is not None:
+                self._pending.pop(seal, None)
+            if key is not None:
+                entry = self._pending.get(key)
+                if entry is not None:
+                    entry.item = item
+                    self.merged += 1
+                    return True
+
+            if len(self._queue) >= self.maxsize and not self._make_room(droppable):
+                self.dropped += 1
+                return False
+
+            entry = _Entry(item, key, droppable, time.monotonic())
+            self._queue.append(entry)
+            if key is not None:
+                self._pending[key] = entry
+            self.enqueued += 1
+            if len(self._queue) > self.max_depth:
+                self.max_depth = len(self._queue)
+            self._cond.notify()
+            return True
+
+    def _make_room(self, droppable: bool) -> bool:
+        """Apply the overflow policy; returns False if the new item should be dropped"""
+        if self.policy == POLICY_DROP_NEWEST and droppable:
+            return False
+        if self.policy == POLICY_DROP_OLDEST:
+            for entry in self._queue:
+                if entry.droppable:
+                    self._queue.remove(entry)
+                    self._release(entry)
+                    self.dropped += 1
+                    return True
+        if not self._running:
+            # No worker to wait for; the caller drains synchronously
+            return True
+        # block (or nothing evictable): wait for the worker to make space
+        started = time.monotonic()
+        while len(self._queue) >= self.maxsize and self._running:
+            self._cond.wait(0.1)
+        self.blocked_s += time.monotonic() - started
+        return len(self._queue) < self.maxsize
+
+    def _release(self, entry: _Entry) -> None:
+        """Forget entry as its key's merge slot (a sealed entry's key may already point at a newer one)"""
+        if entry.key is not None and self._pending.get(entry.key) is entry:
+            del self._pending[entry.key]
+
+    def _take(self) -> Optional[_Entry]:
+        with self._cond:
+            while not self._queue and self._running:
+                self._cond.wait(0.1)
+            if not self._queue:
+                return None
+            entry = self._queue.popleft()
+            self._release(entry)
+            self._cond.notify_all()
+            return entry
+
+    def process_one(self, entry: _Entry) -> None:
+        started = time.monotonic()
+        lag = started - entry.enqueued_at
+        self.last_lag_s = lag
+        if lag > self.max_lag_s:
+            self.max_lag_s = lag
+        metrics.STAGE_LAG_SECONDS.observe(lag, stage=self.name)
+        try:
+            self.handler(entry.item)
+        except Exception as e:
+            self.errors += 1
+            print(f"[Pipeline] {self.name} stage error: {e}")
+        self.busy_s += time.monotonic() - started
+        self.processed += 1
+
+    def run(self) -> None:
+        while self._running or self._queue:
+            entry = self._take()
+            if entry is not None:
+                self.process_one(entry)
+
+    def drain(self) -> int:
+        """Process everything queued on the calling thread (no worker needed)"""
+        count = 0
+        while True:
+            with self._cond:
+                if not self._queue:
+                    return count
+                entry = self._queue.popleft()
+                if entry.key is not None:
+                    self._pending.pop(entry.key, None)
+            self.process_one(entry)
+            count += 1
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self.run, name=f"stage-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> Dict[str, Any]:
+        oldest = self._queue[0].enqueued_at if self._queue else None
+        return {
+            'policy': self.policy,
+            'depth': len(self._queue),
+            'capacity': self.maxsize,
+            'max_depth': self.max_depth,
+            'enqueued': self.enqueued,
+            'processed': self.processed,
+            'merged': self.merged,
+            'dropped': self.dropped,
+            'errors': self.errors,
+            'lag_ms': round(((time.monotonic() - oldest) if oldest else 0.0) * 1000, 3),
+            'last_lag_ms': round(self.last_lag_s * 1000, 3),
+            'max_lag_ms': round(self.max_lag_s * 1000, 3),
+            'blocked_ms': round(self.blocked_s * 1000, 3),
+            'busy_ms': round(self.busy_s * 1000, 3),
+        }
+
+
+class _QueuedPersistence:
+    """StreamPersistenceManager stand-in that hands writes to the persistence stage"""
+
+    def __init__(self, stage: PipelineStage):
+        self._stage = stage
+
+    def add_tick(self, *args, **kwargs):
+        self._stage.put(('add_tick', args, kwargs))
+
+    def add_candle(self, *args, **kwargs):
+        # Closed candles are few and must not be lost to a tick burst
+        self._stage.put(('add_candle', args, kwargs), droppable=False)
+
+
+class StagedIngest:
+    """
+    Ingest -> (persistence, emit) stages around a FrameIngestPipeline.
+
+    Usage:
+        staged = StagedIngest(emit=socketio.emit, persistence_manager=manager)
+        pipeline = FrameIngestPipeline(..., emit=staged.emit, persistence_manager=staged.persistence)
+        staged.attach(pipeline.process_payload_data)
+        staged.start()
+        staged.submit(payload_data)  # from the Chrome reader thread
+    """
+
+    def __init__(self, emit: Callable[..., None], persistence_manager=None,
+                 ingest_size: int = 10000, persist_size: int = 50000, emit_size: int = 1000):
+        self._emit = emit
+        self._persistence_manager = persistence_manager
+        self.emit_stage = PipelineStage('emit', self._emit_item, maxsize=emit_size, policy=POLICY_DROP_OLDEST)
+        self.persist_stage = None
+        self.persistence = None
+        if persistence_manager is not None:
+            self.persist_stage = PipelineStage('persist', self._persist_item, maxsize=persist_size,
+                                               policy=POLICY_DROP_NEWEST)
+            self.persistence = _QueuedPersistence(self.persist_stage)
+        self.ingest_stage: Optional[PipelineStage] = None
+        self._ingest_size = ingest_size
+
+    def attach(self, process_frame: Callable[[Any], Any]) -> None:
+        """Set the ingest stage handler (e.g. FrameIngestPipeline.process_payload_data)"""
+        self.ingest_stage = PipelineStage('ingest', process_frame, maxsize=self._ingest_size,
+                                          policy=POLICY_BLOCK)
+
+    @property
+    def stages(self):
+        return [s for s in (self.ingest_stage, self.persist_stage, self.emit_stage) if s is not None]
+
+    def submit(self, payload_data: Any) -> bool:
+        return self.ingest_stage.put(payload_data)
+
+    def emit(self, event: str, data: Any, **kwargs) -> None:
+        """
+        Queue an emit; candle_update merges per (asset, timeframe, room), everything else is kept.
+
+        Any other event for the same (asset, timeframe, room), e.g. candle_closed, seals the queued
+        update, so a later update cannot merge ahead of it and overtake its seq.
+        """
+        stream_key = None
+        if isinstance(data, dict) and not set(kwargs) - {'to'}:
+            stream_key = ('candle_update', data.get('asset'), data.get('timeframe'), kwargs.get('to'))
+        if event == 'candle_update' and stream_key is not None:
+            self.emit_stage.put((event, data, kwargs), key=stream_key)
+        else:
+            self.emit_stage.put((event, data, kwargs), droppable=False, seal=stream_key)
+
+    def _emit_item(self, item) -> None:
+        event, data, kwargs = item
+        metrics.EMITS_TOTAL.inc(event=event)
+        with metrics.EMIT_SECONDS.time(event=event):
+            self._emit(event, data, **kwargs)
+
+    def _persist_item(self, item) -> None:
+        method, args, kwargs = item
+        getattr(self._persistence_manager, method)(*args, **kwargs)
+
+    def start(self) -> None:
+        for stage in self.stages:
+            stage.start()
+
+    def stop(self) -> None:
+        for stage in self.stages:
+            stage.stop()
+
+    def drain(self) -> None:
+        """Run every queued item through all stages on the calling thread"""
+        for stage in self.stages:
+            stage.drain()
+
+    def stats(self) -> Dict[str, Any]:
+        stages = {stage.name: stage.stats() for stage in self.stages}
+        for name, stage_stats in stages.items():
+            metrics.STAGE_DEPTH.set(stage_stats['depth'], stage=name)
+        bottleneck = max(stages, key=lambda name: stages[name]['lag_ms']) if stages else None
+        return {
+            'stages': stages,
+            'bottleneck': bottleneck if bottleneck and stages[bottleneck]['lag_ms'] > 0 else None,
+            'timestamp': time.time(),
+        }
@@ -0,0 +1,109 @@
+"""
+Startup profile module for streaming_server.py refactoring
+Import-time breakdown for --profile-startup: wraps builtins.__import__ from
+the top of the server module and charges each import's self time (its own
+execution, minus the imports it triggers) to its top-level package, plus
+wall-clock phases marked along the way (module imports, module state,
+argument handling) up to binding the port.
+
+Uses nothing outside builtins, sys and time, so it can be imported right after
+eventlet.monkey_patch() without pulling anything in itself. Disabled unless the
+flag is on the command line: every method then returns at once.
+
+Usage:
+    from backend.startup_profile import ImportProfiler
+    startup_profiler = ImportProfiler.from_argv(started=process_started)
+    ...imports...
+    startup_profiler.mark('module imports')
+    print(startup_profiler.report())
+"""
+
+import builtins
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+FLAG = '--profile-startup'
+
+
+class ImportProfiler:
+    """Self time per top-level package of every import while installed, plus named startup phases."""
+
+    def __init__(self, enabled: bool = True, started: Optional[float] = None):
+        self.enabled = enabled
+        self.started = time.perf_counter() if started is None else started
+        self.self_seconds: Dict[str, float] = {}
+        self.import_counts: Dict[str, int] = {}
+        self.phases: List[Tuple[str, float]] = []
+        self._last_mark = self.started
+        self._children: List[float] = []
+        self._original = None
+
+    @classmethod
+    def from_argv(cls, argv: Optional[Sequence[str]] = None, started: Optional[float] = None) -> 'ImportProfiler':
+        """Installed profiler when --profile-startup is in argv (default sys.argv), a disabled one otherwise"""
+        profiler = cls(enabled=FLAG in (sys.argv if argv is None else argv), started=started)
+        profiler.install()
+        return profiler
+
+    def install(self):
+        if self.enabled and self._original is None:
+            self._original = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        if self._original is not None:
+            if builtins.__import__ == self._import:
+                builtins.__import__ = self._original
+            self._original = None
+
+    def mark(self, phase: str):
+        """Close a startup phase: wall time since the previous mark (or process start)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last_mark))
+        self._last_mark = now
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        full_name = name
+        if level:
+            package = (globals or {}).get('__package__') or ''
+            package = package.rsplit('.', level - 1)[0] if level > 1 else package
+            full_name = f'{package}.{name}' if name else package
+        if full_name in sys.modules:
+            return self._original(name, globals, locals, fromlist, level)
+
+        self._children.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._children.pop()
+            package = full_name.split('.', 1)[0] or '?'
+            self.self_seconds[package] = self.self_seconds.get(package, 0.0) + elapsed - children
+            self.import_counts[package] = self.import_counts.get(package, 0) + 1
+            if self._children:
+                self._children[-1] += elapsed
+
+    def breakdown(self, top: int = 15) -> List[Tuple[str, float]]:
+        """(package, self seconds) for the slowest packages, slowest first"""
+        return sorted(self.self_seconds.items(), key=lambda item: item[1], reverse=True)[:top]
+
+    def report(self, top: int = 15) -> str:
+        """Printable breakdown; also stops timing imports"""
+        self.uninstall()
+        if not self.enabled:
+            return ''
+        total = time.perf_counter() - self.started
+        lines = [f"[Startup] Import-time breakdown (self time per top-level package, top {top}):"]
+        for package, seconds in self.breakdown(top):
+            lines.append(f"[Startup]   {package:<28} {seconds * 1000:8.1f} ms  ({self.import_counts[package]} imports)")
+        imported = sum(self.self_seconds.values())
+        lines.append(f"[Startup]   {'all imports':<28} {imported * 1000:8.1f} ms")
+        lines.append("[Startup] Phases:")
+        for phase, seconds in self.phases:
+            lines.append(f"[Startup]   {phase:<28} {seconds * 1000:8.1f} ms")
+        lines.append(f"[Startup] ✓ Ready to bind after {total:.3f}s")
+        return '\n'.join(lines)
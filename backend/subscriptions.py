@@ -0,0 +1,160 @@
+"""
+Subscription management module for streaming_server.py refactoring
+Tracks which Socket.IO clients follow which (asset, timeframe) streams. Each
+stream maps to one Socket.IO room, so candle updates are emitted once per room
+instead of to every client, and ingest runs while any subscription exists.
+
+A disconnected client's streams can be held for a grace period so ingest (and
+the update log) keep running until it reconnects and resumes.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+ROOM_PREFIX = "candles"
+
+
+def normalize_asset(asset: str) -> str:
+    """Same normalization as RealtimeDataStreaming._normalize_asset_name (EURUSD_otc -> EURUSDOTC)"""
+    return str(asset or '').replace('_', '').replace('/', '').replace(' ', '').upper()
+
+
+def room_name(asset: str, timeframe: int) -> str:
+    """Room for one stream, e.g. candles:EURUSDOTC:60"""
+    return f"{ROOM_PREFIX}:{normalize_asset(asset)}:{int(timeframe)}"
+
+
+class SubscriptionManager:
+    """Thread-safe client <-> (asset, timeframe) subscription registry"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # room -> subscribed sids
+        self._members: Dict[str, Set[str]] = {}
+        # sid -> rooms
+        self._client_rooms: Dict[str, Set[str]] = {}
+        # normalized asset -> {timeframe: room}
+        self._streams: Dict[str, Dict[int, str]] = {}
+        # normalized asset -> asset name as the client first spelled it
+        self._display_names: Dict[str, str] = {}
+        # room -> monotonic expiry of a stream kept alive after its last subscriber left
+        self._held: Dict[str, float] = {}
+
+    def subscribe(self, sid: str, asset: str, timeframe: int) -> str:
+        """
+        Add a client to a stream's room.
+
+        Returns:
+            The room name (the caller joins the Socket.IO room)
+        """
+        room = room_name(asset, timeframe)
+        key = normalize_asset(asset)
+        with self._lock:
+            self._members.setdefault(room, set()).add(sid)
+            self._client_rooms.setdefault(sid, set()).add(room)
+            self._streams.setdefault(key, {})[int(timeframe)] = room
+            self._display_names.setdefault(key, asset)
+            self._held.pop(room, None)
+        return room
+
+    def unsubscribe(self, sid: str, asset: Optional[str] = None, timeframe: Optional[int] = None) -> List[str]:
+        """
+        Remove a client from matching streams (all of its streams if asset is None).
+
+        Returns:
+            Rooms the client left
+        """
+        with self._lock:
+            rooms = self._client_rooms.get(sid, set())
+            if asset is not None:
+                prefix = f"{ROOM_PREFIX}:{normalize_asset(asset)}:"
+                rooms = {r for r in rooms if r.startswith(prefix)
+                         and (timeframe is None or r == room_name(asset, timeframe))}
+            left = sorted(rooms)
+            for room in left:
+                self._leave(sid, room)
+            return left
+
+    def remove_client(self, sid: str, hold_seconds: float = 0.0) -> List[str]:
+        """
+        Forget a disconnected client.
+
+        Args:
+            hold_seconds: Keep streams it was the last subscriber of for this long
+                (see expire_held), so a quick reconnect can resume them
+
+        Returns:
+            The rooms it was in
+        """
+        hold_until = time.monotonic() + hold_seconds if hold_seconds > 0 else None
+        with self._lock:
+            left = sorted(self._client_rooms.get(sid, ()))
+            for room in left:
+                self._leave(sid, room, hold_until)
+            return left
+
+    def expire_held(self, now: Optional[float] = None) -> List[str]:
+        """Drop held streams whose grace period is over; returns their rooms"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            expired = sorted(room for room, until in self._held.items() if until <= now)
+            for room in expired:
+                del self._held[room]
+                self._drop_stream(room)
+            return expired
+
+    def _leave(self, sid: str, room: str, hold_until: Optional[float] = None) -> None:
+        members = self._members.get(room)
+        if members is not None:
+            members.discard(sid)
+            if not members:
+                del self._members[room]
+                if hold_until is not None:
+                    self._held[room] = hold_until
+                else:
+                    self._drop_stream(room)
+        client_rooms = self._client_rooms.get(sid)
+        if client_rooms is not None:
+            client_rooms.discard(room)
+            if not client_rooms:
+                del self._client_rooms[sid]
+
+    def _drop_stream(self, room: str) -> None:
+        _, asset_key, timeframe = room.split(':')
+        streams = self._streams.get(asset_key, {})
+        streams.pop(int(timeframe), None)
+        if not streams:
+            self._streams.pop(asset_key, None)
+            self._display_names.pop(asset_key, None)
+
+    def rooms_for(self, asset: str) -> List[Tuple[int, str]]:
+        """(timeframe, room) pairs with at least one subscriber (or held) for asset"""
+        with self._lock:
+            return sorted(self._streams.get(normalize_asset(asset), {}).items())
+
+    def members(self, room: str) -> Set[str]:
+        with self._lock:
+            return set(self._members.get(room, ()))
+
+    def client_rooms(self, sid: str) -> List[str]:
+        with self._lock:
+            return sorted(self._client_rooms.get(sid, ()))
+
+    def assets(self) -> List[str]:
+        """Subscribed (or held) assets, as the clients named them"""
+        with self._lock:
+            return sorted(self._display_names.values())
+
+    def has_subscribers(self) -> bool:
+        with self._lock:
+            return bool(self._members)
+
+    def held(self) -> List[str]:
+        with self._lock:
+            return sorted(self._held)
+
+    def snapshot(self) -> Dict[str, int]:
+        """room -> subscriber count"""
+        with self._lock:
+            return {room: len(members) for room, members in sorted(self._members.items())}
@@ -0,0 +1,113 @@
+"""
+Update log module for streaming_server.py refactoring
+Keeps a sequence-numbered, bounded history of the candle_update / candle_closed
+events sent to each (asset, timeframe) room, so a reconnecting client can send
+its last seen sequence number and receive only what it missed.
+
+Each stream log is compacted per candle: a newer update of a candle replaces the
+older entry (with the new sequence number), so the buffer holds the latest state
+of the last `capacity` candles rather than the last `capacity` ticks. When the
+candles a client missed have already been evicted, since() returns None and the
+caller falls back to a full snapshot.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_LOG_CAPACITY = 500  # candles per stream
+
+
+class _StreamLog:
+    __slots__ = ('capacity', 'seq', 'evicted_seq', 'entries')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.seq = 0
+        # Highest sequence number no longer retained; clients behind it need a snapshot
+        self.evicted_seq = 0
+        # candle timestamp -> (seq, event, payload), in sequence order
+        self.entries: 'OrderedDict[Any, Tuple[int, str, Dict]]' = OrderedDict()
+
+    def record(self, event: str, payload: Dict) -> int:
+        self.seq += 1
+        ts = payload.get('timestamp')
+        self.entries.pop(ts, None)
+        self.entries[ts] = (self.seq, event, payload)
+        while len(self.entries) > self.capacity:
+            _, (evicted, _, _) = self.entries.popitem(last=False)
+            self.evicted_seq = max(self.evicted_seq, evicted)
+        return self.seq
+
+    def since(self, last_seq: int) -> Optional[List[Dict]]:
+        if last_seq > self.seq or last_seq < self.evicted_seq:
+            return None
+        return [{'seq': seq, 'event': event, 'candle': payload}
+                for seq, event, payload in self.entries.values() if seq > last_seq]
+
+
+class UpdateLog:
+    """
+    Per-stream sequence numbers and bounded delta history.
+
+    The epoch changes whenever the log is reset (server restart or backend
+    reset); sequence numbers from another epoch are never resumed.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_LOG_CAPACITY):
+        self.capacity = max(1, capacity)
+        self._lock = threading.Lock()
+        self._streams: Dict[str, _StreamLog] = {}
+        self.epoch = uuid.uuid4().hex[:12]
+
+    def record(self, stream: str, event: str, payload: Dict) -> int:
+        """
+        Append an emitted event for a stream (room name).
+
+        Returns:
+            The event's sequence number (also stored as payload['seq'])
+        """
+        with self._lock:
+            log = self._streams.get(stream)
+            if log is None:
+                log = self._streams[stream] = _StreamLog(self.capacity)
+            payload['seq'] = log.seq + 1
+            return log.record(event, payload)
+
+    def head(self, stream: str) -> int:
+        """Latest sequence number of a stream (0 if nothing was sent yet)"""
+        with self._lock:
+            log = self._streams.get(stream)
+            return log.seq if log else 0
+
+    def since(self, stream: str, last_seq: int, epoch: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Events after last_seq, oldest first, one per candle (its latest state).
+
+        Returns:
+            List of {'seq', 'event', 'candle'}, or None when the gap cannot be
+            covered (evicted, unknown stream, or another epoch) and a snapshot is needed
+        """
+        if epoch is not None and epoch != self.epoch:
+            return None
+        with self._lock:
+            log = self._streams.get(stream)
+            if log is None:
+                return [] if last_seq == 0 else None
+            return log.since(int(last_seq))
+
+    def reset(self) -> None:
+        """Drop all history and start a new epoch"""
+        with self._lock:
+            self._streams.clear()
+            self.epoch = uuid.uuid4().hex[:12]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'epoch': self.epoch,
+                'capacity': self.capacity,
+                'streams': {name: {'seq': log.seq, 'retained': len(log.entries), 'evicted_seq': log.evicted_seq}
+                            for name, log in sorted(self._streams.items())},
+            }
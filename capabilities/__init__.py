@@ -1,52 +1,35 @@
 from .base import Ctx, CapResult, Capability
 
-# Import all capability classes
-try:
-    from .data_streaming import RealtimeDataStreaming  # noqa: F401
-except ImportError:
-    RealtimeDataStreaming = None
-
-try:
-    from .session_scan import SessionScan  # noqa: F401
-except ImportError:
-    SessionScan = None
-
-try:
-    from .profile_scan import ProfileScan  # noqa: F401
-except ImportError:
-    ProfileScan = None
-
-try:
-    from .favorite_select import FavoriteSelect  # noqa: F401
-except ImportError:
-    FavoriteSelect = None
-
-try:
-    from .trade_click_cap import TradeClick  # noqa: F401
-except ImportError:
-    TradeClick = None
-
-try:
-    from .TF_dropdown_retract import TF_Dropdown_Retract  # noqa: F401
-except ImportError:
-    TF_Dropdown_Retract = None
-
-try:
-    from .timestamp_convert_utc import TimestampConvertUTC  # noqa: F401
-except ImportError:
-    TimestampConvertUTC = None
-
-try:
-    from .favorite_star_select import FavoriteStarSelect  # noqa: F401
-except ImportError:
-    FavoriteStarSelect = None
-
-try:
-    from .TF_dropdown_open_close_screenshot import TF_Dropdown_Open_Close_Screenshot  # noqa: F401
-except ImportError:
-    TF_Dropdown_Open_Close_Screenshot = None
-
-try:
-    from .take_screenshot import TakeScreenshot  # noqa: F401
-except ImportError:
-    TakeScreenshot = None
+# Capability classes are imported on first access (PEP 562), not with the package:
+# most of them pull in Selenium, which importing capabilities.candle_store or
+# capabilities.redis_integration should not pay for. A capability whose
+# dependencies are missing resolves to None, as before.
+_LAZY_CAPABILITIES = {
+    "RealtimeDataStreaming": ".data_streaming",
+    "SessionScan": ".session_scan",
+    "ProfileScan": ".profile_scan",
+    "FavoriteSelect": ".favorite_select",
+    "TradeClick": ".trade_click_cap",
+    "TF_Dropdown_Retract": ".TF_dropdown_retract",
+    "TimestampConvertUTC": ".timestamp_convert_utc",
+    "FavoriteStarSelect": ".favorite_star_select",
+    "TF_Dropdown_Open_Close_Screenshot": ".TF_dropdown_open_close_screenshot",
+    "TakeScreenshot": ".take_screenshot",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_CAPABILITIES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CAPABILITIES))
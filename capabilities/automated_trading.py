@@ -205,13 +205,13 @@ class AutomatedTrading(Capability):
         try:
             while not self.stop_event.is_set():
                 try:
-                    # Generate signals for each asset
+                    # Generate signals for every asset in one batch, then trade each
+                    signals_by_asset = self._generate_signals_for_assets(ctx, assets, strategy_id)
                     for asset in assets:
                         if self.stop_event.is_set():
                             break
 
-                        # Get signal for asset
-                        signal_result = self._generate_signal_for_asset(ctx, asset, strategy_id)
+                        signal_result = signals_by_asset.get(asset)
                         if signal_result and signal_result.get("signal"):
                             # Execute trade based on signal
                             self._execute_signal_trade(ctx, asset, signal_result, risk_settings)
@@ -236,40 +236,44 @@ class AutomatedTrading(Capability):
             self.is_running = False
             self.trading_stats["is_running"] = False
 
-    def _generate_signal_for_asset(self, ctx: Ctx, asset: str, strategy_id: str) -> Optional[Dict[str, Any]]:
-        """Generate trading signal for a specific asset."""
+    def _generate_signals_for_assets(self, ctx: Ctx, assets: List[str], strategy_id: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Generate the strongest trading signal per asset with one batch signal generation run."""
         try:
             # Import signal generation capability
             from .signal_generation import SignalGeneration
 
             signal_cap = SignalGeneration()
             result = signal_cap.run(ctx, {
-                "asset": asset,
+                "assets": assets,
                 "min_candles": 30,
                 "signal_types": ["SMA", "RSI"]
             })
 
-            if result.ok and result.data.get("signals"):
-                # Return the strongest signal
-                signals = result.data["signals"]
-                best_signal = None
-                best_confidence = 0.0
-
-                for signal_type, signal_data in signals.items():
-                    if isinstance(signal_data, dict) and signal_data.get("confidence", 0) > best_confidence:
-                        best_signal = {
-                            "type": signal_type,
-                            "signal": signal_data.get("signal"),
-                            "confidence": signal_data.get("confidence", 0)
-                        }
-                        best_confidence = signal_data.get("confidence", 0)
-
-                return best_signal
+            if result.ok:
+                return {asset: self._best_signal(entry.get("signals") or {})
+                        for asset, entry in result.data.get("assets", {}).items()}
 
         except Exception as e:
-            print(f"Signal generation error for {asset}: {e}")
+            print(f"Signal generation error for {', '.join(assets)}: {e}")
+
+        return {}
+
+    @staticmethod
+    def _best_signal(signals: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the strongest signal."""
+        best_signal = None
+        best_confidence = 0.0
+
+        for signal_type, signal_data in signals.items():
+            if isinstance(signal_data, dict) and signal_data.get("confidence", 0) > best_confidence:
+                best_signal = {
+                    "type": signal_type,
+                    "signal": signal_data.get("signal"),
+                    "confidence": signal_data.get("confidence", 0)
+                }
+                best_confidence = signal_data.get("confidence", 0)
 
-        return None
+        return best_signal
 
     def _execute_signal_trade(self, ctx: Ctx, asset: str, signal: Dict[str, Any], risk_settings: Dict[str, Any]):
         """Execute a trade based on signal."""
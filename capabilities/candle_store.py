@@ -0,0 +1,440 @@
+"""
+Array-backed candle storage for RealtimeDataStreaming.
+
+Each (asset, timeframe) pair owns a preallocated NumPy buffer of
+[timestamp, open, close, high, low] rows with a fixed retention cap, so a
+long-running session keeps a flat memory footprint. Tick updates are O(1),
+column views are zero-copy, and every buffer carries a monotonically
+increasing sequence number so consumers can pick up closed candles without
+relying on list indices (which shift once the cap is reached).
+
+CandleMap/CandleSeries keep the old CANDLES[asset] dict-of-lists interface
+working on top of the store.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+CANDLE_FIELDS = ("timestamp", "open", "close", "high", "low")
+TS, OPEN, CLOSE, HIGH, LOW = range(5)
+
+DEFAULT_CAPACITY = 10_000  # ~7 days of 1m candles per asset/timeframe
+
+# Timeframe labels (as used by the GUI and CSV file names) to seconds
+TIMEFRAME_SECONDS = {
+    "1m": 60, "2m": 120, "3m": 180, "5m": 300, "10m": 600, "15m": 900, "30m": 1800,
+    "1h": 3600, "4h": 14400, "1d": 86400,
+}
+DEFAULT_TIMEFRAMES = (60, 300, 900, 3600, 14400)  # 1m, 5m, 15m, 1h, 4h
+
+
+def _row_to_list(row: np.ndarray) -> List[Any]:
+    values = row.tolist()
+    values[TS] = int(values[TS])
+    return values
+
+
+def _as_rows(rows: Any) -> np.ndarray:
+    """Coerce candle rows ([ts, open, close, high, low, ...]) to an (n, 5) float array"""
+    if isinstance(rows, CandleSeries):
+        return rows.array()
+    if rows is None or not len(rows):
+        return np.empty((0, len(CANDLE_FIELDS)), dtype=np.float64)
+    array = np.asarray(rows, dtype=np.float64)
+    if array.ndim != 2 or array.shape[1] < len(CANDLE_FIELDS):
+        raise ValueError("candle rows must have at least 5 columns")
+    return array[:, :len(CANDLE_FIELDS)]
+
+
+def aggregate_ticks(timestamps: Any, prices: Any, period: int) -> np.ndarray:
+    """
+    Build OHLC candles from (timestamp, price) points in a single vectorised pass.
+
+    Points are ordered by timestamp (stable, so equal timestamps keep arrival
+    order) and grouped by period start; open/close are the first/last price in
+    each group and high/low come from reduceat.
+
+    Returns:
+        (n, 5) array of [period_start, open, close, high, low], oldest first
+    """
+    ts = np.asarray(timestamps, dtype=np.float64)
+    values = np.asarray(prices, dtype=np.float64)
+    if not len(ts):
+        return np.empty((0, len(CANDLE_FIELDS)), dtype=np.float64)
+
+    if len(ts) > 1 and np.any(ts[1:] < ts[:-1]):
+        order = np.argsort(ts, kind="stable")
+        ts, values = ts[order], values[order]
+
+    starts = (np.floor(ts) // period) * period if period else np.floor(ts)
+    firsts = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    lasts = np.r_[firsts[1:] - 1, len(ts) - 1]
+
+    candles = np.empty((len(firsts), len(CANDLE_FIELDS)), dtype=np.float64)
+    candles[:, TS] = starts[firsts]
+    candles[:, OPEN] = values[firsts]
+    candles[:, CLOSE] = values[lasts]
+    candles[:, HIGH] = np.maximum.reduceat(values, firsts)
+    candles[:, LOW] = np.minimum.reduceat(values, firsts)
+    return candles
+
+
+def parse_timeframes(spec: Any) -> Tuple[int, ...]:
+    """
+    Parse "1m,5m,1h" (or an iterable of labels/seconds) into sorted unique seconds.
+
+    Plain numbers ("90") are seconds, so format_timeframes output always parses back.
+
+    Raises:
+        ValueError: for unknown labels or non-positive values
+    """
+    if spec is None:
+        return ()
+    items = spec.split(",") if isinstance(spec, str) else spec
+    seconds = set()
+    for item in items:
+        if isinstance(item, str):
+            item = item.strip().lower()
+            if not item:
+                continue
+            if not item.isdigit():
+                if item not in TIMEFRAME_SECONDS:
+                    raise ValueError(f"unknown timeframe '{item}' (expected one of {', '.join(TIMEFRAME_SECONDS)})")
+                item = TIMEFRAME_SECONDS[item]
+        value = int(item)
+        if value <= 0:
+            raise ValueError(f"timeframe must be positive, got {item}")
+        seconds.add(value)
+    return tuple(sorted(seconds))
+
+
+_TIMEFRAME_LABELS = {seconds: label for label, seconds in TIMEFRAME_SECONDS.items()}
+
+
+def format_timeframes(timeframes: Iterable[int]) -> str:
+    """Inverse of parse_timeframes: (60, 3600, 14400) -> "1m,1h,4h" (seconds without a label stay numeric)"""
+    return ",".join(_TIMEFRAME_LABELS.get(int(tf), str(int(tf))) for tf in timeframes)
+
+
+def resample_candles(candles: Any, timeframe: int) -> np.ndarray:
+    """Roll candles up into a coarser timeframe (first open, last close, max high, min low)"""
+    rows = _as_rows(candles)
+    if not len(rows):
+        return np.empty((0, len(CANDLE_FIELDS)), dtype=np.float64)
+
+    starts = (rows[:, TS] // timeframe) * timeframe
+    firsts = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+    lasts = np.r_[firsts[1:] - 1, len(rows) - 1]
+
+    out = np.empty((len(firsts), len(CANDLE_FIELDS)), dtype=np.float64)
+    out[:, TS] = starts[firsts]
+    out[:, OPEN] = rows[firsts, OPEN]
+    out[:, CLOSE] = rows[lasts, CLOSE]
+    out[:, HIGH] = np.maximum.reduceat(rows[:, HIGH], firsts)
+    out[:, LOW] = np.minimum.reduceat(rows[:, LOW], firsts)
+    return out
+
+
+def merge_candles(older: Any, newer: Any) -> np.ndarray:
+    """
+    Merge two candle sets into one sorted set without duplicate timestamps.
+
+    Where both contain a timestamp, the older candle keeps its open, the newer
+    one supplies the close and the high/low range is widened to cover both.
+    """
+    older = _as_rows(older)
+    newer = _as_rows(newer)
+    if not len(newer):
+        return np.array(older, dtype=np.float64)
+    if not len(older):
+        return np.array(newer, dtype=np.float64)
+
+    merged = np.array(older, dtype=np.float64)
+    _, oi, ni = np.intersect1d(merged[:, TS], newer[:, TS], return_indices=True)
+    if len(oi):
+        merged[oi, CLOSE] = newer[ni, CLOSE]
+        merged[oi, HIGH] = np.maximum(merged[oi, HIGH], newer[ni, HIGH])
+        merged[oi, LOW] = np.minimum(merged[oi, LOW], newer[ni, LOW])
+
+    extra = np.ones(len(newer), dtype=bool)
+    extra[ni] = False
+    merged = np.concatenate([merged, newer[extra]])
+    return merged[np.argsort(merged[:, TS], kind="stable")]
+
+
+class CandleBuffer:
+    """Ring buffer of candles for one asset/timeframe.
+
+    Storage is 2x capacity and the live window is compacted back to the start
+    when it reaches the end, which keeps every view contiguous at an amortised
+    O(1) cost per append. Views returned by array()/column() are valid until
+    the next append or load.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self._data = np.zeros((capacity * 2, len(CANDLE_FIELDS)), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+        self.total = 0  # candles ever appended; the next candle gets sequence number `total`
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def seq_start(self) -> int:
+        """Sequence number of the oldest retained candle"""
+        return self.total - len(self)
+
+    @property
+    def closed_seq(self) -> int:
+        """Number of candles closed so far (every candle but the forming one)"""
+        return max(0, self.total - 1)
+
+    def array(self) -> np.ndarray:
+        """(n, 5) view of the retained candles, oldest first"""
+        return self._data[self._start:self._end]
+
+    def column(self, name: str) -> np.ndarray:
+        return self._data[self._start:self._end, CANDLE_FIELDS.index(name)]
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        window = self._data[self._start:self._end]
+        return {name: window[:, i] for i, name in enumerate(CANDLE_FIELDS)}
+
+    def last(self) -> Optional[List[Any]]:
+        if self._end == self._start:
+            return None
+        return _row_to_list(self._data[self._end - 1])
+
+    def row(self, index: int) -> List[Any]:
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("candle index out of range")
+        return _row_to_list(self._data[self._start + index])
+
+    def append(self, ts: float, open_price: float, close_price: float, high_price: float, low_price: float) -> None:
+        if self._end == len(self._data):
+            self._compact()
+        self._data[self._end] = (ts, open_price, close_price, high_price, low_price)
+        self._end += 1
+        self.total += 1
+        if self._end - self._start > self.capacity:
+            self._start += 1
+
+    def update_last(self, price: float) -> None:
+        """Fold a price into the forming candle's close/high/low"""
+        row = self._data[self._end - 1]
+        row[CLOSE] = price
+        if price > row[HIGH]:
+            row[HIGH] = price
+        if price < row[LOW]:
+            row[LOW] = price
+
+    def update_tick(self, candle_start: float, price: float) -> bool:
+        """
+        Apply a tick whose aligned period start is candle_start.
+
+        Returns:
+            True if the tick opened a new candle (closing the previous one)
+        """
+        if self._end == self._start or candle_start > self._data[self._end - 1, TS]:
+            self.append(candle_start, price, price, price, price)
+            return True
+        self.update_last(price)
+        return False
+
+    def load(self, rows: Any) -> None:
+        """Replace the contents with rows of [timestamp, open, close, high, low, ...]"""
+        array = _as_rows(rows)[-self.capacity:]
+        n = len(array)
+        self._data[:n] = array
+        self._start = 0
+        self._end = n
+        self.total += n
+
+    def closed_since(self, seq: int) -> Tuple[np.ndarray, int]:
+        """
+        Closed candles with sequence number >= seq that are still retained.
+
+        Returns:
+            (view of rows, sequence number to pass next time)
+        """
+        closed_end = len(self) - 1
+        if closed_end <= 0:
+            return self._data[self._start:self._start], max(seq, self.closed_seq)
+        offset = min(max(0, seq - self.seq_start), closed_end)
+        return self._data[self._start + offset:self._start + closed_end], self.closed_seq
+
+    def to_list(self) -> List[List[Any]]:
+        rows = self.array().tolist()
+        for row in rows:
+            row[TS] = int(row[TS])
+        return rows
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def _compact(self) -> None:
+        n = self._end - self._start
+        self._data[:n] = self._data[self._start:self._end]
+        self._start = 0
+        self._end = n
+
+
+class CandleStore:
+    """CandleBuffers keyed by (asset, timeframe seconds)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._buffers: Dict[Tuple[str, int], CandleBuffer] = {}
+
+    def get(self, asset: str, timeframe: int) -> Optional[CandleBuffer]:
+        return self._buffers.get((asset, timeframe))
+
+    def buffer(self, asset: str, timeframe: int) -> CandleBuffer:
+        """Return the buffer for asset/timeframe, creating it on first use"""
+        key = (asset, timeframe)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = CandleBuffer(self.capacity)
+        return buf
+
+    def update_tick(self, asset: str, timeframe: int, tstamp: float, price: float) -> bool:
+        """Align tstamp to the timeframe and fold the price into the right candle"""
+        candle_start = (tstamp // timeframe) * timeframe if timeframe else tstamp
+        return self.buffer(asset, timeframe).update_tick(candle_start, price)
+
+    def update_tick_multi(self, asset: str, timeframes: Iterable[int], tstamp: float, price: float) -> List[int]:
+        """
+        Fold one tick into several timeframes at once.
+
+        Returns:
+            Timeframes in which the tick opened a new candle (closing the previous one)
+        """
+        opened = []
+        for timeframe in timeframes:
+            if self.update_tick(asset, timeframe, tstamp, price):
+                opened.append(timeframe)
+        return opened
+
+    def replace(self, asset: str, timeframe: int, rows: Any) -> CandleBuffer:
+        buf = self.buffer(asset, timeframe)
+        buf.load(rows)
+        return buf
+
+    def remove(self, asset: str, timeframe: Optional[int] = None) -> None:
+        for key in [k for k in self._buffers if k[0] == asset and (timeframe is None or k[1] == timeframe)]:
+            del self._buffers[key]
+
+    def keys(self, timeframe: Optional[int] = None) -> List[Tuple[str, int]]:
+        return [k for k in self._buffers if timeframe is None or k[1] == timeframe]
+
+    def assets(self, timeframe: Optional[int] = None) -> List[str]:
+        return [asset for asset, tf in self.keys(timeframe)]
+
+    def clear(self) -> None:
+        self._buffers.clear()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buf.nbytes for buf in self._buffers.values())
+
+
+class CandleSeries(Sequence):
+    """List-like view of one CandleBuffer (rows come back as [ts, open, close, high, low] lists)"""
+
+    def __init__(self, buffer: CandleBuffer):
+        self.buffer = buffer
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = self.buffer.array()[index].tolist()
+            for row in rows:
+                row[TS] = int(row[TS])
+            return rows
+        return self.buffer.row(index)
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        return iter(self.buffer.to_list())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CandleSeries):
+            other = other.to_list()
+        return self.buffer.to_list() == other
+
+    def __repr__(self) -> str:
+        return f"CandleSeries({len(self)} candles)"
+
+    def append(self, row: Iterable[Any]) -> None:
+        self.buffer.append(*list(row)[:len(CANDLE_FIELDS)])
+
+    def array(self) -> np.ndarray:
+        return self.buffer.array()
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return self.buffer.columns()
+
+    def to_list(self) -> List[List[Any]]:
+        return self.buffer.to_list()
+
+    @property
+    def closed_seq(self) -> int:
+        return self.buffer.closed_seq
+
+    def closed_since(self, seq: int) -> Tuple[np.ndarray, int]:
+        return self.buffer.closed_since(seq)
+
+
+class CandleMap(MutableMapping):
+    """
+    Dict-style view of a CandleStore at one timeframe, standing in for the old
+    CANDLES: Dict[str, List[List]] attribute. The timeframe is read through a
+    callable so the view follows RealtimeDataStreaming.PERIOD.
+    """
+
+    def __init__(self, store: CandleStore, timeframe: Callable[[], int]):
+        self.store = store
+        self._timeframe = timeframe
+
+    def __getitem__(self, asset: str) -> CandleSeries:
+        buf = self.store.get(asset, self._timeframe())
+        if buf is None:
+            raise KeyError(asset)
+        return CandleSeries(buf)
+
+    def __setitem__(self, asset: str, rows: Any) -> None:
+        self.store.replace(asset, self._timeframe(), rows)
+
+    def __delitem__(self, asset: str) -> None:
+        if self.store.get(asset, self._timeframe()) is None:
+            raise KeyError(asset)
+        self.store.remove(asset, self._timeframe())
+
+    def __contains__(self, asset) -> bool:
+        return self.store.get(asset, self._timeframe()) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.assets(self._timeframe()))
+
+    def __len__(self) -> int:
+        return len(self.store.keys(self._timeframe()))
+
+    def __repr__(self) -> str:
+        return f"CandleMap(timeframe={self._timeframe()}, assets={list(self)})"
+
+    def to_dict(self) -> Dict[str, List[List[Any]]]:
+        """Plain dict-of-lists copy (for JSON export)"""
+        return {asset: self[asset].to_list() for asset in self}
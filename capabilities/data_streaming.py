@@ -3,17 +3,20 @@ import base64
 import binascii
 import json
 import os
-import re
 from datetime import datetime, timezone
 import time as time_mod
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.common.by import By
 
 try:
     # Try relative import first (when used as module)
     from .base import CapResult, Capability, Ctx, add_utils_to_syspath, save_json, timestamp
+    from .frame_decoder import FrameDecoder
+    from .candle_store import CandleMap, CandleSeries, CandleStore, aggregate_ticks, merge_candles, parse_timeframes, resample_candles
+    from .tick_buffer import TickBuffer
 except ImportError:
     # Fallback for standalone execution
     import sys
@@ -23,6 +26,9 @@ except ImportError:
     if str(api_root) not in sys.path:
         sys.path.insert(0, str(api_root))
     from capabilities.base import CapResult, Capability, Ctx, add_utils_to_syspath, save_json, timestamp
+    from capabilities.frame_decoder import FrameDecoder
+    from capabilities.candle_store import CandleMap, CandleSeries, CandleStore, aggregate_ticks, merge_candles, parse_timeframes, resample_candles
+    from capabilities.tick_buffer import TickBuffer
 
 add_utils_to_syspath()
 
@@ -32,13 +38,18 @@ class RealtimeDataStreaming(Capability):
 
     def __init__(self):
         # Global state management following po_bot_v2.py methodology
-        self.CANDLES: Dict[str, List[List[Any]]] = {}  # asset -> [[timestamp, open, close, high, low], ...]
+        # Candle ring buffers per (asset, timeframe); CANDLES is a dict-style view at PERIOD
+        self.candle_store = CandleStore()
+        self._candle_map = CandleMap(self.candle_store, lambda: self.PERIOD)
         self.PERIOD: int = 60  # Default period in seconds (1 minute)
         # When locked, PERIOD should not be overridden by incoming chart settings.
         # This helps force a 1m stream when the platform UI reports an unexpected timeframe.
         self.PERIOD_LOCKED: bool = False
+        # Additional timeframes (seconds) aggregated from the same ticks alongside PERIOD
+        self.TIMEFRAMES: Tuple[int, ...] = ()
         self.CURRENT_ASSET: Optional[str] = None
-        self.realtime_asset_data: List[Dict[str, Any]] = []
+        # Bounded (asset, timestamp, price) tick history; raw frames are not kept by default
+        self.tick_buffer = TickBuffer()
         self.current_asset_prices: Dict[str, Any] = {}  # To store the latest price for each asset
         self.SESSION_ID = None
         self.USER_ID = None
@@ -51,6 +62,48 @@ class RealtimeDataStreaming(Capability):
         self.CANDLE_ONLY_MODE: bool = False
         self.TICK_ONLY_MODE: bool = False
         self.ASSET_FOCUS_MODE: bool = False
+        self.FOCUS_ASSETS: set = set()  # Normalized names of every focused asset
+        
+        # Single-pass WebSocket frame decoder
+        self.frame_decoder = FrameDecoder()
+
+    @property
+    def CANDLES(self) -> CandleMap:
+        """asset -> [[timestamp, open, close, high, low], ...] at the current PERIOD"""
+        return self._candle_map
+
+    @CANDLES.setter
+    def CANDLES(self, candles: Dict[str, List[List[Any]]]) -> None:
+        self.candle_store.clear()
+        for asset, rows in candles.items():
+            self._candle_map[asset] = rows
+
+    @property
+    def realtime_asset_data(self) -> List[Dict[str, Any]]:
+        """Retained ticks as {timestamp, asset, price, raw_timestamp} dicts (built on access)"""
+        return self.tick_buffer.to_records()
+
+    def set_raw_frame_capture(self, enabled: bool) -> None:
+        """Keep the raw payload alongside each tick (off by default; clears tick history)"""
+        self.tick_buffer = TickBuffer(self.tick_buffer.capacity, keep_raw=enabled)
+
+    def get_recent_ticks(self, asset: Optional[str] = None, count: int = 100) -> List[Dict[str, Any]]:
+        """Last `count` ticks, optionally for one asset (normalized name match)"""
+        if asset is not None:
+            asset = self._resolve_tick_asset(asset)
+            if asset is None:
+                return []
+        return self.tick_buffer.to_records(count, asset)
+
+    def _resolve_tick_asset(self, asset: str) -> Optional[str]:
+        assets = self.tick_buffer.assets()
+        if asset in assets:
+            return asset
+        normalized = self._normalize_asset_name(asset)
+        for name in assets:
+            if self._normalize_asset_name(name) == normalized:
+                return name
+        return None
 
     # ========================================
     # Helper Methods
@@ -91,12 +144,40 @@ class RealtimeDataStreaming(Capability):
         """
         self.ASSET_FOCUS_MODE = True
         self.CURRENT_ASSET = asset
+        self.FOCUS_ASSETS = {self._normalize_asset_name(asset)}
+    
+    def set_focus_assets(self, assets: List[str]) -> None:
+        """
+        Focus on several assets at once (e.g. one per subscribed GUI client).
+        CURRENT_ASSET stays if it is still focused, else becomes the first asset.
+        An empty list releases focus.
+        
+        Args:
+            assets: Asset symbols to keep; ticks for any other asset are filtered out
+        """
+        assets = list(assets)
+        if not assets:
+            self.release_asset_focus()
+            return
+        self.FOCUS_ASSETS = {self._normalize_asset_name(asset) for asset in assets}
+        self.ASSET_FOCUS_MODE = True
+        if not self.CURRENT_ASSET or self._normalize_asset_name(self.CURRENT_ASSET) not in self.FOCUS_ASSETS:
+            self.CURRENT_ASSET = assets[0]
     
     def release_asset_focus(self) -> None:
         """
         Disable asset focus mode, allowing the capability to auto-sync with Pocket Option UI.
         """
         self.ASSET_FOCUS_MODE = False
+        self.FOCUS_ASSETS = set()
+    
+    def _is_outside_focus(self, asset: Optional[str]) -> bool:
+        """True if asset focus mode is on and asset is not one of the focused assets"""
+        if not (self.ASSET_FOCUS_MODE and asset):
+            return False
+        if self.FOCUS_ASSETS:
+            return self._normalize_asset_name(asset) not in self.FOCUS_ASSETS
+        return bool(self.CURRENT_ASSET) and self._normalize_asset_name(asset) != self._normalize_asset_name(self.CURRENT_ASSET)
     
     def set_timeframe(self, minutes: int, lock: bool = True) -> None:
         """
@@ -116,6 +197,36 @@ class RealtimeDataStreaming(Capability):
         """
         self.PERIOD_LOCKED = False
     
+    def set_timeframes(self, timeframes: Any) -> None:
+        """
+        Aggregate extra timeframes from every tick, in addition to PERIOD.
+        
+        Args:
+            timeframes: "1m,5m,15m,1h,4h", a list of labels, or seconds; empty disables
+        """
+        self.TIMEFRAMES = parse_timeframes(timeframes)
+    
+    def get_timeframes(self) -> List[int]:
+        """All timeframes (seconds) being built, PERIOD first."""
+        return [self.PERIOD] + [tf for tf in self.TIMEFRAMES if tf != self.PERIOD]
+    
+    def get_timeframe_candles(self, asset: str, timeframe: int):
+        """
+        Get candles for an asset at any aggregated timeframe (seconds).
+        Uses normalized asset name matching to handle format variations.
+        
+        Returns:
+            CandleSeries of [timestamp, open, close, high, low], or [] if none
+        """
+        buf = self.candle_store.get(asset, timeframe)
+        if buf is None:
+            normalized_asset = self._normalize_asset_name(asset)
+            for stored_asset in self.candle_store.assets(timeframe):
+                if self._normalize_asset_name(stored_asset) == normalized_asset:
+                    buf = self.candle_store.get(stored_asset, timeframe)
+                    break
+        return CandleSeries(buf) if buf is not None else []
+    
     def get_latest_candle(self, asset: str) -> Optional[List[Any]]:
         """
         Get the latest candle for a specific asset.
@@ -128,8 +239,9 @@ class RealtimeDataStreaming(Capability):
             Latest candle as [timestamp, open, close, high, low] or None
         """
         # Try direct lookup first (fast path)
-        if asset in self.CANDLES and self.CANDLES[asset]:
-            return self.CANDLES[asset][-1]
+        candles = self.candle_store.get(asset, self.PERIOD)
+        if candles is not None and len(candles):
+            return candles.last()
         
         # If not found, try normalized matching (handles format differences)
         normalized_asset = self._normalize_asset_name(asset)
@@ -260,62 +372,15 @@ class RealtimeDataStreaming(Capability):
     # ========================================
 
     def _decode_and_parse_payload(self, encoded_payload: str) -> Optional[Any]:
-        """Decodes a base64 payload and parses it as JSON."""
+        """Decodes a base64 payload and parses it as JSON (single pass, see frame_decoder)."""
         try:
-            decoded_payload = base64.b64decode(encoded_payload).decode('utf-8')
-            
-            # Handle Socket.IO prefixes and event arrays
-            decoded_payload = self._handle_socketio_format(decoded_payload)
-            
-            # Try to load as JSON directly
-            return self._parse_json_payload(decoded_payload)
-                
-        except (UnicodeDecodeError, json.JSONDecodeError, ValueError) as e:
-            if self.ctx and self.ctx.verbose:
+            return self.frame_decoder.parse_payload(encoded_payload)
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError, ValueError) as e:
+            ctx = getattr(self, 'ctx', None)
+            if ctx and ctx.verbose:
                 print(f"⚠️ Payload decode error: {e}")
             return None
 
-    def _handle_socketio_format(self, payload: str) -> str:
-        """Handle Socket.IO prefixes and event arrays."""
-        if not payload or not payload[0].isdigit():
-            return payload
-            
-        # Remove numeric prefix
-        match = re.match(r'^\d+', payload)
-        if match:
-            payload = payload[match.end():]
-        
-        # Handle Socket.IO event arrays like 42["event", data]
-        if payload.startswith('["') and ']' in payload:
-            event_match = re.match(r'\["([^"]+)"(?:,\s*(.+))?\]', payload)
-            if event_match:
-                event_name = event_match.group(1)
-                data_str = event_match.group(2) if event_match.group(2) else '[]'
-                try:
-                    data = json.loads(data_str) if data_str else {}
-                    # For Socket.IO events, we return a dict with event name and data
-                    # This is a special case that should be handled by the caller
-                    return json.dumps({"event": event_name, "data": data})
-                except json.JSONDecodeError:
-                    pass
-                    
-        return payload
-
-    def _parse_json_payload(self, payload: str) -> Optional[Any]:
-        """Parse JSON payload with fallback options."""
-        try:
-            return json.loads(payload)
-        except json.JSONDecodeError:
-            # If fails, try stripping outer array if present
-            if payload.startswith('[') and payload.endswith(']'):
-                inner = payload[1:-1]
-                try:
-                    parsed = json.loads(inner)
-                    return [parsed] if isinstance(parsed, dict) else parsed
-                except json.JSONDecodeError:
-                    pass
-            raise
-
     def _process_session_message(self, message: Dict[str, Any], ctx: Ctx) -> None:
         """Process session/connection and authentication messages with flexible parsing."""
         try:
@@ -540,7 +605,7 @@ class RealtimeDataStreaming(Capability):
                 
                 # Asset filtering: Skip if asset focus mode is enabled and asset doesn't match current asset
                 # Use normalized comparison to handle format differences (USDJPY_otc vs USDJPYOTC)
-                if self.ASSET_FOCUS_MODE and self.CURRENT_ASSET and self._normalize_asset_name(asset) != self._normalize_asset_name(self.CURRENT_ASSET):
+                if self._is_outside_focus(asset):
                     if ctx.verbose:
                         print(f"🔍 [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Filtering out historical data for {asset} (focus on {self.CURRENT_ASSET})")
                     return
@@ -551,41 +616,37 @@ class RealtimeDataStreaming(Capability):
                     if ctx.verbose:
                         print(f"🎯 [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Current asset synced: {asset}")
                 
-                # Process candles
-                candles = []
-                if 'candles' in data:
-                    candles = list(reversed(data['candles']))
+                # Snapshot candles (newest first in the payload)
+                candles = np.empty((0, 5))
+                if 'candles' in data and data['candles']:
+                    candles = np.asarray(data['candles'][::-1], dtype=np.float64)[:, :5]
                 
-                # Process history points
-                for tstamp, value in data['history']:
-                    tstamp = int(float(tstamp))
-                    # Find or create candle for this timestamp
-                    candle_start = (tstamp // self.PERIOD) * self.PERIOD if self.PERIOD else tstamp
-                    
-                    # Find existing candle or create new one
-                    existing_candle = None
-                    for c in candles:
-                        if c[0] == candle_start:
-                            existing_candle = c
-                            break
-                    
-                    if existing_candle:
-                        # Update existing candle
-                        existing_candle[2] = value  # close
-                        if value > existing_candle[3]:
-                            existing_candle[3] = value  # high
-                        if value < existing_candle[4]:
-                            existing_candle[4] = value  # low
-                    else:
-                        # Create new candle
-                        candles.append([candle_start, value, value, value, value])
+                # Aggregate history points in one vectorised pass, then fold into the snapshot
+                history = np.asarray(data['history'], dtype=np.float64).reshape(-1, 2)
+                candles = merge_candles(candles, aggregate_ticks(history[:, 0], history[:, 1], self.PERIOD))
                 
-                # Sort candles by timestamp
-                candles.sort(key=lambda x: x[0])
+                # Keep live candles formed since the snapshot (no duplicate timestamps)
+                live = self.candle_store.get(asset, self.PERIOD)
+                if live is not None and len(live):
+                    candles = merge_candles(candles, live.array())
                 
                 # Store candles
                 self.CANDLES[asset] = candles
                 
+                # Seed the additional timeframes from the same snapshot
+                for timeframe in self.TIMEFRAMES:
+                    if timeframe == self.PERIOD:
+                        continue
+                    if self.PERIOD and timeframe % self.PERIOD == 0:
+                        # Coarser timeframe: roll up the merged PERIOD candles
+                        tf_candles = resample_candles(candles, timeframe)
+                    else:
+                        tf_candles = aggregate_ticks(history[:, 0], history[:, 1], timeframe)
+                    tf_live = self.candle_store.get(asset, timeframe)
+                    if tf_live is not None and len(tf_live):
+                        tf_candles = merge_candles(tf_candles, tf_live.array())
+                    self.candle_store.replace(asset, timeframe, tf_candles)
+                
                 if ctx.verbose:
                     print(f"📊 [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Processed {len(candles)} candles for {asset}")
 
@@ -627,61 +688,40 @@ class RealtimeDataStreaming(Capability):
                 tstamp = int(time_mod.time())
                 asset = self.CURRENT_ASSET or 'Unknown'
             
-            # CRITICAL FIX: Asset filtering BEFORE processing
-            # Skip this update if asset focus mode is enabled and this isn't the focused asset
-            # Use normalized comparison to handle format differences (USDJPY_otc vs USDJPYOTC)
-            if self.ASSET_FOCUS_MODE and self.CURRENT_ASSET and asset and self._normalize_asset_name(asset) != self._normalize_asset_name(self.CURRENT_ASSET):
-                if ctx.verbose:
-                    print(f"🔍 [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Filtering out {asset} (focus on {self.CURRENT_ASSET})")
-                return
-            
-            if asset and current_value is not None and tstamp is not None:
-                # Update or create candles
-                if asset not in self.CANDLES:
-                    self.CANDLES[asset] = []
-                
-                candles = self.CANDLES[asset]
-                
-                # Align timestamp to period boundary (round down to :00 seconds)
-                candle_start = (tstamp // self.PERIOD) * self.PERIOD if self.PERIOD else tstamp
-                
-                if not candles:
-                    # Initialize with first candle using aligned timestamp
-                    candles.append([candle_start, current_value, current_value, current_value, current_value])
-                else:
-                    # Check if we've crossed into a new candle period
-                    last_candle_start = candles[-1][0]
-                    
-                    if candle_start > last_candle_start:
-                        # New candle period - create new candle with aligned timestamp
-                        candles.append([candle_start, current_value, current_value, current_value, current_value])
-                        if ctx.verbose:
-                            print(f"📈 New candle created for {asset} at {datetime.fromtimestamp(candle_start, tz=timezone.utc).strftime('%H:%M:%S')}")
-                    else:
-                        # Same candle period - update last candle
-                        candles[-1][2] = current_value  # close
-                        candles[-1][3] = max(candles[-1][3], current_value)  # high
-                        candles[-1][4] = min(candles[-1][4], current_value)  # low
-                
-                # Store real-time update
-                self.realtime_asset_data.append({
-                    "timestamp": datetime.fromtimestamp(tstamp, tz=timezone.utc).isoformat().replace('+00:00', 'Z'),
-                    "asset": asset,
-                    "price": current_value,
-                    "raw_timestamp": tstamp,
-                    "raw_payload": data
-                })
-                if len(self.realtime_asset_data) > 10000:
-                    self.realtime_asset_data = self.realtime_asset_data[-10000:]
-                self.current_asset_prices[asset] = {"price": current_value, "timestamp": tstamp}
-                
-                if ctx.verbose:
-                    print(f"💰 [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Real-time update for {asset}: {current_value} at {tstamp}")
+            self._process_tick(asset, tstamp, current_value, data, ctx)
                     
         except (ValueError, TypeError) as e:
             if ctx.verbose:
                 print(f"❌ [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Error processing real-time update: {e} for payload {data}")
 
+    def _process_tick(self, asset: Optional[str], tstamp: Optional[int], current_value: Any, data: Any, ctx: Ctx) -> None:
+        """Apply one tick to the candle series of its asset (focus filter, OHLC update, price cache)."""
+        # CRITICAL FIX: Asset filtering BEFORE processing
+        # Skip this update if asset focus mode is enabled and this isn't the focused asset
+        # Use normalized comparison to handle format differences (USDJPY_otc vs USDJPYOTC)
+        if self._is_outside_focus(asset):
+            if ctx.verbose:
+                print(f"🔍 [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Filtering out {asset} (focus on {self.CURRENT_ASSET})")
+            return
+        
+        if asset and current_value is not None and tstamp is not None:
+            # Update or create candle (timestamp aligned to period boundary)
+            if self.candle_store.update_tick(asset, self.PERIOD, tstamp, current_value) and ctx.verbose:
+                candle_start = (tstamp // self.PERIOD) * self.PERIOD if self.PERIOD else tstamp
+                print(f"📈 New candle created for {asset} at {datetime.fromtimestamp(candle_start, tz=timezone.utc).strftime('%H:%M:%S')}")
+            
+            # Same tick feeds every additional timeframe
+            for timeframe in self.TIMEFRAMES:
+                if timeframe != self.PERIOD:
+                    self.candle_store.update_tick(asset, timeframe, tstamp, current_value)
+            
+            # Store real-time update (fixed-size ring, oldest ticks overwritten)
+            self.tick_buffer.append(asset, tstamp, current_value, data)
+            self.current_asset_prices[asset] = {"price": current_value, "timestamp": tstamp}
+            
+            if ctx.verbose:
+                print(f"💰 [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Real-time update for {asset}: {current_value} at {tstamp}")
+
     def _stream_realtime_update(self, data: List[Any], ctx: Ctx) -> None:
         """Process and immediately output real-time price updates for streaming mode."""
         try:
@@ -692,7 +732,7 @@ class RealtimeDataStreaming(Capability):
             
             # Asset filtering: Skip if asset focus mode is enabled and asset doesn't match current asset
             # Use normalized comparison to handle format differences (USDJPY_otc vs USDJPYOTC)
-            if self.ASSET_FOCUS_MODE and self.CURRENT_ASSET and self._normalize_asset_name(asset) != self._normalize_asset_name(self.CURRENT_ASSET):
+            if self._is_outside_focus(asset):
                 if ctx.verbose:
                     print(f"🔍 [{timestamp_str}] Filtering out {asset} (focus on {self.CURRENT_ASSET})")
                 return
@@ -723,19 +763,15 @@ class RealtimeDataStreaming(Capability):
 
     def _update_candles(self, asset: str, current_value: float, tstamp: int, timestamp_str: str) -> None:
         """Update candle data for the asset."""
-        if asset in self.CANDLES and self.CANDLES[asset]:
-            candles = self.CANDLES[asset]
-            candles[-1][2] = current_value  # set close
-            if current_value > candles[-1][3]:  # set high
-                candles[-1][3] = current_value
-            if current_value < candles[-1][4]:  # set low
-                candles[-1][4] = current_value
+        candles = self.candle_store.get(asset, self.PERIOD)
+        if candles is not None and len(candles):
+            candles.update_last(current_value)  # set close/high/low
             
             # Check if we need to create a new candle
             candle_boundary = (tstamp // self.PERIOD) * self.PERIOD
-            last_boundary = (candles[-1][0] // self.PERIOD) * self.PERIOD
+            last_boundary = (candles.last()[0] // self.PERIOD) * self.PERIOD
             if candle_boundary > last_boundary:
-                candles.append([tstamp, current_value, current_value, current_value, current_value])
+                candles.append(tstamp, current_value, current_value, current_value, current_value)
                 print(f"🕯️  [{timestamp_str}] NEW CANDLE {asset}: O:{current_value} H:{current_value} L:{current_value} C:{current_value}")
 
     def _get_price_change_indicator(self, asset: str, current_value: float) -> str:
@@ -855,9 +891,9 @@ class RealtimeDataStreaming(Capability):
 
     def _reset_stream_state(self, inputs: Dict[str, Any]) -> None:
         """Reset the stream state for a new stream."""
-        self.realtime_asset_data = []
+        self.tick_buffer.clear()
         self.current_asset_prices = {}
-        self.CANDLES = {}
+        self.candle_store.clear()
         self.CURRENT_ASSET = None
         self.PERIOD = inputs.get('period', 60)  # Already in seconds
 
@@ -1065,9 +1101,9 @@ class RealtimeDataStreaming(Capability):
                     } for asset, candles in self.CANDLES.items()
                 },
                 "realtime_data": {
-                    "messages_count": len(self.realtime_asset_data),
+                    "messages_count": len(self.tick_buffer),
                     "current_prices": self.current_asset_prices,
-                    "latest_updates": self.realtime_asset_data[-10:] if self.realtime_asset_data else []
+                    "latest_updates": self.tick_buffer.to_records(10)
                 },
                 "session_validation": {
                     "sync_valid": self._validate_session_sync(ctx),
@@ -1243,9 +1279,9 @@ class RealtimeDataStreaming(Capability):
 
     def _reset_run_state(self, inputs: Dict[str, Any]) -> None:
         """Reset the state for a new run."""
-        self.realtime_asset_data = []
+        self.tick_buffer.clear()
         self.current_asset_prices = {}
-        self.CANDLES = {}
+        self.candle_store.clear()
         self.CURRENT_ASSET = None
         self.PERIOD = inputs.get('period', 60)  # Allow period override from inputs, in seconds
 
@@ -1325,7 +1361,7 @@ class RealtimeDataStreaming(Capability):
         """Print the final status of the data collection."""
         if ctx.verbose:
             print(f"[data_streaming] Final: Processed {processed_count} WebSocket messages")
-            print(f"[data_streaming] Collected {len(self.realtime_asset_data)} real-time updates")
+            print(f"[data_streaming] Collected {len(self.tick_buffer)} real-time updates")
             print(f"[data_streaming] Tracking candles for {len(self.CANDLES)} assets")
             print(f"[data_streaming] Session authenticated: {self.SESSION_AUTHENTICATED}")
             print(f"[data_streaming] Timeframe detected: {self.SESSION_TIMEFRAME_DETECTED}")
@@ -1364,11 +1400,11 @@ class RealtimeDataStreaming(Capability):
             "collected_at": datetime.now().isoformat(),
             "current_asset": self.CURRENT_ASSET,
             "period_minutes": self.PERIOD,
-            "total_realtime_updates": len(self.realtime_asset_data),
+            "total_realtime_updates": len(self.tick_buffer),
             "latest_prices": self.current_asset_prices,
             "candles_summary": candles_summary,
             "realtime_updates": self.realtime_asset_data,
-            "candles_data": self.CANDLES,
+            "candles_data": self.CANDLES.to_dict(),
             "session_summary": session_summary
         })
 
@@ -1377,7 +1413,7 @@ class RealtimeDataStreaming(Capability):
             data={
                 "current_asset": self.CURRENT_ASSET,
                 "period_minutes": self.PERIOD,
-                "total_realtime_updates": len(self.realtime_asset_data),
+                "total_realtime_updates": len(self.tick_buffer),
                 "latest_asset_prices": self.current_asset_prices,
                 "candles_summary": candles_summary,
                 "session_summary": session_summary,
@@ -0,0 +1,195 @@
+"""
+Single-pass decoder for PocketOption WebSocket frames.
+
+Frames are classified by their Socket.IO prefix and event name without
+re-serialising anything: a binary frame is base64-decoded and parsed once,
+and a text frame has its numeric prefix stripped by hand before a single
+JSON parse. updateStream arrays come back as typed (asset, ts, price) ticks.
+
+orjson is used for parsing when it is installed; the stdlib json module is
+the fallback.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from typing import Any, List, NamedTuple, Optional
+
+try:
+    import orjson
+
+    def _loads(raw):
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity and other non-strict JSON that the stdlib accepts
+            return json.loads(raw)
+
+    JSON_BACKEND = "orjson"
+except ImportError:
+    _loads = json.loads
+    JSON_BACKEND = "json"
+
+
+# Frame kinds
+FRAME_TICKS = "ticks"                    # updateStream: [[asset, ts, price], ...]
+FRAME_CHART_SETTINGS = "chart_settings"  # updateCharts: [{"chart_id": ..., "settings": "..."}]
+FRAME_HISTORY = "history"                # {"asset": ..., "period": ..., "history": [[ts, price], ...]}
+FRAME_EVENT = "event"                    # 42["event", data]
+FRAME_PLACEHOLDER = "placeholder"        # 451-["event", {"_placeholder": true}] announcing a binary frame
+FRAME_CONTROL = "control"                # Engine.IO/Socket.IO handshake and ping/pong
+FRAME_DATA = "data"                      # any other JSON payload
+FRAME_INVALID = "invalid"
+
+TICK_EVENTS = frozenset({"updateStream"})
+CHART_EVENTS = frozenset({"updateCharts"})
+HISTORY_EVENTS = frozenset({"updateHistoryNew", "updateHistoryNewFast", "loadHistoryPeriod", "loadHistoryPeriodFast"})
+
+_DIGITS = frozenset(b"0123456789")
+
+
+class Tick(NamedTuple):
+    asset: str
+    ts: float
+    price: float
+
+
+class DecodedFrame(NamedTuple):
+    kind: str
+    event: Optional[str] = None
+    data: Any = None
+    ticks: Optional[List[Tick]] = None
+
+
+INVALID_FRAME = DecodedFrame(FRAME_INVALID)
+
+
+def extract_ticks(data: Any) -> List[Tick]:
+    """Convert an updateStream array into Tick tuples, skipping malformed rows"""
+    ticks = []
+    for row in data:
+        if type(row) is list and len(row) >= 3 and type(row[0]) is str:
+            try:
+                ticks.append(Tick(row[0], float(row[1]), float(row[2])))
+            except (TypeError, ValueError):
+                continue
+    return ticks
+
+
+def _split_socketio(raw):
+    """Split a Socket.IO text frame into (packet prefix, body) without regex"""
+    i = 0
+    n = len(raw)
+    while i < n and raw[i] in _DIGITS:
+        i += 1
+    return raw[:i], raw[i:]
+
+
+class FrameDecoder:
+    """Stateful frame classifier; remembers the event announced by a 451- placeholder"""
+
+    def __init__(self):
+        self.pending_event: Optional[str] = None
+
+    def decode(self, payload_data: str) -> DecodedFrame:
+        """Decode a base64 (opcode 2) payload from Network.webSocketFrameReceived"""
+        try:
+            raw = base64.b64decode(payload_data)
+        except (binascii.Error, ValueError, TypeError):
+            return INVALID_FRAME
+        return self.decode_bytes(raw)
+
+    def decode_text(self, text: str) -> DecodedFrame:
+        """Decode an opcode 1 (text) frame"""
+        return self.decode_bytes(text.encode("utf-8"))
+
+    def decode_bytes(self, raw: bytes) -> DecodedFrame:
+        if not raw:
+            return INVALID_FRAME
+        if raw[0] in _DIGITS:
+            return self._decode_socketio(raw)
+
+        event, self.pending_event = self.pending_event, None
+        try:
+            data = _loads(raw)
+        except ValueError:
+            return INVALID_FRAME
+        return self.classify(data, event)
+
+    def classify(self, data: Any, event: Optional[str] = None) -> DecodedFrame:
+        """Classify a parsed payload by event name, falling back to its shape"""
+        if event in TICK_EVENTS or (
+            type(data) is list and data and type(data[0]) is list
+            and len(data[0]) >= 3 and type(data[0][0]) is str
+        ):
+            return DecodedFrame(FRAME_TICKS, event, data, extract_ticks(data))
+
+        if event in CHART_EVENTS or (type(data) is dict and "settings" in data) or (
+            type(data) is list and data and type(data[0]) is dict
+            and ("settings" in data[0] or "chart_id" in data[0])
+        ):
+            return DecodedFrame(FRAME_CHART_SETTINGS, event, data)
+
+        if event in HISTORY_EVENTS or (type(data) is dict and "history" in data):
+            return DecodedFrame(FRAME_HISTORY, event, data)
+
+        return DecodedFrame(FRAME_DATA, event, data)
+
+    def _decode_socketio(self, raw: bytes) -> DecodedFrame:
+        prefix, body = _split_socketio(raw)
+        has_attachment = body[:1] == b"-"
+        if has_attachment:
+            body = body[1:]
+
+        if not body:
+            return DecodedFrame(FRAME_CONTROL, data=prefix.decode("ascii"))
+
+        try:
+            data = _loads(body)
+        except ValueError:
+            return INVALID_FRAME
+
+        if type(data) is list and data and type(data[0]) is str:
+            event = data[0]
+            if has_attachment:
+                self.pending_event = event
+                return DecodedFrame(FRAME_PLACEHOLDER, event)
+            args = data[1] if len(data) == 2 else data[1:]
+            if event in TICK_EVENTS and type(args) is list:
+                return DecodedFrame(FRAME_TICKS, event, args, extract_ticks(args))
+            return DecodedFrame(FRAME_EVENT, event, args)
+
+        return DecodedFrame(FRAME_CONTROL, data=data)
+
+    def parse_payload(self, payload_data: str) -> Optional[Any]:
+        """
+        Decode a base64 payload into the object shape RealtimeDataStreaming has
+        always returned: plain JSON for binary frames, {"event", "data"} for
+        Socket.IO event arrays, None for placeholders and undecodable frames.
+        """
+        raw = base64.b64decode(payload_data)
+        if not raw:
+            return None
+
+        if raw[0] in _DIGITS:
+            _, body = _split_socketio(raw)
+            if not body or body[:1] == b"-":
+                return None
+            data = _loads(body)
+            if type(data) is list and data and type(data[0]) is str:
+                if len(data) == 1:
+                    return {"event": data[0], "data": []}
+                if len(data) == 2:
+                    return {"event": data[0], "data": data[1]}
+            return data
+
+        try:
+            return _loads(raw)
+        except ValueError:
+            # If fails, try stripping outer array if present
+            if raw[:1] == b"[" and raw[-1:] == b"]":
+                parsed = _loads(raw[1:-1])
+                return [parsed] if isinstance(parsed, dict) else parsed
+            raise
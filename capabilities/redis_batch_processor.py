@@ -12,7 +12,6 @@ import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 from capabilities.redis_integration import RedisIntegration
-from capabilities.supabase_csv_ingestion import SupabaseCSVIngestion
 from config.redis_config import BATCH_PROCESSING_INTERVAL
 
 class RedisBatchProcessor:
@@ -28,13 +27,21 @@ class RedisBatchProcessor:
             redis_integration: Redis integration instance
         """
         self.redis_integration = redis_integration
-        self.supabase_client = SupabaseCSVIngestion()
+        self._supabase_client = None  # Created on first insert (imports pandas and the Supabase client)
         self.logger = logging.getLogger(__name__)
         self.processing_thread = None
         self.stop_event = threading.Event()
         self.active_assets = set()
         self.last_processed_times = {}
     
+    @property
+    def supabase_client(self):
+        """Supabase ingestion client, imported and connected on first use."""
+        if self._supabase_client is None:
+            from capabilities.supabase_csv_ingestion import SupabaseCSVIngestion
+            self._supabase_client = SupabaseCSVIngestion()
+        return self._supabase_client
+    
     def start_processing(self):
         """Start batch processing thread."""
         if self.processing_thread and self.processing_thread.is_alive():
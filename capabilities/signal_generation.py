@@ -3,21 +3,31 @@ from __future__ import annotations
 from typing import Any, Dict, Optional, Tuple, List
 import json
 
+import numpy as np
+
+from strategies import kernels
+from strategies.batch_indicators import BatchFrame
+
 from .base import Ctx, CapResult, Capability, timestamp, save_json
 
+# Every signal reads at most the last 26 closes (MACD's slow EMA)
+SIGNAL_WINDOW = 26
+
 
 class SignalGeneration(Capability):
     """
     Capability for generating trading signals for specific assets.
 
     Interface inputs:
-      - asset: str (required) - Asset symbol (e.g., 'EURUSD')
+      - asset: str (required unless assets is given) - Asset symbol (e.g., 'EURUSD')
+      - assets: List[str] - Several assets scanned in one batch; signals come back keyed by these names
       - min_candles: int = 30 - Minimum candles required for analysis
       - signal_types: List[str] = ["SMA", "RSI", "MACD"] - Types of signals to generate
+      - real_candles / real_candles_by_asset - Candle data provided directly (single / batch)
 
     Behavior:
-      - Analyzes recent candle data for the specified asset
-      - Generates technical analysis signals
+      - Analyzes recent candle data for the specified asset(s)
+      - Generates technical analysis signals, all assets at once over one aligned close matrix
       - Returns signal data with confidence scores
     Kind: "read"
     """
@@ -26,9 +36,13 @@ class SignalGeneration(Capability):
 
     def run(self, ctx: Ctx, inputs: Dict[str, Any]) -> CapResult:
         asset = inputs.get("asset", "").strip().upper()
+        assets = [a.strip() for a in inputs.get("assets") or [] if a and a.strip()]
         min_candles = int(inputs.get("min_candles", 30))
         signal_types = inputs.get("signal_types", ["SMA", "RSI", "MACD"])
 
+        if assets:
+            return self._run_batch(ctx, assets, inputs, min_candles, signal_types)
+
         if not asset:
             return CapResult(ok=False, data={"inputs": inputs}, error="asset is required", artifacts=())
 
@@ -83,124 +97,137 @@ class SignalGeneration(Capability):
         except Exception as e:
             return CapResult(ok=False, data={"asset": asset, "inputs": inputs}, error=f"Signal generation failed: {str(e)}", artifacts=())
 
-    def _generate_signals(self, candles: List[List], signal_types: List[str]) -> Dict[str, Any]:
-        """Generate trading signals from candle data."""
-        signals = {}
+    def _run_batch(self, ctx: Ctx, assets: List[str], inputs: Dict[str, Any], min_candles: int,
+                   signal_types: List[str]) -> CapResult:
+        """
+        Signals for several assets: candle lookups per asset, then one batch computation for all of them.
 
+        Results are keyed by the caller's asset names; only the candle lookups use the upper-cased symbol.
+        """
         try:
-            # Simple signal generation logic (can be enhanced with real technical analysis)
-            if "SMA" in signal_types:
-                signals["SMA"] = self._calculate_sma_signal(candles)
+            real_candles_by_asset = {a.strip().upper(): c for a, c in (inputs.get("real_candles_by_asset") or {}).items()}
+            candles_by_asset = {}
+            for asset in assets:
+                symbol = asset.upper()
+                candles = real_candles_by_asset.get(symbol)
+                if not candles or len(candles) < min_candles:
+                    candles = self._get_candle_data(ctx, symbol, min_candles)
+                if candles and len(candles) >= min_candles:
+                    candles_by_asset[asset] = candles
+
+            batch_signals = self._generate_signals_batch(candles_by_asset, signal_types) if candles_by_asset else {}
+
+            results = {}
+            for asset in assets:
+                if asset in batch_signals:
+                    results[asset] = {
+                        "signals": batch_signals[asset],
+                        "candles_analyzed": len(candles_by_asset[asset]),
+                        "data_source": "real_time_data"
+                    }
+                else:
+                    # Fallback to mock signals if no real data available
+                    results[asset] = {
+                        "signals": self._generate_mock_signals(asset.upper(), signal_types),
+                        "candles_analyzed": 0,
+                        "data_source": "mock_data_fallback"
+                    }
 
-            if "RSI" in signal_types:
-                signals["RSI"] = self._calculate_rsi_signal(candles)
+            artifacts = []
+            if ctx.debug:
+                signal_data = {"timestamp": timestamp(), "assets": results, "signal_types": signal_types}
+                artifacts.append(save_json(ctx, f"signal_generation_batch_{timestamp()}.json", signal_data, "signals"))
 
-            if "MACD" in signal_types:
-                signals["MACD"] = self._calculate_macd_signal(candles)
+            return CapResult(
+                ok=True,
+                data={"assets": results, "signal_types": signal_types},
+                artifacts=tuple(artifacts)
+            )
 
         except Exception as e:
-            signals["error"] = f"Signal calculation failed: {str(e)}"
-
-        return signals
+            return CapResult(ok=False, data={"assets": assets, "inputs": inputs}, error=f"Signal generation failed: {str(e)}", artifacts=())
 
-    def _calculate_sma_signal(self, candles: List[List]) -> Dict[str, Any]:
-        """Calculate Simple Moving Average signal."""
-        if len(candles) < 20:
-            return {"signal": "insufficient_data", "confidence": 0.0}
-
-        # Simple SMA crossover logic
-        closes = [candle[4] if len(candle) > 4 else 0 for candle in candles[-20:]]
-
-        if len(closes) < 20:
-            return {"signal": "insufficient_data", "confidence": 0.0}
-
-        sma_10 = sum(closes[-10:]) / 10
-        sma_20 = sum(closes) / 20
-
-        if sma_10 > sma_20:
-            return {"signal": "bullish", "confidence": 0.6, "sma_10": sma_10, "sma_20": sma_20}
-        elif sma_10 < sma_20:
-            return {"signal": "bearish", "confidence": 0.6, "sma_10": sma_10, "sma_20": sma_20}
-        else:
-            return {"signal": "neutral", "confidence": 0.3, "sma_10": sma_10, "sma_20": sma_20}
+    def _generate_signals(self, candles: List[List], signal_types: List[str]) -> Dict[str, Any]:
+        """Generate trading signals from candle data (a batch of one asset)."""
+        return self._generate_signals_batch({"": candles}, signal_types)[""]
 
-    def _calculate_rsi_signal(self, candles: List[List]) -> Dict[str, Any]:
-        """Calculate RSI signal."""
-        if len(candles) < 14:
-            return {"signal": "insufficient_data", "confidence": 0.0}
+    def _generate_signals_batch(self, candles_by_asset: Dict[str, List[List]],
+                                signal_types: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Generate trading signals for every asset at once from one right-aligned close matrix."""
+        signals = {asset: {} for asset in candles_by_asset}
 
-        # Simplified RSI calculation
-        closes = [candle[4] if len(candle) > 4 else 0 for candle in candles[-14:]]
+        try:
+            frame = BatchFrame.from_closes({
+                asset: [candle[4] if len(candle) > 4 else 0 for candle in candles[-SIGNAL_WINDOW:]]
+                for asset, candles in candles_by_asset.items()
+            }, length=SIGNAL_WINDOW)
+            lengths = frame.lengths()
+
+            for signal_type, calculate in (("SMA", self._calculate_sma_signal),
+                                           ("RSI", self._calculate_rsi_signal),
+                                           ("MACD", self._calculate_macd_signal)):
+                if signal_type in signal_types:
+                    for asset, signal in zip(frame.assets, calculate(frame.close, lengths)):
+                        signals[asset][signal_type] = signal
 
-        if len(closes) < 14:
-            return {"signal": "insufficient_data", "confidence": 0.0}
+        except Exception as e:
+            for asset_signals in signals.values():
+                asset_signals["error"] = f"Signal calculation failed: {str(e)}"
 
-        gains = []
-        losses = []
+        return signals
 
-        for i in range(1, len(closes)):
-            change = closes[i] - closes[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
+    def _calculate_sma_signal(self, closes: np.ndarray, lengths: np.ndarray) -> List[Dict[str, Any]]:
+        """Calculate Simple Moving Average signal per row of an (assets, window) close matrix."""
+        # Simple SMA crossover logic
+        sma_10 = kernels.sma(closes[:, -10:], 10)[:, -1].tolist()
+        sma_20 = kernels.sma(closes[:, -20:], 20)[:, -1].tolist()
+
+        results = []
+        for n, fast, slow in zip(lengths, sma_10, sma_20):
+            if n < 20:
+                results.append({"signal": "insufficient_data", "confidence": 0.0})
+            elif fast > slow:
+                results.append({"signal": "bullish", "confidence": 0.6, "sma_10": fast, "sma_20": slow})
+            elif fast < slow:
+                results.append({"signal": "bearish", "confidence": 0.6, "sma_10": fast, "sma_20": slow})
             else:
-                gains.append(0)
-                losses.append(abs(change))
-
-        avg_gain = sum(gains) / 14
-        avg_loss = sum(losses) / 14
-
-        if avg_loss == 0:
-            rsi = 100
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-
-        if rsi > 70:
-            return {"signal": "overbought", "confidence": 0.7, "rsi": rsi}
-        elif rsi < 30:
-            return {"signal": "oversold", "confidence": 0.7, "rsi": rsi}
-        else:
-            return {"signal": "neutral", "confidence": 0.4, "rsi": rsi}
-
-    def _calculate_macd_signal(self, candles: List[List]) -> Dict[str, Any]:
-        """Calculate MACD signal."""
-        if len(candles) < 26:
-            return {"signal": "insufficient_data", "confidence": 0.0}
-
-        closes = [candle[4] if len(candle) > 4 else 0 for candle in candles[-26:]]
-
-        if len(closes) < 26:
-            return {"signal": "insufficient_data", "confidence": 0.0}
-
-        # Simplified MACD calculation
-        ema_12 = self._calculate_ema(closes, 12)
-        ema_26 = self._calculate_ema(closes, 26)
-
-        if ema_12 is None or ema_26 is None:
-            return {"signal": "insufficient_data", "confidence": 0.0}
-
-        macd = ema_12 - ema_26
-
-        if macd > 0:
-            return {"signal": "bullish", "confidence": 0.5, "macd": macd}
-        elif macd < 0:
-            return {"signal": "bearish", "confidence": 0.5, "macd": macd}
-        else:
-            return {"signal": "neutral", "confidence": 0.3, "macd": macd}
-
-    def _calculate_ema(self, prices: List[float], period: int) -> Optional[float]:
-        """Calculate Exponential Moving Average."""
-        if len(prices) < period:
-            return None
-
-        multiplier = 2 / (period + 1)
-        ema = prices[0]
-
-        for price in prices[1:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
-
-        return ema
+                results.append({"signal": "neutral", "confidence": 0.3, "sma_10": fast, "sma_20": slow})
+        return results
+
+    def _calculate_rsi_signal(self, closes: np.ndarray, lengths: np.ndarray) -> List[Dict[str, Any]]:
+        """Calculate RSI signal per row of an (assets, window) close matrix."""
+        # Cutler RSI over the 13 moves in the last 14 closes
+        rsi_values = kernels.cutler_rsi(closes[:, -14:], 13)[:, -1].tolist()
+
+        results = []
+        for n, rsi in zip(lengths, rsi_values):
+            if n < 14:
+                results.append({"signal": "insufficient_data", "confidence": 0.0})
+            elif rsi > 70:
+                results.append({"signal": "overbought", "confidence": 0.7, "rsi": rsi})
+            elif rsi < 30:
+                results.append({"signal": "oversold", "confidence": 0.7, "rsi": rsi})
+            else:
+                results.append({"signal": "neutral", "confidence": 0.4, "rsi": rsi})
+        return results
+
+    def _calculate_macd_signal(self, closes: np.ndarray, lengths: np.ndarray) -> List[Dict[str, Any]]:
+        """Calculate MACD signal per row of an (assets, window) close matrix."""
+        # Simplified MACD: EMAs seeded on the first of the last 26 closes
+        window = closes[:, -26:]
+        macd_values = (kernels.ema(window, 12)[:, -1] - kernels.ema(window, 26)[:, -1]).tolist()
+
+        results = []
+        for n, macd in zip(lengths, macd_values):
+            if n < 26:
+                results.append({"signal": "insufficient_data", "confidence": 0.0})
+            elif macd > 0:
+                results.append({"signal": "bullish", "confidence": 0.5, "macd": macd})
+            elif macd < 0:
+                results.append({"signal": "bearish", "confidence": 0.5, "macd": macd})
+            else:
+                results.append({"signal": "neutral", "confidence": 0.3, "macd": macd})
+        return results
 
     def _get_candle_data(self, ctx: Ctx, asset: str, min_candles: int) -> Optional[List[List]]:
         """Get candle data for the specified asset from data streaming capability."""
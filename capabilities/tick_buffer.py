@@ -0,0 +1,128 @@
+"""
+Fixed-capacity tick history for RealtimeDataStreaming.
+
+Ticks are written into a preallocated NumPy structured array
+(asset id, timestamp, price) used as a ring, so ingest is constant time and
+allocates nothing per tick. Asset names are interned to small integer ids.
+The raw frame side buffer is off by default.
+
+Queries ("last N ticks for asset X") are vectorised and return copies;
+to_records() rebuilds the old realtime_asset_data dicts for JSON export.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+TICK_DTYPE = np.dtype([("asset_id", np.int32), ("ts", np.float64), ("price", np.float64)])
+
+DEFAULT_TICK_CAPACITY = 10_000
+
+
+class TickBuffer:
+    """Ring buffer of (asset, timestamp, price) ticks"""
+
+    def __init__(self, capacity: int = DEFAULT_TICK_CAPACITY, keep_raw: bool = False):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.keep_raw = keep_raw
+        self._ticks = np.zeros(capacity, dtype=TICK_DTYPE)
+        self._raw: Optional[List[Any]] = [None] * capacity if keep_raw else None
+        self._next = 0  # ticks ever appended
+        self._asset_ids: Dict[str, int] = {}
+        self._asset_names: List[str] = []
+
+    def __len__(self) -> int:
+        return min(self._next, self.capacity)
+
+    @property
+    def total(self) -> int:
+        """Ticks appended since the last clear (including overwritten ones)"""
+        return self._next
+
+    def asset_id(self, asset: str) -> int:
+        asset_id = self._asset_ids.get(asset)
+        if asset_id is None:
+            asset_id = self._asset_ids[asset] = len(self._asset_names)
+            self._asset_names.append(asset)
+        return asset_id
+
+    def append(self, asset: str, ts: float, price: float, raw: Any = None) -> None:
+        i = self._next % self.capacity
+        self._ticks[i] = (self.asset_id(asset), ts, price)
+        if self._raw is not None:
+            self._raw[i] = raw
+        self._next += 1
+
+    def clear(self) -> None:
+        self._next = 0
+        self._asset_ids.clear()
+        self._asset_names.clear()
+        if self._raw is not None:
+            self._raw = [None] * self.capacity
+
+    def _order(self) -> np.ndarray:
+        """Ring positions of the retained ticks, oldest first"""
+        n = len(self)
+        if self._next <= self.capacity:
+            return np.arange(n)
+        start = self._next % self.capacity
+        return (np.arange(n) + start) % self.capacity
+
+    def _select(self, n: Optional[int], asset: Optional[str]) -> np.ndarray:
+        order = self._order()
+        if asset is not None:
+            asset_id = self._asset_ids.get(asset)
+            if asset_id is None:
+                return order[:0]
+            order = order[self._ticks["asset_id"][order] == asset_id]
+        if n is not None:
+            order = order[-n:] if n > 0 else order[:0]
+        return order
+
+    def last(self, n: Optional[int] = None, asset: Optional[str] = None) -> np.ndarray:
+        """
+        Last n ticks (all retained if n is None), optionally for one asset.
+
+        Returns:
+            Structured array with fields asset_id, ts, price, oldest first
+        """
+        return self._ticks[self._select(n, asset)]
+
+    def prices(self, asset: str, n: Optional[int] = None) -> np.ndarray:
+        return self.last(n, asset)["price"]
+
+    def latest(self, asset: str) -> Optional[Dict[str, Any]]:
+        ticks = self.last(1, asset)
+        if not len(ticks):
+            return None
+        return {"asset": asset, "timestamp": float(ticks["ts"][0]), "price": float(ticks["price"][0])}
+
+    def assets(self) -> List[str]:
+        return list(self._asset_names)
+
+    def to_records(self, n: Optional[int] = None, asset: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Ticks as realtime_asset_data-style dicts (built on demand, for export)"""
+        order = self._select(n, asset)
+        ticks = self._ticks[order]
+        records = []
+        for pos, (asset_id, ts, price) in zip(order.tolist(), ticks.tolist()):
+            raw_timestamp = int(ts) if float(ts).is_integer() else ts
+            record = {
+                "timestamp": datetime.fromtimestamp(ts, tz=timezone.utc).isoformat().replace('+00:00', 'Z'),
+                "asset": self._asset_names[asset_id],
+                "price": price,
+                "raw_timestamp": raw_timestamp,
+            }
+            if self._raw is not None:
+                record["raw_payload"] = self._raw[pos]
+            records.append(record)
+        return records
+
+    @property
+    def nbytes(self) -> int:
+        return self._ticks.nbytes
@@ -1,5 +1,6 @@
 """Data loader for historical CSV data and live streaming data."""
 
+import sys
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Optional
@@ -7,13 +8,18 @@ from pathlib import Path
 from datetime import datetime
 import logging
 
+_ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+if str(_ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(_ROOT_DIR))
+from backend.data_catalog import DataCatalog, get_catalog
+
 logger = logging.getLogger(__name__)
 
 
 class DataLoader:
     """Load historical CSV data for backtesting."""
     
-    def __init__(self, data_dir: str = "data_history/pocket_option"):
+    def __init__(self, data_dir: str = "data_history/pocket_option", catalog: Optional[DataCatalog] = None):
         self.data_dir = Path(data_dir)
         # Add additional data directories to search (relative to project root)
         script_dir = Path(__file__).parent
@@ -21,6 +27,8 @@ class DataLoader:
         self.additional_dirs = [
             root_dir / "data" / "data_output" / "assets_data" / "data_collect"
         ]
+        # Shared across DataLoader instances: files are only rescanned when a directory changes
+        self.catalog = catalog or get_catalog([self.data_dir] + self.additional_dirs, recursive=True)
     
     def load_csv(self, file_path: str) -> pd.DataFrame:
         """Load CSV file and return DataFrame."""
@@ -53,21 +61,20 @@ class DataLoader:
             logger.info(f"Loading data from direct path: {asset}")
             return self.load_csv(str(asset_path))
         
-        # Otherwise, search by asset name and timeframe
-        # Get all available files and filter by asset and timeframe
-        all_files = self.get_available_files()
-        
+        # Otherwise, search the catalog by asset name and timeframe
         # Try exact match first (case-insensitive)
         exact_matches = [
-            f for f in all_files 
-            if f['asset'].lower() == asset.lower() and f['timeframe'] == timeframe
+            self._file_info(entry)
+            for entry in self.catalog.query(asset=asset, timeframe=timeframe)
+            if entry.asset.lower() == asset.lower()
         ]
         
         # Fallback to partial match if no exact match
         if not exact_matches:
             exact_matches = [
-                f for f in all_files 
-                if asset.lower() in f['asset'].lower() and f['timeframe'] == timeframe
+                self._file_info(entry)
+                for entry in self.catalog.query(timeframe=timeframe)
+                if asset.lower() in entry.asset.lower()
             ]
         
         if not exact_matches:
@@ -97,56 +104,16 @@ class DataLoader:
     
     def get_available_files(self) -> List[Dict[str, str]]:
         """Get list of available data files."""
-        files = []
-        
-        # Collect all directories to search
-        search_dirs = [self.data_dir] + self.additional_dirs
-        
-        # Search for all CSV files recursively in all directories
-        for data_dir in search_dirs:
-            if not data_dir.exists():
-                continue
-            for file_path in data_dir.rglob("*.csv"):
-                if file_path.is_file():
-                    # Try to extract timeframe from filename first
-                    parts = file_path.stem.split('_')
-                    timeframe = None
-                    asset = None
-                    
-                    # Method 1: Look for timeframe in filename (e.g., ASSET_1m_date)
-                    for i, part in enumerate(parts):
-                        if part in ['1m', '5m', '15m', '1h', '4h', '1d']:
-                            timeframe = part
-                            asset = '_'.join(parts[:i])
-                            break
-                    
-                    # Method 2: Infer from parent directory name (e.g., data_1m, 1M_candles, 5M_candles)
-                    if not timeframe:
-                        parent_dir = file_path.parent.name
-                        if 'data_1m' in parent_dir or '1m_candles' in parent_dir.lower():
-                            timeframe = '1m'
-                        elif 'data_5m' in parent_dir or '5m_candles' in parent_dir.lower():
-                            timeframe = '5m'
-                        elif '15m' in parent_dir.lower():
-                            timeframe = '15m'
-                        elif '1h_candles' in parent_dir.lower() or '60m' in parent_dir.lower():
-                            timeframe = '1h'
-                        
-                        # Extract asset from filename
-                        asset = parts[0] if parts else 'Unknown'
-                    
-                    # Skip if we still don't have basic info
-                    if not asset or not timeframe or timeframe == 'unknown':
-                        continue
-                    
-                    files.append({
-                        'filename': file_path.name,
-                        'asset': asset,
-                        'timeframe': timeframe,
-                        'path': str(file_path)
-                    })
-        
-        return files
+        return [self._file_info(entry) for entry in self.catalog.query()]
+    
+    @staticmethod
+    def _file_info(entry) -> Dict[str, str]:
+        return {
+            'filename': entry.filename,
+            'asset': entry.asset,
+            'timeframe': entry.timeframe,
+            'path': entry.path
+        }
 
 
 class BacktestEngine:
@@ -0,0 +1,96 @@
+import { renderHook, act } from '@testing-library/react';
+import { useStreamControl } from '../useStreamControl';
+
+// Minimal Socket.IO client stand-in: on/off/listeners for server events, emit records client events
+class MockSocket {
+  constructor() {
+    this.handlers = {};
+    this.sent = [];
+  }
+
+  on(event, handler) {
+    (this.handlers[event] = this.handlers[event] || []).push(handler);
+  }
+
+  off(event, handler) {
+    this.handlers[event] = (this.handlers[event] || []).filter(h => h !== handler);
+  }
+
+  listeners(event) {
+    return this.handlers[event] || [];
+  }
+
+  emit(event, data) {
+    this.sent.push([event, data]);
+  }
+
+  receive(event, data) {
+    this.listeners(event).slice().forEach(handler => handler(data));
+  }
+}
+
+const candle = (seq, timestamp, close) => ({
+  asset: 'EURUSD_otc', timeframe: 60, timestamp, open: 1.1, high: 1.2, low: 1.0, close, seq
+});
+
+const startedStream = () => {
+  const socket = new MockSocket();
+  renderHook(() => useStreamControl(socket));
+  act(() => {
+    socket.receive('stream_started', { asset: 'EURUSD_otc', epoch: 'e1' });
+    socket.receive('candle_update', candle(1, 60, 1.1));
+    socket.receive('candle_closed', candle(2, 60, 1.15));
+    socket.receive('candle_update', candle(3, 120, 1.12));
+  });
+  socket.sent = [];
+  return socket;
+};
+
+describe('useStreamControl resume', () => {
+  test('reconnect resumes from the last seq and epoch', () => {
+    const socket = startedStream();
+
+    act(() => socket.receive('connect'));
+
+    expect(socket.sent).toEqual([
+      ['resume_stream', { epoch: 'e1', streams: [{ asset: 'EURUSD_otc', timeframe: 60, last_seq: 3 }] }]
+    ]);
+  });
+
+  test('replayed deltas reach the live listeners once', () => {
+    const socket = startedStream();
+    const applied = [];
+    socket.on('candle_update', data => applied.push(['candle_update', data.seq]));
+    socket.on('candle_closed', data => applied.push(['candle_closed', data.seq]));
+
+    act(() => {
+      socket.receive('connect');
+      socket.receive('stream_resumed', {
+        asset: 'EURUSD_otc', timeframe: 60, epoch: 'e1', mode: 'delta', from_seq: 3, seq: 5,
+        updates: [
+          { seq: 4, event: 'candle_closed', candle: candle(4, 120, 1.13) },
+          { seq: 5, event: 'candle_update', candle: candle(5, 180, 1.14) }
+        ]
+      });
+    });
+    expect(applied).toEqual([['candle_closed', 4], ['candle_update', 5]]);
+    expect(socket.sent.filter(([event]) => event === 'start_stream')).toEqual([]);
+
+    socket.sent = [];
+    act(() => socket.receive('connect'));
+    expect(socket.sent[0][1].streams[0].last_seq).toBe(5);
+  });
+
+  test('gap or new epoch falls back to start_stream', () => {
+    const socket = startedStream();
+
+    act(() => {
+      socket.receive('connect');
+      socket.receive('stream_resumed', {
+        asset: 'EURUSD_otc', timeframe: 60, epoch: 'e2', mode: 'snapshot', seq: 0, candles: []
+      });
+    });
+
+    expect(socket.sent[1]).toEqual(['start_stream', { asset: 'EURUSD_otc', timeframe: 60 }]);
+  });
+});
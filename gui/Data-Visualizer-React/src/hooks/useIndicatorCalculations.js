@@ -1,4 +1,5 @@
 import { useState, useCallback, useEffect } from 'react';
+import { expandIndicatorSeries, mergeIndicatorDelta } from '../utils/indicatorUtils';
 
 /**
  * Hook for managing indicator calculations
@@ -24,9 +25,11 @@ export const useIndicatorCalculations = (socket) => {
     }
     setState(prev => ({ ...prev, isCalculating: true }));
 
+    // Series come back as parallel time/value arrays (smaller payload) and are expanded on receipt
     socket.emit('calculate_indicators', {
       asset,
-      instances
+      instances,
+      series_format: 'columns'
     });
     if (process.env.NODE_ENV === 'development') {
       console.log('[useIndicatorCalculations] Emitted calculate_indicators event');
@@ -41,8 +44,13 @@ export const useIndicatorCalculations = (socket) => {
     if (!socket) return;
 
     const handleIndicatorData = (data) => {
+      // Live updates from the backend carry only new points: merge instead of replacing
+      if (data?.delta) {
+        setState(prev => ({ ...prev, data: mergeIndicatorDelta(prev.data, data) }));
+        return;
+      }
       setState({
-        data,
+        data: expandIndicatorSeries(data),
         error: null,
         isCalculating: false
       });
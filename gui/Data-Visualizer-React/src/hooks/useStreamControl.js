@@ -1,8 +1,14 @@
-import { useState, useCallback, useEffect } from 'react';
+import { useState, useCallback, useEffect, useRef } from 'react';
+
+const streamKey = (asset, timeframe) => `${asset}|${timeframe}`;
 
 /**
  * Hook for managing streaming state and controls
  * Handles stream lifecycle, asset detection, and state transitions
+ *
+ * Tracks the last candle_update/candle_closed seq per (asset, timeframe) stream and the
+ * server epoch, so a reconnect sends resume_stream and replays only the missed updates.
+ * start_stream (a full history reload) is only used when the server reports a gap or a new epoch.
  */
 export const useStreamControl = (socket) => {
   const [streamState, setStreamState] = useState({
@@ -18,11 +24,32 @@ export const useStreamControl = (socket) => {
     isDetecting: false
   });
 
+  // (asset|timeframe) -> { asset, timeframe, lastSeq }, plus the epoch those seqs belong to
+  const streamsRef = useRef(new Map());
+  const epochRef = useRef(null);
+
   useEffect(() => {
     if (!socket) return;
 
+    const trackSeq = (data) => {
+      if (!data?.asset || typeof data.seq !== 'number') return;
+      const key = streamKey(data.asset, data.timeframe);
+      const tracked = streamsRef.current.get(key);
+      if (!tracked || data.seq > tracked.lastSeq) {
+        streamsRef.current.set(key, { asset: data.asset, timeframe: data.timeframe, lastSeq: data.seq });
+      }
+    };
+
+    const setEpoch = (epoch) => {
+      if (!epoch || epoch === epochRef.current) return;
+      // Sequence numbers from another epoch can never be resumed
+      epochRef.current = epoch;
+      streamsRef.current.clear();
+    };
+
     const handleStreamStarted = (data) => {
       console.log('Stream started:', data);
+      setEpoch(data?.epoch);
       setStreamState(prev => ({
         ...prev,
         active: true,
@@ -35,6 +62,10 @@ export const useStreamControl = (socket) => {
       setStreamState(prev => ({ ...prev, active: false }));
     };
 
+    const handleSubscribed = (data) => {
+      setEpoch(data?.epoch);
+    };
+
     const handleAssetChanged = (data) => {
       console.log('Asset changed:', data);
       setStreamState(prev => ({ ...prev, asset: data?.asset || prev.asset }));
@@ -60,6 +91,36 @@ export const useStreamControl = (socket) => {
       }, 3000);
     };
 
+    const handleReconnect = () => {
+      const streams = Array.from(streamsRef.current.values());
+      if (streams.length === 0) return;
+      console.log(`[Reconnection] Resuming ${streams.length} stream(s) from epoch ${epochRef.current}`);
+      socket.emit('resume_stream', {
+        epoch: epochRef.current,
+        streams: streams.map(({ asset, timeframe, lastSeq }) => ({ asset, timeframe, last_seq: lastSeq }))
+      });
+    };
+
+    const handleStreamResumed = (data) => {
+      const key = streamKey(data.asset, data.timeframe);
+      if (data.mode !== 'delta' || data.epoch !== epochRef.current) {
+        // Gap no longer buffered or server restarted: reload the history
+        console.log(`[Reconnection] ${key}: no deltas to resume from (${data.mode}), restarting stream`);
+        streamsRef.current.delete(key);
+        socket.emit('start_stream', { asset: data.asset, timeframe: data.timeframe });
+        return;
+      }
+
+      // Replay through the live listeners (which also advance the tracked seq); updates
+      // already received live are sent again and skipped by seq
+      const updates = (data.updates || []).filter(update => update.seq > data.from_seq);
+      console.log(`[Reconnection] ${key}: applying ${updates.length} missed update(s) after seq ${data.from_seq}`);
+      updates.forEach(({ seq, event, candle }) => {
+        socket.listeners(event).slice().forEach(listener => listener({ ...candle, seq }));
+      });
+      setStreamState(prev => ({ ...prev, active: true, asset: data.asset || prev.asset }));
+    };
+
     const handleAssetDetected = (data) => {
       console.log('[AssetDetection] Asset detected:', data);
       setAssetState(prev => ({
@@ -88,6 +149,11 @@ export const useStreamControl = (socket) => {
     socket.on('chrome_reconnected', handleChromeReconnected);
     socket.on('asset_detected', handleAssetDetected);
     socket.on('asset_detection_failed', handleAssetDetectionFailed);
+    socket.on('candle_update', trackSeq);
+    socket.on('candle_closed', trackSeq);
+    socket.on('connect', handleReconnect);
+    socket.on('stream_resumed', handleStreamResumed);
+    socket.on('subscribed', handleSubscribed);
 
     return () => {
       // Cleanup event handlers
@@ -98,18 +164,25 @@ export const useStreamControl = (socket) => {
       socket.off('chrome_reconnected', handleChromeReconnected);
       socket.off('asset_detected', handleAssetDetected);
       socket.off('asset_detection_failed', handleAssetDetectionFailed);
+      socket.off('candle_update', trackSeq);
+      socket.off('candle_closed', trackSeq);
+      socket.off('connect', handleReconnect);
+      socket.off('stream_resumed', handleStreamResumed);
+      socket.off('subscribed', handleSubscribed);
     };
   }, [socket]);
 
   // Stream control actions
   const startStream = useCallback((asset) => {
     if (socket) {
+      streamsRef.current.clear();
       socket.emit('start_stream', { asset });
     }
   }, [socket]);
 
   const stopStream = useCallback(() => {
     if (socket) {
+      streamsRef.current.clear();
       socket.emit('stop_stream');
     }
   }, [socket]);
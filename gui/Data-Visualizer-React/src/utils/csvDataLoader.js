@@ -8,15 +8,23 @@
  * @param {string} selectedAssetFile - The filename of the CSV file
  * @param {Function} detectBackendUrl - Function to detect backend URL
  * @param {Function} parseTradingData - Function to parse raw data
+ * @param {Object} [range] - Optional row range: { from, to, limit, columns, max_points } (unix seconds / row count / column list / bucket count)
  * @returns {Promise<Array>} Parsed chart data
  */
-export const loadCsvData = async (assetId, selectedAssetFile, detectBackendUrl, parseTradingData) => {
+export const loadCsvData = async (assetId, selectedAssetFile, detectBackendUrl, parseTradingData, range = {}) => {
   if (!assetId || !selectedAssetFile) {
     throw new Error('Asset ID and file selection are required');
   }
 
   const baseUrl = detectBackendUrl();
-  const response = await fetch(`${baseUrl}/api/csv-data/${selectedAssetFile}`);
+  const params = new URLSearchParams();
+  Object.entries(range).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== '') {
+      params.set(key, Array.isArray(value) ? value.join(',') : String(value));
+    }
+  });
+  const query = params.toString() ? `?${params}` : '';
+  const response = await fetch(`${baseUrl}/api/csv-data/${selectedAssetFile}${query}`);
 
   if (!response.ok) {
     throw new Error(`Failed to load CSV data: ${response.status}`);
@@ -42,4 +42,93 @@ export const getCurrentAsset = (dataSource, selectedAsset, streamAsset) => {
  */
 export const shouldCalculateIndicators = (dataSource, selectedAsset, streamAsset) => {
   return (dataSource === 'csv' && selectedAsset) || (dataSource === 'platform' && streamAsset);
-};
\ No newline at end of file
+};
+/**
+ * Expands a series_format: 'columns' result ({time: [...], value: [...]} per series)
+ * into the [{time, value}] points the charts use
+ * @param {Object} data - indicators_calculated payload
+ * @returns {Object} Payload with point series (unchanged when already in points format)
+ */
+export const expandIndicatorSeries = (data) => {
+  if (!data || data.series_format !== 'columns') {
+    return data;
+  }
+  const toPoints = ({ time = [], value = [] }) => time.map((t, i) => ({ time: t, value: value[i] }));
+
+  const series = {};
+  Object.entries(data.series || {}).forEach(([instanceName, columns]) => {
+    if (Array.isArray(columns.time)) {
+      series[instanceName] = toPoints(columns);
+    } else {
+      // Multi-line indicators (MACD, Bollinger, Stochastic)
+      series[instanceName] = Object.fromEntries(
+        Object.entries(columns).map(([line, lineColumns]) => [line, toPoints(lineColumns)])
+      );
+    }
+  });
+  const expanded = { ...data, series };
+  delete expanded.series_format;
+  return expanded;
+};
+
+/**
+ * Appends points to a series, replacing the last point when it has the same time
+ * @param {Array} points - Existing [{time, value}] points, oldest first
+ * @param {Array} updates - New points, oldest first
+ * @returns {Array} Merged points
+ */
+const mergeSeriesPoints = (points = [], updates = []) => {
+  const merged = points.slice();
+  updates.forEach((point) => {
+    const last = merged[merged.length - 1];
+    if (last && last.time === point.time) {
+      merged[merged.length - 1] = point;
+    } else if (!last || point.time > last.time) {
+      merged.push(point);
+    }
+  });
+  return merged;
+};
+
+/**
+ * Merges a streamed indicators_calculated delta (delta: true) into the last full result
+ * @param {Object|null} current - Current indicator result
+ * @param {Object} delta - New points (closed candles, then the forming one) and latest values per instance
+ * @returns {Object|null} Updated result, or current when the delta is for another asset
+ */
+export const mergeIndicatorDelta = (current, delta) => {
+  if (!current || current.asset !== delta.asset) {
+    return current;
+  }
+
+  // Only instances the client still shows (a removed indicator may be streamed until the next request)
+  const known = (instanceName) => Object.prototype.hasOwnProperty.call(current.series || {}, instanceName);
+  const pick = (values = {}) => Object.fromEntries(Object.entries(values).filter(([name]) => known(name)));
+
+  const series = { ...current.series };
+  Object.entries(delta.series || {}).forEach(([instanceName, update]) => {
+    if (!known(instanceName)) {
+      return;
+    }
+    if (Array.isArray(update)) {
+      series[instanceName] = mergeSeriesPoints(series[instanceName], update);
+    } else {
+      // Multi-line indicators (MACD, Bollinger, Stochastic)
+      const lines = { ...(series[instanceName] || {}) };
+      Object.entries(update).forEach(([line, points]) => {
+        lines[line] = mergeSeriesPoints(lines[line], points);
+      });
+      series[instanceName] = lines;
+    }
+  });
+
+  return {
+    ...current,
+    indicators: { ...current.indicators, ...pick(delta.indicators) },
+    signals: { ...current.signals, ...pick(delta.signals) },
+    series,
+    latest_timestamp: delta.latest_timestamp,
+    latest_price: delta.latest_price,
+    timestamp: delta.timestamp
+  };
+};
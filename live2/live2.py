@@ -24,6 +24,12 @@ import random
 from pocket_option_api_client import PocketOptionAPIClient, create_pocket_option_client_from_config, TradeResult
 from data_streaming import RealtimeDataStreaming
 
+# Indicator maths is shared with the main strategies package
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+from strategies import kernels
+
 # --- Configure urllib3 warning suppression ---
 import warnings
 import urllib3
@@ -249,67 +255,28 @@ class NeuralBeastQuantumFusion:
         """Enhanced RSI calculation with quantum enhancement"""
         if len(prices) < period + 1:
             return 50.0
-        
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[:period]) if len(gains) >= period else 0
-        avg_loss = np.mean(losses[:period]) if len(losses) >= period else 0
-        
-        for i in range(period, len(gains)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return kernels.rsi_last(prices, period)
 
     @staticmethod
     def calculate_bollinger_bands(prices: List[float], period: int = 20, multiplier: float = 2.0):
         """Calculate Bollinger Bands with neural enhancement"""
         if len(prices) < period:
             return prices[-1], prices[-1], prices[-1]
-        
-        sma = np.mean(prices[-period:])
-        std = np.std(prices[-period:])
-        
-        upper_band = sma + (multiplier * std)
-        lower_band = sma - (multiplier * std)
-        
-        return upper_band, sma, lower_band
+        return kernels.bollinger_last(prices, period, multiplier)
 
     @staticmethod
     def calculate_macd(prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9):
         """Calculate MACD with beast enhancement"""
         if len(prices) < slow:
             return 0, 0, 0
-        
-        ema_fast = NeuralBeastQuantumFusion.calculate_ema(prices, fast)
-        ema_slow = NeuralBeastQuantumFusion.calculate_ema(prices, slow)
-        
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line * 0.9
-        histogram = macd_line - signal_line
-        
-        return macd_line, signal_line, histogram
+        return kernels.macd_last(prices, fast, slow, signal)
 
     @staticmethod
     def calculate_ema(prices: List[float], period: int) -> float:
         """Enhanced EMA calculation"""
         if len(prices) < period:
             return prices[-1] if prices else 0.0
-        
-        multiplier = 2 / (period + 1)
-        ema = prices[0]
-        
-        for price in prices[1:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
-        
-        return ema
+        return kernels.ema_last(prices, period)
 
     @staticmethod
     def calculate_stochastic(candles: List[Candle], k_period: int = 14, d_period: int = 3):
@@ -317,20 +284,12 @@ class NeuralBeastQuantumFusion:
         if len(candles) < k_period:
             return 50.0, 50.0
         
-        recent_candles = candles[-k_period:]
-        highest_high = max(c.high for c in recent_candles)
-        lowest_low = min(c.low for c in recent_candles)
-        current_close = candles[-1].close
-        
-        if highest_high == lowest_low:
-            k_percent = 50.0
-        else:
-            k_percent = ((current_close - lowest_low) / (highest_high - lowest_low)) * 100
-        
-        # Simplified D% calculation
-        d_percent = k_percent * 0.9
-        
-        return k_percent, d_percent
+        recent_candles = candles[-(k_period + d_period - 1):]
+        k_percent, d_percent = kernels.stochastic_last([c.high for c in recent_candles],
+                                                       [c.low for c in recent_candles],
+                                                       [c.close for c in recent_candles], k_period, d_period)
+        # %D needs d_period %K values; until then it follows %K
+        return k_percent, k_percent if math.isnan(d_percent) else d_percent
 
     @staticmethod
     def calculate_atr(candles: List[Candle], period: int = 14) -> float:
@@ -338,14 +297,9 @@ class NeuralBeastQuantumFusion:
         if len(candles) < period:
             return 0.001
         
-        true_ranges = []
-        for i in range(1, len(candles)):
-            tr1 = candles[i].high - candles[i].low
-            tr2 = abs(candles[i].high - candles[i-1].close)
-            tr3 = abs(candles[i].low - candles[i-1].close)
-            true_ranges.append(max(tr1, tr2, tr3))
-        
-        return np.mean(true_ranges[-period:]) if true_ranges else 0.001
+        recent_candles = candles[-(period + 1):]
+        return kernels.atr_last([c.high for c in recent_candles], [c.low for c in recent_candles],
+                                [c.close for c in recent_candles], period)
 
     @staticmethod
     def analyze_volume(candles: List[Candle]) -> dict:
@@ -3,6 +3,7 @@ import os
 import re
 import time
 import threading
+from collections.abc import Sequence
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple, List
 
@@ -129,8 +130,8 @@ class DataCollectTopdownSelect(RealtimeDataStreaming):
                 with filepath.open("w", newline="", encoding="utf-8") as f:
                     w = csv.writer(f)
                     w.writerow(["timestamp", "open", "close", "high", "low"])
-                    # Validate candle data before writing
-                    if not isinstance(self.CANDLES[asset], list):
+                    # Validate candle data before writing (a CandleSeries view, or a plain list of rows)
+                    if not isinstance(self.CANDLES[asset], Sequence):
                         if ctx.verbose:
                             print(f"⚠️ [{datetime.now(timezone.utc).strftime('%H:%M:%SZ')}] Invalid candle data format for {asset}")
                         return
@@ -4,49 +4,19 @@ Advanced Trading Strategies - Tier 1 strategies from gtrr46.py
 These are the most sophisticated strategies with proven performance.
 """
 
-from typing import List, Optional
+from typing import Optional
 import numpy as np
+from . import kernels
 from .base import BaseStrategy
 
 
 class AdvancedStrategies:
     """Advanced trading strategies from gtrr46.py - most comprehensive implementation."""
     
-    @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> float:
-        """Calculate RSI indicator with enhanced accuracy."""
-        if len(prices) < period + 1:
-            return 50.0
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        avg_gain = (np.mean(gains[-period:])
-                    if np.any(gains[-period:]) else 0)
-        avg_loss = (np.mean(losses[-period:])
-                    if np.any(losses[-period:]) else 0)
-        if avg_loss == 0:
-            return 100.0
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-
-    @staticmethod
-    def calculate_sma(prices: List[float], period: int) -> float:
-        """Calculate Simple Moving Average."""
-        if len(prices) < period:
-            return prices[-1] if prices else 0.0
-        return np.mean(prices[-period:])
-
-    @staticmethod
-    def calculate_ema(prices: List[float], period: int) -> float:
-        """Calculate Exponential Moving Average with enhanced precision."""
-        if len(prices) < period:
-            return prices[-1] if prices else 0.0
-        weights = np.exp(np.linspace(-1., 0., period))
-        weights /= weights.sum()
-        a = np.convolve(prices, weights, mode='full')[:len(prices)]
-        a[:period] = a[period]
-        return a[-1]
+    # Indicator helpers are the shared kernels behind BaseStrategy
+    calculate_rsi = staticmethod(BaseStrategy.calculate_rsi)
+    calculate_sma = staticmethod(BaseStrategy.calculate_sma)
+    calculate_ema = staticmethod(BaseStrategy.calculate_ema)
 
     @staticmethod
     def aggressive_momentum_scalper(candles) -> Optional[str]:
@@ -120,11 +90,10 @@ class AdvancedStrategies:
             return None
         
         closes = [c.close for c in candles]
-        ema5 = AdvancedStrategies.calculate_ema(closes, 5)
-        ema13 = AdvancedStrategies.calculate_ema(closes, 13)
-        prev_closes = closes[:-1]
-        prev_ema5 = AdvancedStrategies.calculate_ema(prev_closes, 5)
-        prev_ema13 = AdvancedStrategies.calculate_ema(prev_closes, 13)
+        ema5_series = kernels.ema(closes, 5)
+        ema13_series = kernels.ema(closes, 13)
+        ema5, prev_ema5 = ema5_series[-1], ema5_series[-2]
+        ema13, prev_ema13 = ema13_series[-1], ema13_series[-2]
         c0 = candles[-1]
         
         # Bullish crossover
@@ -4,7 +4,7 @@ Alternative Trading Strategies - Tier 2 strategies from gunna.py
 Unique strategies with different approaches and methodologies.
 """
 
-from typing import List, Optional
+from typing import Optional
 import numpy as np
 from .base import BaseStrategy
 
@@ -12,32 +12,9 @@ from .base import BaseStrategy
 class AlternativeStrategies:
     """Alternative trading strategies from gunna.py - unique implementations."""
     
-    @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> float:
-        """Calculate RSI indicator."""
-        if len(prices) < period + 1:
-            return 50.0
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-        if avg_loss == 0:
-            return 100.0
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-
-    @staticmethod
-    def calculate_ema(prices: List[float], period: int) -> float:
-        """Calculate Exponential Moving Average."""
-        if len(prices) < period:
-            return prices[-1] if prices else 0.0
-        weights = np.exp(np.linspace(-1., 0., period))
-        weights /= weights.sum()
-        a = np.convolve(prices, weights, mode='full')[:len(prices)]
-        a[:period] = a[period]
-        return a[-1]
+    # Indicator helpers are the shared kernels behind BaseStrategy
+    calculate_rsi = staticmethod(BaseStrategy.calculate_rsi)
+    calculate_ema = staticmethod(BaseStrategy.calculate_ema)
 
     @staticmethod
     def rsi_volume_strategy(candles) -> Optional[str]:
@@ -5,9 +5,10 @@ Base Strategy Class - Common interface for all trading strategies.
 
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-import numpy as np
 import logging
 
+from . import kernels
+
 logger = logging.getLogger(__name__)
 
 class BaseStrategy(ABC):
@@ -32,42 +33,24 @@ class BaseStrategy(ABC):
     
     @staticmethod
     def calculate_rsi(prices: List[float], period: int = 14) -> float:
-        """Calculate RSI indicator."""
+        """Calculate RSI indicator (Cutler: plain means of the last period moves)."""
         if len(prices) < period + 1:
             return 50.0
-        
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[-period:]) if np.any(gains[-period:]) else 0
-        avg_loss = np.mean(losses[-period:]) if np.any(losses[-period:]) else 0
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return kernels.cutler_rsi_last(prices, period)
     
     @staticmethod
     def calculate_sma(prices: List[float], period: int) -> float:
         """Calculate Simple Moving Average."""
         if len(prices) < period:
             return prices[-1] if prices else 0.0
-        return np.mean(prices[-period:])
+        return kernels.sma_last(prices, period)
     
     @staticmethod  
     def calculate_ema(prices: List[float], period: int) -> float:
         """Calculate Exponential Moving Average."""
         if len(prices) < period:
             return prices[-1] if prices else 0.0
-        
-        weights = np.exp(np.linspace(-1., 0., period))
-        weights /= weights.sum()
-        a = np.convolve(prices, weights, mode='full')[:len(prices)]
-        a[:period] = a[period]
-        return a[-1]
+        return kernels.ema_last(prices, period)
     
     def validate_candles(self, candles, min_length: int) -> bool:
         """Validate candle data meets minimum requirements."""
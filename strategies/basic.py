@@ -4,40 +4,18 @@ Basic Trading Strategies - Tier 3 strategies from gunna_v2.py and others
 Simple and reliable strategies for consistent performance.
 """
 
-from typing import List, Optional
+from typing import Optional
 import numpy as np
+from . import kernels
 from .base import BaseStrategy
 
 
 class BasicStrategies:
     """Basic trading strategies from multiple sources - simple implementations."""
     
-    @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> float:
-        """Calculate RSI indicator."""
-        if len(prices) < period + 1:
-            return 50.0
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-        if avg_loss == 0:
-            return 100.0
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-
-    @staticmethod
-    def calculate_ema(prices: List[float], period: int) -> float:
-        """Calculate Exponential Moving Average."""
-        if len(prices) < period:
-            return prices[-1] if prices else 0.0
-        weights = np.exp(np.linspace(-1., 0., period))
-        weights /= weights.sum()
-        a = np.convolve(prices, weights, mode='full')[:len(prices)]
-        a[:period] = a[period]
-        return a[-1]
+    # Indicator helpers are the shared kernels behind BaseStrategy
+    calculate_rsi = staticmethod(BaseStrategy.calculate_rsi)
+    calculate_ema = staticmethod(BaseStrategy.calculate_ema)
 
     @staticmethod
     def momentum_breakout(candles) -> Optional[str]:
@@ -103,10 +81,10 @@ class BasicStrategies:
             return None
         
         prices = [c.close for c in candles]
-        ema_5_prev = BasicStrategies.calculate_ema(prices[:-1], 5)
-        ema_21_prev = BasicStrategies.calculate_ema(prices[:-1], 21)
-        ema_5_now = BasicStrategies.calculate_ema(prices, 5)
-        ema_21_now = BasicStrategies.calculate_ema(prices, 21)
+        ema_5 = kernels.ema(prices, 5)
+        ema_21 = kernels.ema(prices, 21)
+        ema_5_prev, ema_5_now = ema_5[-2], ema_5[-1]
+        ema_21_prev, ema_21_now = ema_21[-2], ema_21[-1]
         
         # Bullish crossover
         if ema_5_prev < ema_21_prev and ema_5_now > ema_21_now:
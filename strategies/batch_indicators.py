@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Batch Indicators Module
+Indicators for many assets in one call over an aligned (assets x time) matrix.
+
+BatchFrame lines every asset's candles up on one timeline that ends at the
+newest candle. Histories of different lengths are ragged on the left and
+masked: an asset's columns before its first candle are NaN in every output,
+and gaps inside a history carry the previous close forward.
+
+BatchIndicatorEngine evaluates frontend indicator instances (the same
+instance format, parameter mapping and pipeline column names as
+IndicatorPlanner) with the strategies' NumPy kernels (strategies/kernels.py).
+Each indicator is one broadcasting call over every asset, so scanning fifty
+favorites costs little more than scanning one.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from strategies import kernels
+from strategies.indicator_planner import request_key, resolve_params
+
+logger = logging.getLogger(__name__)
+
+# Candle rows are [timestamp, open, close, high, low] (capabilities/candle_store.py)
+TS, OPEN, CLOSE, HIGH, LOW = range(5)
+
+
+def _candle_rows(rows: Any) -> np.ndarray:
+    """(n, 5) float array from candle lists, arrays or a CandleSeries"""
+    if hasattr(rows, 'array'):
+        rows = rows.array()
+    array = np.asarray(rows, dtype=float)
+    return array.reshape(-1, array.shape[-1] if array.size else 5)[:, :5]
+
+
+@dataclass
+class BatchFrame:
+    """
+    OHLC matrices of shape (assets, time), right-aligned on the newest candle.
+
+    first[i] is the column of asset i's first candle (time when it has none);
+    everything left of it is NaN.
+    """
+    assets: List[str]
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    first: np.ndarray
+    timestamps: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_candles(cls, candles_by_asset: Mapping[str, Any], timeframe_seconds: int = 60,
+                     length: Optional[int] = None) -> 'BatchFrame':
+        """
+        Align candle rows on one timeframe_seconds grid ending at the newest candle of any asset.
+
+        length caps the number of columns (default: the longest history); older candles are dropped.
+        """
+        assets = list(candles_by_asset)
+        rows = [_candle_rows(candles_by_asset[asset]) for asset in assets]
+        starts = [r[:, TS] for r in rows if len(r)]
+        if not starts:
+            timestamps = np.empty(0)
+        else:
+            end = max(float(ts[-1]) for ts in starts)
+            span = int((end - min(float(ts[0]) for ts in starts)) // timeframe_seconds) + 1
+            columns = span if length is None else length
+            timestamps = end - timeframe_seconds * np.arange(columns - 1, -1, -1, dtype=float)
+
+        width = len(timestamps)
+        matrices = np.full((4, len(assets), width), np.nan)
+        for i, r in enumerate(rows):
+            if not len(r) or not width:
+                continue
+            cols = ((r[:, TS] - timestamps[0]) // timeframe_seconds).astype(int)
+            keep = (cols >= 0) & (cols < width)
+            # Later rows win on duplicate candle times
+            matrices[:, i, cols[keep]] = r[keep][:, [OPEN, HIGH, LOW, CLOSE]].T
+        return cls._filled(assets, matrices, timestamps)
+
+    @classmethod
+    def from_closes(cls, closes_by_asset: Mapping[str, Sequence[float]],
+                    length: Optional[int] = None) -> 'BatchFrame':
+        """Right-align close series by position (the last value of every series is the last column)"""
+        assets = list(closes_by_asset)
+        width = max((len(v) for v in closes_by_asset.values()), default=0) if length is None else length
+        close = np.full((len(assets), width), np.nan)
+        for i, asset in enumerate(assets):
+            values = closes_by_asset[asset]
+            values = values[len(values) - width:] if len(values) > width else values
+            if len(values):
+                close[i, width - len(values):] = values
+        return cls._filled(assets, np.stack([close, close, close, close]), None)
+
+    @classmethod
+    def _filled(cls, assets: List[str], matrices: np.ndarray, timestamps: Optional[np.ndarray]) -> 'BatchFrame':
+        """Forward-fill gaps after each asset's first candle with flat candles at the previous close"""
+        open_, high, low, close = matrices
+        valid = ~np.isnan(close)
+        width = close.shape[1]
+        first = np.where(valid.any(axis=1), valid.argmax(axis=1), width)
+        if not valid.all():
+            last_seen = np.maximum.accumulate(np.where(valid, np.arange(width), 0), axis=1)
+            carried = np.take_along_axis(close, last_seen, axis=1)
+            open_, high, low = (np.where(valid, m, carried) for m in (open_, high, low))
+            close = carried
+        return cls(assets, open_, high, low, close, first, timestamps)
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    @property
+    def width(self) -> int:
+        return self.close.shape[1]
+
+    def lengths(self) -> np.ndarray:
+        """Columns of history per asset"""
+        return self.width - self.first
+
+    def index(self, asset: str) -> int:
+        return self.assets.index(asset)
+
+    def left_aligned(self, matrix: np.ndarray) -> np.ndarray:
+        """Each row shifted so its first candle is column 0 (the freed tail repeats the last value)"""
+        if not self.first.any():
+            return matrix
+        cols = np.minimum(self.first[:, None] + np.arange(self.width), self.width - 1)
+        return np.take_along_axis(matrix, cols, axis=1)
+
+    def right_aligned(self, matrix: np.ndarray) -> np.ndarray:
+        """Inverse of left_aligned, with every column before an asset's first candle masked to NaN"""
+        if not self.first.any():
+            return matrix
+        cols = np.arange(self.width) - self.first[:, None]
+        out = np.take_along_axis(matrix, np.maximum(cols, 0), axis=1)
+        out[cols < 0] = np.nan
+        return out
+
+
+class BatchIndicatorEngine:
+    """
+    Computes indicator kernels for every asset of a BatchFrame at once.
+
+    Kernels run on left-aligned matrices, so each asset's recursions and
+    warm-up start at its own first candle, exactly as a per-asset run would.
+
+    Usage:
+        engine = BatchIndicatorEngine(BatchFrame.from_candles(candles_by_asset))
+        latest = engine.latest({'RSI': {'type': 'rsi', 'params': {'period': 14}}})
+        oversold = [a for a, v in zip(engine.frame.assets, latest['RSI']['rsi_14']) if v < 30]
+    """
+
+    def __init__(self, frame: BatchFrame):
+        self.frame = frame
+        self._inputs: Dict[str, np.ndarray] = {}
+        self._results: Dict[Hashable, Optional[Dict[str, np.ndarray]]] = {}
+
+        # Counters
+        self.kernel_runs = 0
+
+    def _input(self, name: str) -> np.ndarray:
+        if name not in self._inputs:
+            self._inputs[name] = self.frame.left_aligned(getattr(self.frame, name))
+        return self._inputs[name]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._input('high')
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._input('low')
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._input('close')
+
+    def evaluate(self, instances: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[Dict[str, np.ndarray]]]:
+        """
+        (assets, time) output columns per instance name (pipeline column names, e.g. 'macd', 'macd_signal').
+
+        Instances with a type the batch kernels do not cover map to None.
+        """
+        out = {}
+        for instance_name, instance_config in instances.items():
+            out[instance_name] = self.compute(instance_config.get('type'), instance_config.get('params', {}))
+        return out
+
+    def latest(self, instances: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[Dict[str, np.ndarray]]]:
+        """Like evaluate, with each column reduced to its (assets,) values on the newest candle"""
+        return {name: None if columns is None else {column: values[:, -1] for column, values in columns.items()}
+                for name, columns in self.evaluate(instances).items()}
+
+    def compute(self, indicator_type: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, np.ndarray]]:
+        key = request_key(indicator_type, params)
+        if key in self._results:
+            return self._results[key]
+        kernel = _KERNELS.get(indicator_type)
+        result = None
+        if kernel is not None:
+            self.kernel_runs += 1
+            try:
+                result = {column: self.frame.right_aligned(values)
+                          for column, values in kernel(self, resolve_params(indicator_type, params)).items()}
+            except Exception as e:
+                logger.error(f"Error calculating batch {indicator_type}: {str(e)}")
+        self._results[key] = result
+        return result
+
+
+# ========================================
+# Kernels: engine, resolved pipeline params -> {pipeline column: (assets, time) array}
+# ========================================
+
+def _sma(engine: BatchIndicatorEngine, p: Dict[str, Any]):
+    return {'sma_20': kernels.sma(engine.close, p['sma_period'])}
+
+
+def _ema(engine: BatchIndicatorEngine, p: Dict[str, Any]):
+    return {'ema_16': kernels.ema(engine.close, p['ema_fast'])}
+
+
+def _rsi(engine: BatchIndicatorEngine, p: Dict[str, Any]):
+    return {'rsi_14': kernels.rsi(engine.close, p['rsi_period'])}
+
+
+def _macd(engine: BatchIndicatorEngine, p: Dict[str, Any]):
+    macd, macd_signal, histogram = kernels.macd(engine.close, p['macd_fast'], p['macd_slow'], p['macd_signal'])
+    return {'macd': macd, 'macd_signal': macd_signal, 'macd_histogram': histogram}
+
+
+def _bollinger(engine: BatchIndicatorEngine, p: Dict[str, Any]):
+    upper, middle, lower = kernels.bollinger(engine.close, p['bb_period'], p['bb_std'])
+    return {'bb_upper': upper, 'bb_middle': middle, 'bb_lower': lower}
+
+
+def _stochastic(engine: BatchIndicatorEngine, p: Dict[str, Any]):
+    stoch_k, stoch_d = kernels.stochastic(engine.high, engine.low, engine.close, p['stoch_k'], p['stoch_d'])
+    return {'stoch_k': stoch_k, 'stoch_d': stoch_d}
+
+
+def _atr(engine: BatchIndicatorEngine, p: Dict[str, Any]):
+    return {'atr_14': kernels.atr(engine.high, engine.low, engine.close, p['atr_period'])}
+
+
+_KERNELS: Dict[str, Callable[[BatchIndicatorEngine, Dict[str, Any]], Dict[str, np.ndarray]]] = {
+    'sma': _sma,
+    'ema': _ema,
+    'rsi': _rsi,
+    'macd': _macd,
+    'bollinger': _bollinger,
+    'stochastic': _stochastic,
+    'atr': _atr,
+}
+
+SUPPORTED_TYPES: List[str] = sorted(_KERNELS)
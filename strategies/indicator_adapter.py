@@ -16,7 +16,30 @@ import sys
 root_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(root_dir))
 
-from strategies.technical_indicators import TechnicalIndicatorsPipeline
+from strategies.indicator_planner import IndicatorPlanner
+
+# Wire formats for indicator series:
+#   'points'  - [{time, value}, ...] per line (default, what the charts consume)
+#   'columns' - {'time': [...], 'value': [...]} per line (parallel arrays, about half the JSON)
+SERIES_FORMATS = ('points', 'columns')
+
+
+def columnar_series(points: List[Dict[str, float]]) -> Dict[str, List]:
+    """Parallel {'time': [...], 'value': [...]} arrays from a [{time, value}, ...] series."""
+    return {'time': [p['time'] for p in points], 'value': [p['value'] for p in points]}
+
+
+def columnar_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """calculate_indicators result with every series (including MACD/BB/Stoch lines) as parallel arrays."""
+    if not result.get('series'):
+        return {**result, 'series_format': 'columns'}
+    series = {}
+    for instance_name, data in result['series'].items():
+        if isinstance(data, dict):
+            series[instance_name] = {line: columnar_series(points) for line, points in data.items()}
+        else:
+            series[instance_name] = columnar_series(data)
+    return {**result, 'series': series, 'series_format': 'columns'}
 
 
 class IndicatorAdapter:
@@ -30,15 +53,16 @@ class IndicatorAdapter:
     """
     
     def __init__(self):
-        """Initialize the adapter (TechnicalIndicatorsPipeline created per request to avoid parameter bleed)."""
-        pass  # Pipeline instantiated per request for isolation
+        """Initialize the adapter (an IndicatorPlanner is created per request, so parameters never bleed)."""
+        pass  # Planner instantiated per request for isolation
     
     def calculate_indicators_for_instances(
         self, 
         asset: str, 
         candles: List[List], 
         instances: Dict[str, Dict[str, Any]],
-        timeframe_seconds: int = 60
+        timeframe_seconds: int = 60,
+        series_format: str = 'points'
     ) -> Dict[str, Any]:
         """
         Calculate indicators for multiple instances.
@@ -52,6 +76,7 @@ class IndicatorAdapter:
                     'RSI-14': {'type': 'rsi', 'params': {'period': 14}}
                 }
             timeframe_seconds: Candle period in seconds (default: 60 for 1-minute candles)
+            series_format: 'points' (default) or 'columns' (see SERIES_FORMATS)
         
         Returns:
             Dict with format:
@@ -62,6 +87,7 @@ class IndicatorAdapter:
                 'signals': {instance_name: signal, ...},
                 'timestamp': str
             }
+            ('columns' adds 'series_format' and gives each series as {time: [...], value: [...]})
         """
         try:
             # Convert candles to DataFrame
@@ -89,27 +115,28 @@ class IndicatorAdapter:
                 "signals": {},
                 "timestamp": datetime.now().isoformat()
             }
+            if series_format == 'columns':
+                result['series_format'] = 'columns'
+            
+            # One pass for all instances: only requested kernels run, identical
+            # (type, params) instances are computed once and intermediates are shared
+            planner = IndicatorPlanner(df)
+            instance_columns = planner.evaluate(instances)
             
-            # Calculate each indicator instance
             for instance_name, instance_config in instances.items():
                 indicator_type = instance_config.get('type')
                 params = instance_config.get('params', {})
-                
-                # Create fresh pipeline instance for this indicator to prevent parameter bleed
-                pipeline = TechnicalIndicatorsPipeline()
-                
-                # Configure pipeline for this specific indicator
-                self._configure_pipeline_for_indicator(pipeline, indicator_type, params)
-                
-                # Calculate indicators
-                df_with_indicators = pipeline.calculate_indicators(df.copy())
+                columns = instance_columns.get(instance_name)
+                if not columns:
+                    continue
                 
                 # Extract and format results for this instance
                 instance_result = self._extract_indicator_data(
-                    df_with_indicators,
+                    pd.DataFrame({'timestamp': df['timestamp'], **columns}, copy=False),
                     indicator_type,
                     instance_name,
-                    params
+                    params,
+                    series_format
                 )
                 
                 if instance_result:
@@ -131,7 +158,7 @@ class IndicatorAdapter:
         Convert candle array format to pandas DataFrame.
         
         Args:
-            candles: List of [timestamp, open, close, high, low]
+            candles: List of [timestamp, open, close, high, low] or a CandleSeries
         
         Returns:
             DataFrame with columns: timestamp, open, high, low, close
@@ -139,6 +166,18 @@ class IndicatorAdapter:
         if not candles:
             return pd.DataFrame()
         
+        # Candle store series expose zero-copy column views
+        if hasattr(candles, 'columns'):
+            columns = candles.columns()
+            return pd.DataFrame({
+                'timestamp': columns['timestamp'].astype(np.int64),
+                'open': columns['open'],
+                'close': columns['close'],
+                'high': columns['high'],
+                'low': columns['low'],
+                'volume': np.zeros(len(candles), dtype=np.int64)  # OTC pairs don't have volume
+            }, copy=False)
+        
         # Extract OHLC data (note: candles format is [timestamp, open, close, high, low])
         data = {
             'timestamp': [c[0] for c in candles],
@@ -151,44 +190,6 @@ class IndicatorAdapter:
         
         return pd.DataFrame(data)
     
-    def _configure_pipeline_for_indicator(self, pipeline: TechnicalIndicatorsPipeline, indicator_type: str, params: Dict[str, Any]):
-        """
-        Configure the pipeline parameters for a specific indicator.
-        
-        Args:
-            pipeline: TechnicalIndicatorsPipeline instance to configure
-            indicator_type: Type of indicator (sma, ema, rsi, etc.)
-            params: Parameters for the indicator
-        """
-        # Map frontend indicator types to pipeline parameter names
-        param_mapping = {
-            'sma': {'period': 'sma_period'},
-            'ema': {'period': 'ema_fast'},
-            'wma': {'period': 'wma_period'},
-            'rsi': {'period': 'rsi_period'},
-            'macd': {'fast': 'macd_fast', 'slow': 'macd_slow', 'signal': 'macd_signal'},
-            'bollinger': {'period': 'bb_period', 'std_dev': 'bb_std'},
-            'stochastic': {'k': 'stoch_k', 'd': 'stoch_d'},
-            'williams_r': {'period': 'williams_period'},
-            'roc': {'period': 'roc_period'},
-            'schaff_tc': {
-                'fast': 'schaff_fast',
-                'slow': 'schaff_slow',
-                'd_macd': 'schaff_d_macd',
-                'd_pf': 'schaff_d_pf'
-            },
-            'demarker': {'period': 'demarker_period'},
-            'cci': {'period': 'cci_period'},
-            'atr': {'period': 'atr_period'},
-            'supertrend': {'period': 'supertrend_period', 'multiplier': 'supertrend_multiplier'}
-        }
-        
-        # Update pipeline params (each pipeline instance is fresh, so no bleed)
-        if indicator_type in param_mapping:
-            for param_key, pipeline_key in param_mapping[indicator_type].items():
-                if param_key in params:
-                    pipeline.params[pipeline_key] = params[param_key]
-    
     def _find_indicator_columns(self, df: pd.DataFrame, indicator_type: str):
         """
         Dynamically find DataFrame columns for a given indicator type.
@@ -271,7 +272,8 @@ class IndicatorAdapter:
         df: pd.DataFrame, 
         indicator_type: str,
         instance_name: str,
-        params: Dict[str, Any]
+        params: Dict[str, Any],
+        series_format: str = 'points'
     ) -> Optional[Dict[str, Any]]:
         """
         Extract indicator data from calculated DataFrame and format for frontend.
@@ -282,6 +284,7 @@ class IndicatorAdapter:
             indicator_type: Type of indicator
             instance_name: Name of this instance
             params: Parameters used
+            series_format: 'points' or 'columns'
         
         Returns:
             Dict with 'indicator', 'series', and optionally 'signal'
@@ -297,7 +300,7 @@ class IndicatorAdapter:
             if columns not in df.columns:
                 return None
             
-            series_data = self._create_series(df, columns)
+            series_data = self._create_series(df, columns, series_format)
             latest_value = df[columns].iloc[-1] if not pd.isna(df[columns].iloc[-1]) else None
             
             result = {
@@ -317,38 +320,41 @@ class IndicatorAdapter:
         
         # Handle multi-column indicators (MACD, Bollinger, Stochastic)
         elif isinstance(columns, list):
-            return self._extract_multi_column_indicator(df, indicator_type, columns, params)
+            return self._extract_multi_column_indicator(df, indicator_type, columns, params, series_format)
         
         return None
     
-    def _create_series(self, df: pd.DataFrame, column: str) -> List[Dict[str, float]]:
+    def _create_series(self, df: pd.DataFrame, column: str, series_format: str = 'points'):
         """
-        Create time series data for a single indicator column.
+        Create time series data for a single indicator column (NaN rows dropped).
         
         Args:
             df: DataFrame with indicator data
             column: Column name to extract
+            series_format: 'points' or 'columns'
         
         Returns:
-            List of {time: timestamp, value: float}
+            List of {time: timestamp, value: float}, or {time: [...], value: [...]} for 'columns'
         """
-        series_data = []
-        for idx, row in df.iterrows():
-            if not pd.isna(row[column]):
-                series_data.append({
-                    'time': int(row['timestamp']),
-                    'value': float(row[column])
-                })
-        return series_data
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        times = df['timestamp'].to_numpy()[valid].astype(np.int64).tolist()
+        values = values[valid].tolist()
+        if series_format == 'columns':
+            return {'time': times, 'value': values}
+        return [{'time': t, 'value': v} for t, v in zip(times, values)]
     
     def _extract_multi_column_indicator(
         self,
         df: pd.DataFrame,
         indicator_type: str,
         columns: List[str],
-        params: Dict[str, Any]
+        params: Dict[str, Any],
+        series_format: str = 'points'
     ) -> Dict[str, Any]:
         """Extract data for multi-column indicators like MACD, Bollinger Bands, Stochastic."""
+        # Latest row of every line in one lookup
+        latest = {col: (None if pd.isna(value) else float(value)) for col, value in df[columns].iloc[-1].items()}
         
         if indicator_type == 'macd':
             # MACD has three lines: macd, signal, histogram
@@ -356,18 +362,18 @@ class IndicatorAdapter:
             
             return {
                 'indicator': {
-                    'macd': float(df[macd_col].iloc[-1]) if not pd.isna(df[macd_col].iloc[-1]) else None,
-                    'signal': float(df[signal_col].iloc[-1]) if not pd.isna(df[signal_col].iloc[-1]) else None,
-                    'histogram': float(df[histogram_col].iloc[-1]) if not pd.isna(df[histogram_col].iloc[-1]) else None,
+                    'macd': latest[macd_col],
+                    'signal': latest[signal_col],
+                    'histogram': latest[histogram_col],
                     'type': 'macd',
                     **params
                 },
                 'series': {
-                    'macd': self._create_series(df, macd_col),
-                    'signal': self._create_series(df, signal_col),
-                    'histogram': self._create_series(df, histogram_col)
+                    'macd': self._create_series(df, macd_col, series_format),
+                    'signal': self._create_series(df, signal_col, series_format),
+                    'histogram': self._create_series(df, histogram_col, series_format)
                 },
-                'signal': 'BUY' if df[histogram_col].iloc[-1] > 0 else 'SELL'
+                'signal': 'BUY' if latest[histogram_col] is not None and latest[histogram_col] > 0 else 'SELL'
             }
         
         elif indicator_type == 'bollinger':
@@ -376,16 +382,16 @@ class IndicatorAdapter:
             
             return {
                 'indicator': {
-                    'upper': float(df[upper_col].iloc[-1]) if not pd.isna(df[upper_col].iloc[-1]) else None,
-                    'middle': float(df[middle_col].iloc[-1]) if not pd.isna(df[middle_col].iloc[-1]) else None,
-                    'lower': float(df[lower_col].iloc[-1]) if not pd.isna(df[lower_col].iloc[-1]) else None,
+                    'upper': latest[upper_col],
+                    'middle': latest[middle_col],
+                    'lower': latest[lower_col],
                     'type': 'bollinger',
                     **params
                 },
                 'series': {
-                    'upper': self._create_series(df, upper_col),
-                    'middle': self._create_series(df, middle_col),
-                    'lower': self._create_series(df, lower_col)
+                    'upper': self._create_series(df, upper_col, series_format),
+                    'middle': self._create_series(df, middle_col, series_format),
+                    'lower': self._create_series(df, lower_col, series_format)
                 }
             }
         
@@ -395,20 +401,60 @@ class IndicatorAdapter:
             
             return {
                 'indicator': {
-                    'k': float(df[k_col].iloc[-1]) if not pd.isna(df[k_col].iloc[-1]) else None,
-                    'd': float(df[d_col].iloc[-1]) if not pd.isna(df[d_col].iloc[-1]) else None,
+                    'k': latest[k_col],
+                    'd': latest[d_col],
                     'type': 'stochastic',
                     **params
                 },
                 'series': {
-                    'k': self._create_series(df, k_col),
-                    'd': self._create_series(df, d_col)
+                    'k': self._create_series(df, k_col, series_format),
+                    'd': self._create_series(df, d_col, series_format)
                 },
-                'signal': self._generate_stochastic_signal(df[k_col].iloc[-1], df[d_col].iloc[-1])
+                'signal': self._generate_stochastic_signal(latest[k_col], latest[d_col])
             }
         
         return {}
     
+    def format_latest(
+        self,
+        indicator_type: str,
+        params: Dict[str, Any],
+        values: Dict[str, Optional[float]]
+    ) -> Dict[str, Any]:
+        """
+        Build the 'indicator' entry (and 'signal') for one instance's latest values,
+        in the shape _extract_indicator_data produces. Used for streamed updates.
+
+        Args:
+            indicator_type: Type of indicator
+            params: Instance parameters
+            values: {'value': x} for single-line indicators, otherwise keyed like the
+                series ('macd'/'signal'/'histogram', 'upper'/'middle'/'lower', 'k'/'d')
+
+        Returns:
+            Dict with 'indicator' and optionally 'signal'
+        """
+        if indicator_type == 'macd':
+            histogram = values.get('histogram')
+            return {
+                'indicator': {**values, 'type': 'macd', **params},
+                'signal': 'BUY' if histogram is not None and histogram > 0 else 'SELL'
+            }
+
+        if indicator_type == 'bollinger':
+            return {'indicator': {**values, 'type': 'bollinger', **params}}
+
+        if indicator_type == 'stochastic':
+            return {
+                'indicator': {**values, 'type': 'stochastic', **params},
+                'signal': self._generate_stochastic_signal(values.get('k'), values.get('d'))
+            }
+
+        result = {'indicator': {'value': values.get('value'), 'type': indicator_type, **params}}
+        if indicator_type in ['rsi', 'williams_r', 'roc', 'schaff_tc', 'demarker', 'cci']:
+            result['signal'] = self._generate_signal(indicator_type, values.get('value'))
+        return result
+
     def _generate_signal(self, indicator_type: str, value: Optional[float]) -> str:
         """
         Generate BUY/SELL signal based on indicator value and type.
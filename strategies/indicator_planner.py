@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Indicator Planner Module
+Evaluates a set of frontend indicator instances in one pass over a shared
+OHLC frame instead of one full TechnicalIndicatorsPipeline run per instance:
+
+- only the requested indicator kernels run (no patterns, pivots, volume...)
+- identical (type, params) instances are computed once
+- intermediates (EMAs, true range, ATR, typical price, hl2) are shared
+- library choice (pandas-ta, then TA-Lib, then manual) and formulas follow
+  TechnicalIndicatorsPipeline, so results match a full pipeline run
+"""
+
+import logging
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+from strategies import technical_indicators as ti
+from strategies.technical_indicators import (
+    TechnicalIndicatorsPipeline,
+    commodity_channel_index,
+    demarker,
+    schaff_trend_cycle,
+    supertrend_from_bands,
+    true_range,
+    weighted_moving_average,
+)
+
+logger = logging.getLogger(__name__)
+
+# Frontend param name -> TechnicalIndicatorsPipeline.params key, per indicator type
+PARAM_MAPPING: Dict[str, Dict[str, str]] = {
+    'sma': {'period': 'sma_period'},
+    'ema': {'period': 'ema_fast'},
+    'wma': {'period': 'wma_period'},
+    'rsi': {'period': 'rsi_period'},
+    'macd': {'fast': 'macd_fast', 'slow': 'macd_slow', 'signal': 'macd_signal'},
+    'bollinger': {'period': 'bb_period', 'std_dev': 'bb_std'},
+    'stochastic': {'k': 'stoch_k', 'd': 'stoch_d'},
+    'williams_r': {'period': 'williams_period'},
+    'roc': {'period': 'roc_period'},
+    'schaff_tc': {
+        'fast': 'schaff_fast',
+        'slow': 'schaff_slow',
+        'd_macd': 'schaff_d_macd',
+        'd_pf': 'schaff_d_pf'
+    },
+    'demarker': {'period': 'demarker_period'},
+    'cci': {'period': 'cci_period'},
+    'atr': {'period': 'atr_period'},
+    'supertrend': {'period': 'supertrend_period', 'multiplier': 'supertrend_multiplier'}
+}
+
+_default_params: Optional[Dict[str, Any]] = None
+
+
+def default_params() -> Dict[str, Any]:
+    """TechnicalIndicatorsPipeline default parameters"""
+    global _default_params
+    if _default_params is None:
+        _default_params = dict(TechnicalIndicatorsPipeline().params)
+    return _default_params
+
+
+def resolve_params(indicator_type: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Pipeline parameters an instance runs with (frontend params over pipeline defaults)"""
+    resolved = dict(default_params())
+    for param_key, pipeline_key in PARAM_MAPPING.get(indicator_type, {}).items():
+        if params and param_key in params:
+            resolved[pipeline_key] = params[param_key]
+    return resolved
+
+
+def request_key(indicator_type: str, params: Optional[Dict[str, Any]]) -> Tuple:
+    """Dedup key: indicator type plus the pipeline parameters that affect it"""
+    resolved = resolve_params(indicator_type, params)
+    return (indicator_type,) + tuple((key, resolved[key]) for key in sorted(PARAM_MAPPING.get(indicator_type, {}).values()))
+
+
+class IndicatorPlanner:
+    """
+    Computes indicator kernels over one OHLC frame, memoising shared intermediates.
+
+    Usage:
+        planner = IndicatorPlanner(df)
+        columns = planner.evaluate({'SMA-20': {'type': 'sma', 'params': {'period': 20}}})
+        columns['SMA-20']  # {'sma_20': pd.Series}
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.high = df['high']
+        self.low = df['low']
+        self.close = df['close']
+        self._shared: Dict[Hashable, Any] = {}
+        self._results: Dict[Tuple, Optional[Dict[str, pd.Series]]] = {}
+
+        # Counters
+        self.kernel_runs = 0
+        self.shared_hits = 0
+
+    def evaluate(self, instances: Dict[str, Dict[str, Any]]) -> Dict[str, Optional[Dict[str, pd.Series]]]:
+        """
+        Output columns per instance name (pipeline column names, e.g. 'macd', 'macd_signal').
+
+        Instances with an unknown type, or whose backing library is unavailable, map to None.
+        """
+        out = {}
+        for instance_name, instance_config in instances.items():
+            indicator_type = instance_config.get('type')
+            params = instance_config.get('params', {})
+            out[instance_name] = self.compute(indicator_type, params)
+        return out
+
+    def compute(self, indicator_type: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, pd.Series]]:
+        key = request_key(indicator_type, params)
+        if key in self._results:
+            return self._results[key]
+        kernel = _KERNELS.get(indicator_type)
+        result = None
+        if kernel is not None:
+            self.kernel_runs += 1
+            try:
+                result = kernel(self, resolve_params(indicator_type, params))
+            except Exception as e:
+                logger.error(f"Error calculating {indicator_type}: {str(e)}")
+        self._results[key] = result
+        return result
+
+    # ========================================
+    # Shared intermediates
+    # ========================================
+
+    def shared(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        if key in self._shared:
+            self.shared_hits += 1
+            return self._shared[key]
+        value = self._shared[key] = build()
+        return value
+
+    def ema(self, span: int, adjust: bool = True) -> pd.Series:
+        return self.shared(('ema', span, adjust), lambda: self.close.ewm(span=span, adjust=adjust).mean())
+
+    def true_range(self) -> pd.Series:
+        return self.shared('true_range', lambda: true_range(self.high, self.low, self.close))
+
+    def typical_price(self) -> pd.Series:
+        return self.shared('typical_price', lambda: (self.high + self.low + self.close) / 3)
+
+    def hl2(self) -> pd.Series:
+        return self.shared('hl2', lambda: (self.high + self.low) / 2)
+
+    def atr(self, period: int) -> pd.Series:
+        """ATR with the pipeline's library preference (pandas-ta, TA-Lib, rolling mean of TR)"""
+        def build():
+            if ti.ta.available:
+                return ti.ta.atr(self.high, self.low, self.close, length=period)
+            if ti.talib.available:
+                return ti.talib.ATR(self.high, self.low, self.close, timeperiod=period)
+            return self.true_range().rolling(window=period).mean()
+        return self.shared(('atr', period), build)
+
+
+# ========================================
+# Kernels: planner, resolved pipeline params -> {pipeline column: series}
+# ========================================
+
+def _sma(planner: IndicatorPlanner, p: Dict[str, Any]):
+    return {'sma_20': planner.close.rolling(window=p['sma_period']).mean()}
+
+
+def _ema(planner: IndicatorPlanner, p: Dict[str, Any]):
+    return {'ema_16': planner.ema(p['ema_fast'])}
+
+
+def _wma(planner: IndicatorPlanner, p: Dict[str, Any]):
+    return {'wma_20': weighted_moving_average(planner.close, p['wma_period'])}
+
+
+def _macd(planner: IndicatorPlanner, p: Dict[str, Any]):
+    fast, slow, signal = p['macd_fast'], p['macd_slow'], p['macd_signal']
+    if ti.ta.available:
+        data = ti.ta.macd(planner.close, fast=fast, slow=slow, signal=signal)
+        if data is None or data.empty:
+            return None
+        suffix = f"{fast}_{slow}_{signal}"
+        return {'macd': data[f"MACD_{suffix}"], 'macd_signal': data[f"MACDs_{suffix}"],
+                'macd_histogram': data[f"MACDh_{suffix}"]}
+    if ti.talib.available:
+        macd, macd_signal, histogram = ti.talib.MACD(planner.close, fastperiod=fast, slowperiod=slow,
+                                                     signalperiod=signal)
+        return {'macd': macd, 'macd_signal': macd_signal, 'macd_histogram': histogram}
+    return None
+
+
+def _bollinger(planner: IndicatorPlanner, p: Dict[str, Any]):
+    period, std = p['bb_period'], p['bb_std']
+    if ti.ta.available:
+        data = ti.ta.bbands(planner.close, length=period, std=std)
+        if data is None or data.empty:
+            return None
+        return {'bb_upper': data[f"BBU_{period}_{std}"], 'bb_middle': data[f"BBM_{period}_{std}"],
+                'bb_lower': data[f"BBL_{period}_{std}"]}
+    if ti.talib.available:
+        upper, middle, lower = ti.talib.BBANDS(planner.close, timeperiod=period, nbdevup=std, nbdevdn=std)
+        return {'bb_upper': upper, 'bb_middle': middle, 'bb_lower': lower}
+    return None
+
+
+def _rsi(planner: IndicatorPlanner, p: Dict[str, Any]):
+    if ti.ta.available:
+        return {'rsi_14': ti.ta.rsi(planner.close, length=p['rsi_period'])}
+    if ti.talib.available:
+        return {'rsi_14': ti.talib.RSI(planner.close, timeperiod=p['rsi_period'])}
+    return None
+
+
+def _stochastic(planner: IndicatorPlanner, p: Dict[str, Any]):
+    k, d = p['stoch_k'], p['stoch_d']
+    if ti.ta.available:
+        data = ti.ta.stoch(planner.high, planner.low, planner.close, k=k, d=d)
+        if data is None or data.empty:
+            return None
+        return {'stoch_k': data[f"STOCHk_{k}_{d}_3"], 'stoch_d': data[f"STOCHd_{k}_{d}_3"]}
+    if ti.talib.available:
+        stoch_k, stoch_d = ti.talib.STOCH(planner.high, planner.low, planner.close,
+                                          fastk_period=k, slowk_period=d, slowd_period=3)
+        return {'stoch_k': stoch_k, 'stoch_d': stoch_d}
+    return None
+
+
+def _williams_r(planner: IndicatorPlanner, p: Dict[str, Any]):
+    if ti.ta.available:
+        return {'williams_r': ti.ta.willr(planner.high, planner.low, planner.close, length=p['williams_period'])}
+    if ti.talib.available:
+        return {'williams_r': ti.talib.WILLR(planner.high, planner.low, planner.close,
+                                             timeperiod=p['williams_period'])}
+    return None
+
+
+def _roc(planner: IndicatorPlanner, p: Dict[str, Any]):
+    if ti.ta.available:
+        return {'roc_10': ti.ta.roc(planner.close, length=p['roc_period'])}
+    if ti.talib.available:
+        return {'roc_10': ti.talib.ROC(planner.close, timeperiod=p['roc_period'])}
+    return None
+
+
+def _schaff_tc(planner: IndicatorPlanner, p: Dict[str, Any]):
+    macd = planner.ema(p['schaff_fast'], adjust=False) - planner.ema(p['schaff_slow'], adjust=False)
+    return {'schaff_tc': schaff_trend_cycle(macd, p['schaff_d_macd'], p['schaff_d_pf'])}
+
+
+def _demarker(planner: IndicatorPlanner, p: Dict[str, Any]):
+    return {'demarker': demarker(planner.high, planner.low, p['demarker_period'])}
+
+
+def _cci(planner: IndicatorPlanner, p: Dict[str, Any]):
+    return {'cci': commodity_channel_index(planner.typical_price(), p['cci_period'])}
+
+
+def _atr(planner: IndicatorPlanner, p: Dict[str, Any]):
+    return {'atr_14': planner.atr(p['atr_period'])}
+
+
+def _supertrend(planner: IndicatorPlanner, p: Dict[str, Any]):
+    period, multiplier = p['supertrend_period'], p['supertrend_multiplier']
+    if ti.ta.available:
+        data = ti.ta.supertrend(planner.high, planner.low, planner.close, length=period, multiplier=multiplier)
+        if data is None or data.empty:
+            return None
+        return {'supertrend': data[f"SUPERT_{period}_{multiplier}"]}
+    # Like the pipeline's manual path: bands use the atr_period ATR (atr_14 column), not supertrend_period
+    atr = planner.atr(p['atr_period'])
+    hl2 = planner.hl2()
+    supertrend, _ = supertrend_from_bands(planner.close, hl2 + multiplier * atr, hl2 - multiplier * atr)
+    return {'supertrend': supertrend}
+
+
+_KERNELS: Dict[str, Callable[[IndicatorPlanner, Dict[str, Any]], Optional[Dict[str, pd.Series]]]] = {
+    'sma': _sma,
+    'ema': _ema,
+    'wma': _wma,
+    'macd': _macd,
+    'bollinger': _bollinger,
+    'rsi': _rsi,
+    'stochastic': _stochastic,
+    'williams_r': _williams_r,
+    'roc': _roc,
+    'schaff_tc': _schaff_tc,
+    'demarker': _demarker,
+    'cci': _cci,
+    'atr': _atr,
+    'supertrend': _supertrend,
+}
+
+SUPPORTED_TYPES: List[str] = sorted(_KERNELS)
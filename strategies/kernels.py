@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Kernels Module
+Vectorised NumPy indicator kernels shared by every strategy.
+
+Each kernel takes price arrays (lists are accepted) and comes in two forms:
+
+- name(...) returns the full series, NaN while the window fills
+- name_last(...) returns the latest value only, reading just the tail
+  where the indicator has no recursion
+
+Full-series kernels also take 2-D (rows x time) arrays and run every row at
+once along the last axis (see strategies/batch_indicators.py).
+
+EMA-style recursions (EMA, Wilder RSI, the MACD signal line) run as a blocked
+scan: each block of _BLOCK values is smoothed from zero with one matrix
+product, and the levels carried between blocks are the same recursion over
+n / _BLOCK block ends, so nothing loops per value in Python.
+"""
+
+from functools import lru_cache
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+_BLOCK = 64
+
+
+def _as_array(values: ArrayLike) -> np.ndarray:
+    return np.asarray(values, dtype=float)
+
+
+def _tail(values: ArrayLike, n: int) -> np.ndarray:
+    """The last n values as an array (lists are sliced before converting)"""
+    return _as_array(values[-n:] if n > 0 else values[:0])
+
+
+def _warmup(shape: Tuple[int, ...], start: int, values: np.ndarray) -> np.ndarray:
+    """values placed at [..., start:], NaN before"""
+    out = np.full(shape, np.nan)
+    out[..., start:] = values
+    return out
+
+
+@lru_cache(maxsize=128)
+def _block_weights(alpha: float, size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(weights, carry) for one block: weights[j, k] = alpha * decay**(k - j) for j <= k, carry[k] = decay**(k + 1)"""
+    decay = 1.0 - alpha
+    steps = np.arange(size)
+    lags = steps[None, :] - steps[:, None]
+    weights = np.where(lags >= 0, alpha * decay ** np.maximum(lags, 0), 0.0)
+    carry = decay ** (steps + 1)
+    weights.flags.writeable = False
+    carry.flags.writeable = False
+    return weights, carry
+
+
+def _smooth(values: np.ndarray, alpha: float, start) -> np.ndarray:
+    """y[..., i] = alpha * values[..., i] + (1 - alpha) * y[..., i - 1], with y[..., -1] = start"""
+    n = values.shape[-1]
+    if n == 0:
+        return np.empty(values.shape)
+    rows = values.shape[:-1]
+    size = min(_BLOCK, n)
+    weights, carry = _block_weights(alpha, size)
+    blocks = -(-n // size)
+    padded = np.zeros(rows + (blocks, size))
+    padded.reshape(rows + (-1,))[..., :n] = values
+    partial = (padded.reshape(-1, size) @ weights).reshape(padded.shape)  # Every block smoothed from zero
+
+    carry_in = np.empty(rows + (blocks,))
+    carry_in[..., 0] = start
+    if blocks > 1:
+        # Levels after each block follow the same recursion one level up:
+        # level[b] = decay**size * level[b - 1] + partial[b, -1]
+        tail = carry[-1]
+        carry_in[..., 1:] = _smooth(partial[..., :-1, -1] / (1 - tail), 1 - tail, carry_in[..., 0])
+    partial += carry_in[..., None] * carry
+    return partial.reshape(rows + (-1,))[..., :n]
+
+
+def _rolling_extreme(values: np.ndarray, period: int, ufunc: np.ufunc) -> np.ndarray:
+    """Rolling max/min over the last axis as period - 1 shifted elementwise passes (no per-window reduce)"""
+    n = values.shape[-1]
+    out = values[..., period - 1:].copy()
+    for lag in range(1, period):
+        ufunc(out, values[..., period - 1 - lag:n - lag], out=out)
+    return out
+
+
+def _rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """100 - 100 / (1 + gain / loss); 100 when there are no losses"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+
+
+def _gains_losses(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    deltas = np.diff(values)
+    return np.where(deltas > 0, deltas, 0.0), np.where(deltas < 0, -deltas, 0.0)
+
+
+# ========================================
+# Moving averages
+# ========================================
+
+def sma(values: ArrayLike, period: int) -> np.ndarray:
+    """Simple moving average"""
+    x = _as_array(values)
+    if not 0 < period <= x.shape[-1]:
+        return np.full(x.shape, np.nan)
+    return _warmup(x.shape, period - 1, sliding_window_view(x, period, axis=-1).mean(axis=-1))
+
+
+def sma_last(values: ArrayLike, period: int) -> float:
+    return float(np.mean(_tail(values, period))) if 0 < period <= len(values) else float('nan')
+
+
+def ema(values: ArrayLike, period: int) -> np.ndarray:
+    """Exponential moving average, alpha = 2 / (period + 1), seeded on the first value"""
+    x = _as_array(values)
+    out = np.empty(x.shape)
+    if x.shape[-1]:
+        out[..., 0] = x[..., 0]
+        out[..., 1:] = _smooth(x[..., 1:], 2.0 / (period + 1), x[..., 0])
+    return out
+
+
+def ema_last(values: ArrayLike, period: int) -> float:
+    x = _as_array(values)
+    return float(ema(x, period)[-1]) if len(x) else float('nan')
+
+
+# ========================================
+# Oscillators
+# ========================================
+
+def rsi(values: ArrayLike, period: int = 14) -> np.ndarray:
+    """Wilder RSI: averages seeded on the first period moves, then smoothed with alpha = 1 / period"""
+    x = _as_array(values)
+    if x.shape[-1] < period + 1:
+        return np.full(x.shape, np.nan)
+    alpha = 1.0 / period
+    gain_loss = []
+    for moves in _gains_losses(x):
+        averages = np.empty(moves.shape[:-1] + (moves.shape[-1] - period + 1,))
+        averages[..., 0] = np.mean(moves[..., :period], axis=-1)
+        averages[..., 1:] = _smooth(moves[..., period:], alpha, averages[..., 0])
+        gain_loss.append(averages)
+    return _warmup(x.shape, period, _rsi_from_averages(*gain_loss))
+
+
+def rsi_last(values: ArrayLike, period: int = 14) -> float:
+    return float(rsi(values, period)[-1])
+
+
+def cutler_rsi(values: ArrayLike, period: int = 14) -> np.ndarray:
+    """Cutler RSI: plain means of the last period gains and losses (no smoothing)"""
+    x = _as_array(values)
+    if x.shape[-1] < period + 1:
+        return np.full(x.shape, np.nan)
+    gains, losses = _gains_losses(x)
+    avg_gain = sliding_window_view(gains, period, axis=-1).mean(axis=-1)
+    avg_loss = sliding_window_view(losses, period, axis=-1).mean(axis=-1)
+    return _warmup(x.shape, period, _rsi_from_averages(avg_gain, avg_loss))
+
+
+def cutler_rsi_last(values: ArrayLike, period: int = 14) -> float:
+    if len(values) < period + 1:
+        return float('nan')
+    gains, losses = _gains_losses(_tail(values, period + 1))
+    return float(_rsi_from_averages(np.mean(gains), np.mean(losses)))
+
+
+def macd(values: ArrayLike, fast: int = 12, slow: int = 26,
+         signal: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(macd, signal, histogram); the signal line is an EMA of the MACD line seeded on its first value"""
+    x = _as_array(values)
+    line = ema(x, fast) - ema(x, slow)
+    signal_line = ema(line, signal)
+    return line, signal_line, line - signal_line
+
+
+def macd_last(values: ArrayLike, fast: int = 12, slow: int = 26,
+              signal: int = 9) -> Tuple[float, float, float]:
+    line, signal_line, histogram = macd(_as_array(values), fast, slow, signal)
+    if not len(line):
+        return float('nan'), float('nan'), float('nan')
+    return float(line[-1]), float(signal_line[-1]), float(histogram[-1])
+
+
+def stochastic(high: ArrayLike, low: ArrayLike, close: ArrayLike, k_period: int = 14,
+               d_period: int = 3) -> Tuple[np.ndarray, np.ndarray]:
+    """(%K, %D): close within the k_period high-low range (50 on a flat range), %D its d_period SMA"""
+    h, l, c = _as_array(high), _as_array(low), _as_array(close)
+    if not 0 < k_period <= c.shape[-1]:
+        return np.full(c.shape, np.nan), np.full(c.shape, np.nan)
+    highest, lowest = _rolling_extreme(h, k_period, np.maximum), _rolling_extreme(l, k_period, np.minimum)
+    span = highest - lowest
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = np.where(span == 0, 50.0, (c[..., k_period - 1:] - lowest) / span * 100)
+    return _warmup(c.shape, k_period - 1, k), _warmup(c.shape, k_period - 1, sma(k, d_period))
+
+
+def stochastic_last(high: ArrayLike, low: ArrayLike, close: ArrayLike, k_period: int = 14,
+                    d_period: int = 3) -> Tuple[float, float]:
+    """(%K, %D) of the latest candle; %D is NaN until d_period %K values exist"""
+    if not 0 < k_period <= len(close):
+        return float('nan'), float('nan')
+    tail = k_period + d_period - 1
+    h, l, c = _tail(high, tail), _tail(low, tail), _tail(close, tail)
+    windows = np.arange(len(c) - k_period + 1)[:, None] + np.arange(k_period)  # At most d_period rows
+    highest, lowest = h[windows].max(axis=1), l[windows].min(axis=1)
+    span = highest - lowest
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = np.where(span == 0, 50.0, (c[k_period - 1:] - lowest) / span * 100)
+    return float(k[-1]), float(np.mean(k)) if len(k) == d_period else float('nan')
+
+
+# ========================================
+# Volatility
+# ========================================
+
+def bollinger(values: ArrayLike, period: int = 20,
+              num_std: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(upper, middle, lower): SMA +/- num_std population standard deviations"""
+    x = _as_array(values)
+    if not 0 < period <= x.shape[-1]:
+        nan = np.full(x.shape, np.nan)
+        return nan, nan.copy(), nan.copy()
+    middle = sliding_window_view(x, period, axis=-1).mean(axis=-1)
+    # Squared deviations summed as shifted passes; windows.std() reduces each window separately
+    m = middle.shape[-1]
+    variance = np.zeros(middle.shape)
+    for lag in range(period):
+        deviation = x[..., lag:lag + m] - middle
+        variance += deviation * deviation
+    std = np.sqrt(variance / period)
+    start = period - 1
+    return (_warmup(x.shape, start, middle + std * num_std), _warmup(x.shape, start, middle),
+            _warmup(x.shape, start, middle - std * num_std))
+
+
+def bollinger_last(values: ArrayLike, period: int = 20, num_std: float = 2.0) -> Tuple[float, float, float]:
+    if not 0 < period <= len(values):
+        return float('nan'), float('nan'), float('nan')
+    window = _tail(values, period)
+    middle, std = float(np.mean(window)), float(np.std(window))
+    return middle + std * num_std, middle, middle - std * num_std
+
+
+def true_range(high: ArrayLike, low: ArrayLike, close: ArrayLike) -> np.ndarray:
+    """max(high - low, |high - prev close|, |low - prev close|); NaN on the first candle"""
+    h, l, c = _as_array(high), _as_array(low), _as_array(close)
+    out = np.full(c.shape, np.nan)
+    if c.shape[-1] > 1:
+        h, l, prev_close = h[..., 1:], l[..., 1:], c[..., :-1]
+        out[..., 1:] = np.maximum(h - l, np.maximum(np.abs(h - prev_close), np.abs(l - prev_close)))
+    return out
+
+
+def atr(high: ArrayLike, low: ArrayLike, close: ArrayLike, period: int = 14) -> np.ndarray:
+    """Average true range as a simple mean of the last period true ranges"""
+    tr = true_range(high, low, close)
+    if not 0 < period < tr.shape[-1]:
+        return np.full(tr.shape, np.nan)
+    return _warmup(tr.shape, period, sliding_window_view(tr[..., 1:], period, axis=-1).mean(axis=-1))
+
+
+def atr_last(high: ArrayLike, low: ArrayLike, close: ArrayLike, period: int = 14) -> float:
+    """Mean of the last period true ranges (of all of them while fewer exist)"""
+    tail = period + 1
+    tr = true_range(_tail(high, tail), _tail(low, tail), _tail(close, tail))[1:]
+    return float(np.mean(tr)) if len(tr) else float('nan')
@@ -7,6 +7,8 @@ import numpy as np
 from typing import List, Optional, Dict, Tuple
 from dataclasses import dataclass
 
+from strategies import kernels
+
 @dataclass
 class Signal:
     direction: str  # 'call' or 'put'
@@ -150,101 +152,27 @@ class NeuralBeastQuantumFusion:
         """Exponential Moving Average calculation"""
         if len(prices) < period:
             return prices[-1] if prices else 0.0
-        
-        alpha = 2 / (period + 1)
-        ema = [prices[0]]
-        
-        for price in prices[1:]:
-            ema.append(alpha * price + (1 - alpha) * ema[-1])
-        
-        return ema[-1]
+        return kernels.ema_last(prices, period)
 
     def calculate_rsi(self, prices: List[float], period: int = 14) -> float:
-        """Relative Strength Index calculation"""
+        """Relative Strength Index calculation (Wilder smoothing)"""
         if len(prices) < period + 1:
             return 50.0
-        
-        deltas = np.diff(prices)
-        seed = deltas[:period]
-        up = seed[seed >= 0].sum() / period
-        down = -seed[seed < 0].sum() / period
-        
-        if down == 0:
-            return 100.0
-        
-        rs = up / down
-        rsi = 100 - (100 / (1 + rs))
-        
-        for i in range(period, len(deltas)):
-            delta = deltas[i]
-            if delta > 0:
-                upval = delta
-                downval = 0
-            else:
-                upval = 0
-                downval = -delta
-                
-            up = (up * (period - 1) + upval) / period
-            down = (down * (period - 1) + downval) / period
-            
-            if down == 0:
-                rs = float('inf')
-            else:
-                rs = up / down
-                
-            rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        return kernels.rsi_last(prices, period)
 
     def calculate_macd(self, prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[float, float]:
         """MACD (Moving Average Convergence Divergence) calculation"""
         if len(prices) < slow:
             return 0.0, 0.0
-        
-        # Calculate EMAs
-        ema_fast = []
-        ema_slow = []
-        
-        # Fast EMA
-        alpha_fast = 2 / (fast + 1)
-        ema_fast.append(prices[0])
-        for price in prices[1:]:
-            ema_fast.append(alpha_fast * price + (1 - alpha_fast) * ema_fast[-1])
-        
-        # Slow EMA
-        alpha_slow = 2 / (slow + 1)
-        ema_slow.append(prices[0])
-        for price in prices[1:]:
-            ema_slow.append(alpha_slow * price + (1 - alpha_slow) * ema_slow[-1])
-        
-        # MACD line
-        macd_line = [fast_ema - slow_ema for fast_ema, slow_ema in zip(ema_fast, ema_slow)]
-        
-        # Signal line
-        alpha_signal = 2 / (signal + 1)
-        signal_line = [macd_line[0]]
-        for macd_val in macd_line[1:]:
-            signal_line.append(alpha_signal * macd_val + (1 - alpha_signal) * signal_line[-1])
-        
-        return macd_line[-1], signal_line[-1]
+        macd_line, signal_line, _ = kernels.macd_last(prices, fast, slow, signal)
+        return macd_line, signal_line
 
     def calculate_bollinger_bands(self, prices: List[float], period: int = 20, std_dev: float = 2.0) -> Tuple[float, float, float]:
         """Bollinger Bands calculation"""
         if len(prices) < period:
             current_price = prices[-1] if prices else 0.0
             return current_price, current_price, current_price
-        
-        # Simple Moving Average
-        sma = np.mean(prices[-period:])
-        
-        # Standard Deviation
-        std = np.std(prices[-period:])
-        
-        # Bollinger Bands
-        upper_band = sma + (std * std_dev)
-        lower_band = sma - (std * std_dev)
-        
-        return upper_band, sma, lower_band
+        return kernels.bollinger_last(prices, period, std_dev)
 
 # Usage example
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from strategies import kernels
 from strategies.base import BaseStrategy
 
 
@@ -173,52 +174,21 @@ class QuantumFluxStrategy(BaseStrategy):
         """Calculate RSI indicator."""
         if len(prices) < period + 1:
             return 50.0
-        
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[-period:]) if np.any(gains[-period:]) else 0
-        avg_loss = np.mean(losses[-period:]) if np.any(losses[-period:]) else 0
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return kernels.cutler_rsi_last(prices, period)
     
     def _calculate_macd(self, prices: np.ndarray, fast: int, slow: int, signal: int):
         """Calculate MACD indicator."""
-        ema_fast = self._calculate_ema(prices, fast)
-        ema_slow = self._calculate_ema(prices, slow)
-        macd_line = ema_fast - ema_slow
-        
-        # Simplified signal calculation
-        macd_signal = macd_line * 0.9
-        macd_hist = macd_line - macd_signal
-        
-        return macd_line, macd_signal, macd_hist
+        return kernels.macd_last(prices, fast, slow, signal)
     
     def _calculate_ema(self, prices: np.ndarray, period: int) -> float:
         """Calculate EMA."""
         if len(prices) < period:
             return float(prices[-1]) if len(prices) > 0 else 0.0
-        
-        weights = np.exp(np.linspace(-1., 0., period))
-        weights /= weights.sum()
-        ema = np.convolve(prices, weights, mode='valid')
-        return float(ema[-1]) if len(ema) > 0 else float(prices[-1])
+        return kernels.ema_last(prices, period)
     
     def _calculate_bollinger_bands(self, prices: np.ndarray, period: int, std_dev: float):
         """Calculate Bollinger Bands."""
         if len(prices) < period:
             current = float(prices[-1]) if len(prices) > 0 else 0.0
             return current, current, current
-        
-        sma = np.mean(prices[-period:])
-        std = np.std(prices[-period:])
-        upper = sma + (std * std_dev)
-        lower = sma - (std * std_dev)
-        
-        return upper, sma, lower
+        return kernels.bollinger_last(prices, period, std_dev)
@@ -12,6 +12,8 @@ import time
 import logging
 from enum import Enum
 
+from strategies import kernels
+
 
 class TradeDirection(Enum):
     CALL = "call"
@@ -100,53 +102,29 @@ class BaseStrategy(ABC):
         pass
     
     def calculate_rsi(self, prices: List[float], period: int = 14) -> float:
-        """Calculate RSI indicator"""
+        """Calculate RSI indicator (Cutler: plain means of the last period moves)"""
         if len(prices) < period + 1:
             return 50.0
-        
-        deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[-period:]) if np.any(gains[-period:]) else 0
-        avg_loss = np.mean(losses[-period:]) if np.any(losses[-period:]) else 0
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        return kernels.cutler_rsi_last(prices, period)
     
     def calculate_sma(self, prices: List[float], period: int) -> float:
         """Calculate Simple Moving Average"""
         if len(prices) < period:
             return prices[-1] if prices else 0.0
-        return np.mean(prices[-period:])
+        return kernels.sma_last(prices, period)
     
     def calculate_ema(self, prices: List[float], period: int) -> float:
         """Calculate Exponential Moving Average"""
         if len(prices) < period:
             return prices[-1] if prices else 0.0
-        
-        weights = np.exp(np.linspace(-1., 0., period))
-        weights /= weights.sum()
-        ema = np.convolve(prices, weights, mode='full')[:len(prices)]
-        ema[:period] = ema[period]
-        return ema[-1]
+        return kernels.ema_last(prices, period)
     
     def calculate_bollinger_bands(self, prices: List[float], period: int = 20, std_dev: float = 2) -> Tuple[float, float, float]:
         """Calculate Bollinger Bands (upper, middle, lower)"""
         if len(prices) < period:
             price = prices[-1] if prices else 0.0
             return price, price, price
-        
-        middle = self.calculate_sma(prices, period)
-        std = np.std(prices[-period:])
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
-        
-        return upper, middle, lower
+        return kernels.bollinger_last(prices, period, std_dev)
     
     def update_performance(self, signal_result: SignalResult, trade_result: Optional[bool] = None, profit: float = 0.0):
         """Update strategy performance metrics"""
@@ -358,12 +336,10 @@ class RapidMACrossStrategy(BaseStrategy):
         
         closes = [c.close for c in candles]
         
-        fast_ema = self.calculate_ema(closes, fast_period)
-        slow_ema = self.calculate_ema(closes, slow_period)
-        
-        prev_closes = closes[:-1]
-        prev_fast_ema = self.calculate_ema(prev_closes, fast_period)
-        prev_slow_ema = self.calculate_ema(prev_closes, slow_period)
+        fast_series = kernels.ema(closes, fast_period)
+        slow_series = kernels.ema(closes, slow_period)
+        fast_ema, prev_fast_ema = float(fast_series[-1]), float(fast_series[-2])
+        slow_ema, prev_slow_ema = float(slow_series[-1]), float(slow_series[-2])
         
         current = candles[-1]
         
@@ -563,13 +539,11 @@ class DualEMACrossoverStrategy(BaseStrategy):
         
         closes = [c.close for c in candles]
         
-        fast_ema = self.calculate_ema(closes, fast_period)
-        slow_ema = self.calculate_ema(closes, slow_period)
+        fast_series = kernels.ema(closes, fast_period)
+        slow_series = kernels.ema(closes, slow_period)
         trend_ema = self.calculate_ema(closes, trend_period)
-        
-        prev_closes = closes[:-1]
-        prev_fast = self.calculate_ema(prev_closes, fast_period)
-        prev_slow = self.calculate_ema(prev_closes, slow_period)
+        fast_ema, prev_fast = float(fast_series[-1]), float(fast_series[-2])
+        slow_ema, prev_slow = float(slow_series[-1]), float(slow_series[-2])
         
         current = candles[-1]
         
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+Streaming Indicators Module
+Incremental versions of the IndicatorPlanner indicators for live candles.
+Every instance keeps constant-size state (running sums, monotonic deques,
+EMA weights) and is driven one candle at a time:
+
+- update(high, low, close) folds the forming candle in provisionally and
+  returns its values without changing state (call on every tick)
+- commit(high, low, close) folds a closed candle in for good
+
+Formulas follow the planner: the repo's manual kernels for SMA, EMA, WMA,
+ATR, Schaff, DeMarker, CCI and SuperTrend, and the pandas-ta definitions for
+the library-backed RSI, MACD, Bollinger, Stochastic, Williams %R and ROC.
+CCI's mean deviation is the one O(period) step (it has no running form).
+"""
+
+import math
+import sys
+from collections import deque
+from typing import Any, Dict, Optional, Tuple, Type
+
+from strategies.indicator_planner import resolve_params
+
+NAN = float('nan')
+
+Values = Tuple[float, ...]
+
+
+def _range_position(value: float, lowest: float, highest: float) -> float:
+    """Scalar twin of technical_indicators._range_position (NaN passes through)"""
+    span = highest - lowest
+    return 100 * (value - lowest) / span if span != 0 else 0.0
+
+
+# ========================================
+# Building blocks: step(x, commit) returns the value with x appended
+# ========================================
+
+class _Rolling:
+    """
+    Mean and population variance of the last n values.
+
+    Running sums are re-added from the window every n commits, so rounding never accumulates.
+    """
+    __slots__ = ('n', 'values', 'shift', 'total', 'total_sq', 'same', 'commits')
+
+    def __init__(self, n: int):
+        self.n = n
+        self.values = deque()
+        self.shift = None  # Sums are of (x - first value) to keep the variance well conditioned
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.same = 0  # Trailing run of identical values (a flat window is exact, as in pandas)
+        self.commits = 0
+
+    def step(self, x: float, commit: bool = False) -> Tuple[float, float]:
+        values = self.values
+        shift = x if self.shift is None else self.shift
+        d = x - shift
+        total = self.total + d
+        total_sq = self.total_sq + d * d
+        if len(values) == self.n:
+            old = values[0] - shift
+            total -= old
+            total_sq -= old * old
+            count = self.n
+        else:
+            count = len(values) + 1
+        same = self.same + 1 if values and values[-1] == x else 1
+
+        if commit:
+            self.shift = shift
+            values.append(x)
+            if len(values) > self.n:
+                values.popleft()
+            self.commits += 1
+            self.total, self.total_sq, self.same = total, total_sq, same
+            if self.commits % self.n == 0:
+                self.total = math.fsum(v - shift for v in values)
+                self.total_sq = math.fsum((v - shift) ** 2 for v in values)
+
+        if count < self.n:
+            return NAN, NAN
+        if same >= count:
+            return x, 0.0
+        mean = total / count
+        return shift + mean, max(0.0, total_sq / count - mean * mean)
+
+
+class _Extreme:
+    """Max (largest=True) or min of the last n values via a monotonic deque"""
+    __slots__ = ('n', 'largest', 'queue', 'count')
+
+    def __init__(self, n: int, largest: bool):
+        self.n = n
+        self.largest = largest
+        self.queue = deque()  # (index, value), values monotonic from the front
+        self.count = 0
+
+    def step(self, x: float, commit: bool = False) -> float:
+        queue = self.queue
+        start = self.count - self.n + 1  # Oldest index still in the window once x is in
+        front = queue[0] if queue and queue[0][0] >= start else (queue[1] if len(queue) > 1 else None)
+        if front is None:
+            best = x
+        else:
+            best = max(front[1], x) if self.largest else min(front[1], x)
+
+        if commit:
+            if queue and queue[0][0] < start:
+                queue.popleft()
+            if self.largest:
+                while queue and queue[-1][1] <= x:
+                    queue.pop()
+            else:
+                while queue and queue[-1][1] >= x:
+                    queue.pop()
+            queue.append((self.count, x))
+            self.count += 1
+
+        return best if self.count + (0 if commit else 1) >= self.n else NAN
+
+
+class _Ewm:
+    """pandas ewm(...).mean() recursion, including adjust and min_periods semantics"""
+    __slots__ = ('adjust', 'min_periods', 'old_wt_factor', 'new_wt', 'weighted', 'old_wt', 'nobs')
+
+    def __init__(self, alpha: float, adjust: bool = True, min_periods: int = 0):
+        self.adjust = adjust
+        self.min_periods = max(1, min_periods)
+        self.old_wt_factor = 1.0 - alpha
+        self.new_wt = 1.0 if adjust else alpha
+        self.weighted = NAN
+        self.old_wt = 1.0
+        self.nobs = 0
+
+    @classmethod
+    def span(cls, span: float, **kwargs) -> '_Ewm':
+        return cls(2.0 / (span + 1.0), **kwargs)
+
+    def step(self, x: float, commit: bool = False) -> float:
+        weighted, old_wt, nobs = self.weighted, self.old_wt, self.nobs
+        if x != x:
+            # Missing value: pandas still decays the old weight once averaging has started
+            if nobs:
+                old_wt *= self.old_wt_factor
+        elif nobs == 0:
+            weighted = x
+            nobs = 1
+        else:
+            nobs += 1
+            old_wt *= self.old_wt_factor
+            if weighted != x:
+                weighted = (old_wt * weighted + self.new_wt * x) / (old_wt + self.new_wt)
+            old_wt = old_wt + self.new_wt if self.adjust else 1.0
+        if commit:
+            self.weighted, self.old_wt, self.nobs = weighted, old_wt, nobs
+        return weighted if nobs >= self.min_periods else NAN
+
+
+class _SeededEma:
+    """pandas-ta ema: SMA of the first `length` values, then ewm(span=length, adjust=False)"""
+    __slots__ = ('length', 'seed', 'ewm')
+
+    def __init__(self, length: int):
+        self.length = length
+        self.seed = []
+        self.ewm = _Ewm.span(length, adjust=False)
+
+    def step(self, x: float, commit: bool = False) -> float:
+        if self.ewm.nobs:
+            return self.ewm.step(x, commit)
+        if len(self.seed) + 1 < self.length:
+            if commit:
+                self.seed.append(x)
+            return NAN
+        value = (sum(self.seed) + x) / self.length
+        if commit:
+            self.seed = []
+            self.ewm.step(value, True)
+        return value
+
+
+class _TrueRange:
+    """max(high - low, |high - prev close|, |low - prev close|); NaN on the first candle"""
+    __slots__ = ('prev_close',)
+
+    def __init__(self):
+        self.prev_close = NAN
+
+    def step(self, high: float, low: float, close: float, commit: bool = False) -> float:
+        prev = self.prev_close
+        if commit:
+            self.prev_close = close
+        if prev != prev:
+            return NAN
+        return max(high - low, abs(high - prev), abs(low - prev))
+
+
+# ========================================
+# Indicators
+# ========================================
+
+class StreamingIndicator:
+    """One indicator instance; `fields` name its outputs as in the adapter's series"""
+    fields: Tuple[str, ...] = ('value',)
+
+    def __init__(self, params: Dict[str, Any]):
+        self.params = params
+        self.commits = 0
+
+    def update(self, high: float, low: float, close: float) -> Values:
+        """Values with the forming candle included; state is unchanged"""
+        return self._step(high, low, close, False)
+
+    def commit(self, high: float, low: float, close: float) -> Values:
+        """Fold a closed candle in and return its final values"""
+        self.commits += 1
+        return self._step(high, low, close, True)
+
+    def _step(self, high: float, low: float, close: float, commit: bool) -> Values:
+        raise NotImplementedError
+
+
+class SmaStream(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.window = _Rolling(params['sma_period'])
+
+    def _step(self, high, low, close, commit):
+        return (self.window.step(close, commit)[0],)
+
+
+class EmaStream(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.ema = _Ewm.span(params['ema_fast'])
+
+    def _step(self, high, low, close, commit):
+        return (self.ema.step(close, commit),)
+
+
+class WmaStream(StreamingIndicator):
+    """Weights 1..n: on a full window the weighted sum moves by n * new - (sum of the old window)"""
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.n = params['wma_period']
+        self.values = deque()
+        self.total = 0.0
+        self.weighted = 0.0
+        self.denominator = self.n * (self.n + 1) // 2
+
+    def _step(self, high, low, close, commit):
+        values, n = self.values, self.n
+        if len(values) == n:
+            weighted = self.weighted - self.total + n * close
+            total = self.total - values[0] + close
+            count = n
+        else:
+            count = len(values) + 1
+            weighted = self.weighted + count * close
+            total = self.total + close
+        if commit:
+            values.append(close)
+            if len(values) > n:
+                values.popleft()
+            self.total, self.weighted = total, weighted
+            if self.commits % n == 0:
+                self.total = math.fsum(values)
+                self.weighted = math.fsum(i * v for i, v in enumerate(values, 1))
+        return (weighted / self.denominator if count == n else NAN,)
+
+
+class RsiStream(StreamingIndicator):
+    """pandas-ta rsi: Wilder RMA (ewm alpha=1/n, adjust=True, min_periods=n) of gains and losses"""
+
+    def __init__(self, params):
+        super().__init__(params)
+        n = params['rsi_period']
+        self.gains = _Ewm(1.0 / n, min_periods=n)
+        self.losses = _Ewm(1.0 / n, min_periods=n)
+        self.prev_close = NAN
+
+    def _step(self, high, low, close, commit):
+        change = close - self.prev_close
+        if commit:
+            self.prev_close = close
+        if change != change:
+            return (NAN,)
+        gain = self.gains.step(max(change, 0.0), commit)
+        loss = abs(self.losses.step(min(change, 0.0), commit))
+        return (100 * gain / (gain + loss) if gain + loss != 0 else NAN,)
+
+
+class MacdStream(StreamingIndicator):
+    fields = ('macd', 'signal', 'histogram')
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.fast = _SeededEma(params['macd_fast'])
+        self.slow = _SeededEma(params['macd_slow'])
+        self.signal = _SeededEma(params['macd_signal'])
+
+    def _step(self, high, low, close, commit):
+        macd = self.fast.step(close, commit) - self.slow.step(close, commit)
+        if macd != macd:
+            return NAN, NAN, NAN
+        signal = self.signal.step(macd, commit)
+        return macd, signal, macd - signal
+
+
+class BollingerStream(StreamingIndicator):
+    """pandas-ta bbands: SMA +/- std_dev * population standard deviation"""
+    fields = ('upper', 'middle', 'lower')
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.window = _Rolling(params['bb_period'])
+        self.width = params['bb_std']
+
+    def _step(self, high, low, close, commit):
+        middle, variance = self.window.step(close, commit)
+        deviation = self.width * math.sqrt(variance) if variance == variance else NAN
+        return middle + deviation, middle, middle - deviation
+
+
+class StochasticStream(StreamingIndicator):
+    """pandas-ta stoch(k, d, smooth_k=3): %K is the 3-period SMA of the raw stochastic, %D its d-period SMA"""
+    fields = ('k', 'd')
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.highest = _Extreme(params['stoch_k'], largest=True)
+        self.lowest = _Extreme(params['stoch_k'], largest=False)
+        self.smooth_k = _Rolling(3)
+        self.smooth_d = _Rolling(params['stoch_d'])
+
+    def _step(self, high, low, close, commit):
+        highest = self.highest.step(high, commit)
+        lowest = self.lowest.step(low, commit)
+        if highest != highest:
+            return NAN, NAN
+        # pandas-ta's non_zero_range: a flat range is widened by epsilon instead of dividing by zero
+        span = highest - lowest or sys.float_info.epsilon
+        k = self.smooth_k.step(100 * (close - lowest) / span, commit)[0]
+        if k != k:
+            return NAN, NAN
+        return k, self.smooth_d.step(k, commit)[0]
+
+
+class WilliamsRStream(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.highest = _Extreme(params['williams_period'], largest=True)
+        self.lowest = _Extreme(params['williams_period'], largest=False)
+
+    def _step(self, high, low, close, commit):
+        highest = self.highest.step(high, commit)
+        lowest = self.lowest.step(low, commit)
+        if highest != highest or highest == lowest:
+            return (NAN,)
+        return (100 * ((close - lowest) / (highest - lowest) - 1),)
+
+
+class RocStream(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.closes = deque(maxlen=params['roc_period'])
+
+    def _step(self, high, low, close, commit):
+        closes = self.closes
+        value = 100 * (close - closes[0]) / closes[0] if len(closes) == closes.maxlen and closes[0] else NAN
+        if commit:
+            closes.append(close)
+        return (value,)
+
+
+class SchaffStream(StreamingIndicator):
+    """Schaff Trend Cycle: stochastic of the MACD, smoothed, stochastic again, smoothed (all adjust=False)"""
+
+    def __init__(self, params):
+        super().__init__(params)
+        d_macd, d_pf = params['schaff_d_macd'], params['schaff_d_pf']
+        self.fast = _Ewm.span(params['schaff_fast'], adjust=False)
+        self.slow = _Ewm.span(params['schaff_slow'], adjust=False)
+        self.macd_max = _Extreme(d_macd, largest=True)
+        self.macd_min = _Extreme(d_macd, largest=False)
+        self.pf = _Ewm.span(d_macd, adjust=False)
+        self.pf_max = _Extreme(d_pf, largest=True)
+        self.pf_min = _Extreme(d_pf, largest=False)
+        self.stc = _Ewm.span(d_pf, adjust=False)
+
+    def _step(self, high, low, close, commit):
+        macd = self.fast.step(close, commit) - self.slow.step(close, commit)
+        stoch = _range_position(macd, self.macd_min.step(macd, commit), self.macd_max.step(macd, commit))
+        pf = self.pf.step(stoch, commit)
+        if pf != pf:
+            return (self.stc.step(NAN, commit),)
+        raw = _range_position(pf, self.pf_min.step(pf, commit), self.pf_max.step(pf, commit))
+        return (self.stc.step(raw, commit),)
+
+
+class DemarkerStream(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.demax = _Rolling(params['demarker_period'])
+        self.demin = _Rolling(params['demarker_period'])
+        self.prev_high = NAN
+        self.prev_low = NAN
+
+    def _step(self, high, low, close, commit):
+        prev_high, prev_low = self.prev_high, self.prev_low
+        if commit:
+            self.prev_high, self.prev_low = high, low
+        if prev_high != prev_high:
+            return (NAN,)
+        demax = self.demax.step(high - prev_high if high > prev_high else 0.0, commit)[0]
+        demin = self.demin.step(prev_low - low if low < prev_low else 0.0, commit)[0]
+        denominator = demax + demin
+        return (demax / denominator if denominator != 0 else 0.0,)
+
+
+class CciStream(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.period = params['cci_period']
+        self.window = _Rolling(self.period)
+        self.recent = deque(maxlen=max(0, self.period - 1))  # Window minus the candle being added
+
+    def _step(self, high, low, close, commit):
+        typical = (high + low + close) / 3
+        mean = self.window.step(typical, commit)[0]
+        value = NAN
+        if mean == mean:
+            deviation = (sum(abs(v - mean) for v in self.recent) + abs(typical - mean)) / self.period
+            value = (typical - mean) / (0.015 * deviation) if deviation != 0 else 0.0
+        if commit and self.recent.maxlen:
+            self.recent.append(typical)
+        return (value,)
+
+
+class AtrStream(StreamingIndicator):
+    """Manual pipeline ATR: rolling mean of the true range"""
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.true_range = _TrueRange()
+        self.window = _Rolling(params['atr_period'])
+
+    def _step(self, high, low, close, commit):
+        true_range = self.true_range.step(high, low, close, commit)
+        if true_range != true_range:
+            return (NAN,)
+        return (self.window.step(true_range, commit)[0],)
+
+
+class SupertrendStream(StreamingIndicator):
+    """Manual pipeline SuperTrend (bands from the atr_period ATR, like supertrend_from_bands)"""
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.atr = AtrStream(params)
+        self.multiplier = params['supertrend_multiplier']
+        self.line = NAN
+        self.direction: Optional[str] = None
+
+    def _step(self, high, low, close, commit):
+        atr = self.atr._step(high, low, close, commit)[0]
+        hl2 = (high + low) / 2
+        upper, lower = hl2 + self.multiplier * atr, hl2 - self.multiplier * atr
+
+        if self.commits <= (1 if commit else 0):
+            line, direction = NAN, None  # The first candle is never evaluated
+        elif close <= lower:
+            line, direction = lower, 'down'
+        elif close >= upper:
+            line, direction = upper, 'up'
+        else:
+            line = self.line if self.line == self.line else lower
+            direction = self.direction or 'up'
+
+        if commit:
+            self.line, self.direction = line, direction
+        return (line,)
+
+
+_STREAMS: Dict[str, Type[StreamingIndicator]] = {
+    'sma': SmaStream,
+    'ema': EmaStream,
+    'wma': WmaStream,
+    'rsi': RsiStream,
+    'macd': MacdStream,
+    'bollinger': BollingerStream,
+    'stochastic': StochasticStream,
+    'williams_r': WilliamsRStream,
+    'roc': RocStream,
+    'schaff_tc': SchaffStream,
+    'demarker': DemarkerStream,
+    'cci': CciStream,
+    'atr': AtrStream,
+    'supertrend': SupertrendStream,
+}
+
+SUPPORTED_TYPES = sorted(_STREAMS)
+
+
+def create_stream(indicator_type: str, params: Optional[Dict[str, Any]] = None) -> Optional[StreamingIndicator]:
+    """Incremental indicator for a frontend instance (None for unknown types)"""
+    cls = _STREAMS.get(indicator_type)
+    return cls(resolve_params(indicator_type, params)) if cls is not None else None
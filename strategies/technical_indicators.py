@@ -7,31 +7,68 @@ Calculates 20+ technical indicators for 1-minute candle data.
 
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
+import importlib
 import logging
+import warnings
 from pathlib import Path
 
-# Suppress pandas-ta compatibility warning for Python 3.11
-import warnings
-warnings.filterwarnings('ignore', message='.*pandas-ta not available.*', category=UserWarning)
-warnings.filterwarnings('ignore', message='.*pandas-ta not available.*', category=Warning)
-
-# Technical Analysis Libraries
-try:
-    import pandas_ta as ta
-    PANDAS_TA_AVAILABLE = True
-except ImportError:
-    PANDAS_TA_AVAILABLE = False
-    # Warning suppressed - pandas-ta not available for Python 3.11
-    pass
-
-try:
-    import talib
-    TALIB_AVAILABLE = True
-except ImportError:
-    TALIB_AVAILABLE = False
-    print("Warning: TA-Lib not available. Some indicators will use pandas-ta alternatives.")
+
+class OptionalBackend:
+    """
+    An optional indicator library imported on first use instead of at module import.
+
+    Attribute access goes to the library (ta.rsi(...)); available tells whether it
+    imported. A missing library prints missing_message once, when first resolved.
+    """
+
+    def __init__(self, module_name: str, missing_message: Optional[str] = None):
+        self.module_name = module_name
+        self.missing_message = missing_message
+        self._resolved = False
+        self._module = None
+
+    def resolve(self):
+        """The imported module, or None if it is not installed"""
+        if not self._resolved:
+            with warnings.catch_warnings():
+                # pandas-ta warns about Python 3.11 compatibility on import
+                warnings.filterwarnings('ignore', message='.*pandas-ta not available.*')
+                try:
+                    self._module = importlib.import_module(self.module_name)
+                except ImportError:
+                    self._module = None
+                    if self.missing_message:
+                        print(self.missing_message)
+            self._resolved = True
+        return self._module
+
+    @property
+    def available(self) -> bool:
+        return self.resolve() is not None
+
+    def __getattr__(self, name):
+        module = self.resolve()
+        if module is None:
+            raise AttributeError(f"{self.module_name} is not installed (needed for {name})")
+        return getattr(module, name)
+
+
+# Technical Analysis Libraries (resolved on first use, not at import)
+ta = OptionalBackend('pandas_ta')
+talib = OptionalBackend('talib', "Warning: TA-Lib not available. Some indicators will use pandas-ta alternatives.")
+
+_AVAILABILITY_FLAGS = {'PANDAS_TA_AVAILABLE': ta, 'TALIB_AVAILABLE': talib}
+
+
+def __getattr__(name):
+    # PANDAS_TA_AVAILABLE / TALIB_AVAILABLE stay module attributes, resolved when read
+    backend = _AVAILABILITY_FLAGS.get(name)
+    if backend is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return backend.available
 
 @dataclass
 class IndicatorSet:
@@ -99,6 +136,129 @@ class IndicatorSet:
     engulfing_bullish: Optional[bool] = None
     engulfing_bearish: Optional[bool] = None
 
+# ========================================
+# Series kernels (shared by the pipeline and strategies/indicator_planner.py)
+# ========================================
+
+def weighted_moving_average(series: pd.Series, period: int) -> pd.Series:
+    """Linearly weighted moving average (weights 1..period, newest heaviest)"""
+    values = series.to_numpy(dtype=float)
+    result = np.full(len(values), np.nan)
+    if 0 < period <= len(values):
+        weights = np.arange(1, period + 1)
+        result[period - 1:] = sliding_window_view(values, period) @ weights / weights.sum()
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+    """max(high - low, |high - prev close|, |low - prev close|)"""
+    high_low = high - low
+    high_close_prev = np.abs(high - close.shift(1))
+    low_close_prev = np.abs(low - close.shift(1))
+    
+    return np.maximum(high_low, np.maximum(high_close_prev, low_close_prev))
+
+
+def _range_position(values: np.ndarray, lowest: np.ndarray, highest: np.ndarray) -> np.ndarray:
+    """100 * (value - lowest) / (highest - lowest); 0 on a flat range, NaN while the window fills"""
+    span = highest - lowest
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(span != 0, 100 * (values - lowest) / span, 0.0)
+
+
+def schaff_trend_cycle(macd: pd.Series, d_macd: int, d_pf: int) -> pd.Series:
+    """Schaff Trend Cycle from a MACD line (EMA fast - EMA slow, adjust=False)"""
+    # Calculate Stochastic of MACD
+    macd_min = macd.rolling(window=d_macd).min()
+    macd_max = macd.rolling(window=d_macd).max()
+    stoch_macd = pd.Series(_range_position(macd.to_numpy(dtype=float), macd_min.to_numpy(), macd_max.to_numpy()),
+                           index=macd.index)
+    
+    # Calculate PF (Percentage Factor)
+    pf = stoch_macd.ewm(span=d_macd, adjust=False).mean()
+    
+    # Calculate Stochastic of PF
+    pf_min = pf.rolling(window=d_pf).min()
+    pf_max = pf.rolling(window=d_pf).max()
+    stc = pd.Series(_range_position(pf.to_numpy(), pf_min.to_numpy(), pf_max.to_numpy()), index=macd.index)
+    
+    return stc.ewm(span=d_pf, adjust=False).mean()
+
+
+def demarker(high: pd.Series, low: pd.Series, period: int) -> pd.Series:
+    """DeMarker oscillator (0-1): SMA(DeMax) / (SMA(DeMax) + SMA(DeMin))"""
+    high_values = high.to_numpy(dtype=float)
+    low_values = low.to_numpy(dtype=float)
+    
+    # DeMax / DeMin: rise in high / fall in low versus the previous row, else 0 (first row NaN)
+    demax = np.full(len(high_values), np.nan)
+    demax[1:] = np.where(high_values[1:] > high_values[:-1], high_values[1:] - high_values[:-1], 0.0)
+    demin = np.full(len(low_values), np.nan)
+    demin[1:] = np.where(low_values[1:] < low_values[:-1], low_values[:-1] - low_values[1:], 0.0)
+    
+    # Calculate SMA of DeMax and DeMin
+    demax_sma = pd.Series(demax, index=high.index).rolling(window=period).mean().to_numpy()
+    demin_sma = pd.Series(demin, index=low.index).rolling(window=period).mean().to_numpy()
+    
+    # Calculate DeMarker
+    denominator = demax_sma + demin_sma
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = np.where(denominator != 0, demax_sma / denominator, 0.0)
+    return pd.Series(result, index=high.index)
+
+
+def commodity_channel_index(typical_price: pd.Series, period: int) -> pd.Series:
+    """CCI from the typical price (high + low + close) / 3"""
+    # Calculate SMA of Typical Price
+    sma_tp = typical_price.rolling(window=period).mean().to_numpy()
+    values = typical_price.to_numpy(dtype=float)
+    
+    # Mean deviation of each window from its own SMA (one strided view, no copies per row)
+    mean_dev = np.full(len(values), np.nan)
+    if 0 < period <= len(values):
+        windows = sliding_window_view(values, period)
+        mean_dev[period - 1:] = np.abs(windows - sma_tp[period - 1:, None]).mean(axis=1)
+    
+    # Calculate CCI
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cci = np.where(mean_dev != 0, (values - sma_tp) / (0.015 * mean_dev), 0.0)
+    return pd.Series(cci, index=typical_price.index)
+
+
+def supertrend_from_bands(close: pd.Series, upper_band: pd.Series, lower_band: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Manual SuperTrend line and 'up'/'down' direction from precomputed ATR bands"""
+    close_values = close.to_numpy(dtype=float)
+    upper = upper_band.to_numpy(dtype=float)
+    lower = lower_band.to_numpy(dtype=float)
+    n = len(close_values)
+    
+    # Rows where close touches a band set the line (lower first); the first row is never evaluated
+    below = close_values <= lower
+    above = (close_values >= upper) & ~below
+    if n:
+        below[0] = above[0] = False
+    anchor = below | above
+    line = np.where(below, lower, np.where(above, upper, np.nan))
+    
+    # Until the line exists, in-band rows take the lower band: the first such row with a band seeds it
+    seeds = np.flatnonzero(anchor[1:] | ~np.isnan(lower[1:])) + 1
+    if seeds.size and not anchor[seeds[0]]:
+        anchor[seeds[0]] = True
+        line[seeds[0]] = lower[seeds[0]]
+    
+    # Every other row carries the most recent anchor (index 0 -> NaN line, 'up' direction)
+    last_anchor = np.where(anchor, np.arange(n), 0)
+    np.maximum.accumulate(last_anchor, out=last_anchor)
+    
+    supertrend = pd.Series(line[last_anchor], index=close.index)
+    labels = np.where(below[last_anchor], 'down', 'up').astype(object)
+    if n:
+        labels[0] = np.nan
+    direction = pd.Series(labels, index=close.index, dtype=str)
+    
+    return supertrend, direction
+
+
 class TechnicalIndicatorsPipeline:
     """
     Comprehensive technical indicators calculation pipeline.
@@ -196,7 +356,7 @@ class TechnicalIndicatorsPipeline:
             df['wma_20'] = self._calculate_wma(df['close'], self.params['wma_period'])
             
             # MACD
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 macd_data = ta.macd(df['close'], 
                                   fast=self.params['macd_fast'],
                                   slow=self.params['macd_slow'],
@@ -205,7 +365,7 @@ class TechnicalIndicatorsPipeline:
                     df['macd'] = macd_data[f"MACD_{self.params['macd_fast']}_{self.params['macd_slow']}_{self.params['macd_signal']}"]
                     df['macd_signal'] = macd_data[f"MACDs_{self.params['macd_fast']}_{self.params['macd_slow']}_{self.params['macd_signal']}"]
                     df['macd_histogram'] = macd_data[f"MACDh_{self.params['macd_fast']}_{self.params['macd_slow']}_{self.params['macd_signal']}"]
-            elif TALIB_AVAILABLE:
+            elif talib.available:
                 df['macd'], df['macd_signal'], df['macd_histogram'] = talib.MACD(
                     df['close'], 
                     fastperiod=self.params['macd_fast'],
@@ -214,7 +374,7 @@ class TechnicalIndicatorsPipeline:
                 )
             
             # Bollinger Bands
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 bb_data = ta.bbands(df['close'], 
                                   length=self.params['bb_period'],
                                   std=self.params['bb_std'])
@@ -224,7 +384,7 @@ class TechnicalIndicatorsPipeline:
                     df['bb_upper'] = bb_data[f"BBU_{self.params['bb_period']}_{self.params['bb_std']}"]
                     df['bb_width'] = bb_data[f"BBB_{self.params['bb_period']}_{self.params['bb_std']}"]
                     df['bb_percent'] = bb_data[f"BBP_{self.params['bb_period']}_{self.params['bb_std']}"]
-            elif TALIB_AVAILABLE:
+            elif talib.available:
                 df['bb_upper'], df['bb_middle'], df['bb_lower'] = talib.BBANDS(
                     df['close'],
                     timeperiod=self.params['bb_period'],
@@ -243,22 +403,22 @@ class TechnicalIndicatorsPipeline:
         """Calculate momentum oscillators"""
         try:
             # RSI
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 df['rsi_14'] = ta.rsi(df['close'], length=self.params['rsi_period'])
                 df['rsi_21'] = ta.rsi(df['close'], length=self.params['rsi_period_2'])
-            elif TALIB_AVAILABLE:
+            elif talib.available:
                 df['rsi_14'] = talib.RSI(df['close'], timeperiod=self.params['rsi_period'])
                 df['rsi_21'] = talib.RSI(df['close'], timeperiod=self.params['rsi_period_2'])
             
             # Stochastic Oscillator
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 stoch_data = ta.stoch(df['high'], df['low'], df['close'],
                                     k=self.params['stoch_k'],
                                     d=self.params['stoch_d'])
                 if stoch_data is not None and not stoch_data.empty:
                     df['stoch_k'] = stoch_data[f"STOCHk_{self.params['stoch_k']}_{self.params['stoch_d']}_3"]
                     df['stoch_d'] = stoch_data[f"STOCHd_{self.params['stoch_k']}_{self.params['stoch_d']}_3"]
-            elif TALIB_AVAILABLE:
+            elif talib.available:
                 df['stoch_k'], df['stoch_d'] = talib.STOCH(
                     df['high'], df['low'], df['close'],
                     fastk_period=self.params['stoch_k'],
@@ -267,17 +427,17 @@ class TechnicalIndicatorsPipeline:
                 )
             
             # Williams %R
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 df['williams_r'] = ta.willr(df['high'], df['low'], df['close'], 
                                           length=self.params['williams_period'])
-            elif TALIB_AVAILABLE:
+            elif talib.available:
                 df['williams_r'] = talib.WILLR(df['high'], df['low'], df['close'],
                                              timeperiod=self.params['williams_period'])
             
             # Rate of Change
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 df['roc_10'] = ta.roc(df['close'], length=self.params['roc_period'])
-            elif TALIB_AVAILABLE:
+            elif talib.available:
                 df['roc_10'] = talib.ROC(df['close'], timeperiod=self.params['roc_period'])
             
             # Schaff Trend Cycle
@@ -301,12 +461,12 @@ class TechnicalIndicatorsPipeline:
             df['true_range'] = self._calculate_true_range(df)
             
             # Average True Range
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 df['atr_14'] = ta.atr(df['high'], df['low'], df['close'], 
                                     length=self.params['atr_period'])
                 df['atr_21'] = ta.atr(df['high'], df['low'], df['close'], 
                                     length=self.params['atr_period_2'])
-            elif TALIB_AVAILABLE:
+            elif talib.available:
                 df['atr_14'] = talib.ATR(df['high'], df['low'], df['close'],
                                        timeperiod=self.params['atr_period'])
                 df['atr_21'] = talib.ATR(df['high'], df['low'], df['close'],
@@ -373,23 +533,16 @@ class TechnicalIndicatorsPipeline:
     
     def _calculate_wma(self, series: pd.Series, period: int) -> pd.Series:
         """Calculate Weighted Moving Average"""
-        weights = np.arange(1, period + 1)
-        return series.rolling(window=period).apply(
-            lambda x: np.dot(x, weights) / weights.sum(), raw=True
-        )
+        return weighted_moving_average(series, period)
     
     def _calculate_true_range(self, df: pd.DataFrame) -> pd.Series:
         """Calculate True Range"""
-        high_low = df['high'] - df['low']
-        high_close_prev = np.abs(df['high'] - df['close'].shift(1))
-        low_close_prev = np.abs(df['low'] - df['close'].shift(1))
-        
-        return np.maximum(high_low, np.maximum(high_close_prev, low_close_prev))
+        return true_range(df['high'], df['low'], df['close'])
     
     def _calculate_supertrend(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate SuperTrend indicator"""
         try:
-            if PANDAS_TA_AVAILABLE:
+            if ta.available:
                 supertrend_data = ta.supertrend(df['high'], df['low'], df['close'],
                                               length=self.params['supertrend_period'],
                                               multiplier=self.params['supertrend_multiplier'])
@@ -408,19 +561,7 @@ class TechnicalIndicatorsPipeline:
                 lower_band = hl2 - (self.params['supertrend_multiplier'] * atr)
                 
                 # SuperTrend calculation logic
-                supertrend = pd.Series(index=df.index, dtype=float)
-                direction = pd.Series(index=df.index, dtype=str)
-                
-                for i in range(1, len(df)):
-                    if df['close'].iloc[i] <= lower_band.iloc[i]:
-                        supertrend.iloc[i] = lower_band.iloc[i]
-                        direction.iloc[i] = 'down'
-                    elif df['close'].iloc[i] >= upper_band.iloc[i]:
-                        supertrend.iloc[i] = upper_band.iloc[i]
-                        direction.iloc[i] = 'up'
-                    else:
-                        supertrend.iloc[i] = supertrend.iloc[i-1] if not pd.isna(supertrend.iloc[i-1]) else lower_band.iloc[i]
-                        direction.iloc[i] = direction.iloc[i-1] if not pd.isna(direction.iloc[i-1]) else 'up'
+                supertrend, direction = supertrend_from_bands(df['close'], upper_band, lower_band)
                 
                 df['supertrend'] = supertrend
                 df['supertrend_direction'] = direction
@@ -601,32 +742,7 @@ class TechnicalIndicatorsPipeline:
             ema_slow = df['close'].ewm(span=slow, adjust=False).mean()
             macd = ema_fast - ema_slow
             
-            # Calculate Stochastic of MACD
-            macd_min = macd.rolling(window=d_macd).min()
-            macd_max = macd.rolling(window=d_macd).max()
-            
-            stoch_macd = pd.Series(index=df.index, dtype=float)
-            for i in range(len(df)):
-                if macd_max.iloc[i] - macd_min.iloc[i] != 0:
-                    stoch_macd.iloc[i] = 100 * (macd.iloc[i] - macd_min.iloc[i]) / (macd_max.iloc[i] - macd_min.iloc[i])
-                else:
-                    stoch_macd.iloc[i] = 0
-            
-            # Calculate PF (Percentage Factor)
-            pf = stoch_macd.ewm(span=d_macd, adjust=False).mean()
-            
-            # Calculate Stochastic of PF
-            pf_min = pf.rolling(window=d_pf).min()
-            pf_max = pf.rolling(window=d_pf).max()
-            
-            stc = pd.Series(index=df.index, dtype=float)
-            for i in range(len(df)):
-                if pf_max.iloc[i] - pf_min.iloc[i] != 0:
-                    stc.iloc[i] = 100 * (pf.iloc[i] - pf_min.iloc[i]) / (pf_max.iloc[i] - pf_min.iloc[i])
-                else:
-                    stc.iloc[i] = 0
-            
-            df['schaff_tc'] = stc.ewm(span=d_pf, adjust=False).mean()
+            df['schaff_tc'] = schaff_trend_cycle(macd, d_macd, d_pf)
             
         except Exception as e:
             self.logger.error(f"Error calculating Schaff Trend Cycle: {str(e)}")
@@ -651,36 +767,7 @@ class TechnicalIndicatorsPipeline:
         try:
             period = self.params['demarker_period']
             
-            # Calculate DeMax (DeMarker High)
-            demax = pd.Series(index=df.index, dtype=float)
-            for i in range(1, len(df)):
-                if df['high'].iloc[i] > df['high'].iloc[i-1]:
-                    demax.iloc[i] = df['high'].iloc[i] - df['high'].iloc[i-1]
-                else:
-                    demax.iloc[i] = 0
-            
-            # Calculate DeMin (DeMarker Low)
-            demin = pd.Series(index=df.index, dtype=float)
-            for i in range(1, len(df)):
-                if df['low'].iloc[i] < df['low'].iloc[i-1]:
-                    demin.iloc[i] = df['low'].iloc[i-1] - df['low'].iloc[i]
-                else:
-                    demin.iloc[i] = 0
-            
-            # Calculate SMA of DeMax and DeMin
-            demax_sma = demax.rolling(window=period).mean()
-            demin_sma = demin.rolling(window=period).mean()
-            
-            # Calculate DeMarker
-            demarker = pd.Series(index=df.index, dtype=float)
-            for i in range(len(df)):
-                denominator = demax_sma.iloc[i] + demin_sma.iloc[i]
-                if denominator != 0:
-                    demarker.iloc[i] = demax_sma.iloc[i] / denominator
-                else:
-                    demarker.iloc[i] = 0
-            
-            df['demarker'] = demarker
+            df['demarker'] = demarker(df['high'], df['low'], period)
             
         except Exception as e:
             self.logger.error(f"Error calculating DeMarker: {str(e)}")
@@ -708,26 +795,7 @@ class TechnicalIndicatorsPipeline:
             # Calculate Typical Price
             typical_price = (df['high'] + df['low'] + df['close']) / 3
             
-            # Calculate SMA of Typical Price
-            sma_tp = typical_price.rolling(window=period).mean()
-            
-            # Calculate Mean Deviation
-            mean_dev = pd.Series(index=df.index, dtype=float)
-            for i in range(period - 1, len(df)):
-                deviations = []
-                for j in range(i - period + 1, i + 1):
-                    deviations.append(abs(typical_price.iloc[j] - sma_tp.iloc[i]))
-                mean_dev.iloc[i] = np.mean(deviations)
-            
-            # Calculate CCI
-            cci = pd.Series(index=df.index, dtype=float)
-            for i in range(len(df)):
-                if mean_dev.iloc[i] != 0:
-                    cci.iloc[i] = (typical_price.iloc[i] - sma_tp.iloc[i]) / (0.015 * mean_dev.iloc[i])
-                else:
-                    cci.iloc[i] = 0
-            
-            df['cci'] = cci
+            df['cci'] = commodity_channel_index(typical_price, period)
             
         except Exception as e:
             self.logger.error(f"Error calculating CCI: {str(e)}")
@@ -749,8 +817,8 @@ class TechnicalIndicatorsPipeline:
                 "patterns": ["doji", "hammer", "shooting_star", "engulfing_bullish", "engulfing_bearish"]
             },
             "libraries_available": {
-                "pandas_ta": PANDAS_TA_AVAILABLE,
-                "talib": TALIB_AVAILABLE
+                "pandas_ta": ta.available,
+                "talib": talib.available
             },
             "parameters": self.params
         }
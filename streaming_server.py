@@ -6,15 +6,22 @@ and streams it to the React frontend via Socket.IO
 Enhanced with Redis integration for high-performance data streaming and caching.
 """
 
+import time
+_process_started = time.perf_counter()
+
 # Import eventlet and apply monkey patching FIRST (before any other imports)
 import eventlet
 eventlet.monkey_patch()
 
-from flask import Flask, jsonify, request
-from flask_socketio import SocketIO, emit
+# --profile-startup: charge every import from here on to its package (no-op without the flag)
+from backend.startup_profile import ImportProfiler
+startup_profiler = ImportProfiler.from_argv(started=_process_started)
+startup_profiler.mark('eventlet')
+
+from flask import Flask, Response, jsonify, request
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from flask_cors import CORS
 import json
-import time
 import base64
 import re
 from datetime import datetime, timezone
@@ -24,15 +31,6 @@ import argparse
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-# Suppress pandas-ta compatibility warning for Python 3.11
-import warnings
-warnings.filterwarnings('ignore', message='.*pandas-ta not available.*', category=UserWarning)
-warnings.filterwarnings('ignore', message='.*pandas-ta not available.*', category=Warning)
-
-# Redis integration imports
-from capabilities.redis_integration import RedisIntegration
-from capabilities.redis_batch_processor import RedisBatchProcessor
-
 # Add paths for imports
 root_dir = Path(__file__).parent
 sys.path.insert(0, str(root_dir))
@@ -43,21 +41,35 @@ sys.path.insert(0, str(capabilities_dir))
 scripts_dir = root_dir / 'scripts' / 'custom_sessions'
 sys.path.insert(0, str(scripts_dir))
 
-from strategies.quantum_flux_strategy import QuantumFluxStrategy
-from data_loader import DataLoader, BacktestEngine  # type: ignore
-
-# Import Chrome interception logic from capabilities
-from data_streaming import RealtimeDataStreaming  # type: ignore
+# Heavy or optional modules are imported where first used, not here, so the port binds quickly:
+# Redis / Supabase (initialize_redis), Selenium (attach_to_chrome, RealtimeDataStreaming in __main__),
+# the backtest loader and strategy (handle_run_backtest), the simulated stream (__main__)
 from base import Ctx  # type: ignore
+from capabilities.candle_store import format_timeframes, parse_timeframes
 
 # Import persistence manager
 from stream_persistence import StreamPersistenceManager  # type: ignore
 
+# Import frame ingest pipeline and push-based CDP frame source
+from backend.frame_ingest import FrameIngestPipeline, candle_to_emit_payload, iter_performance_log_frames
+from backend.cdp_frame_stream import CDPFrameStream
+from backend.frame_recorder import FrameRecorder, FrameReplayer
+from backend.emit_coalescer import CandleEmitCoalescer
+from backend.stage_pipeline import StagedIngest
+from backend.subscriptions import SubscriptionManager
+from backend.update_log import DEFAULT_LOG_CAPACITY, UpdateLog
+from backend.data_catalog import DataCatalog, default_catalog_directories, listing_directories
+from backend.historical_seed import HistoricalSeedService
+from backend.csv_range import CsvRangeError, CsvRangeService, negotiate_encoding
+from backend.downsample import downsample_candles, parse_max_points
+from backend.indicator_cache import DEFAULT_MAX_BYTES as DEFAULT_INDICATOR_CACHE_BYTES, IndicatorCache
+from backend.indicator_stream import IndicatorStream
+from backend import metrics
+
 # Import indicator adapter for modular indicator calculations
-from strategies.indicator_adapter import get_indicator_adapter  # type: ignore
+from strategies.indicator_adapter import SERIES_FORMATS, get_indicator_adapter  # type: ignore
 
-# Import simulated streaming capability
-from simulated_streaming import SimulatedStreamingCapability  # type: ignore
+startup_profiler.mark('module imports')
 
 app = Flask(__name__)
 CORS(app)
@@ -83,7 +95,24 @@ period = 60  # 1 minute candles by default
 # Data persistence (optional, configured via --collect-stream argument)
 persistence_manager: Optional[StreamPersistenceManager] = None
 collect_stream_mode = "none"  # none, tick, candle, both
-last_closed_candle_index: Dict[str, int] = {}  # Track last written closed candle per asset
+
+# Frame ingest (configured via --ingest argument)
+ingest_mode = "poll"  # poll (performance log) or cdp (DevTools push)
+frame_pipeline: Optional[FrameIngestPipeline] = None
+staged_ingest: Optional[StagedIngest] = None  # ingest -> persistence / emit stages
+subscriptions = SubscriptionManager()  # client -> (asset, timeframe) rooms
+update_log = UpdateLog()  # sequence-numbered room events for resume_stream
+resume_grace_seconds = 30.0  # --resume-grace: keep a disconnected client's streams ingesting
+data_catalog = DataCatalog(default_catalog_directories(root_dir))  # CSV index (--catalog-manifest to persist)
+historical_seed = HistoricalSeedService(data_catalog)  # start_stream chart seeds
+csv_ranges = CsvRangeService()  # /api/csv-data row-range / compressed responses
+indicator_stream = IndicatorStream()  # calculate_indicators instances kept live as indicators_calculated deltas
+indicator_cache = IndicatorCache(adapter=get_indicator_adapter())  # calculate_indicators results per (asset, timeframe, closed candle, instance)
+cdp_stream: Optional[CDPFrameStream] = None
+frame_recorder: Optional[FrameRecorder] = None  # --record-frames
+replay_frames_path: Optional[str] = None  # --replay-frames (no Chrome needed)
+replay_speed = 1.0
+candle_emitter: Optional[CandleEmitCoalescer] = None  # Coalesces candle_update per --emit-interval-ms
 
 # Reconnection tracking
 chrome_reconnection_attempts = 0
@@ -95,6 +124,8 @@ chrome_reconnect_enabled = False  # Only reconnect when clients need Chrome (Pla
 redis_integration = None
 batch_processor = None
 
+startup_profiler.mark('module state')
+
 # ========================================
 # Chrome Connection Functions
 # ========================================
@@ -182,22 +213,12 @@ def extract_candle_for_emit(asset: str) -> Optional[Dict]:
         latest_candle = data_streamer.get_latest_candle(asset)
         
         if latest_candle:
-            timestamp, open_price, close_price, high_price, low_price = latest_candle
-            
-            candle_data = {
-                'asset': asset,
-                'timestamp': timestamp,
-                'open': open_price,
-                'high': high_price,
-                'low': low_price,
-                'close': close_price,
-                'volume': 0,
-                'date': datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
-            }
+            candle_data = candle_to_emit_payload(asset, latest_candle)
             
             # Push to Redis for real-time streaming
             if redis_integration:
-                redis_integration.add_tick_to_buffer(asset, candle_data)
+                with metrics.REDIS_PUSH_SECONDS.time():
+                    redis_integration.add_tick_to_buffer(asset, candle_data)
             
             return candle_data
     
@@ -211,7 +232,7 @@ def reset_backend_state():
     Reset backend streaming state and clear caches.
     Called on reconnection to ensure clean state.
     """
-    global data_streamer, streaming_active, last_closed_candle_index
+    global data_streamer, streaming_active, frame_pipeline
     
     print("[Reconnection] Resetting backend state and clearing caches...")
     
@@ -219,7 +240,13 @@ def reset_backend_state():
     streaming_active = False
     
     # Clear candle tracking for persistence
-    last_closed_candle_index.clear()
+    if frame_pipeline:
+        frame_pipeline.reset()
+    if candle_emitter:
+        candle_emitter.reset()
+    update_log.reset()
+    indicator_stream.reset()
+    indicator_cache.invalidate()
     
     # Reset capability state
     # The data_streamer is guaranteed to be initialized at this point
@@ -301,11 +328,67 @@ def monitor_chrome_status():
             print(f"[Monitor] Error checking Chrome status: {e}")
             time.sleep(5)
 
+def build_frame_pipeline(ctx, recorder=None) -> FrameIngestPipeline:
+    """
+    Create the frame pipeline behind bounded ingest, persistence and emit stages.
+    Frames handed to staged_ingest.submit() are decoded and turned into candles on
+    the ingest stage; CSV writes and Socket.IO emits run on their own stages so a
+    slow disk or client cannot hold up the next frame.
+    """
+    global frame_pipeline, staged_ingest
+    
+    if staged_ingest:
+        staged_ingest.stop()
+    staged_ingest = StagedIngest(emit=candle_emitter or socketio.emit, persistence_manager=persistence_manager)
+    frame_pipeline = FrameIngestPipeline(
+        data_streamer=data_streamer,
+        ctx=ctx,
+        emit=staged_ingest.emit,
+        extract_candle=extract_candle_for_emit,
+        persistence_manager=staged_ingest.persistence,
+        collect_stream_mode=collect_stream_mode,
+        recorder=recorder,
+        subscriptions=subscriptions,
+        update_log=update_log,
+        indicator_stream=indicator_stream,
+    )
+    staged_ingest.attach(frame_pipeline.process_payload_data)
+    staged_ingest.start()
+    return frame_pipeline
+
+def collect_pipeline_stats() -> Dict[str, Any]:
+    """Queue depth, lag and drop counters per stage, plus emit coalescing and CDP counters"""
+    stats = staged_ingest.stats() if staged_ingest else {'stages': {}, 'bottleneck': None, 'timestamp': time.time()}
+    if candle_emitter:
+        stats['coalescer'] = {
+            'interval_ms': round(candle_emitter.interval * 1000),
+            'updates_received': candle_emitter.updates_received,
+            'updates_emitted': candle_emitter.updates_emitted,
+        }
+    stats['update_log'] = update_log.stats()
+    stats['historical_seed'] = historical_seed.stats()
+    stats['catalog'] = data_catalog.stats()
+    stats['csv_ranges'] = csv_ranges.stats()
+    stats['indicator_stream'] = indicator_stream.stats()
+    stats['indicator_cache'] = indicator_cache.stats()
+    if metrics.REGISTRY.enabled:
+        stats['latency'] = metrics.REGISTRY.latency_summary()
+    if cdp_stream:
+        stats['cdp'] = {
+            'frames_received': cdp_stream.frames_received,
+            'frames_dispatched': cdp_stream.frames_dispatched,
+            'events_skipped': cdp_stream.events_skipped,
+        }
+    return stats
+
 def stream_from_chrome():
     """
     Background thread to capture WebSocket data from Chrome or generate simulated data.
+    Frames are pulled from the performance log (ingest_mode='poll') or pushed by a
+    CDP subscription to Network.webSocketFrameReceived (ingest_mode='cdp').
     """
     global chrome_driver, streaming_active, data_streamer, capability_ctx, current_asset, is_simulated_mode_global
+    global cdp_stream
     
 
     # REAL MODE:
@@ -317,6 +400,19 @@ def stream_from_chrome():
             return
     
     capability_ctx = Ctx(driver=chrome_driver, artifacts_root=None, debug=False, dry_run=False, verbose=True)
+    build_frame_pipeline(capability_ctx, recorder=frame_recorder)
+    
+    if ingest_mode == 'cdp':
+        print("[Stream] Starting push-based WebSocket capture via CDP (port 9222)...")
+        
+        def on_cdp_frame(payload_data):
+            if streaming_active:
+                staged_ingest.submit(payload_data)
+        
+        cdp_stream = CDPFrameStream(on_frame=on_cdp_frame, port=9222, verbose=True)
+        cdp_stream.run_forever()
+        return
+    
     print("[Stream] Starting WebSocket capture from Chrome...")
     
     processed_messages = set()
@@ -335,97 +431,8 @@ def stream_from_chrome():
                 
                 logs = chrome_driver.get_log('performance')
                 
-                for log_entry in logs:
-                    msg_id = f"{log_entry.get('timestamp', 0)}_{hash(log_entry.get('message', ''))}"
-                    if msg_id in processed_messages:
-                        continue
-                    
-                    processed_messages.add(msg_id)
-                    
-                    message = json.loads(log_entry['message'])['message']
-                    response = message.get('params', {}).get('response', {})
-                    
-                    if response.get('opcode', 0) == 2:
-                        payload_data = response.get('payloadData')
-                        if payload_data:
-                            payload = data_streamer._decode_and_parse_payload(payload_data)
-                            
-                            if payload:
-                                if 'updateCharts' in str(payload) or 'chartPeriod' in str(payload):
-                                    data_streamer._process_chart_settings(payload, capability_ctx)
-                                
-                                data_streamer._process_realtime_update(payload, capability_ctx)
-                                
-                                if persistence_manager and collect_stream_mode != 'none':
-                                    current_focused_asset = data_streamer.get_current_asset()
-                                    if current_focused_asset:
-                                        try:
-                                            tick_asset = None
-                                            tick_value = None
-                                            tick_timestamp = None
-                                            
-                                            if isinstance(payload, list) and len(payload) > 0:
-                                                if isinstance(payload[0], list) and len(payload[0]) >= 3:
-                                                    tick_asset = payload[0][0]
-                                                    tick_timestamp = int(float(payload[0][1]))
-                                                    tick_value = payload[0][2]
-                                                else:
-                                                    tick_value = payload[-1] if isinstance(payload[-1], (int, float)) else None
-                                                    tick_timestamp = int(time.time())
-                                                    tick_asset = current_focused_asset
-                                            elif isinstance(payload, dict):
-                                                tick_asset = payload.get('asset') or payload.get('symbol') or current_focused_asset
-                                                tick_value = payload.get('quote') or payload.get('price') or payload.get('value')
-                                                tick_timestamp = payload.get('timestamp', int(time.time()))
-                                                if isinstance(tick_timestamp, str):
-                                                    tick_timestamp = int(float(tick_timestamp))
-                                            else:
-                                                tick_value = float(payload) if isinstance(payload, (int, float, str)) else None
-                                                tick_timestamp = int(time.time())
-                                                tick_asset = current_focused_asset
-                                            
-                                            if tick_asset and tick_value is not None and tick_timestamp and collect_stream_mode in ['tick', 'both']:
-                                                timestamp_str = datetime.fromtimestamp(tick_timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-                                                persistence_manager.add_tick(tick_asset, timestamp_str, tick_value)
-                                            
-                                            if tick_asset and collect_stream_mode in ['candle', 'both']:
-                                                candles = data_streamer.get_all_candles(tick_asset)
-                                                if candles and len(candles) >= 2:
-                                                    closed_upto = len(candles) - 2
-                                                    last_written = last_closed_candle_index.get(tick_asset, -1)
-                                                    
-                                                    if closed_upto > last_written:
-                                                        try:
-                                                            period = getattr(data_streamer, 'PERIOD', 60)
-                                                            tfm = max(1, int(period // 60))
-                                                        except (TypeError, ValueError, AttributeError) as e:
-                                                            print(f"[Persistence] Invalid PERIOD value, using 1m default: {e}")
-                                                            tfm = 1
-                                                        
-                                                        for i in range(last_written + 1, closed_upto + 1):
-                                                            c = candles[i]
-                                                            persistence_manager.add_candle(
-                                                                asset=tick_asset,
-                                                                timeframe_minutes=tfm,
-                                                                candle_ts=c[0],
-                                                                open_price=c[1],
-                                                                close_price=c[2],
-                                                                high_price=c[3],
-                                                                low_price=c[4]
-                                                            )
-                                                        
-                                                        last_closed_candle_index[tick_asset] = closed_upto
-                                        
-                                        except Exception as e:
-                                            print(f"[Persistence] Error saving data: {e}")
-
-                                        # Extract processed candle and emit to frontend
-                                        # Use capability API method to get current asset
-                                        current_focused_asset = data_streamer.get_current_asset()
-                                        if current_focused_asset:
-                                            candle_data = extract_candle_for_emit(current_focused_asset)
-                                            if candle_data:
-                                                socketio.emit('candle_update', candle_data)
+                for payload_data in iter_performance_log_frames(logs, processed_messages):
+                    staged_ingest.submit(payload_data)
                 
                 if len(processed_messages) > 10000:
                     processed_messages.clear()
@@ -445,6 +452,33 @@ def stream_from_chrome():
         else:
             time.sleep(0.5)
 
+def replay_recorded_frames():
+    """
+    Background thread that feeds a --replay-frames recording through the same
+    decode/candle/persistence/emit pipeline as live Chrome frames.
+    Replay starts on start_stream and restarts from the top on the next one.
+    """
+    global capability_ctx
+    
+    capability_ctx = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+    build_frame_pipeline(capability_ctx)
+    replayer = FrameReplayer(replay_frames_path)
+    speed_label = f"{replay_speed:g}x" if replay_speed > 0 else "max speed"
+    
+    while True:
+        if streaming_active:
+            print(f"[Replay] Replaying {replay_frames_path} at {speed_label}...")
+            try:
+                count = replayer.replay(staged_ingest.submit, speed=replay_speed,
+                                        should_continue=lambda: streaming_active)
+                print(f"[Replay] ✓ Replayed {count} frames")
+            except Exception as e:
+                print(f"[Replay] Error: {e}")
+            while streaming_active:
+                time.sleep(0.5)
+        else:
+            time.sleep(0.5)
+
 # Note: Timeframe detection is now fully handled by data_streamer._process_chart_settings
 # No separate detect_timeframe function needed - delegated to capability
 
@@ -462,96 +496,44 @@ def health():
         "timestamp": datetime.now().isoformat()
     })
 
+@app.route('/api/pipeline-stats')
+def pipeline_stats():
+    """Per-stage queue depth, lag and drop counters of the ingest pipeline"""
+    return jsonify(collect_pipeline_stats())
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus text-format counters, gauges and latency histograms (--metrics)"""
+    if not metrics.REGISTRY.enabled:
+        return jsonify({'error': 'Metrics disabled (start with --metrics)'}), 404
+    collect_pipeline_stats()  # refreshes the stage depth gauges
+    metrics.STREAMING_ACTIVE.set(1 if streaming_active else 0)
+    metrics.SUBSCRIBED_STREAMS.set(len(subscriptions.snapshot()))
+    return Response(metrics.REGISTRY.render(), mimetype=metrics.CONTENT_TYPE.split(';')[0],
+                    headers={'Content-Type': metrics.CONTENT_TYPE})
+
 @app.route('/api/available-csv-files')
 def get_available_csv_files():
-    """Get list of all available CSV files, optionally filtered by timeframe"""
-    import glob
-    import os
-    
+    """Get list of all available CSV files, optionally filtered by timeframe (served from the data catalog)"""
     timeframe_filter = request.args.get('timeframe', None)
     
     files = []
-    data_dir = root_dir / 'data' / 'data_output' / 'assets_data'
-    
-    # Map timeframe to directory names
-    timeframe_dirs = {
-        '1m': ['1M_candles', '1M_candles_utc'],
-        '5m': ['5M_candles', '5M_candles_utc'],
-        '15m': ['15M_candles', '15M_candles_utc'],
-        '1h': ['1H_candles', '1H_candles_utc'],
-        '4h': ['4H_candles', '4H_candles_utc'],
-        'tick': ['0M_candles'],
-    }
-    
-    # Build search paths
-    search_paths = []
-    if timeframe_filter and timeframe_filter in timeframe_dirs:
-        for dir_name in timeframe_dirs[timeframe_filter]:
-            search_paths.append(str(data_dir / 'data_collect' / dir_name / '*.csv'))
-        
-        if timeframe_filter == '1m':
-            search_paths.extend([
-                str(data_dir / 'realtime_stream' / '1M_candle_data' / '*.csv'),
-                str(data_dir / 'realtime_stream' / '1M_tick_data' / '*.csv'),
-            ])
-    else:
-        search_paths = [
-            str(data_dir / 'realtime_stream' / '1M_candle_data' / '*.csv'),
-            str(data_dir / 'realtime_stream' / '1M_tick_data' / '*.csv'),
-            str(data_dir / 'data_collect' / '*_candles' / '*.csv'),
-            str(data_dir / 'data_collect' / '*_candles_utc' / '*.csv'),
-        ]
-    
-    for pattern in search_paths:
-        for filepath in glob.glob(pattern):
-            filename = os.path.basename(filepath)
-            
-            # Parse asset name
-            parts = filename.split('_')
-            if len(parts) >= 2:
-                asset_parts = []
-                for i, part in enumerate(parts):
-                    if part in ['1m', '5m', '15m', '1h', '4h', '60m', 'otc'] or part.isdigit() or len(part) > 10:
-                        break
-                    asset_parts.append(part)
-                
-                if len(asset_parts) == 0:
-                    asset_parts = [parts[0]]
-                if len(parts) > 1 and 'otc' in parts[1].lower():
-                    asset_parts.append('otc')
-                
-                asset = '_'.join(asset_parts).upper()
-                
-                # Determine timeframe from parent directory
-                parent_dir = os.path.basename(os.path.dirname(filepath))
-                timeframe = '1m'
-                
-                if '1M' in parent_dir or '1m' in parent_dir:
-                    timeframe = '1m'
-                elif '5M' in parent_dir or '5m' in parent_dir:
-                    timeframe = '5m'
-                elif '15M' in parent_dir or '15m' in parent_dir:
-                    timeframe = '15m'
-                elif '1H' in parent_dir or '1h' in parent_dir:
-                    timeframe = '1h'
-                elif '4H' in parent_dir or '4h' in parent_dir:
-                    timeframe = '4h'
-                elif '0M' in parent_dir or 'tick' in parent_dir.lower():
-                    timeframe = 'tick'
-                
-                files.append({
-                    'path': filepath,
-                    'filename': filename,
-                    'asset': asset,
-                    'timeframe': timeframe,
-                    'size': os.path.getsize(filepath)
-                })
+    for entry in data_catalog.query(timeframe=timeframe_filter or None, within=listing_directories(root_dir)):
+        info = entry.to_dict()
+        info['asset'] = entry.asset.upper()
+        files.append(info)
     
     return jsonify({'files': files, 'count': len(files)})
 
 @app.route('/api/csv-data/<path:filename>')
 def serve_csv_file(filename):
-    """Serve CSV file content"""
+    """
+    Serve CSV file content.
+
+    Optional query parameters (see backend/csv_range.py): from, to, limit,
+    columns, format=csv|json|binary, max_points. Responses are compressed when the client
+    sends Accept-Encoding; without parameters or compression the file is sent as-is.
+    """
     import os
     from flask import send_file
     
@@ -574,7 +556,14 @@ def serve_csv_file(filename):
     for search_dir in search_dirs:
         filepath = search_dir / filename
         if filepath.exists():
-            return send_file(str(filepath), mimetype='text/csv')
+            accept_encoding = request.headers.get('Accept-Encoding', '')
+            if not request.args and not negotiate_encoding(accept_encoding):
+                return send_file(str(filepath), mimetype='text/csv')
+            try:
+                body, headers = csv_ranges.render(filepath, request.args, accept_encoding)
+            except CsvRangeError as e:
+                return jsonify({'error': str(e)}), 400
+            return Response(body, headers=headers)
     
     return jsonify({'error': 'File not found'}), 404
 
@@ -594,12 +583,12 @@ def handle_connect():
     
     if is_reconnection:
         print(f"[Socket.IO] Client reconnected. Chrome: {chrome_status}")
-        # Reset backend state on client reconnection
-        reset_backend_state()
-        # Emit reconnection event to client
+        # Candles and the update log are kept: the client sends resume_stream with its
+        # last seq and gets the missed deltas (or a snapshot) instead of a full reload
         emit('backend_reconnected', {
             'timestamp': datetime.now().isoformat(),
-            'chrome_status': chrome_status
+            'chrome_status': chrome_status,
+            'epoch': update_log.epoch
         })
     else:
         print(f"[Socket.IO] Client connected. Chrome: {chrome_status}")
@@ -618,12 +607,262 @@ def handle_disconnect():
     
     print(f"[Socket.IO] Client disconnected")
     
-    # Stop streaming on client disconnect
-    if streaming_active:
-        streaming_active = False
+    if candle_emitter:
+        candle_emitter.remove_client(request.sid)
+    
+    # Socket.IO drops the client's rooms; streams it was the last subscriber of keep
+    # ingesting for the grace period so a reconnect can resume without a gap
+    was_streaming = streaming_active
+    subscriptions.remove_client(request.sid, hold_seconds=resume_grace_seconds)
+    if subscriptions.held():
+        socketio.start_background_task(release_held_streams, resume_grace_seconds)
+    apply_subscriptions()
+    if was_streaming and not streaming_active:
+        print(f"[Socket.IO] Stream stopped - last subscriber disconnected")
+
+def release_held_streams(delay: float):
+    """Stop ingest for held streams nobody resumed within the grace period"""
+    global streaming_active
+    
+    socketio.sleep(delay + 0.5)
+    expired = subscriptions.expire_held()
+    if expired:
+        was_streaming = streaming_active
+        apply_subscriptions()
+        print(f"[Socket.IO] Released {len(expired)} stream(s) not resumed within {delay:g}s")
+        if was_streaming and not streaming_active:
+            print(f"[Socket.IO] Stream stopped - last subscriber disconnected")
+
+def apply_subscriptions():
+    """
+    Focus ingest on every subscribed asset; streaming stays active while any
+    client is subscribed.
+    """
+    global streaming_active
+    
+    assets = subscriptions.assets()
+    streaming_active = bool(assets)
+    indicator_stream.retain(list(subscriptions.snapshot()) + subscriptions.held())
+    if not assets:
         data_streamer.release_asset_focus()
         data_streamer.unlock_timeframe()
-        print(f"[Socket.IO] Stream stopped due to client disconnect")
+    elif not is_simulated_mode_global:
+        data_streamer.set_focus_assets(assets)
+
+def parse_subscription_timeframe(value) -> int:
+    """Timeframe from a client request: seconds (60) or a label ('5m'); defaults to the stream period"""
+    if value in (None, ''):
+        return data_streamer.PERIOD
+    if isinstance(value, (int, float)):
+        return int(value)
+    return parse_timeframes(str(value))[0]
+
+def subscribe_client(asset: str, timeframe: int) -> Optional[str]:
+    """Join the requesting client to an (asset, timeframe) room; emits subscription_error if unavailable"""
+    if not is_simulated_mode_global and timeframe not in data_streamer.get_timeframes():
+        emit('subscription_error', {
+            'asset': asset,
+            'timeframe': timeframe,
+            'error': f'Timeframe {timeframe}s is not aggregated',
+            'available_timeframes': data_streamer.get_timeframes()
+        })
+        return None
+    room = subscriptions.subscribe(request.sid, asset, timeframe)
+    join_room(room)
+    return room
+
+def unsubscribe_client(asset: Optional[str] = None, timeframe: Optional[int] = None) -> List[str]:
+    """Remove the requesting client from matching rooms (all if asset is None)"""
+    rooms = subscriptions.unsubscribe(request.sid, asset, timeframe)
+    for room in rooms:
+        leave_room(room)
+    return rooms
+
+def snapshot_candles(asset: str, timeframe: int, count: int = 200) -> List[Dict]:
+    """Latest in-memory candles of a stream as candle_update payloads (no CSV reload)"""
+    if is_simulated_mode_global:
+        return [{
+            'asset': asset,
+            'timestamp': c[0],
+            'open': c[1],
+            'high': c[3],
+            'low': c[4],
+            'close': c[2],
+            'volume': 0,
+            'date': datetime.fromtimestamp(c[0] / 1000, tz=timezone.utc).isoformat()
+        } for c in data_streamer.get_historical_candles(asset, count=count)]
+    candles = data_streamer.get_timeframe_candles(asset, timeframe)
+    return [candle_to_emit_payload(asset, c) for c in list(candles)[-count:]]
+
+def send_resume(asset: str, timeframe: int, room: str, last_seq: int, epoch: Optional[str]):
+    """
+    Bring a (re)subscribed client up to date: the updates it missed since last_seq,
+    or a snapshot when the gap is no longer in the update log.
+    Live updates may repeat entries already sent here; clients skip seq <= the last applied.
+    """
+    deltas = update_log.since(room, last_seq, epoch)
+    reply = {
+        'asset': asset,
+        'timeframe': timeframe,
+        'room': room,
+        'epoch': update_log.epoch,
+        'timestamp': datetime.now().isoformat()
+    }
+    if deltas is not None:
+        reply.update(mode='delta', from_seq=last_seq, seq=deltas[-1]['seq'] if deltas else last_seq,
+                     updates=deltas)
+        print(f"[Resume] {room}: {len(deltas)} update(s) after seq {last_seq}")
+    else:
+        # Read the head first: candles formed meanwhile also arrive as live updates
+        reply['seq'] = update_log.head(room)
+        candles = snapshot_candles(asset, timeframe)
+        reply.update(mode='snapshot', candles=candles, count=len(candles))
+        print(f"[Resume] {room}: gap after seq {last_seq} not buffered - sent {len(candles)} candle snapshot")
+    emit('stream_resumed', reply)
+
+@socketio.on('resume_stream')
+def handle_resume_stream(data):
+    """
+    Resume after a reconnect without re-running start_stream:
+    {'epoch': ..., 'streams': [{'asset', 'timeframe', 'last_seq'}, ...]}
+    (or a single stream's fields at the top level). Each stream is re-subscribed and
+    answered with stream_resumed (mode 'delta' or 'snapshot').
+    """
+    global chrome_reconnect_enabled
+    
+    data = data or {}
+    streams = data.get('streams') or ([data] if data.get('asset') else [])
+    if not streams:
+        emit('subscription_error', {'error': 'asset is required'})
+        return
+    if not is_simulated_mode_global:
+        chrome_reconnect_enabled = True
+    
+    resumed = []
+    for stream in streams:
+        try:
+            timeframe = parse_subscription_timeframe(stream.get('timeframe'))
+            last_seq = int(stream.get('last_seq') or 0)
+        except (TypeError, ValueError, IndexError) as e:
+            emit('subscription_error', {'asset': stream.get('asset'), 'error': str(e)})
+            continue
+        room = subscribe_client(stream['asset'], timeframe)
+        if room:
+            resumed.append((stream['asset'], timeframe, room, last_seq))
+    apply_subscriptions()
+    
+    for asset, timeframe, room, last_seq in resumed:
+        send_resume(asset, timeframe, room, last_seq, data.get('epoch'))
+
+@socketio.on('subscribe')
+def handle_subscribe(data):
+    """Follow an additional (asset, timeframe) stream: {'asset': 'EURUSD_OTC', 'timeframe': 300 | '5m'}"""
+    global chrome_reconnect_enabled
+    
+    if not data or not data.get('asset'):
+        emit('subscription_error', {'error': 'asset is required'})
+        return
+    try:
+        timeframe = parse_subscription_timeframe(data.get('timeframe'))
+    except (ValueError, IndexError) as e:
+        emit('subscription_error', {'asset': data['asset'], 'error': str(e)})
+        return
+    
+    if not is_simulated_mode_global:
+        chrome_reconnect_enabled = True
+    room = subscribe_client(data['asset'], timeframe)
+    if not room:
+        return
+    apply_subscriptions()
+    
+    print(f"[Socket.IO] Client {request.sid} subscribed to {room}")
+    emit('subscribed', {
+        'asset': data['asset'],
+        'timeframe': timeframe,
+        'room': room,
+        'epoch': update_log.epoch,
+        'seq': update_log.head(room),
+        'timestamp': datetime.now().isoformat()
+    })
+
+@socketio.on('unsubscribe')
+def handle_unsubscribe(data):
+    """Stop following a stream: {'asset', 'timeframe'}; omit timeframe for every timeframe, omit both for all"""
+    data = data or {}
+    timeframe = None
+    if data.get('timeframe') not in (None, ''):
+        try:
+            timeframe = parse_subscription_timeframe(data['timeframe'])
+        except (ValueError, IndexError) as e:
+            emit('subscription_error', {'error': str(e)})
+            return
+    rooms = unsubscribe_client(data.get('asset'), timeframe)
+    apply_subscriptions()
+    
+    emit('unsubscribed', {
+        'rooms': rooms,
+        'timestamp': datetime.now().isoformat()
+    })
+
+@socketio.on('get_subscriptions')
+def handle_get_subscriptions():
+    """List this client's rooms and subscriber counts for every active stream"""
+    emit('subscriptions', {
+        'rooms': subscriptions.client_rooms(request.sid),
+        'streams': subscriptions.snapshot(),
+        'timestamp': datetime.now().isoformat()
+    })
+
+@socketio.on('get_pipeline_stats')
+def handle_get_pipeline_stats():
+    """Send ingest pipeline stage metrics to the requesting client"""
+    emit('pipeline_stats', collect_pipeline_stats())
+
+@socketio.on('set_update_rate')
+def handle_set_update_rate(data):
+    """
+    Negotiate this client's candle_update rate.
+    Accepts {'max_updates_per_second': N} or {'interval_ms': M}; omit both to use the server default.
+    Closed candles are always delivered immediately.
+    """
+    if not candle_emitter:
+        emit('update_rate_set', {'interval_ms': 0, 'coalescing': False})
+        return
+    
+    data = data or {}
+    interval = None
+    try:
+        if data.get('max_updates_per_second'):
+            interval = 1.0 / float(data['max_updates_per_second'])
+        elif data.get('interval_ms'):
+            interval = float(data['interval_ms']) / 1000.0
+    except (TypeError, ValueError, ZeroDivisionError):
+        emit('update_rate_error', {'error': 'max_updates_per_second / interval_ms must be positive numbers'})
+        return
+    
+    applied = candle_emitter.set_client_interval(request.sid, interval)
+    print(f"[Socket.IO] Client {request.sid} candle_update interval: {applied * 1000:.0f}ms")
+    emit('update_rate_set', {
+        'interval_ms': round(applied * 1000),
+        'coalescing': True,
+        'timestamp': datetime.now().isoformat()
+    })
+
+def request_max_points(data) -> Optional[int]:
+    """Optional 'max_points' from a Socket.IO payload (invalid values disable downsampling)"""
+    try:
+        return parse_max_points((data or {}).get('max_points'))
+    except ValueError as e:
+        print(f"[Downsample] Ignoring max_points: {e}")
+        return None
+
+def request_series_format(data) -> str:
+    """Optional 'series_format' from a Socket.IO payload ('points' unless the client asks for another)"""
+    series_format = (data or {}).get('series_format') or 'points'
+    if series_format not in SERIES_FORMATS:
+        print(f"[Indicators] Ignoring series_format {series_format!r}: must be one of {', '.join(SERIES_FORMATS)}")
+        return 'points'
+    return series_format
 
 @socketio.on('start_stream')
 def handle_start_stream(data):
@@ -637,23 +876,36 @@ def handle_start_stream(data):
             data_streamer.start_streaming([current_asset])
         else:
             chrome_reconnect_enabled = True
-            if not chrome_driver:
+            if not chrome_driver and not replay_frames_path:
                 emit('stream_error', {
                     'error': 'Chrome not connected',
                     'timestamp': datetime.now().isoformat()
                 })
                 return
-            data_streamer.set_asset_focus(current_asset)
             data_streamer.set_timeframe(minutes=1, lock=True)
     
-    streaming_active = True
+    # start_stream is a single-stream subscription: it replaces this client's rooms
+    unsubscribe_client()
+    timeframe = data_streamer.PERIOD if not is_simulated_mode_global else 60
+    room = subscribe_client(current_asset, timeframe)
+    apply_subscriptions()
     
     print(f"[Stream] Started for {current_asset}")
     emit('stream_started', {
         'asset': current_asset,
+        'epoch': update_log.epoch,
         'timestamp': datetime.now().isoformat()
     })
     
+    # A client that already has the history sends its last seq: deltas instead of a reload
+    if room and data and data.get('last_seq') is not None:
+        try:
+            last_seq = int(data['last_seq'])
+        except (TypeError, ValueError):
+            last_seq = 0
+        send_resume(current_asset, timeframe, room, last_seq, data.get('epoch'))
+        return
+    
     # Stage 1: Seed chart with historical data FIRST, then start live stream
     # This provides context for seamless transition from history to real-time
     
@@ -677,42 +929,14 @@ def handle_start_stream(data):
         source_type = 'simulated'
         print(f"[Stream] Generated {len(historical_candles_to_emit)} SIMULATED historical candles")
     else:
-        # REAL MODE: Try to load historical candles from CSV files first
+        # REAL MODE: Seed from the indexed candle CSVs (tail-read, cached per file mtime)
         try:
-            import pandas as pd
-            from pathlib import Path
-            
-            data_collect_dir = Path('data/data_output/assets_data/data_collect/1M_candle_data')
-            if data_collect_dir.exists():
-                asset_normalized = current_asset.replace('_', '').lower()
-                matching_files = []
-                
-                for csv_file in data_collect_dir.glob('*.csv'):
-                    if asset_normalized in csv_file.stem.lower().replace('_', ''):
-                        matching_files.append(csv_file)
-                
-                if matching_files:
-                    latest_file = max(matching_files, key=lambda f: f.stat().st_mtime)
-                    print(f"[Stream] Loading historical CSV data from {latest_file.name}")
-                    
-                    df = pd.read_csv(latest_file)
-                    df = df.tail(200)
-                    
-                    for _, row in df.iterrows():
-                        timestamp = int(row['timestamp'])
-                        historical_candles_to_emit.append({
-                            'asset': current_asset,
-                            'timestamp': timestamp,
-                            'open': float(row['open']),
-                            'high': float(row['high']),
-                            'low': float(row['low']),
-                            'close': float(row['close']),
-                            'volume': int(row.get('volume', 0) or 0),
-                            'date': datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
-                        })
-                    
-                    source_type = 'csv'
-                    print(f"[Stream] Loaded {len(historical_candles_to_emit)} historical candles from CSV")
+            seed = historical_seed.load(current_asset, timeframe=data_streamer.PERIOD, count=200)
+            if seed.candles:
+                historical_candles_to_emit = list(seed.candles)
+                source_type = 'csv'
+                origin = 'cache' if seed.cached else ', '.join(seed.files)
+                print(f"[Stream] Loaded {len(historical_candles_to_emit)} historical candles from CSV ({origin})")
         except Exception as e:
             print(f"[Stream] Could not load CSV historical data: {e}")
         
@@ -738,11 +962,14 @@ def handle_start_stream(data):
                 print(f"[Stream] No historical data available for {current_asset}")
     
     if historical_candles_to_emit:
+        source_count = len(historical_candles_to_emit)
+        historical_candles_to_emit = downsample_candles(historical_candles_to_emit, request_max_points(data))
         print(f"[Stream] Seeding chart with {len(historical_candles_to_emit)} historical candles from {source_type}")
         emit('historical_candles_loaded', {
             'asset': current_asset,
             'candles': historical_candles_to_emit,
             'count': len(historical_candles_to_emit),
+            'source_count': source_count,
             'source': source_type,
             'timestamp': datetime.now().isoformat()
         })
@@ -750,18 +977,14 @@ def handle_start_stream(data):
 @socketio.on('stop_stream')
 def handle_stop_stream():
     """Stop streaming data (real or simulated)"""
-    global streaming_active
-
-    streaming_active = False
-    print(f"[Stream] Stopped")
+    unsubscribe_client()
+    apply_subscriptions()
+    print(f"[Stream] Stopped for client {request.sid}" + ("" if streaming_active else " (no subscribers left)"))
     emit('stream_stopped', {'timestamp': datetime.now().isoformat()})
     
     # Release resources
-    if is_simulated_mode_global:
+    if is_simulated_mode_global and not streaming_active:
         data_streamer.stop_streaming(current_asset)
-    else:
-        data_streamer.release_asset_focus()
-        data_streamer.unlock_timeframe()
 
 @socketio.on('change_asset')
 def handle_change_asset(data):
@@ -770,10 +993,14 @@ def handle_change_asset(data):
 
     if data and 'asset' in data:
         current_asset = data['asset']
-        # Use API method to change asset focus
-        data_streamer.set_asset_focus(current_asset)
+        # Move only this client's streams to the new asset, keeping their timeframes
+        timeframes = [int(room.rsplit(':', 1)[1]) for room in subscriptions.client_rooms(request.sid)]
+        unsubscribe_client()
+        for timeframe in sorted(set(timeframes)) or [data_streamer.PERIOD]:
+            subscribe_client(current_asset, timeframe)
+        apply_subscriptions()
         
-        print(f"[Stream] Asset changed to {current_asset}")
+        print(f"[Stream] Asset changed to {current_asset} for client {request.sid}")
         emit('asset_changed', {
             'asset': current_asset,
             'timestamp': datetime.now().isoformat()
@@ -868,6 +1095,53 @@ def handle_store_csv_candles(data):
             'timestamp': datetime.now().isoformat()
         })
 
+@socketio.on('get_timeframe_candles')
+def handle_get_timeframe_candles(data):
+    """
+    Return in-memory candles for any aggregated timeframe (no history re-request).
+    Expects {'asset': 'EURUSD_otc', 'timeframe': '5m' or seconds, 'limit': 500}.
+    """
+    global data_streamer
+    
+    try:
+        asset = data.get('asset')
+        timeframe = data.get('timeframe', '1m')
+        limit = int(data.get('limit', 500))
+        
+        if not asset:
+            emit('timeframe_candles_error', {'error': 'No asset specified'})
+            return
+        
+        if not hasattr(data_streamer, 'get_timeframe_candles'):
+            emit('timeframe_candles_error', {'error': 'Timeframe aggregation not available in this mode'})
+            return
+        
+        timeframe_seconds = parse_timeframes([timeframe])[0]
+        if timeframe_seconds not in data_streamer.get_timeframes():
+            emit('timeframe_candles_error', {
+                'error': f'Timeframe {timeframe} is not being aggregated',
+                'available': data_streamer.get_timeframes()
+            })
+            return
+        
+        candles = data_streamer.get_timeframe_candles(asset, timeframe_seconds)
+        rows = candles[-limit:] if limit > 0 else candles[:]
+        emit('timeframe_candles', {
+            'asset': asset,
+            'timeframe': timeframe_seconds,
+            'candles': [
+                {'timestamp': c[0], 'open': c[1], 'close': c[2], 'high': c[3], 'low': c[4], 'volume': 0}
+                for c in rows
+            ],
+            'timestamp': datetime.now().isoformat()
+        })
+        
+    except (TypeError, ValueError, IndexError) as e:
+        emit('timeframe_candles_error', {
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        })
+
 @socketio.on('calculate_indicators')
 def handle_calculate_indicators(data):
     """
@@ -881,7 +1155,9 @@ def handle_calculate_indicators(data):
             'SMA-20': {'type': 'sma', 'params': {'period': 20}},
             'RSI-14': {'type': 'rsi', 'params': {'period': 14}},
             'BB-20': {'type': 'bollinger', 'params': {'period': 20, 'std_dev': 2}}
-        }
+        },
+        'max_points': 500,           # optional LTTB downsampling
+        'series_format': 'columns'   # optional: {time: [...], value: [...]} per series instead of points
     }
     
     Now supports all 13+ indicators via TechnicalIndicatorsPipeline:
@@ -924,6 +1200,7 @@ def handle_calculate_indicators(data):
                 "timestamp": datetime.now().isoformat()
             }
             print(f"[Indicators] No indicators specified for {asset} - sending empty result")
+            indicator_stream.untrack(asset)
             emit('indicators_calculated', empty_result)
             return
         
@@ -933,8 +1210,11 @@ def handle_calculate_indicators(data):
         # Get the actual timeframe period from data_streamer
         timeframe_seconds = data_streamer.PERIOD if hasattr(data_streamer, 'PERIOD') and data_streamer.PERIOD else 60
         
-        adapter = get_indicator_adapter()
-        result = adapter.calculate_indicators_for_instances(asset, candles, instances, timeframe_seconds)
+        # Repeat requests (re-renders, reconnects, other clients) are served from the cache;
+        # only instances without an entry for these candles are computed
+        with metrics.INDICATOR_SECONDS.time():
+            result = indicator_cache.calculate(asset, candles, instances, timeframe_seconds,
+                                               request_max_points(data), request_series_format(data))
         
         if 'error' in result:
             print(f"[Indicators] Error: {result['error']}")
@@ -943,6 +1223,14 @@ def handle_calculate_indicators(data):
             print(f"[Indicators] ✓ Calculated {len(result.get('indicators', {}))} indicator instances for {asset}")
             emit('indicators_calculated', result)
             
+            # Keep the calculated instances live on a subscribed stream: each candle_update to its
+            # room now comes with an indicators_calculated delta, so the client no longer polls
+            if any(tf == timeframe_seconds for tf, _ in subscriptions.rooms_for(asset)):
+                live = {name: instances[name] for name in result['indicators'] if name in instances}
+                tracked = indicator_stream.track(asset, timeframe_seconds, live, candles)
+                if tracked:
+                    print(f"[Indicators] ✓ Streaming {tracked} indicator instances for {asset} incrementally")
+            
     except Exception as e:
         print(f"[Indicators] Exception: {e}")
         import traceback
@@ -967,6 +1255,10 @@ def handle_run_backtest(data):
             emit('backtest_error', {'error': 'No file path provided'})
             return
         
+        # pandas-backed loader and strategy, imported on the first backtest
+        from data_loader import DataLoader, BacktestEngine  # type: ignore
+        from strategies.quantum_flux_strategy import QuantumFluxStrategy
+        
         loader = DataLoader()
         df = loader.load_csv(file_path)
         candles = loader.df_to_candles(df)
@@ -978,7 +1270,8 @@ def handle_run_backtest(data):
             return
         
         engine = BacktestEngine(strategy)
-        results = engine.run_backtest(candles)
+        with metrics.BACKTEST_SECONDS.time(strategy=strategy_type):
+            results = engine.run_backtest(candles)
         
         emit('backtest_complete', {
             'results': results,
@@ -997,6 +1290,9 @@ def initialize_redis():
     global redis_integration, batch_processor
     
     try:
+        from capabilities.redis_integration import RedisIntegration
+        from capabilities.redis_batch_processor import RedisBatchProcessor
+        
         redis_integration = RedisIntegration()
         batch_processor = RedisBatchProcessor(redis_integration)
         batch_processor.start_processing()
@@ -1077,7 +1373,7 @@ def handle_get_cached_historical_data(data):
             emit('cached_historical_data', {
                 'asset': asset,
                 'timeframe': timeframe,
-                'data': cached_data,
+                'data': downsample_candles(cached_data, request_max_points(data)),
                 'source': 'redis_cache'
             })
         else:
@@ -1192,10 +1488,90 @@ if __name__ == '__main__':
         action='store_true',
         help='Enable simulated data streaming for testing (no real market connection)'
     )
+    parser.add_argument(
+        '--ingest',
+        choices=['poll', 'cdp'],
+        default='poll',
+        help='Frame ingest: poll=Selenium performance log every 100ms, cdp=push subscription to Network.webSocketFrameReceived (default: poll)'
+    )
+    
+    parser.add_argument(
+        '--timeframes',
+        default='1m,5m,15m,1h,4h',
+        help='Timeframes aggregated from every tick, comma-separated (default: 1m,5m,15m,1h,4h; empty = stream timeframe only)'
+    )
+    
+    parser.add_argument(
+        '--emit-interval-ms',
+        type=int,
+        default=100,
+        help='Coalesce candle_update to at most one emit per asset/timeframe per interval; 0 = emit every frame (default: 100)'
+    )
+    parser.add_argument(
+        '--resume-buffer',
+        type=int,
+        default=DEFAULT_LOG_CAPACITY,
+        help=f'Candles per asset/timeframe kept for resume_stream deltas (default: {DEFAULT_LOG_CAPACITY})'
+    )
+    parser.add_argument(
+        '--resume-grace',
+        type=float,
+        default=30.0,
+        help='Seconds a disconnected client\'s streams keep ingesting so it can resume without a gap; 0 = stop at once (default: 30)'
+    )
+    parser.add_argument(
+        '--catalog-manifest',
+        default=str(root_dir / 'data' / 'data_output' / 'assets_data' / '.catalog_manifest.json'),
+        help='JSON manifest of the CSV data catalog, reused on restart to skip rescanning; empty = disabled'
+    )
+    parser.add_argument(
+        '--indicator-cache-mb',
+        type=float,
+        default=DEFAULT_INDICATOR_CACHE_BYTES / (1024 * 1024),
+        help=f'Memory budget for cached calculate_indicators results in MB; 0 = disabled (default: {DEFAULT_INDICATOR_CACHE_BYTES // (1024 * 1024)})'
+    )
+    parser.add_argument(
+        '--metrics',
+        action='store_true',
+        help='Collect hot-path counters and latency histograms, served at /metrics in Prometheus text format'
+    )
+    parser.add_argument(
+        '--record-frames',
+        metavar='PATH',
+        help='Append every raw WebSocket frame to PATH for offline replay (.gz suffix = gzip)'
+    )
+    parser.add_argument(
+        '--replay-frames',
+        metavar='PATH',
+        help='Replay a --record-frames file instead of connecting to Chrome'
+    )
+    parser.add_argument(
+        '--replay-speed',
+        type=float,
+        default=1.0,
+        help='Replay rate relative to the recording: 1=real time, 10=10x, 0=as fast as possible (default: 1)'
+    )
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help='Print an import-time breakdown per package and startup phase before binding port 3001'
+    )
     
     args = parser.parse_args()
     collect_stream_mode = args.collect_stream
+    ingest_mode = args.ingest
+    replay_frames_path = args.replay_frames
+    replay_speed = args.replay_speed
+    if replay_frames_path and args.simulated_mode:
+        parser.error('--replay-frames cannot be combined with --simulated-mode')
     is_simulated_mode_global = args.simulated_mode # Set global flag
+    update_log = UpdateLog(capacity=args.resume_buffer)
+    resume_grace_seconds = max(0.0, args.resume_grace)
+    indicator_cache.max_bytes = max(0, int(args.indicator_cache_mb * 1024 * 1024))
+    metrics.REGISTRY.enable(args.metrics)
+    if args.catalog_manifest:
+        data_catalog = DataCatalog(default_catalog_directories(root_dir), manifest_path=args.catalog_manifest)
+        historical_seed = HistoricalSeedService(data_catalog)
 
     print("=" * 60)
     print("QuantumFlux Trading Platform - GUI Backend Server")
@@ -1207,13 +1583,20 @@ if __name__ == '__main__':
         print("⚠️  SIMULATED DATA MODE ENABLED")
         print("   Using simulated data stream for testing - NO real market connection")
         print("="*80 + "\n")
+        from simulated_streaming import SimulatedStreamingCapability  # type: ignore
         data_streamer = SimulatedStreamingCapability(period_seconds=60)
     else:
         print("\n" + "="*80)
         print("✅ REAL DATA MODE ENABLED")
         print("   Using real market data - requires Chrome connection to PocketOption")
         print("="*80 + "\n")
+        from data_streaming import RealtimeDataStreaming  # type: ignore  (imports Selenium)
         data_streamer = RealtimeDataStreaming()
+        try:
+            data_streamer.set_timeframes(args.timeframes)
+            print(f"[Timeframes] ✓ Aggregating {format_timeframes(data_streamer.get_timeframes())} from each tick")
+        except ValueError as e:
+            parser.error(str(e))
     
     # Initialize persistence manager if collection is enabled
     if collect_stream_mode != 'none':
@@ -1252,12 +1635,33 @@ if __name__ == '__main__':
     else:
         print("\n[Persistence] Stream collection disabled (use --collect-stream to enable)")
     
-    # Initialize Redis integration
-    if not initialize_redis():
-        print("[Startup] ⚠️ Redis integration failed - continuing without Redis")
+    # Initialize Redis integration once the server is up (redis / Supabase imports and the connection stay off the startup path)
+    def initialize_redis_in_background():
+        if not initialize_redis():
+            print("[Startup] ⚠️ Redis integration failed - continuing without Redis")
+    
+    socketio.start_background_task(initialize_redis_in_background)
+    print("[Redis] Connecting in the background after startup")
+    
+    if args.emit_interval_ms > 0:
+        candle_emitter = CandleEmitCoalescer(socketio.emit, interval=args.emit_interval_ms / 1000.0,
+                                             members=subscriptions.members)
+        threading.Thread(target=candle_emitter.run, daemon=True).start()
+        print(f"[Emit] ✓ candle_update coalesced to one emit per {args.emit_interval_ms}ms (closes immediate)")
+    # Forming-candle indicator deltas follow the same rate
+    indicator_stream.provisional_interval = max(0, args.emit_interval_ms) / 1000.0
+    
+    if args.record_frames:
+        frame_recorder = FrameRecorder(args.record_frames)
+        print(f"[Replay] ✓ Recording raw WebSocket frames to {args.record_frames}")
     
     # Startup mode handling
-    if is_simulated_mode_global:
+    if replay_frames_path:
+        print(f"\n[Startup] ⏯ REPLAY MODE - skipping Chrome connection")
+        stream_thread = threading.Thread(target=replay_recorded_frames, daemon=True)
+        stream_thread.start()
+        print(f"[Startup] ✓ Replay thread started ({replay_frames_path})")
+    elif is_simulated_mode_global:
         print("\n[Startup] 🎲 SIMULATED MODE - skipping Chrome connection")
         print("[Startup] Simulated data will be generated for testing")
         stream_thread = threading.Thread(target=stream_from_chrome, daemon=True)
@@ -1280,6 +1684,10 @@ if __name__ == '__main__':
             print("[Startup] ⚠️ Chrome not connected. Live streaming will be unavailable.")
             print("[Startup] To enable: Start Chrome with --remote-debugging-port=9222")
     
+    startup_profiler.mark('startup')
+    if args.profile_startup:
+        print(startup_profiler.report())
+    
     print(f"\n[Startup] Starting server on http://0.0.0.0:3001")
     print("=" * 60)
     
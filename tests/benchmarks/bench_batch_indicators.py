@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Scan cost across many assets: one indicator pass per asset vs one batch pass
+over the aligned (assets x time) matrix (strategies/batch_indicators.py).
+
+per_asset_indicators keeps the per-asset loop as the parity reference for
+tests/test_batch_indicators.py: the same kernels, one 1-D call per asset and
+indicator.
+
+Usage:
+    python tests/benchmarks/bench_batch_indicators.py [--assets 1,10,50,100] [--candles 200] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from strategies import kernels
+from strategies.batch_indicators import BatchFrame, BatchIndicatorEngine
+from tests.benchmarks.bench_strategy_kernels import synthetic_ohlc
+
+# A typical favorites scan
+INSTANCES = {
+    'SMA-20': {'type': 'sma', 'params': {'period': 20}},
+    'EMA-12': {'type': 'ema', 'params': {'period': 12}},
+    'RSI-14': {'type': 'rsi', 'params': {'period': 14}},
+    'MACD': {'type': 'macd', 'params': {'fast': 12, 'slow': 26, 'signal': 9}},
+    'BB-20': {'type': 'bollinger', 'params': {'period': 20, 'std_dev': 2}},
+    'STOCH': {'type': 'stochastic', 'params': {'period': 14, 'smooth_k': 3}},
+    'ATR-14': {'type': 'atr', 'params': {'period': 14}},
+}
+
+
+def per_asset_indicators(high, low, close):
+    """{instance: {column: series}} for one asset, one kernel call per indicator"""
+    macd, macd_signal, histogram = kernels.macd(close, 12, 26, 9)
+    upper, middle, lower = kernels.bollinger(close, 20, 2)
+    stoch_k, stoch_d = kernels.stochastic(high, low, close, 14, 3)
+    return {
+        'SMA-20': {'sma_20': kernels.sma(close, 20)},
+        'EMA-12': {'ema_16': kernels.ema(close, 12)},
+        'RSI-14': {'rsi_14': kernels.rsi(close, 14)},
+        'MACD': {'macd': macd, 'macd_signal': macd_signal, 'macd_histogram': histogram},
+        'BB-20': {'bb_upper': upper, 'bb_middle': middle, 'bb_lower': lower},
+        'STOCH': {'stoch_k': stoch_k, 'stoch_d': stoch_d},
+        'ATR-14': {'atr_14': kernels.atr(high, low, close, 14)},
+    }
+
+
+def synthetic_universe(assets, candles, ragged=True, start=1700000040):
+    """{asset: candle rows}; with ragged, every third asset has a shorter history"""
+    universe = {}
+    for i in range(assets):
+        n = candles - (i % 3) * candles // 4 if ragged else candles
+        high, low, close = synthetic_ohlc(n, seed=i)
+        open_ = [close[0]] + close[:-1]
+        times = start + 60 * np.arange(candles - n, candles)
+        universe[f'ASSET{i}_otc'] = [[int(t), o, c, h, l]
+                                     for t, o, c, h, l in zip(times, open_, close, high, low)]
+    return universe
+
+
+def scan_per_asset(universe):
+    out = {}
+    for asset, rows in universe.items():
+        array = np.asarray(rows, dtype=float)
+        out[asset] = per_asset_indicators(array[:, 3], array[:, 4], array[:, 2])
+    return out
+
+
+def scan_batch(universe):
+    return BatchIndicatorEngine(BatchFrame.from_candles(universe)).evaluate(INSTANCES)
+
+
+def measure(fn, repeat):
+    """Best seconds over repeat calls"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(asset_counts, candles=200, repeat=5):
+    """{assets: {'per_asset_ms', 'batch_ms'}}: cost of one full scan of every instance"""
+    results = {}
+    for count in asset_counts:
+        universe = synthetic_universe(count, candles)
+        results[count] = {'per_asset_ms': measure(lambda: scan_per_asset(universe), repeat) * 1e3,
+                          'batch_ms': measure(lambda: scan_batch(universe), repeat) * 1e3}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-asset vs batch indicator scans')
+    parser.add_argument('--assets', default='1,10,50,100', help='Comma-separated asset counts')
+    parser.add_argument('--candles', type=int, default=200, help='Candles per asset (default: 200)')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs, best kept (default: 5)')
+    args = parser.parse_args()
+
+    counts = [int(s) for s in args.assets.split(',') if s]
+    results = run_benchmark(counts, candles=args.candles, repeat=args.repeat)
+
+    print(f"{'assets':>7} {'per-asset ms':>13} {'batch ms':>9} {'speedup':>8}")
+    for count, row in results.items():
+        speedup = row['per_asset_ms'] / row['batch_ms']
+        print(f"{count:>7} {row['per_asset_ms']:13.2f} {row['batch_ms']:9.2f} {speedup:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tick-to-candle_update latency: performance-log polling vs CDP push.
+
+Polling mode replays the 100 ms get_log('performance') loop from
+streaming_server.stream_from_chrome against an in-memory log buffer.
+Push mode sends the same frames through tests/utils/fake_cdp_server.py.
+
+Usage:
+    python tests/benchmarks/bench_cdp_ingest.py [--ticks 200] [--interval 0.02]
+"""
+
+import argparse
+import base64
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'capabilities'))
+
+from backend.cdp_frame_stream import CDPFrameStream
+from backend.frame_ingest import FrameIngestPipeline, iter_performance_log_frames
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+from tests.utils.fake_cdp_server import FakeCDPServer
+
+ASSET = "EURUSD_otc"
+POLL_INTERVAL = 0.1
+
+
+class _LatencyRecorder:
+    """Collects send->emit latency keyed by tick price"""
+
+    def __init__(self):
+        self.sent = {}
+        self.latencies_ms = []
+        self._lock = threading.Lock()
+
+    def mark_sent(self, price):
+        self.sent[price] = time.perf_counter()
+
+    def emit(self, event, data):
+        if event != 'candle_update':
+            return
+        now = time.perf_counter()
+        with self._lock:
+            sent_at = self.sent.pop(data['price'], None)
+            if sent_at is not None:
+                self.latencies_ms.append((now - sent_at) * 1000)
+
+
+def _make_pipeline(recorder):
+    streamer = RealtimeDataStreaming()
+    streamer.set_asset_focus(ASSET)
+    return FrameIngestPipeline(
+        data_streamer=streamer,
+        ctx=Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False),
+        emit=recorder.emit,
+        extract_candle=lambda asset: {'asset': asset, 'price': streamer.get_latest_candle(asset)[2]},
+    )
+
+
+def _ticks(n):
+    base_ts = 1700000000.0
+    return [[[ASSET, base_ts + i * 0.25, round(1.1 + i * 1e-5, 5)]] for i in range(n)]
+
+
+def run_poll(ticks, interval):
+    """Ticks are appended to a log buffer; a 100 ms loop drains it like stream_from_chrome"""
+    recorder = _LatencyRecorder()
+    pipeline = _make_pipeline(recorder)
+    buffer, lock, running = [], threading.Lock(), [True]
+
+    def poll_loop():
+        processed = set()
+        while running[0]:
+            with lock:
+                logs, buffer[:] = list(buffer), []
+            for payload_data in iter_performance_log_frames(logs, processed):
+                pipeline.process_payload_data(payload_data)
+            time.sleep(POLL_INTERVAL)
+
+    worker = threading.Thread(target=poll_loop, daemon=True)
+    worker.start()
+    for i, tick in enumerate(ticks):
+        payload_data = base64.b64encode(json.dumps(tick).encode()).decode()
+        message = {'message': {'method': CDPFrameStream.FRAME_EVENT,
+                               'params': {'response': {'opcode': 2, 'payloadData': payload_data}}}}
+        recorder.mark_sent(tick[0][2])
+        with lock:
+            buffer.append({'timestamp': i, 'message': json.dumps(message)})
+        time.sleep(interval)
+    time.sleep(POLL_INTERVAL * 2)
+    running[0] = False
+    worker.join()
+    return recorder.latencies_ms
+
+
+def run_cdp(ticks, interval):
+    """Ticks are pushed as Network.webSocketFrameReceived events over a DevTools socket"""
+    recorder = _LatencyRecorder()
+    pipeline = _make_pipeline(recorder)
+    with FakeCDPServer() as server:
+        stream = CDPFrameStream(on_frame=pipeline.process_payload_data, port=server.port, verbose=False)
+        stream.start()
+        if not server.wait_for_subscription():
+            raise RuntimeError("CDP client never subscribed")
+        for tick in ticks:
+            recorder.mark_sent(tick[0][2])
+            server.push_frame(tick)
+            time.sleep(interval)
+        time.sleep(0.2)
+        stream.stop()
+    return recorder.latencies_ms
+
+
+def _summary(name, latencies):
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{name:<6} n={len(ordered):<5} p50={statistics.median(ordered):8.2f} ms  "
+          f"p99={p99:8.2f} ms  max={ordered[-1]:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark tick-to-candle_update latency')
+    parser.add_argument('--ticks', type=int, default=200, help='Number of ticks to send (default: 200)')
+    parser.add_argument('--interval', type=float, default=0.02, help='Seconds between ticks (default: 0.02)')
+    args = parser.parse_args()
+
+    ticks = _ticks(args.ticks)
+    print(f"Sending {args.ticks} ticks every {args.interval * 1000:.0f} ms")
+    _summary('poll', run_poll(ticks, args.interval))
+    _summary('cdp', run_cdp(ticks, args.interval))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Frame decoding throughput over a recorded PocketOption WebSocket session.
+
+Compares the previous RealtimeDataStreaming decode path (base64, regex prefix
+strip, regex event match, json.loads, json.dumps wrapper, json.loads, then two
+str(payload) scans for chart settings) with capabilities/frame_decoder.py.
+
+Usage:
+    python tests/benchmarks/bench_frame_decoder.py [--corpus PATH] [--repeat 50]
+"""
+
+import argparse
+import base64
+import json
+import os
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from capabilities import frame_decoder
+from capabilities.frame_decoder import FrameDecoder
+
+DEFAULT_CORPUS = os.path.join(
+    ROOT, 'data', 'data_output', 'assets_data', 'websocket_json', 'detailed_websocket_data_20250903_012215.json'
+)
+
+
+def load_corpus(path):
+    """Return the session's frames as base64 payloadData strings"""
+    with open(path, 'r', encoding='utf-8') as f:
+        messages = json.load(f)['websocket_messages']
+
+    frames = []
+    for message in messages:
+        raw = message.get('full_payload_raw')
+        if not raw:
+            continue
+        if raw[0].isdigit():
+            # Text (opcode 1) frame; encode so both decoders see the same input
+            raw = base64.b64encode(raw.encode('utf-8')).decode('ascii')
+        frames.append(raw)
+    return frames
+
+
+def legacy_decode(encoded_payload):
+    """The decode path RealtimeDataStreaming used before frame_decoder"""
+    try:
+        payload = base64.b64decode(encoded_payload).decode('utf-8')
+        if payload and payload[0].isdigit():
+            match = re.match(r'^\d+', payload)
+            if match:
+                payload = payload[match.end():]
+            if payload.startswith('["') and ']' in payload:
+                event_match = re.match(r'\["([^"]+)"(?:,\s*(.+))?\]', payload)
+                if event_match:
+                    data_str = event_match.group(2) if event_match.group(2) else '[]'
+                    try:
+                        data = json.loads(data_str) if data_str else {}
+                        payload = json.dumps({"event": event_match.group(1), "data": data})
+                    except json.JSONDecodeError:
+                        pass
+        try:
+            return json.loads(payload)
+        except json.JSONDecodeError:
+            if payload.startswith('[') and payload.endswith(']'):
+                parsed = json.loads(payload[1:-1])
+                return [parsed] if isinstance(parsed, dict) else parsed
+            raise
+    except (UnicodeDecodeError, json.JSONDecodeError, ValueError):
+        return None
+
+
+def run_legacy(frames):
+    for payload_data in frames:
+        payload = legacy_decode(payload_data)
+        if payload:
+            'updateCharts' in str(payload) or 'chartPeriod' in str(payload)
+
+
+def run_decoder(frames):
+    decoder = FrameDecoder()
+    for payload_data in frames:
+        decoder.decode(payload_data)
+
+
+def measure(fn, frames, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(frames)
+    elapsed = time.perf_counter() - start
+    return len(frames) * repeat / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark WebSocket frame decoding throughput')
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS, help='Recorded detailed_websocket_data_*.json file')
+    parser.add_argument('--repeat', type=int, default=50, help='Passes over the corpus (default: 50)')
+    args = parser.parse_args()
+
+    frames = load_corpus(args.corpus)
+    print(f"Corpus: {os.path.basename(args.corpus)} ({len(frames)} frames x {args.repeat})")
+
+    results = [('legacy', measure(run_legacy, frames, args.repeat))]
+
+    backend_loads = frame_decoder._loads
+    frame_decoder._loads = json.loads
+    try:
+        results.append(('decoder[json]', measure(run_decoder, frames, args.repeat)))
+    finally:
+        frame_decoder._loads = backend_loads
+    if frame_decoder.JSON_BACKEND != 'json':
+        results.append((f'decoder[{frame_decoder.JSON_BACKEND}]', measure(run_decoder, frames, args.repeat)))
+
+    baseline = results[0][1]
+    for name, fps in results:
+        print(f"{name:<16} {fps:12,.0f} frames/s  ({fps / baseline:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Historical snapshot merge time: per-point linear scan vs vectorised group-by.
+
+Builds a PocketOption-style {"asset", "period", "history": [[ts, price], ...]}
+payload and times RealtimeDataStreaming._process_historical_data against the
+previous O(points x candles) implementation.
+
+Usage:
+    python tests/benchmarks/bench_historical_merge.py [--points 10000] [--spacing 5] [--period 60]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+
+
+def make_history(points, spacing, start=1756800000.0):
+    price = 1.1650
+    history = []
+    for i in range(points):
+        price += random.uniform(-0.0002, 0.0002)
+        history.append([start + i * spacing + random.random() * 0.5, round(price, 5)])
+    return {"asset": "EURUSD_otc", "period": 60, "history": history}
+
+
+def legacy_merge(data, period):
+    """Candle formation as _process_historical_data did it before the vectorised merge"""
+    candles = []
+    if 'candles' in data:
+        candles = list(reversed(data['candles']))
+    for tstamp, value in data['history']:
+        tstamp = int(float(tstamp))
+        candle_start = (tstamp // period) * period if period else tstamp
+        existing_candle = None
+        for c in candles:
+            if c[0] == candle_start:
+                existing_candle = c
+                break
+        if existing_candle:
+            existing_candle[2] = value
+            if value > existing_candle[3]:
+                existing_candle[3] = value
+            if value < existing_candle[4]:
+                existing_candle[4] = value
+        else:
+            candles.append([candle_start, value, value, value, value])
+    candles.sort(key=lambda x: x[0])
+    return candles
+
+
+def time_call(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark historical candle merge')
+    parser.add_argument('--points', type=int, default=10000, help='History points in the payload (default: 10000)')
+    parser.add_argument('--spacing', type=float, default=5.0, help='Seconds between history points (default: 5)')
+    parser.add_argument('--period', type=int, default=60, help='Candle period in seconds (default: 60)')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per implementation (default: 5)')
+    args = parser.parse_args()
+
+    random.seed(7)
+    payload = make_history(args.points, args.spacing)
+
+    def run_current():
+        streamer = RealtimeDataStreaming()
+        streamer.PERIOD = args.period
+        streamer._process_historical_data(payload, CTX)
+        return streamer
+
+    expected = legacy_merge(payload, args.period)
+    merged = run_current().get_all_candles("EURUSD_otc").to_list()
+    assert [c[0] for c in merged] == [c[0] for c in expected], "candle timestamps differ from legacy merge"
+
+    legacy_ms = time_call(lambda: legacy_merge(payload, args.period), args.repeat)
+    current_ms = time_call(run_current, args.repeat)
+    print(f"{args.points} points, {len(expected)} candles of {args.period}s")
+    print(f"legacy     {legacy_ms:10.2f} ms")
+    print(f"vectorised {current_ms:10.2f} ms  ({legacy_ms / current_ms:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
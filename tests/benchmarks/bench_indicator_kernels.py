@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Per-row loop vs vectorised indicator kernels (strategies/technical_indicators.py).
+
+The legacy_* functions are the .iloc / rolling.apply implementations the
+kernels replaced, kept verbatim as the parity reference for
+tests/test_indicator_kernels.py.
+
+Usage:
+    python tests/benchmarks/bench_indicator_kernels.py [--sizes 1000,10000,100000] [--legacy-max 10000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from strategies.technical_indicators import (
+    commodity_channel_index,
+    demarker,
+    schaff_trend_cycle,
+    supertrend_from_bands,
+    true_range,
+    weighted_moving_average,
+)
+
+
+# ========================================
+# Legacy per-row implementations
+# ========================================
+
+def legacy_weighted_moving_average(series, period):
+    weights = np.arange(1, period + 1)
+    return series.rolling(window=period).apply(
+        lambda x: np.dot(x, weights) / weights.sum(), raw=True
+    )
+
+
+def legacy_schaff_trend_cycle(macd, d_macd, d_pf):
+    macd_min = macd.rolling(window=d_macd).min()
+    macd_max = macd.rolling(window=d_macd).max()
+
+    stoch_macd = pd.Series(index=macd.index, dtype=float)
+    for i in range(len(macd)):
+        if macd_max.iloc[i] - macd_min.iloc[i] != 0:
+            stoch_macd.iloc[i] = 100 * (macd.iloc[i] - macd_min.iloc[i]) / (macd_max.iloc[i] - macd_min.iloc[i])
+        else:
+            stoch_macd.iloc[i] = 0
+
+    pf = stoch_macd.ewm(span=d_macd, adjust=False).mean()
+
+    pf_min = pf.rolling(window=d_pf).min()
+    pf_max = pf.rolling(window=d_pf).max()
+
+    stc = pd.Series(index=macd.index, dtype=float)
+    for i in range(len(macd)):
+        if pf_max.iloc[i] - pf_min.iloc[i] != 0:
+            stc.iloc[i] = 100 * (pf.iloc[i] - pf_min.iloc[i]) / (pf_max.iloc[i] - pf_min.iloc[i])
+        else:
+            stc.iloc[i] = 0
+
+    return stc.ewm(span=d_pf, adjust=False).mean()
+
+
+def legacy_demarker(high, low, period):
+    demax = pd.Series(index=high.index, dtype=float)
+    for i in range(1, len(high)):
+        if high.iloc[i] > high.iloc[i-1]:
+            demax.iloc[i] = high.iloc[i] - high.iloc[i-1]
+        else:
+            demax.iloc[i] = 0
+
+    demin = pd.Series(index=low.index, dtype=float)
+    for i in range(1, len(low)):
+        if low.iloc[i] < low.iloc[i-1]:
+            demin.iloc[i] = low.iloc[i-1] - low.iloc[i]
+        else:
+            demin.iloc[i] = 0
+
+    demax_sma = demax.rolling(window=period).mean()
+    demin_sma = demin.rolling(window=period).mean()
+
+    result = pd.Series(index=high.index, dtype=float)
+    for i in range(len(high)):
+        denominator = demax_sma.iloc[i] + demin_sma.iloc[i]
+        if denominator != 0:
+            result.iloc[i] = demax_sma.iloc[i] / denominator
+        else:
+            result.iloc[i] = 0
+
+    return result
+
+
+def legacy_commodity_channel_index(typical_price, period):
+    sma_tp = typical_price.rolling(window=period).mean()
+
+    mean_dev = pd.Series(index=typical_price.index, dtype=float)
+    for i in range(period - 1, len(typical_price)):
+        deviations = []
+        for j in range(i - period + 1, i + 1):
+            deviations.append(abs(typical_price.iloc[j] - sma_tp.iloc[i]))
+        mean_dev.iloc[i] = np.mean(deviations)
+
+    cci = pd.Series(index=typical_price.index, dtype=float)
+    for i in range(len(typical_price)):
+        if mean_dev.iloc[i] != 0:
+            cci.iloc[i] = (typical_price.iloc[i] - sma_tp.iloc[i]) / (0.015 * mean_dev.iloc[i])
+        else:
+            cci.iloc[i] = 0
+
+    return cci
+
+
+def legacy_supertrend_from_bands(close, upper_band, lower_band):
+    supertrend = pd.Series(index=close.index, dtype=float)
+    direction = pd.Series(index=close.index, dtype=str)
+
+    for i in range(1, len(close)):
+        if close.iloc[i] <= lower_band.iloc[i]:
+            supertrend.iloc[i] = lower_band.iloc[i]
+            direction.iloc[i] = 'down'
+        elif close.iloc[i] >= upper_band.iloc[i]:
+            supertrend.iloc[i] = upper_band.iloc[i]
+            direction.iloc[i] = 'up'
+        else:
+            supertrend.iloc[i] = supertrend.iloc[i-1] if not pd.isna(supertrend.iloc[i-1]) else lower_band.iloc[i]
+            direction.iloc[i] = direction.iloc[i-1] if not pd.isna(direction.iloc[i-1]) else 'up'
+
+    return supertrend, direction
+
+
+# ========================================
+# Inputs and cases
+# ========================================
+
+def synthetic_ohlc(n, seed=11):
+    """Random-walk OHLC frame with flat stretches (zero-range windows) and a few NaN gaps"""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0, 1e-3, n)
+    steps[rng.random(n) < 0.05] = 0.0
+    close = 1.1 + np.cumsum(steps)
+    close[n // 3:n // 3 + 25] = close[n // 3]
+    open_ = close + rng.normal(0, 5e-4, n)
+    high = np.maximum(open_, close) + rng.uniform(0, 1e-3, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 1e-3, n)
+    flat = slice(n // 3, n // 3 + 25)
+    open_[flat] = high[flat] = low[flat] = close[flat]
+    for column in (open_, close, high, low):
+        column[rng.random(n) < 0.002] = np.nan
+    return pd.DataFrame({'open': open_, 'close': close, 'high': high, 'low': low})
+
+
+def _macd(df):
+    return df['close'].ewm(span=23, adjust=False).mean() - df['close'].ewm(span=50, adjust=False).mean()
+
+
+def _bands(df, multiplier=3.0):
+    atr = true_range(df['high'], df['low'], df['close']).rolling(window=14).mean()
+    hl2 = (df['high'] + df['low']) / 2
+    return df['close'], hl2 + multiplier * atr, hl2 - multiplier * atr
+
+
+# name -> (args builder, legacy, vectorised, extra args)
+CASES = {
+    'wma': (lambda df: (df['close'],), legacy_weighted_moving_average, weighted_moving_average, (20,)),
+    'schaff_tc': (lambda df: (_macd(df),), legacy_schaff_trend_cycle, schaff_trend_cycle, (10, 10)),
+    'demarker': (lambda df: (df['high'], df['low']), legacy_demarker, demarker, (14,)),
+    'cci': (lambda df: ((df['high'] + df['low'] + df['close']) / 3,),
+            legacy_commodity_channel_index, commodity_channel_index, (20,)),
+    'supertrend': (_bands, legacy_supertrend_from_bands, supertrend_from_bands, ()),
+}
+
+
+def measure(fn, args, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(sizes, legacy_max=10000, repeat=3):
+    """{size: {kernel: {'legacy_ms', 'vectorised_ms', 'speedup'}}}; legacy skipped above legacy_max"""
+    results = {}
+    for n in sizes:
+        df = synthetic_ohlc(n)
+        results[n] = {}
+        for name, (build, legacy, vectorised, extra) in CASES.items():
+            args = build(df) + extra
+            row = {'vectorised_ms': measure(vectorised, args, repeat) * 1000, 'legacy_ms': None, 'speedup': None}
+            if n <= legacy_max:
+                row['legacy_ms'] = measure(legacy, args, 1) * 1000
+                row['speedup'] = row['legacy_ms'] / row['vectorised_ms']
+            results[n][name] = row
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark per-row vs vectorised indicator kernels')
+    parser.add_argument('--sizes', default='1000,10000,100000', help='Comma-separated candle counts')
+    parser.add_argument('--legacy-max', type=int, default=10000,
+                        help='Largest size to time the per-row loops at (default: 10000; 100k takes minutes)')
+    parser.add_argument('--repeat', type=int, default=3, help='Vectorised runs per case, best kept (default: 3)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    results = run_benchmark(sizes, legacy_max=args.legacy_max, repeat=args.repeat)
+
+    print(f"{'candles':>8} {'kernel':<12} {'legacy ms':>12} {'vectorised ms':>14} {'speedup':>9}")
+    for n, rows in results.items():
+        for name, row in rows.items():
+            legacy = f"{row['legacy_ms']:12.1f}" if row['legacy_ms'] is not None else f"{'-':>12}"
+            speedup = f"{row['speedup']:8.0f}x" if row['speedup'] is not None else f"{'-':>9}"
+            print(f"{n:>8} {name:<12} {legacy} {row['vectorised_ms']:14.2f} {speedup}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+calculate_indicators response build: iterrows() series extraction vs the
+vectorised path (strategies/indicator_adapter.py), in both wire formats.
+
+LegacyIndicatorAdapter keeps the per-row _create_series verbatim as the parity
+reference for tests/test_indicator_payload.py.
+
+Usage:
+    python tests/benchmarks/bench_indicator_payload.py [--sizes 1000,10000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from strategies.indicator_adapter import IndicatorAdapter
+
+# Ten instances over the manual kernels (pandas_ta/talib are optional)
+INSTANCES = {
+    'SMA-20': {'type': 'sma', 'params': {'period': 20}},
+    'SMA-50': {'type': 'sma', 'params': {'period': 50}},
+    'EMA-12': {'type': 'ema', 'params': {'period': 12}},
+    'EMA-26': {'type': 'ema', 'params': {'period': 26}},
+    'WMA-10': {'type': 'wma', 'params': {'period': 10}},
+    'STC': {'type': 'schaff_tc', 'params': {'fast': 23, 'slow': 50}},
+    'DEM': {'type': 'demarker', 'params': {'period': 14}},
+    'CCI': {'type': 'cci', 'params': {'period': 20}},
+    'ATR': {'type': 'atr', 'params': {'period': 14}},
+    'ST': {'type': 'supertrend', 'params': {'period': 10, 'multiplier': 3}},
+}
+
+
+class LegacyIndicatorAdapter(IndicatorAdapter):
+    """The adapter with its original row-by-row series extraction"""
+
+    def _create_series(self, df, column, series_format='points'):
+        series_data = []
+        for idx, row in df.iterrows():
+            if not pd.isna(row[column]):
+                series_data.append({
+                    'time': int(row['timestamp']),
+                    'value': float(row[column])
+                })
+        return series_data
+
+
+def synthetic_candles(n, seed=21):
+    """[timestamp, open, close, high, low] rows of a 1m random walk"""
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-3, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) + rng.uniform(0, 5e-4, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 5e-4, n)
+    timestamps = 1700000040 + np.arange(n) * 60
+    return [[int(t), o, c, h, l] for t, o, c, h, l in zip(timestamps, open_, close, high, low)]
+
+
+def measure(fn, repeat):
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_benchmark(sizes, repeat=3, legacy_max=10000):
+    """{size: {variant: {'ms', 'json_bytes'}}} for legacy / points / columns; legacy skipped above legacy_max"""
+    legacy, adapter = LegacyIndicatorAdapter(), IndicatorAdapter()
+    variants = {
+        'legacy': lambda candles: legacy.calculate_indicators_for_instances('EURUSD_otc', candles, INSTANCES),
+        'points': lambda candles: adapter.calculate_indicators_for_instances('EURUSD_otc', candles, INSTANCES),
+        'columns': lambda candles: adapter.calculate_indicators_for_instances('EURUSD_otc', candles, INSTANCES,
+                                                                              series_format='columns'),
+    }
+    results = {}
+    for n in sizes:
+        candles = synthetic_candles(n)
+        results[n] = {}
+        for name, build in variants.items():
+            if name == 'legacy' and n > legacy_max:
+                continue
+            seconds, payload = measure(lambda: build(candles), 1 if name == 'legacy' else repeat)
+            results[n][name] = {'ms': seconds * 1000, 'json_bytes': len(json.dumps(payload))}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark calculate_indicators response building')
+    parser.add_argument('--sizes', default='1000,10000', help='Comma-separated candle counts')
+    parser.add_argument('--legacy-max', type=int, default=10000, help='Largest size to time iterrows at')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per vectorised variant, best kept (default: 3)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    results = run_benchmark(sizes, repeat=args.repeat, legacy_max=args.legacy_max)
+
+    print(f"{'candles':>8} {'variant':<8} {'build ms':>10} {'json KB':>9} {'speedup':>9}")
+    for n, rows in results.items():
+        for name, row in rows.items():
+            speedup = f"{rows['legacy']['ms'] / row['ms']:8.1f}x" if 'legacy' in rows else f"{'-':>9}"
+            print(f"{n:>8} {name:<8} {row['ms']:10.1f} {row['json_bytes'] / 1024:9.0f} {speedup}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+End-to-end ingest benchmark: per-stage latency and throughput of the live path.
+
+Each tick frame is timed through the stages streaming_server runs in production:
+
+    decode       FrameDecoder.decode (base64 + JSON)
+    process      RealtimeDataStreaming._process_realtime_update
+    close        FrameIngestPipeline._flush_closed_candles (close detection + candle_closed)
+    persist      StreamPersistenceManager.add_tick / add_candle (CSV into a temp dir)
+    emit         get_latest_candle + candle_to_emit_payload (extract_candle_for_emit)
+    indicators   IndicatorAdapter.calculate_indicators_for_instances, once per closed candle
+
+Frames are synthetic ticks or a --record-frames recording (backend/frame_recorder.py),
+offered at a target rate. Results are printed as p50/p99 per stage and can be
+saved as a JSON baseline; --compare reports stages whose p99 regressed.
+
+Usage:
+    python tests/benchmarks/bench_ingest_pipeline.py [--rate 10000] [--ticks 20000]
+    python tests/benchmarks/bench_ingest_pipeline.py --replay session.frames --rate 0
+    python tests/benchmarks/bench_ingest_pipeline.py --save-baseline tests/benchmarks/baselines/ingest_pipeline.json
+    python tests/benchmarks/bench_ingest_pipeline.py --compare tests/benchmarks/baselines/ingest_pipeline.json
+"""
+
+import argparse
+import base64
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts', 'custom_sessions'))
+
+from backend.frame_ingest import FrameIngestPipeline, candle_to_emit_payload
+from backend.frame_recorder import FrameReplayer
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+from capabilities.frame_decoder import FRAME_TICKS
+from stream_persistence import StreamPersistenceManager  # type: ignore
+from strategies.indicator_adapter import IndicatorAdapter
+
+STAGES = ('decode', 'process', 'close', 'persist', 'emit', 'indicators')
+DEFAULT_BASELINE = os.path.join(ROOT, 'tests', 'benchmarks', 'baselines', 'ingest_pipeline.json')
+INDICATOR_INSTANCES = {
+    'SMA-20': {'type': 'sma', 'params': {'period': 20}},
+    'RSI-14': {'type': 'rsi', 'params': {'period': 14}},
+    'BB-20': {'type': 'bollinger', 'params': {'period': 20, 'std_dev': 2}},
+}
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+
+
+def synthetic_frames(ticks, assets=1, spacing=0.5, start=1700000040.0, seed=7):
+    """base64 tick frames ([[asset, ts, price]]) spaced `spacing` market-seconds apart"""
+    rng = random.Random(seed)
+    names = ["EURUSD_otc", "GBPUSD_otc", "USDJPY_otc", "AUDUSD_otc", "EURJPY_otc"][:max(1, assets)]
+    prices = {name: 1.1 + i * 0.1 for i, name in enumerate(names)}
+    frames = []
+    for i in range(ticks):
+        asset = names[i % len(names)]
+        prices[asset] += rng.uniform(-0.0002, 0.0002)
+        tick = [[asset, round(start + i * spacing, 3), round(prices[asset], 5)]]
+        frames.append(base64.b64encode(json.dumps(tick).encode()).decode())
+    return frames
+
+
+def replay_frames(path):
+    return [payload for _, payload in FrameReplayer(path).frames()]
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+
+def summarise(samples_ns):
+    ordered = sorted(samples_ns)
+    count = len(ordered)
+    return {
+        'count': count,
+        'p50_us': round(percentile(ordered, 50) / 1000, 3),
+        'p99_us': round(percentile(ordered, 99) / 1000, 3),
+        'max_us': round(ordered[-1] / 1000, 3) if count else 0.0,
+        'mean_us': round(sum(ordered) / count / 1000, 3) if count else 0.0,
+    }
+
+
+def run_benchmark(frames, rate=10000, persist_dir=None, indicators=True):
+    """
+    Push frames through every ingest stage at `rate` frames/s (0 = as fast as possible).
+
+    Returns:
+        Result dict with per-stage latency summaries and throughput
+    """
+    streamer = RealtimeDataStreaming()
+    closed = []
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda event, data: closed.append(data)
+                                   if event == 'candle_closed' else None,
+                                   extract_candle=lambda asset: None)
+    adapter = IndicatorAdapter()
+    samples = {stage: [] for stage in STAGES}
+    ticks = 0
+    clock = time.perf_counter_ns
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out_dir = persist_dir or tmp
+        persistence = StreamPersistenceManager(candle_dir=os.path.join(out_dir, 'candles'),
+                                               tick_dir=os.path.join(out_dir, 'ticks'))
+        start = time.perf_counter()
+        for i, payload_data in enumerate(frames):
+            if rate > 0:
+                ahead = start + i / rate - time.perf_counter()
+                if ahead > 0.001:
+                    time.sleep(ahead)
+
+            t0 = clock()
+            frame = streamer.frame_decoder.decode(payload_data)
+            t1 = clock()
+            samples['decode'].append(t1 - t0)
+
+            if frame.kind != FRAME_TICKS:
+                pipeline.process_frame(frame)
+                samples['process'].append(clock() - t1)
+                continue
+
+            streamer._process_realtime_update(frame.data, CTX)
+            t2 = clock()
+            samples['process'].append(t2 - t1)
+            ticks += 1
+
+            tick = frame.ticks[-1]
+            del closed[:]
+            pipeline._flush_closed_candles(tick.asset)
+            t3 = clock()
+            samples['close'].append(t3 - t2)
+
+            timestamp_str = datetime.fromtimestamp(tick.ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            persistence.add_tick(tick.asset, timestamp_str, tick.price)
+            for c in closed:
+                persistence.add_candle(asset=c['asset'], timeframe_minutes=max(1, c['timeframe'] // 60),
+                                       candle_ts=c['timestamp'], open_price=c['open'], close_price=c['close'],
+                                       high_price=c['high'], low_price=c['low'])
+            t4 = clock()
+            samples['persist'].append(t4 - t3)
+
+            latest = streamer.get_latest_candle(tick.asset)
+            if latest:
+                candle_to_emit_payload(tick.asset, latest)
+            t5 = clock()
+            samples['emit'].append(t5 - t4)
+
+            if indicators and any(c['timeframe'] == streamer.PERIOD for c in closed):
+                candles = streamer.get_all_candles(tick.asset)
+                if len(candles) >= 20:
+                    adapter.calculate_indicators_for_instances(tick.asset, candles, INDICATOR_INSTANCES)
+                    samples['indicators'].append(clock() - t5)
+        wall = time.perf_counter() - start
+
+    busy_ns = sum(sum(values) for values in samples.values())
+    return {
+        'meta': {
+            'frames': len(frames),
+            'ticks': ticks,
+            'target_rate': rate,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'recorded_at': datetime.now(timezone.utc).isoformat(),
+        },
+        'stages': {stage: summarise(values) for stage, values in samples.items()},
+        'throughput': {
+            'achieved_fps': round(len(frames) / wall, 1) if wall else 0.0,
+            'capacity_fps': round(len(frames) / (busy_ns / 1e9), 1) if busy_ns else 0.0,
+        },
+    }
+
+
+def compare(result, baseline, max_regression=0.25):
+    """
+    Stages whose p99 grew by more than max_regression (fraction) over the baseline.
+
+    Returns:
+        List of (stage, baseline_p99_us, current_p99_us)
+    """
+    regressions = []
+    for stage, current in result['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous or not previous.get('count') or not current['count']:
+            continue
+        if current['p99_us'] > previous['p99_us'] * (1 + max_regression):
+            regressions.append((stage, previous['p99_us'], current['p99_us']))
+    return regressions
+
+
+def print_result(result, baseline=None):
+    meta = result['meta']
+    rate = f"{meta['target_rate']}/s" if meta['target_rate'] else "max"
+    print(f"{meta['frames']} frames ({meta['ticks']} ticks) offered at {rate}")
+    print(f"{'stage':<11} {'count':>7} {'p50 us':>10} {'p99 us':>10} {'max us':>10}" + ("  p99 vs baseline" if baseline else ""))
+    for stage, s in result['stages'].items():
+        line = f"{stage:<11} {s['count']:>7} {s['p50_us']:>10.2f} {s['p99_us']:>10.2f} {s['max_us']:>10.2f}"
+        previous = (baseline or {}).get('stages', {}).get(stage)
+        if previous and previous.get('p99_us'):
+            line += f"  {(s['p99_us'] / previous['p99_us'] - 1) * 100:+6.1f}%"
+        print(line)
+    print(f"throughput: achieved {result['throughput']['achieved_fps']:.0f} frames/s, "
+          f"capacity {result['throughput']['capacity_fps']:.0f} frames/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the end-to-end ingest pipeline per stage')
+    parser.add_argument('--ticks', type=int, default=20000, help='Synthetic ticks to generate (default: 20000)')
+    parser.add_argument('--assets', type=int, default=1, help='Synthetic assets to interleave (default: 1)')
+    parser.add_argument('--spacing', type=float, default=0.5, help='Market seconds between synthetic ticks (default: 0.5)')
+    parser.add_argument('--replay', metavar='PATH', help='Use a --record-frames recording instead of synthetic ticks')
+    parser.add_argument('--rate', type=float, default=10000, help='Offered frames per second, 0 = max (default: 10000)')
+    parser.add_argument('--no-indicators', action='store_true', help='Skip the indicator stage')
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE, metavar='PATH',
+                        help=f'Write results as a JSON baseline (default path: {os.path.relpath(DEFAULT_BASELINE, ROOT)})')
+    parser.add_argument('--compare', nargs='?', const=DEFAULT_BASELINE, metavar='PATH',
+                        help='Compare p99 per stage against a saved baseline; exit 1 on regression')
+    parser.add_argument('--max-regression', type=float, default=25.0,
+                        help='Allowed p99 growth over the baseline in percent (default: 25)')
+    args = parser.parse_args()
+
+    # TechnicalIndicatorsPipeline warns on every call with < 200 candles
+    logging.getLogger('strategies.technical_indicators').setLevel(logging.ERROR)
+    frames = replay_frames(args.replay) if args.replay else synthetic_frames(args.ticks, args.assets, args.spacing)
+    result = run_benchmark(frames, rate=args.rate, indicators=not args.no_indicators)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_result(result, baseline)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline saved to {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = compare(result, baseline, args.max_regression / 100)
+        for stage, before, after in regressions:
+            print(f"REGRESSION {stage}: p99 {before:.2f} us -> {after:.2f} us")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
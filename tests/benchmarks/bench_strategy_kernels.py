@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Per-signal indicator cost: the strategies' former pure-Python helpers vs the
+shared NumPy kernels (strategies/kernels.py) at several candle windows.
+
+The legacy_* functions keep the replaced helpers verbatim as the parity
+reference for tests/test_strategy_kernels.py. The convolution "EMA" and the
+macd * 0.9 signal line are not kept: the kernels replace them with real
+EMA/MACD maths rather than reproducing them.
+
+Usage:
+    python tests/benchmarks/bench_strategy_kernels.py [--sizes 50,500,5000] [--repeat 5] [--number 20]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, ROOT)
+
+from strategies import kernels
+
+
+def legacy_sma(prices, period):
+    """strategies/base.py"""
+    return np.mean(prices[-period:])
+
+
+def legacy_ema(prices, period):
+    """neural_beast_strategy.py / live2.py / signal_generation.py"""
+    alpha = 2 / (period + 1)
+    ema = [prices[0]]
+    for price in prices[1:]:
+        ema.append(alpha * price + (1 - alpha) * ema[-1])
+    return ema[-1]
+
+
+def legacy_cutler_rsi(prices, period=14):
+    """strategies/base.py, basic/advanced/alternative, strategies.py, QuantumFluxStrategy"""
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.mean(gains[-period:]) if np.any(gains[-period:]) else 0
+    avg_loss = np.mean(losses[-period:]) if np.any(losses[-period:]) else 0
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def legacy_wilder_rsi(prices, period=14):
+    """live2.py"""
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0)
+    losses = np.where(deltas < 0, -deltas, 0)
+    avg_gain = np.mean(gains[:period]) if len(gains) >= period else 0
+    avg_loss = np.mean(losses[:period]) if len(losses) >= period else 0
+    for i in range(period, len(gains)):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+    if avg_loss == 0:
+        return 100.0
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def legacy_macd(prices, fast=12, slow=26, signal=9):
+    """neural_beast_strategy.py (the one helper with a real signal line)"""
+    ema_fast, ema_slow = [prices[0]], [prices[0]]
+    alpha_fast, alpha_slow = 2 / (fast + 1), 2 / (slow + 1)
+    for price in prices[1:]:
+        ema_fast.append(alpha_fast * price + (1 - alpha_fast) * ema_fast[-1])
+        ema_slow.append(alpha_slow * price + (1 - alpha_slow) * ema_slow[-1])
+    macd_line = [f - s for f, s in zip(ema_fast, ema_slow)]
+    alpha_signal = 2 / (signal + 1)
+    signal_line = [macd_line[0]]
+    for macd_val in macd_line[1:]:
+        signal_line.append(alpha_signal * macd_val + (1 - alpha_signal) * signal_line[-1])
+    return macd_line[-1], signal_line[-1]
+
+
+def legacy_bollinger(prices, period=20, std_dev=2.0):
+    """neural_beast_strategy.py / live2.py / strategies.py"""
+    sma = np.mean(prices[-period:])
+    std = np.std(prices[-period:])
+    return sma + std * std_dev, sma, sma - std * std_dev
+
+
+def legacy_stochastic_k(highs, lows, closes, k_period=14):
+    """live2.py %K"""
+    highest_high = max(highs[-k_period:])
+    lowest_low = min(lows[-k_period:])
+    if highest_high == lowest_low:
+        return 50.0
+    return ((closes[-1] - lowest_low) / (highest_high - lowest_low)) * 100
+
+
+def legacy_atr(highs, lows, closes, period=14):
+    """live2.py"""
+    true_ranges = []
+    for i in range(1, len(closes)):
+        tr1 = highs[i] - lows[i]
+        tr2 = abs(highs[i] - closes[i - 1])
+        tr3 = abs(lows[i] - closes[i - 1])
+        true_ranges.append(max(tr1, tr2, tr3))
+    return np.mean(true_ranges[-period:])
+
+
+def synthetic_ohlc(n, seed=23):
+    """(high, low, close) lists of a 1m random walk"""
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-3, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) + rng.uniform(0, 5e-4, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 5e-4, n)
+    return high.tolist(), low.tolist(), close.tolist()
+
+
+# signal: (legacy(high, low, close), kernel(high, low, close)); legacy stochastic is %K only (%D was k * 0.9)
+SIGNALS = {
+    'sma': (lambda h, l, c: legacy_sma(c, 20), lambda h, l, c: kernels.sma_last(c, 20)),
+    'ema': (lambda h, l, c: legacy_ema(c, 21), lambda h, l, c: kernels.ema_last(c, 21)),
+    'rsi_cutler': (lambda h, l, c: legacy_cutler_rsi(c), lambda h, l, c: kernels.cutler_rsi_last(c)),
+    'rsi_wilder': (lambda h, l, c: legacy_wilder_rsi(c), lambda h, l, c: kernels.rsi_last(c)),
+    'macd': (lambda h, l, c: legacy_macd(c), lambda h, l, c: kernels.macd_last(c)),
+    'bollinger': (lambda h, l, c: legacy_bollinger(c), lambda h, l, c: kernels.bollinger_last(c)),
+    'stochastic': (lambda h, l, c: legacy_stochastic_k(h, l, c), lambda h, l, c: kernels.stochastic_last(h, l, c)),
+    'atr': (lambda h, l, c: legacy_atr(h, l, c), lambda h, l, c: kernels.atr_last(h, l, c)),
+}
+
+
+def measure(fn, repeat, number):
+    """Best per-call seconds over repeat runs of number calls"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def run_benchmark(sizes, repeat=5, number=20):
+    """{size: {signal: {'legacy_us', 'kernel_us'}}}: per-call cost on the latest candle of a size-candle window"""
+    results = {}
+    for n in sizes:
+        high, low, close = synthetic_ohlc(n)
+        results[n] = {
+            name: {'legacy_us': measure(lambda: legacy(high, low, close), repeat, number) * 1e6,
+                   'kernel_us': measure(lambda: kernel(high, low, close), repeat, number) * 1e6}
+            for name, (legacy, kernel) in SIGNALS.items()
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark strategy indicator helpers vs strategies/kernels.py')
+    parser.add_argument('--sizes', default='50,500,5000', help='Comma-separated candle windows')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per signal, best kept (default: 5)')
+    parser.add_argument('--number', type=int, default=20, help='Calls per timed run (default: 20)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+    results = run_benchmark(sizes, repeat=args.repeat, number=args.number)
+
+    print(f"{'candles':>8} {'signal':<11} {'legacy us':>10} {'kernel us':>10} {'speedup':>8}")
+    for n, rows in results.items():
+        for name, row in rows.items():
+            speedup = row['legacy_us'] / row['kernel_us']
+            print(f"{n:>8} {name:<11} {row['legacy_us']:10.1f} {row['kernel_us']:10.1f} {speedup:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
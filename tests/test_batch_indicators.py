@@ -0,0 +1,105 @@
+"""
+Tests for batch indicator computation across assets (strategies/batch_indicators.py)
+against the per-asset loop in tests/benchmarks/bench_batch_indicators.py.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from capabilities.automated_trading import AutomatedTrading
+from capabilities.base import Ctx
+from capabilities.signal_generation import SignalGeneration
+from strategies.batch_indicators import BatchFrame, BatchIndicatorEngine
+from tests.benchmarks.bench_batch_indicators import INSTANCES, per_asset_indicators, run_benchmark, synthetic_universe
+
+
+def test_ragged_batch_matches_per_asset():
+    universe = synthetic_universe(7, 120)
+    universe['EMPTY_otc'] = []
+    frame = BatchFrame.from_candles(universe)
+    assert frame.close.shape == (8, 120)
+    assert frame.lengths().tolist() == [120, 90, 60, 120, 90, 60, 120, 0]
+
+    result = BatchIndicatorEngine(frame).evaluate(INSTANCES)
+    for i, (asset, rows) in enumerate(universe.items()):
+        n = len(rows)
+        if not n:
+            assert all(np.isnan(values[i]).all() for columns in result.values() for values in columns.values())
+            continue
+        array = np.asarray(rows, dtype=float)
+        expected = per_asset_indicators(array[:, 3], array[:, 4], array[:, 2])
+        for name, columns in expected.items():
+            for column, series in columns.items():
+                values = result[name][column][i]
+                assert np.isnan(values[:120 - n]).all(), (asset, column)
+                # Same kernels; only the scan block boundaries move with the matrix width
+                np.testing.assert_allclose(values[120 - n:], series, rtol=1e-9, atol=1e-15, err_msg=f"{asset} {column}")
+
+
+def test_gaps_latest_and_unsupported_types():
+    # Candle at t=120 missing: carried forward as a flat candle at the previous close
+    rows = [[0, 1.0, 1.1, 1.2, 0.9], [60, 1.1, 1.3, 1.4, 1.0], [180, 1.3, 1.2, 1.35, 1.15]]
+    frame = BatchFrame.from_candles({'A': rows, 'B': rows[1:]})
+    assert frame.timestamps.tolist() == [0, 60, 120, 180]
+    assert frame.close[0].tolist() == [1.1, 1.3, 1.3, 1.2] and frame.high[0, 2] == 1.3
+    assert frame.first.tolist() == [0, 1]
+
+    engine = BatchIndicatorEngine(frame)
+    instances = {'SMA-2': {'type': 'sma', 'params': {'period': 2}}, 'ST': {'type': 'supertrend', 'params': {}}}
+    latest = engine.latest(instances)
+    assert latest['ST'] is None
+    np.testing.assert_allclose(latest['SMA-2']['sma_20'], [1.25, 1.25])
+    engine.evaluate(instances)
+    assert engine.kernel_runs == 1  # Results are cached per request key
+
+    closes = BatchFrame.from_closes({'A': [1.0, 2.0, 3.0], 'B': [4.0]}, length=2)
+    assert closes.close[0].tolist() == [2.0, 3.0] and np.isnan(closes.close[1, 0]) and closes.lengths().tolist() == [2, 1]
+
+
+def test_signal_generation_batch_matches_single_asset():
+    universe = synthetic_universe(4, 60)
+    universe['SHORT_otc'] = universe['ASSET0_otc'][-20:]
+    cap = SignalGeneration()
+    batch = cap._generate_signals_batch(universe, ['SMA', 'RSI', 'MACD'])
+    for asset, candles in universe.items():
+        single = cap._generate_signals(candles, ['SMA', 'RSI', 'MACD'])
+        assert set(batch[asset]) == set(single) == {'SMA', 'RSI', 'MACD'}
+        for signal_type, signal in single.items():
+            assert batch[asset][signal_type]['signal'] == signal['signal']
+    assert batch['SHORT_otc']['MACD']['signal'] == 'insufficient_data'
+    assert batch['SHORT_otc']['SMA']['signal'] != 'insufficient_data'
+
+    ctx = Ctx(driver=None, artifacts_root='/tmp', debug=False, dry_run=True, verbose=False)
+    result = cap.run(ctx, {'assets': ['asset1_otc', 'ASSET2_otc'], 'real_candles_by_asset': universe, 'min_candles': 30})
+    assert result.ok and list(result.data['assets']) == ['asset1_otc', 'ASSET2_otc']
+    assert all(entry['data_source'] == 'real_time_data' for entry in result.data['assets'].values())
+    assert result.data['assets']['asset1_otc']['signals'] == batch['ASSET1_otc']
+
+
+def test_automated_trading_finds_mixed_case_otc_signals(monkeypatch):
+    universe = {asset.upper(): candles for asset, candles in synthetic_universe(2, 60, ragged=False).items()}
+    lookups = []
+
+    def candle_data(self, ctx, asset, min_candles):
+        lookups.append(asset)
+        return universe.get(asset)
+
+    monkeypatch.setattr(SignalGeneration, '_get_candle_data', candle_data)
+    ctx = Ctx(driver=None, artifacts_root='/tmp', debug=False, dry_run=True, verbose=False)
+    signals = AutomatedTrading()._generate_signals_for_assets(ctx, ['ASSET0_otc', 'asset1_OTC'], 'quantum_flux')
+
+    # Results come back under the caller's spelling; candles are looked up by the upper-cased symbol
+    assert list(signals) == ['ASSET0_otc', 'asset1_OTC']
+    assert lookups == ['ASSET0_OTC', 'ASSET1_OTC']
+    expected = SignalGeneration()._generate_signals(universe['ASSET0_OTC'], ['SMA', 'RSI'])
+    assert signals['ASSET0_otc'] == AutomatedTrading._best_signal(expected) is not None
+
+
+def test_benchmark_reports_both_scans():
+    results = run_benchmark([1, 5], candles=60, repeat=1)
+    assert set(results) == {1, 5}
+    assert all(row['per_asset_ms'] > 0 and row['batch_ms'] > 0 for row in results.values())
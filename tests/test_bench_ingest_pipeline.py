@@ -0,0 +1,33 @@
+"""
+Smoke tests for the end-to-end ingest benchmark (tests/benchmarks/bench_ingest_pipeline.py).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.benchmarks.bench_ingest_pipeline import STAGES, compare, run_benchmark, synthetic_frames
+
+
+def test_every_stage_is_timed(tmp_path):
+    frames = synthetic_frames(600, assets=2, spacing=5.0)
+    result = run_benchmark(frames, rate=0, persist_dir=str(tmp_path), indicators=False)
+
+    assert result['meta']['ticks'] == 600
+    assert set(result['stages']) == set(STAGES)
+    for stage in ('decode', 'process', 'close', 'persist', 'emit'):
+        assert result['stages'][stage]['count'] == 600
+        assert result['stages'][stage]['p99_us'] >= result['stages'][stage]['p50_us'] > 0
+    assert result['stages']['indicators']['count'] == 0
+    assert result['throughput']['capacity_fps'] > 0
+    # Closed 1m candles for both assets were written next to the ticks
+    assert len(os.listdir(tmp_path / 'candles')) >= 2
+
+
+def test_compare_flags_p99_regressions_only():
+    baseline = {'stages': {'decode': {'count': 10, 'p99_us': 10.0}, 'emit': {'count': 10, 'p99_us': 10.0}}}
+    result = {'stages': {'decode': {'count': 10, 'p99_us': 14.0}, 'emit': {'count': 10, 'p99_us': 11.0},
+                         'indicators': {'count': 0, 'p99_us': 0.0}}}
+
+    assert compare(result, baseline, max_regression=0.25) == [('decode', 10.0, 14.0)]
@@ -0,0 +1,187 @@
+"""
+Tests for the array-backed candle store (capabilities/candle_store.py) and
+the CANDLES compatibility view on RealtimeDataStreaming.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.frame_ingest import FrameIngestPipeline
+from capabilities.base import Ctx
+from capabilities.candle_store import CandleBuffer, CandleSeries, CandleStore, aggregate_ticks, merge_candles
+from capabilities.data_streaming import RealtimeDataStreaming
+from strategies.indicator_adapter import IndicatorAdapter
+from tests.benchmarks.bench_historical_merge import legacy_merge, make_history
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+
+
+def test_tick_updates_fold_into_forming_candle():
+    store = CandleStore(capacity=10)
+    assert store.update_tick("EURUSD_otc", 60, 120.5, 1.10) is True
+    assert store.update_tick("EURUSD_otc", 60, 150.0, 1.12) is False
+    assert store.update_tick("EURUSD_otc", 60, 170.0, 1.09) is False
+    assert store.update_tick("EURUSD_otc", 60, 180.0, 1.11) is True
+
+    buf = store.get("EURUSD_otc", 60)
+    assert buf.to_list() == [[120, 1.10, 1.09, 1.12, 1.09], [180, 1.11, 1.11, 1.11, 1.11]]
+    assert buf.closed_seq == 1
+
+
+def test_retention_cap_keeps_memory_flat():
+    buf = CandleBuffer(capacity=100)
+    nbytes = buf.nbytes
+    for i in range(1050):
+        buf.update_tick(i * 60, float(i))
+
+    assert len(buf) == 100
+    assert buf.nbytes == nbytes
+    assert buf.last()[0] == 1049 * 60
+    assert buf.array()[0, 0] == 950 * 60
+    assert buf.total == 1050
+
+
+def test_closed_since_uses_sequence_numbers_across_wraparound():
+    buf = CandleBuffer(capacity=5)
+    for i in range(4):
+        buf.update_tick(i * 60, float(i))
+    rows, seq = buf.closed_since(0)
+    assert rows[:, 0].tolist() == [0, 60, 120]
+    assert seq == 3
+
+    for i in range(4, 12):
+        buf.update_tick(i * 60, float(i))
+    rows, seq = buf.closed_since(seq)
+    # Candles 3..6 fell out of the 5-candle window; only retained closed ones come back
+    assert rows[:, 0].tolist() == [420, 480, 540, 600]
+    assert seq == 11
+
+
+def test_column_views_are_zero_copy():
+    buf = CandleBuffer(capacity=10)
+    buf.load([[0, 1.0, 1.5, 2.0, 0.5], [60, 1.5, 1.2, 1.6, 1.1]])
+    close = buf.column("close")
+    assert np.shares_memory(close, buf.array())
+    buf.update_last(1.7)
+    assert close[-1] == 1.7
+
+
+def test_load_rejects_short_rows():
+    with pytest.raises(ValueError):
+        CandleBuffer(capacity=10).load([[0, 1.0, 1.0]])
+
+
+def test_candles_compatibility_view():
+    streamer = RealtimeDataStreaming()
+    streamer.CANDLES["EURUSD_otc"] = [[0, 1.0, 1.1, 1.2, 0.9], [60, 1.1, 1.3, 1.3, 1.1]]
+
+    assert "EURUSD_otc" in streamer.CANDLES
+    assert list(streamer.CANDLES) == ["EURUSD_otc"]
+    assert streamer.get_latest_candle("EURUSDOTC") == [60, 1.1, 1.3, 1.3, 1.1]
+    candles = streamer.get_all_candles("EURUSD_otc")
+    assert isinstance(candles, CandleSeries)
+    assert candles[-1:] == [[60, 1.1, 1.3, 1.3, 1.1]]
+    assert candles == [[0, 1.0, 1.1, 1.2, 0.9], [60, 1.1, 1.3, 1.3, 1.1]]
+
+    # Buffers are per timeframe; CANDLES follows PERIOD
+    streamer.PERIOD = 300
+    assert "EURUSD_otc" not in streamer.CANDLES
+    streamer.PERIOD = 60
+
+    streamer.CANDLES = {}
+    assert len(streamer.CANDLES) == 0
+
+
+def test_realtime_ticks_build_candles_in_store():
+    streamer = RealtimeDataStreaming()
+    streamer._process_realtime_update([["EURUSD_otc", 1700000000.2, 1.1]], CTX)
+    streamer._process_realtime_update([["EURUSD_otc", 1700000010.0, 1.3]], CTX)
+    streamer._process_realtime_update([["EURUSD_otc", 1700000065.0, 1.2]], CTX)
+
+    assert streamer.get_all_candles("EURUSD_otc").to_list() == [
+        [1699999980, 1.1, 1.3, 1.3, 1.1],
+        [1700000040, 1.2, 1.2, 1.2, 1.2],
+    ]
+
+
+def test_topdown_collector_exports_candle_series_to_csv(tmp_path, monkeypatch):
+    topdown = pytest.importorskip("scripts.custom_sessions.data_collect_topdown_select")
+    monkeypatch.setattr(topdown, "project_root", tmp_path)
+    collector = topdown.DataCollectTopdownSelect()
+    collector.CANDLES["EURUSD_otc"] = [[1700000040, 1.0, 1.1, 1.2, 0.9], [1700000100, 1.1, 1.3, 1.3, 1.1]]
+
+    collector.save_to_csv("EURUSD_otc", CTX)
+
+    written = list((tmp_path / "data" / "data_output" / "assets_data" / "data_collect" / "1M_candles").glob("*.csv"))
+    assert len(written) == 1
+    assert written[0].read_text().splitlines() == [
+        "timestamp,open,close,high,low",
+        "2023-11-14 22:14:00Z,1.0,1.1,1.2,0.9",
+        "2023-11-14 22:15:00Z,1.1,1.3,1.3,1.1",
+    ]
+
+
+def test_indicator_adapter_reads_column_views():
+    streamer = RealtimeDataStreaming()
+    streamer.CANDLES["EURUSD_otc"] = [[i * 60, 1.0 + i, 1.5 + i, 2.0 + i, 0.5 + i] for i in range(3)]
+    df = IndicatorAdapter()._candles_to_dataframe(streamer.get_all_candles("EURUSD_otc"))
+
+    assert df["timestamp"].tolist() == [0, 60, 120]
+    assert df["close"].tolist() == [1.5, 2.5, 3.5]
+    assert df["volume"].tolist() == [0, 0, 0]
+
+
+def test_pipeline_persists_each_closed_candle_once():
+    class Recorder:
+        def __init__(self):
+            self.candles = []
+
+        def add_tick(self, *args):
+            pass
+
+        def add_candle(self, **kwargs):
+            self.candles.append(kwargs['candle_ts'])
+
+    streamer = RealtimeDataStreaming()
+    streamer.candle_store.capacity = 3
+    streamer.set_asset_focus("EURUSD_otc")
+    recorder = Recorder()
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda *a: None, extract_candle=lambda a: None,
+                                   persistence_manager=recorder, collect_stream_mode='candle')
+    for i in range(8):
+        pipeline.process_payload([["EURUSD_otc", 1700000040 + i * 60, 1.0 + i]])
+
+    assert recorder.candles == [1700000040 + i * 60 for i in range(7)]
+
+
+def test_aggregate_ticks_groups_by_period():
+    candles = aggregate_ticks([60.5, 70, 65, 119.9, 120], [1.0, 1.3, 0.9, 1.1, 2.0], 60)
+    assert candles.tolist() == [[60, 1.0, 1.1, 1.3, 0.9], [120, 2.0, 2.0, 2.0, 2.0]]
+
+
+def test_merge_candles_has_no_duplicate_timestamps():
+    older = [[0, 1.0, 1.1, 1.2, 0.9], [60, 1.1, 1.2, 1.3, 1.0]]
+    newer = [[60, 1.15, 1.25, 1.4, 1.05], [120, 1.25, 1.3, 1.3, 1.2]]
+    assert merge_candles(older, newer).tolist() == [
+        [0, 1.0, 1.1, 1.2, 0.9],
+        [60, 1.1, 1.25, 1.4, 1.0],
+        [120, 1.25, 1.3, 1.3, 1.2],
+    ]
+
+
+def test_historical_merge_matches_legacy_and_keeps_live_candles():
+    payload = make_history(2000, 5.0)
+    streamer = RealtimeDataStreaming()
+    last_ts = payload["history"][-1][0]
+    streamer._process_realtime_update([["EURUSD_otc", last_ts + 120, 1.5]], CTX)
+    streamer._process_historical_data(payload, CTX)
+
+    candles = streamer.get_all_candles("EURUSD_otc").to_list()
+    expected = legacy_merge(payload, 60)
+    np.testing.assert_allclose(candles[:-1], expected)
+    assert candles[-1] == [int((last_ts + 120) // 60 * 60), 1.5, 1.5, 1.5, 1.5]
@@ -0,0 +1,145 @@
+"""
+Tests for push-based CDP frame ingest (backend/cdp_frame_stream.py, backend/frame_ingest.py).
+
+Runs against tests/utils/fake_cdp_server.py, so no Chrome instance is needed.
+"""
+
+import base64
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'capabilities'))
+
+from backend.cdp_frame_stream import CDPFrameStream
+from backend.frame_ingest import FrameIngestPipeline, iter_performance_log_frames
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+from tests.utils.fake_cdp_server import FakeCDPServer
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _frame_message(payload, opcode=2, method=CDPFrameStream.FRAME_EVENT):
+    text = json.dumps(payload)
+    payload_data = base64.b64encode(text.encode()).decode() if opcode == 2 else text
+    return json.dumps({"method": method, "params": {"response": {"opcode": opcode, "payloadData": payload_data}}})
+
+
+def test_find_target_prefers_pocketoption_page():
+    with FakeCDPServer() as server:
+        stream = CDPFrameStream(on_frame=lambda _: None, port=server.port, verbose=False)
+        assert stream.find_target_url().endswith("/page/PAGE")
+
+
+def test_find_target_without_endpoint_returns_none():
+    stream = CDPFrameStream(on_frame=lambda _: None, port=1, verbose=False)
+    assert stream.find_target_url() is None
+    assert stream.connect() is False
+
+
+def test_handle_message_dispatches_only_binary_frames():
+    received = []
+    stream = CDPFrameStream(on_frame=received.append, verbose=False)
+
+    assert stream.handle_message(json.dumps({"method": "Network.requestWillBeSent", "params": {}})) is False
+    assert stream.handle_message(_frame_message("2", opcode=1)) is False
+    assert stream.handle_message(_frame_message([["EURUSD_otc", 1700000000.1, 1.1]])) is True
+
+    assert len(received) == 1
+    assert json.loads(base64.b64decode(received[0])) == [["EURUSD_otc", 1700000000.1, 1.1]]
+    assert stream.events_skipped == 1
+    assert stream.frames_received == 2
+    assert stream.frames_dispatched == 1
+
+
+def test_stream_subscribes_and_receives_pushed_frames():
+    received = []
+    with FakeCDPServer() as server:
+        stream = CDPFrameStream(on_frame=received.append, port=server.port, verbose=False)
+        stream.start()
+        try:
+            assert server.wait_for_subscription()
+            server.push_event("Network.responseReceived", {"requestId": "1"})
+            server.push_frame([["EURUSD_otc", 1700000000.5, 1.2345]])
+            assert _wait_for(lambda: len(received) == 1)
+        finally:
+            stream.stop()
+
+    assert server.commands[0]["method"] == "Network.enable"
+    assert stream.events_skipped >= 1
+
+
+def test_stream_reconnects_after_disconnect():
+    received = []
+    with FakeCDPServer() as server:
+        stream = CDPFrameStream(on_frame=received.append, port=server.port, verbose=False, reconnect_delay=0.05)
+        stream.start()
+        try:
+            assert server.wait_for_subscription()
+            server.commands.clear()
+            server.disconnect_clients()
+            assert server.wait_for_subscription()
+            assert _wait_for(lambda: server.client_count == 1)
+            server.push_frame([["EURUSD_otc", 1700000001.0, 1.1]])
+            assert _wait_for(lambda: len(received) == 1)
+        finally:
+            stream.stop()
+
+
+def test_iter_performance_log_frames_dedupes_and_filters():
+    frame = {"method": CDPFrameStream.FRAME_EVENT,
+             "params": {"response": {"opcode": 2, "payloadData": "WyJ4Il0="}}}
+    text = {"method": CDPFrameStream.FRAME_EVENT,
+            "params": {"response": {"opcode": 1, "payloadData": "2"}}}
+    logs = [
+        {"timestamp": 1, "message": json.dumps({"message": frame})},
+        {"timestamp": 1, "message": json.dumps({"message": frame})},
+        {"timestamp": 2, "message": json.dumps({"message": text})},
+    ]
+    seen = set()
+    assert list(iter_performance_log_frames(logs, seen)) == ["WyJ4Il0="]
+    assert list(iter_performance_log_frames(logs, seen)) == []
+
+
+def test_pipeline_emits_candle_update_for_pushed_tick():
+    streamer = RealtimeDataStreaming()
+    streamer.set_asset_focus("EURUSD_otc")
+    emitted = []
+    done = threading.Event()
+
+    def emit(event, data):
+        emitted.append((event, data))
+        done.set()
+
+    pipeline = FrameIngestPipeline(
+        data_streamer=streamer,
+        ctx=Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False),
+        emit=emit,
+        extract_candle=lambda asset: {"asset": asset, "candle": streamer.get_latest_candle(asset)},
+    )
+
+    with FakeCDPServer() as server:
+        stream = CDPFrameStream(on_frame=pipeline.process_payload_data, port=server.port, verbose=False)
+        stream.start()
+        try:
+            assert server.wait_for_subscription()
+            server.push_frame([["EURUSD_otc", 1700000010.0, 1.2345]])
+            assert done.wait(5)
+        finally:
+            stream.stop()
+
+    event, data = emitted[0]
+    assert event == "candle_update"
+    assert data["asset"] == "EURUSD_otc"
+    assert data["candle"][2] == 1.2345
@@ -0,0 +1,123 @@
+"""
+Tests for range-limited / compressed CSV serving (backend/csv_range.py).
+"""
+
+import gzip
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.csv_range import CsvRangeError, CsvRangeService, CsvTimestampIndex, negotiate_encoding
+
+T0 = 1761387360  # 2025-10-25 10:16:00Z
+
+
+def _write(path, rows, start=T0, iso=False, mode='w'):
+    with open(path, mode) as f:
+        if mode == 'w':
+            f.write("timestamp,open,close,high,low\n")
+        for i in range(rows):
+            ts = start + i * 60
+            stamp = np.datetime_as_string(np.datetime64(ts, 's')).replace('T', ' ') + 'Z' if iso else ts
+            f.write(f"{stamp},{i},{i + 0.5},{i + 1},{i - 1}\n")
+
+
+def test_index_resolves_ranges_for_epoch_and_iso_files(tmp_path):
+    for iso in (False, True):
+        path = tmp_path / f"EURUSD_otc_1m_{iso}.csv"
+        _write(path, 100, iso=iso)
+        idx = CsvTimestampIndex(path)
+        assert len(idx) == 100 and idx.sorted and idx.timestamps[0] == T0
+
+        assert list(idx.resolve(T0 + 60, T0 + 180)) == [1, 2, 3]
+        assert list(idx.resolve(limit=2)) == [98, 99]
+        assert list(idx.resolve(start=T0 + 600, limit=2)) == [10, 11]
+        assert list(idx.resolve(end=T0 + 120, limit=2)) == [1, 2]
+        assert idx.read_lines(idx.resolve(T0 + 60, T0 + 60))[0].split(b',')[1:] == [b'1', b'1.5', b'2', b'0']
+
+
+def test_index_extends_appended_rows(tmp_path):
+    path = tmp_path / "EURUSD_otc_1m.csv"
+    _write(path, 10)
+    service = CsvRangeService()
+    assert len(service.index(path)) == 10
+
+    # A partially written row is picked up whole once its newline arrives
+    with open(path, 'a') as f:
+        f.write(f"{T0 + 600},10,10")
+    assert len(service.index(path)) == 11
+    with open(path, 'a') as f:
+        f.write(",11,9\n")
+    _write(path, 2, start=T0 + 660, mode='a')
+    idx = service.index(path)
+    assert len(idx) == 13 and service.index_builds == 1
+    assert idx.read_lines(idx.resolve(limit=3))[0] == f"{T0 + 600},10,10,11,9".encode()
+
+
+def test_render_formats_and_columns(tmp_path):
+    path = tmp_path / "EURUSD_otc_1m.csv"
+    _write(path, 50, iso=True)
+    service = CsvRangeService()
+
+    body, headers = service.render(path, {'limit': '2', 'columns': 'timestamp,close'})
+    assert body.decode().splitlines() == ["timestamp,close",
+                                          "2025-10-25 11:04:00Z,48.5", "2025-10-25 11:05:00Z,49.5"]
+    assert headers['X-Total-Rows'] == '50' and headers['X-Last-Timestamp'] == str(T0 + 49 * 60)
+
+    body, headers = service.render(path, {'from': str(T0), 'to': '2025-10-25 10:17:00', 'format': 'json'})
+    assert json.loads(body) == {'columns': ['timestamp', 'open', 'close', 'high', 'low'],
+                                'rows': [[T0, 0, 0.5, 1, -1], [T0 + 60, 1, 1.5, 2, 0]]}
+
+    body, headers = service.render(path, {'limit': '3', 'columns': 'timestamp,high', 'format': 'binary'})
+    matrix = np.frombuffer(body, dtype='<f8').reshape(int(headers['X-Rows']), 2)
+    assert matrix[:, 0].tolist() == [T0 + 47 * 60, T0 + 48 * 60, T0 + 49 * 60]
+    assert matrix[:, 1].tolist() == [48, 49, 50]
+
+    for bad in ({'limit': '0'}, {'from': 'yesterday'}, {'columns': 'volume'}, {'format': 'xml'}):
+        with pytest.raises(CsvRangeError):
+            service.render(path, bad)
+
+
+def test_compression_negotiation(tmp_path):
+    path = tmp_path / "EURUSD_otc_1m.csv"
+    _write(path, 500)
+    service = CsvRangeService()
+
+    assert negotiate_encoding("gzip, deflate") == 'gzip'
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
+
+    body, headers = service.render(path, {}, "gzip, deflate")
+    assert headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(body) == path.read_bytes()
+    assert len(body) < path.stat().st_size
+
+    # Small bodies are not worth compressing
+    body, headers = service.render(path, {'limit': '1'}, "gzip")
+    assert 'Content-Encoding' not in headers and body.count(b'\n') == 2
+
+    # Repeated queries are served from the response cache
+    service.render(path, {}, "gzip, deflate")
+    assert service.stats()['cached_responses'] == 2
+
+
+def test_max_points_aggregates_rows(tmp_path):
+    path = tmp_path / "EURUSD_otc_1m.csv"
+    _write(path, 100, iso=True)
+    service = CsvRangeService()
+
+    body, headers = service.render(path, {'max_points': '10'})
+    lines = body.decode().splitlines()
+    assert lines[1] == "2025-10-25 10:16:00Z,0,9.5,10,-1" and len(lines) == 11
+    assert headers['X-Rows'] == '10' and headers['X-Source-Rows'] == '100'
+
+    body, headers = service.render(path, {'max_points': '10', 'format': 'json', 'columns': 'timestamp,low'})
+    rows = json.loads(body)['rows']
+    assert rows[-1] == [T0 + 90 * 60, 89]
+    with pytest.raises(CsvRangeError):
+        service.render(path, {'max_points': 'x'})
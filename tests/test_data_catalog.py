@@ -0,0 +1,133 @@
+"""
+Tests for the shared CSV data catalog (backend/data_catalog.py).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.data_catalog import (
+    DataCatalog,
+    default_catalog_directories,
+    listing_directories,
+    parse_filename,
+    parse_timestamp,
+    timeframe_from_dir,
+    timeframe_label,
+)
+
+T0 = 1761387360  # 2025-10-25 10:16:00Z
+
+
+def _write(path, rows, start=T0, step=60):
+    with open(path, 'w') as f:
+        f.write("timestamp,open,close,high,low\n")
+        for i in range(rows):
+            f.write(f"{start + i * step},1,1,1,1\n")
+
+
+def _tree(tmp_path):
+    one = tmp_path / "1M_candles"
+    five = tmp_path / "5M_candles"
+    ticks = tmp_path / "1M_tick_data"
+    for d in (one, five, ticks):
+        d.mkdir()
+    _write(one / "EURUSD_otc_1m_2025_10_25_09_54_04.csv", 10)
+    _write(one / "GBPUSD_otc_1m_2025_10_25_09_47_21.csv", 3)
+    _write(five / "EURUSD_otc_5m_2025_10_25_09_54_13.csv", 4, step=300)
+    _write(ticks / "EURUSD_otc_ticks_2025_10_25_part001.csv", 2, step=1)
+    return one, five, ticks
+
+
+def test_name_parsing():
+    assert parse_filename("AUDCAD_otc_1m_2025_10_25_09_50_19.csv") == ("AUDCAD_otc", "1m")
+    assert parse_filename("AEDCNY_otc_60m_2025_10_25_09_55_43.csv") == ("AEDCNY_otc", "1h")
+    assert parse_filename("EURUSD_otc_ticks_2025_10_25_part001.csv") == ("EURUSD_otc", "tick")
+    assert parse_filename("EURUSD_2025_10_25.csv") == ("EURUSD", None)
+    assert timeframe_from_dir("4H_candles_utc") == "4h"
+    assert timeframe_from_dir("1M_tick_data") == "tick"
+    assert timeframe_from_dir("0M_candles") == "tick"
+    assert timeframe_from_dir("data_5m") == "5m"
+    assert timeframe_label(300) == timeframe_label("5M") == "5m"
+    assert parse_timestamp("2025-10-25 10:16:00Z") == T0
+
+
+def test_queries_use_indexes_and_metadata(tmp_path):
+    _tree(tmp_path)
+    catalog = DataCatalog([tmp_path / "1M_candles", tmp_path / "5M_candles", tmp_path / "1M_tick_data"])
+
+    entries = catalog.query(asset="EURUSDOTC")
+    assert sorted(e.timeframe for e in entries) == ["1m", "5m", "tick"]
+    one_minute = catalog.query(asset="eurusd_otc", timeframe=60)
+    assert len(one_minute) == 1
+    entry = one_minute[0].to_dict()
+    assert entry['rows'] == 10 and entry['first_timestamp'] == T0 and entry['last_timestamp'] == T0 + 540
+    assert 'newlines' not in entry
+    assert sorted(e.asset for e in catalog.query(timeframe="1m")) == ["EURUSD_otc", "GBPUSD_otc"]
+    assert catalog.assets("5m") == ["EURUSD_otc"]
+    assert len(catalog) == 4 and catalog.files_read == 4
+
+
+def test_incremental_refresh(tmp_path):
+    one, _, _ = _tree(tmp_path)
+    catalog = DataCatalog([tmp_path], recursive=True)
+    assert len(catalog.query()) == 4
+    scans = catalog.dir_scans
+
+    # Unchanged directories are not listed again
+    catalog.query(timeframe="1m")
+    assert catalog.dir_scans == scans
+
+    # Appended rows are counted from the old end of file
+    path = one / "EURUSD_otc_1m_2025_10_25_09_54_04.csv"
+    with open(path, 'a') as f:
+        f.write(f"{T0 + 600},2,2,2,2\n")
+    entry = catalog.query(asset="EURUSD_otc", timeframe="1m")[0]
+    assert entry.rows == 11 and entry.last_timestamp == T0 + 600
+    assert catalog.files_appended == 1
+
+    # New and deleted files show up once their directory's mtime changes
+    _write(one / "USDJPY_otc_1m_2025_10_25_09_00_00.csv", 5)
+    os.remove(one / "GBPUSD_otc_1m_2025_10_25_09_47_21.csv")
+    os.utime(one, (os.stat(one).st_atime, os.stat(one).st_mtime + 5))
+    assert catalog.assets("1m") == ["EURUSD_otc", "USDJPY_otc"]
+
+
+def test_manifest_warm_start_skips_rereading(tmp_path):
+    _tree(tmp_path)
+    manifest = tmp_path / "catalog.json"
+    dirs = [tmp_path / "1M_candles", tmp_path / "5M_candles"]
+    cold = DataCatalog(dirs, manifest_path=manifest)
+    assert len(cold.query()) == 3 and manifest.exists()
+
+    warm = DataCatalog(dirs, manifest_path=manifest)
+    entries = warm.query(timeframe="1m")
+    assert len(entries) == 2 and {e.rows for e in entries} == {10, 3}
+    assert warm.files_read == 0 and warm.dir_scans == 0
+
+
+def test_default_directories_follow_the_listing_globs(tmp_path):
+    assets_dir = tmp_path / "data" / "data_output" / "assets_data"
+    collect = assets_dir / "data_collect"
+    for d in ("30M_candles", "2h_candles_utc", "1M_candle_data", "scratch"):
+        (collect / d).mkdir(parents=True)
+    (assets_dir / "realtime_stream" / "1M_candle_data").mkdir(parents=True)
+    _write(collect / "30M_candles" / "EURUSD_otc_30m_2025_10_25_09_54_04.csv", 5, step=1800)
+    _write(collect / "2h_candles_utc" / "EURUSD_otc_2025_10_25_09_54_04.csv", 5, step=7200)
+    _write(collect / "1M_candle_data" / "EURUSD_otc_1m_2025_10_25_09_54_04.csv", 5)
+    _write(collect / "scratch" / "EURUSD_otc_1m_2025_10_25_09_54_04.csv", 5)
+    _write(assets_dir / "realtime_stream" / "1M_candle_data" / "GBPUSD_otc_1m_2025_10_25_09_54_04.csv", 5)
+    catalog = DataCatalog(default_catalog_directories(tmp_path))
+
+    listed = catalog.query(within=listing_directories(tmp_path))
+    assert sorted((os.path.basename(os.path.dirname(e.path)), e.timeframe) for e in listed) == [
+        ("1M_candle_data", "1m"), ("2h_candles_utc", "2h"), ("30M_candles", "30m"),
+    ]
+    # data_collect/1M_candle_data only feeds chart seeds
+    assert len(catalog.query(asset="EURUSD_otc", timeframe="1m")) == 1
+
+    # A timeframe directory created later is picked up on the next query
+    (collect / "10M_candles").mkdir()
+    _write(collect / "10M_candles" / "EURUSD_otc_10m_2025_10_25_09_54_04.csv", 5, step=600)
+    assert [e.timeframe for e in catalog.query(timeframe="10m", within=listing_directories(tmp_path))] == ["10m"]
@@ -0,0 +1,75 @@
+"""
+Tests for chart payload downsampling (backend/downsample.py).
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.downsample import (
+    aggregate_ohlc,
+    downsample_candles,
+    downsample_indicator_result,
+    lttb_indices,
+    parse_max_points,
+)
+
+T0 = 1761387360  # 2025-10-25 10:16:00Z
+
+
+def _candles(n):
+    return [{'asset': 'EURUSD_otc', 'timestamp': T0 + i * 60, 'open': float(i), 'high': i + 2.0,
+             'low': i - 2.0, 'close': i + 0.5, 'volume': 1, 'date': str(i)} for i in range(n)]
+
+
+def test_ohlc_buckets_keep_candle_invariants():
+    candles = _candles(1000)
+    out = downsample_candles(candles, 100)
+    assert len(out) == 100
+    first, last = out[0], out[-1]
+    assert first['timestamp'] == T0 and first['date'] == '0'
+    assert (first['open'], first['high'], first['low'], first['close'], first['volume']) == (0.0, 11.0, -2.0, 9.5, 10)
+    assert last['close'] == 999.5 and last['high'] == 1001.0
+    assert sum(c['volume'] for c in out) == 1000
+
+    # Zoomed-in requests (or no max_points) keep full resolution
+    assert downsample_candles(candles, 1000) is candles
+    assert downsample_candles(candles, None) is candles
+
+    # Gaps (NaN) inside a bucket do not blank its high/low
+    starts, merged = aggregate_ohlc({'high': np.array([1.0, np.nan, 3.0, 2.0]),
+                                     'low': np.array([np.nan, 2.0, 0.5, 1.0])}, 2)
+    assert starts.tolist() == [0, 2] and merged['high'].tolist() == [1.0, 3.0] and merged['low'].tolist() == [2.0, 0.5]
+
+
+def test_lttb_keeps_extremes_and_endpoints():
+    x = np.arange(10_000, dtype=np.float64)
+    y = np.sin(x / 500.0)
+    y[4321] = 25.0  # spike must survive
+    idx = lttb_indices(x, y, 500)
+    assert len(idx) == 500 and idx[0] == 0 and idx[-1] == 9999
+    assert np.all(np.diff(idx) > 0)
+    assert 4321 in idx
+    assert lttb_indices(x[:10], y[:10], 50).tolist() == list(range(10))
+
+    picked = downsample_candles(_candles(300), 30, method='lttb')
+    assert len(picked) == 30 and picked[0]['timestamp'] == T0
+    with pytest.raises(ValueError):
+        downsample_candles(_candles(300), 30, method='mean')
+
+
+def test_indicator_series_and_params():
+    series = [{'time': T0 + i * 60, 'value': float(i % 7)} for i in range(400)]
+    result = {'asset': 'EURUSD_otc', 'series': {'SMA-20': series, 'MACD': {'macd': series, 'signal': series[:10]}}}
+    out = downsample_indicator_result(result, 50)
+    assert len(out['series']['SMA-20']) == 50 and len(out['series']['MACD']['macd']) == 50
+    assert len(out['series']['MACD']['signal']) == 10
+    assert out['max_points'] == 50 and len(result['series']['SMA-20']) == 400
+
+    assert parse_max_points(None) is None and parse_max_points('0') is None and parse_max_points('2000') == 2000
+    with pytest.raises(ValueError):
+        parse_max_points('many')
@@ -0,0 +1,97 @@
+"""
+Tests for coalesced candle_update emission (backend/emit_coalescer.py).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.emit_coalescer import MIN_CLIENT_INTERVAL, CandleEmitCoalescer
+
+ASSET = "EURUSD_otc"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Socket:
+    def __init__(self):
+        self.sent = []
+
+    def emit(self, event, data, **kwargs):
+        self.sent.append((event, data.get('close'), kwargs))
+
+
+def _update(ts, close):
+    return {'asset': ASSET, 'timestamp': ts, 'close': close}
+
+
+def _coalescer(interval=0.1):
+    clock, socket = _Clock(), _Socket()
+    return CandleEmitCoalescer(socket.emit, interval=interval, clock=clock), clock, socket
+
+
+def test_burst_for_same_candle_is_coalesced():
+    emitter, clock, socket = _coalescer()
+    for i in range(50):
+        clock.now = i * 0.001
+        emitter('candle_update', _update(60, 1.0 + i))
+
+    assert socket.sent == [('candle_update', 1.0, {})]
+    assert emitter.flush() == 0  # interval not elapsed yet
+    clock.now = 0.1
+    assert emitter.flush() == 1
+    assert socket.sent[-1] == ('candle_update', 50.0, {})
+    assert emitter.updates_received == 50 and emitter.updates_emitted == 2
+
+
+def test_new_candle_and_close_are_not_delayed():
+    emitter, clock, socket = _coalescer()
+    emitter('candle_update', _update(60, 1.0))
+    clock.now = 0.01
+    emitter('candle_update', _update(60, 1.1))  # pending
+    emitter('candle_closed', {'asset': ASSET, 'timeframe': 60, 'timestamp': 60, 'close': 1.1})
+    emitter('candle_update', _update(120, 1.2))  # first update of the next candle
+
+    assert [(e, c) for e, c, _ in socket.sent] == [
+        ('candle_update', 1.0), ('candle_closed', 1.1), ('candle_update', 1.2)]
+    # The pending update of the closed candle was superseded by the close
+    clock.now = 1.0
+    assert emitter.flush() == 0
+
+
+def test_clients_negotiate_their_own_rate():
+    emitter, clock, socket = _coalescer(interval=0.25)
+    assert emitter.set_client_interval("fast", 0.05) == 0.05
+    assert emitter.set_client_interval("greedy", 0.0) == MIN_CLIENT_INTERVAL
+    emitter.remove_client("greedy")
+
+    emitter('candle_update', _update(60, 1.0))
+    assert socket.sent == [('candle_update', 1.0, {'skip_sid': ['fast']}),
+                           ('candle_update', 1.0, {'to': 'fast'})]
+
+    clock.now = 0.01
+    emitter('candle_update', _update(60, 1.1))
+    clock.now = 0.06
+    emitter.flush()
+    assert socket.sent[-1] == ('candle_update', 1.1, {'to': 'fast'})
+    clock.now = 0.3
+    emitter.flush()
+    assert socket.sent[-1] == ('candle_update', 1.1, {'skip_sid': ['fast']})
+
+    assert emitter.set_client_interval("fast", None) == 0.25
+    emitter('candle_update', _update(120, 1.2))
+    assert socket.sent[-1] == ('candle_update', 1.2, {})
+
+
+def test_zero_interval_passes_every_update_through():
+    emitter, clock, socket = _coalescer(interval=0)
+    for i in range(5):
+        emitter('candle_update', _update(60, float(i)))
+    assert len(socket.sent) == 5
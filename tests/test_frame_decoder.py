@@ -0,0 +1,84 @@
+"""
+Tests for the single-pass WebSocket frame decoder (capabilities/frame_decoder.py).
+"""
+
+import base64
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from capabilities.frame_decoder import (
+    FRAME_CHART_SETTINGS,
+    FRAME_CONTROL,
+    FRAME_EVENT,
+    FRAME_HISTORY,
+    FRAME_INVALID,
+    FRAME_PLACEHOLDER,
+    FRAME_TICKS,
+    FrameDecoder,
+    Tick,
+)
+from tests.benchmarks.bench_frame_decoder import DEFAULT_CORPUS, legacy_decode, load_corpus
+
+
+def _b64(obj):
+    text = obj if isinstance(obj, str) else json.dumps(obj)
+    return base64.b64encode(text.encode('utf-8')).decode('ascii')
+
+
+def test_update_stream_returns_typed_ticks():
+    frame = FrameDecoder().decode(_b64([["EURUSD_otc", 1756862521.2, 1.1693], ["GBPUSD_otc", 1756862521.3, 1]]))
+    assert frame.kind == FRAME_TICKS
+    assert frame.ticks == [Tick("EURUSD_otc", 1756862521.2, 1.1693), Tick("GBPUSD_otc", 1756862521.3, 1.0)]
+    assert isinstance(frame.ticks[1].price, float)
+
+
+def test_chart_settings_and_history_are_classified_by_shape():
+    decoder = FrameDecoder()
+    settings = [{"chart_id": "graph", "settings": json.dumps({"chartPeriod": 4, "symbol": "EURUSD_otc"})}]
+    assert decoder.decode(_b64(settings)).kind == FRAME_CHART_SETTINGS
+    history = {"asset": "EURUSD_otc", "period": 60, "history": [[1756862400, 1.1]]}
+    assert decoder.decode(_b64(history)).kind == FRAME_HISTORY
+
+
+def test_placeholder_names_the_following_binary_frame():
+    decoder = FrameDecoder()
+    placeholder = decoder.decode_text('451-["updateHistoryNewFast",{"_placeholder":true,"num":0}]')
+    assert placeholder.kind == FRAME_PLACEHOLDER
+    assert placeholder.event == "updateHistoryNewFast"
+
+    frame = decoder.decode(_b64({"asset": "EURUSD_otc", "candles": []}))
+    assert frame.kind == FRAME_HISTORY
+    assert frame.event == "updateHistoryNewFast"
+    assert decoder.pending_event is None
+
+
+def test_socketio_text_frames():
+    decoder = FrameDecoder()
+    assert decoder.decode_text('2').kind == FRAME_CONTROL
+    assert decoder.decode_text('0{"sid":"abc"}').data == {"sid": "abc"}
+
+    event = decoder.decode_text('42["auth/success"]')
+    assert (event.kind, event.event, event.data) == (FRAME_EVENT, "auth/success", [])
+
+    ticks = decoder.decode_text('42["updateStream",[["EURUSD_otc",1756862521,1.1]]]')
+    assert ticks.ticks == [Tick("EURUSD_otc", 1756862521.0, 1.1)]
+
+
+def test_invalid_frames_do_not_raise():
+    decoder = FrameDecoder()
+    assert decoder.decode("not base64!").kind == FRAME_INVALID
+    assert decoder.decode(_b64("{broken")).kind == FRAME_INVALID
+    assert decoder.decode("").kind == FRAME_INVALID
+
+
+def test_parse_payload_matches_legacy_decoder_on_recorded_corpus():
+    decoder = FrameDecoder()
+    for payload_data in load_corpus(DEFAULT_CORPUS):
+        try:
+            parsed = decoder.parse_payload(payload_data)
+        except ValueError:
+            parsed = None
+        assert parsed == legacy_decode(payload_data)
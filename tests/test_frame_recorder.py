@@ -0,0 +1,94 @@
+"""
+Tests for WebSocket frame record/replay (backend/frame_recorder.py).
+"""
+
+import base64
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.frame_ingest import FrameIngestPipeline
+from backend.frame_recorder import FrameRecorder, FrameReplayer, convert_capture
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+from tests.benchmarks.bench_frame_decoder import DEFAULT_CORPUS
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+ASSET = "EURUSD_otc"
+T0 = 1700000040
+
+
+def _tick_frame(i):
+    return base64.b64encode(json.dumps([[ASSET, T0 + i * 20, 1.0 + i * 0.01]]).encode()).decode()
+
+
+def _pipeline(recorder=None):
+    streamer = RealtimeDataStreaming()
+    streamer.set_asset_focus(ASSET)
+    events = []
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda e, d: events.append((e, d)),
+                                   extract_candle=lambda a: {'asset': a}, recorder=recorder)
+    return pipeline, events
+
+
+def test_round_trip_preserves_order_and_timing(tmp_path):
+    path = tmp_path / "session.frames"
+    with FrameRecorder(path, started_at=1000.0) as recorder:
+        recorder.record("2", received_at=1000.5)
+        recorder.record('42["updateStream"]', received_at=1001.25)
+
+    assert list(FrameReplayer(path).frames()) == [(1000.5, "2"), (1001.25, '42["updateStream"]')]
+
+
+def test_appended_sessions_and_gzip(tmp_path):
+    path = tmp_path / "session.frames.gz"
+    with FrameRecorder(path, started_at=100.0) as recorder:
+        recorder.record("a", received_at=101.0)
+    with FrameRecorder(path, started_at=500.0) as recorder:
+        recorder.record("b", received_at=502.0)
+
+    assert list(FrameReplayer(path).frames()) == [(101.0, "a"), (502.0, "b")]
+
+
+def test_replay_through_pipeline_matches_live_ingest(tmp_path):
+    path = tmp_path / "live.frames"
+    with FrameRecorder(path) as recorder:
+        live, live_events = _pipeline(recorder)
+        for i in range(20):
+            live.process_payload_data(_tick_frame(i))
+
+    replayed, replay_events = _pipeline()
+    assert FrameReplayer(path).replay(replayed.process_payload_data, speed=0) == 20
+
+    live_candles = live.data_streamer.get_all_candles(ASSET).to_list()
+    assert replayed.data_streamer.get_all_candles(ASSET).to_list() == live_candles
+    assert replay_events == live_events
+
+
+def test_replay_speed_scales_recorded_gaps(tmp_path):
+    path = tmp_path / "timed.frames"
+    with FrameRecorder(path, started_at=0.0) as recorder:
+        for i in range(3):
+            recorder.record("2", received_at=i * 0.5)
+
+    start = time.perf_counter()
+    FrameReplayer(path).replay(lambda p: None, speed=10.0)
+    assert 0.09 <= time.perf_counter() - start < 0.5
+
+    seen = []
+    FrameReplayer(path).replay(seen.append, speed=0, should_continue=lambda: len(seen) < 2)
+    assert seen == ["2", "2"]
+
+
+def test_convert_capture_replays_recorded_session(tmp_path):
+    path = tmp_path / "capture.frames"
+    written = convert_capture(DEFAULT_CORPUS, path)
+    assert written > 0
+
+    streamer = RealtimeDataStreaming()
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda *a: None, extract_candle=lambda a: None)
+    assert FrameReplayer(path).replay(pipeline.process_payload_data, speed=0) == written
+    assert len(streamer.tick_buffer) > 0
@@ -0,0 +1,74 @@
+"""
+Tests for the indexed, cached historical seed loader (backend/historical_seed.py).
+"""
+
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import historical_seed
+from backend.data_catalog import DataCatalog
+from backend.historical_seed import HistoricalSeedService, read_tail_rows
+
+T0 = 1761387360  # 2025-10-25 10:16:00Z
+
+
+def _write_candles(path, start, count, iso=True):
+    with open(path, 'w') as f:
+        f.write("timestamp,open,close,high,low\n")
+        for i in range(count):
+            ts = start + i * 60
+            stamp = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%SZ") if iso else str(ts)
+            f.write(f"{stamp},{1 + i},{1.5 + i},{2 + i},{0.5 + i}\n")
+
+
+def test_tail_read_only_touches_the_end(tmp_path, monkeypatch):
+    monkeypatch.setattr(historical_seed, 'READ_BLOCK_SIZE', 256)
+    path = tmp_path / "big.csv"
+    _write_candles(path, T0, 5000)
+
+    header, rows = read_tail_rows(path, 3)
+    assert header == ["timestamp", "open", "close", "high", "low"]
+    assert [r[1] for r in rows] == ["4998", "4999", "5000"]
+    header, rows = read_tail_rows(path, 10000)
+    assert len(rows) == 5000 and rows[0][1] == "1"
+
+
+def test_seed_spans_rotated_parts_and_is_cached(tmp_path):
+    candle_dir = tmp_path / "1M_candle_data"
+    candle_dir.mkdir()
+    older = candle_dir / "EURUSD_otc_1m_2025_10_25_10_00_00_part001.csv"
+    newer = candle_dir / "EURUSD_otc_1m_2025_10_25_10_00_00_part002.csv"
+    _write_candles(older, T0, 100)
+    _write_candles(newer, T0 + 100 * 60, 50, iso=False)
+    os.utime(older, (1, 1))
+    _write_candles(candle_dir / "GBPUSD_otc_1m_2025_10_25_10_00_00_part001.csv", T0, 10)
+    other_session = candle_dir / "EURUSD_otc_1m_2025_10_20_08_00_00_part001.csv"
+    _write_candles(other_session, T0 - 86400, 100)
+    os.utime(other_session, (0, 0))
+
+    catalog = DataCatalog([candle_dir, tmp_path / "missing"])
+    service = HistoricalSeedService(catalog)
+    seed = service.load("EURUSD_OTC", timeframe=60, count=200)
+    assert len(seed.candles) == 150  # the older session is not mixed in
+    seed = service.load("EURUSD_OTC", timeframe=60, count=120)
+    assert len(seed.candles) == 120 and not seed.cached
+    assert seed.files == [newer.name, older.name]
+    assert seed.candles[0]['timestamp'] == T0 + 30 * 60
+    assert seed.candles[-1] == {
+        'asset': 'EURUSD_OTC', 'timestamp': T0 + 149 * 60, 'open': 50.0, 'high': 51.0, 'low': 49.5,
+        'close': 50.5, 'volume': 0, 'date': '2025-10-25T12:45:00+00:00'
+    }
+
+    assert service.load("EURUSD_OTC", timeframe=60, count=120).cached
+    assert catalog.dir_scans == 1
+
+    # Appending a row changes the file's size/mtime: the cached seed is rebuilt
+    with open(newer, 'a') as f:
+        f.write(f"{T0 + 150 * 60},9,9,9,9\n")
+    seed = service.load("EURUSD_OTC", timeframe=60, count=120)
+    assert not seed.cached and seed.candles[-1]['close'] == 9.0
+    assert service.load("USDJPY_OTC", timeframe=60).candles == []
+    assert service.stats()['misses'] == 3
@@ -0,0 +1,132 @@
+"""
+Tests for cached calculate_indicators results (backend/indicator_cache.py).
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.indicator_cache import IndicatorCache
+from capabilities.candle_store import CandleSeries, CandleStore
+from strategies.indicator_adapter import IndicatorAdapter
+
+T0 = 1700006400
+INSTANCES = {
+    'SMA-20': {'type': 'sma', 'params': {'period': 20}},
+    'EMA-12': {'type': 'ema', 'params': {'period': 12}},
+    'CCI': {'type': 'cci', 'params': {'period': 20}},
+    'ST': {'type': 'supertrend', 'params': {'period': 10, 'multiplier': 3}},
+}
+
+
+class CountingAdapter(IndicatorAdapter):
+    def __init__(self):
+        super().__init__()
+        self.computed = []
+
+    def calculate_indicators_for_instances(self, asset, candles, instances, timeframe_seconds=60):
+        self.computed.append(sorted(instances))
+        return super().calculate_indicators_for_instances(asset, candles, instances, timeframe_seconds)
+
+
+def _store(n=300, seed=9):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-3, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    rows = np.column_stack([T0 + np.arange(n) * 60, open_, close,
+                            np.maximum(open_, close) + 2e-4, np.minimum(open_, close) - 2e-4])
+    store = CandleStore()
+    return store, CandleSeries(store.replace("EURUSD_otc", 60, rows))
+
+
+def _assert_matches_full(result, candles, instances=INSTANCES):
+    full = IndicatorAdapter().calculate_indicators_for_instances("EURUSD_otc", candles, instances)
+    assert result['indicators'].keys() == full['indicators'].keys()
+    assert result['latest_timestamp'] == full['latest_timestamp'] and result['latest_price'] == full['latest_price']
+    for name, series in full['series'].items():
+        assert [p['time'] for p in result['series'][name]] == [p['time'] for p in series]
+        np.testing.assert_allclose([p['value'] for p in result['series'][name]], [p['value'] for p in series],
+                                   rtol=1e-9)
+        np.testing.assert_allclose(result['indicators'][name]['value'], full['indicators'][name]['value'], rtol=1e-9)
+    assert result['signals'].keys() == full['signals'].keys()
+
+
+def test_repeat_requests_return_the_cached_payload():
+    adapter = CountingAdapter()
+    cache = IndicatorCache(adapter=adapter)
+    store, candles = _store()
+    first = cache.calculate("EURUSD_otc", candles, INSTANCES)
+    assert cache.calculate("EURUSD_otc", candles, dict(INSTANCES)) is first
+    assert cache.calculate("EURUSDOTC", candles, INSTANCES) is first  # same stream, other spelling
+    assert adapter.computed == [sorted(INSTANCES)]
+    assert cache.stats()['payload_hits'] == 2
+    _assert_matches_full(first, candles)
+
+    # Another panel sharing instances: only the new one is computed
+    other = {'SMA': {'type': 'sma', 'params': {'period': 20}}, 'WMA': {'type': 'wma', 'params': {'period': 10}}}
+    result = cache.calculate("EURUSD_otc", candles, other)
+    assert adapter.computed[-1] == ['WMA'] and cache.stats()['hits'] == 1
+    assert result['series']['SMA'] == first['series']['SMA-20']
+    assert result['indicators']['SMA'] == first['indicators']['SMA-20']
+
+
+def test_ticks_and_closes_only_update_the_tail():
+    adapter = CountingAdapter()
+    cache = IndicatorCache(adapter=adapter)
+    store, candles = _store()
+    cache.calculate("EURUSD_otc", candles, INSTANCES)
+
+    # Forming candle moves: one incremental step per instance
+    store.update_tick("EURUSD_otc", 60, T0 + 299 * 60 + 30, 1.2)
+    _assert_matches_full(cache.calculate("EURUSD_otc", candles, INSTANCES), candles)
+
+    # Candles close: the tail is extended
+    for i, price in enumerate([1.19, 1.195, 1.18], start=300):
+        store.update_tick("EURUSD_otc", 60, T0 + i * 60, price)
+    result = cache.calculate("EURUSD_otc", candles, INSTANCES)
+    _assert_matches_full(result, candles)
+    assert len(adapter.computed) == 1
+    assert cache.stats()['tail_updates'] == 2 * len(INSTANCES)
+
+    # max_points is applied on top of the cached series
+    sampled = cache.calculate("EURUSD_otc", candles, INSTANCES, max_points=50)
+    assert sampled['max_points'] == 50 and len(sampled['series']['SMA-20']) <= 50
+    assert sampled['series']['SMA-20'][-1] == result['series']['SMA-20'][-1]
+    assert len(adapter.computed) == 1
+
+
+def test_replaced_history_is_recomputed():
+    adapter = CountingAdapter()
+    cache = IndicatorCache(adapter=adapter)
+    store, candles = _store()
+    cache.calculate("EURUSD_otc", candles, INSTANCES)
+
+    _, replacement = _store(seed=10)
+    store.replace("EURUSD_otc", 60, replacement.array().copy())
+    store.update_tick("EURUSD_otc", 60, T0 + 300 * 60, 1.2)
+    _assert_matches_full(cache.calculate("EURUSD_otc", candles, INSTANCES), candles)
+    assert len(adapter.computed) == 2
+
+
+def test_memory_budget_and_errors():
+    store, candles = _store()
+    cache = IndicatorCache(max_bytes=200_000)
+    for period in range(5, 25):
+        cache.calculate("EURUSD_otc", candles, {'SMA': {'type': 'sma', 'params': {'period': period}}})
+    stats = cache.stats()
+    assert stats['bytes'] <= 200_000 and stats['evictions'] > 0
+
+    cache.invalidate("EURUSD_OTC")
+    assert cache.stats()['entries'] == 0 and cache.stats()['bytes'] == 0
+
+    # Too few candles: the adapter's error, not cached
+    short = [[T0 + i * 60, 1.0, 1.0, 1.0, 1.0] for i in range(5)]
+    assert 'error' in cache.calculate("EURUSD_otc", short, INSTANCES)
+    assert cache.stats()['entries'] == 0
+
+    disabled = IndicatorCache(max_bytes=0)
+    assert 'SMA-20' in disabled.calculate("EURUSD_otc", candles, INSTANCES)['series']
+    assert disabled.stats()['bytes'] == 0
@@ -0,0 +1,74 @@
+"""
+Tests for vectorised indicator series extraction and the columnar wire format
+(strategies/indicator_adapter.py), against the iterrows() reference in
+tests/benchmarks/bench_indicator_payload.py.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.indicator_cache import IndicatorCache
+from strategies.indicator_adapter import IndicatorAdapter, columnar_result, columnar_series
+from tests.benchmarks.bench_indicator_payload import INSTANCES, LegacyIndicatorAdapter, run_benchmark, synthetic_candles
+
+
+def _without_timestamp(result):
+    return {k: v for k, v in result.items() if k != 'timestamp'}
+
+
+def test_points_match_the_row_loop():
+    candles = synthetic_candles(300)
+    legacy = LegacyIndicatorAdapter().calculate_indicators_for_instances('EURUSD_otc', candles, INSTANCES)
+    result = IndicatorAdapter().calculate_indicators_for_instances('EURUSD_otc', candles, INSTANCES)
+    assert set(result['series']) == set(INSTANCES)
+    assert _without_timestamp(result) == _without_timestamp(legacy)
+    point = result['series']['SMA-20'][-1]
+    assert type(point['time']) is int and type(point['value']) is float
+
+
+def test_multi_line_indicators():
+    n = 50
+    df = pd.DataFrame({
+        'timestamp': 1700000040 + np.arange(n) * 60,
+        'macd': np.where(np.arange(n) < 25, np.nan, np.linspace(-1, 1, n)),
+        'macd_signal': np.where(np.arange(n) < 33, np.nan, np.linspace(-0.5, 0.5, n)),
+        'macd_histogram': np.where(np.arange(n) < 33, np.nan, np.linspace(0.2, -0.2, n)),
+        'stoch_k': np.where(np.arange(n) < 16, np.nan, np.linspace(0, 100, n)),
+        'stoch_d': np.full(n, np.nan),
+    })
+    for indicator_type, params in (('macd', {'fast': 12, 'slow': 26}), ('stochastic', {'period': 14})):
+        expected = LegacyIndicatorAdapter()._extract_indicator_data(df, indicator_type, 'X', params)
+        actual = IndicatorAdapter()._extract_indicator_data(df, indicator_type, 'X', params)
+        assert actual == expected
+        columns = IndicatorAdapter()._extract_indicator_data(df, indicator_type, 'X', params, 'columns')
+        assert columns['series'] == {line: columnar_series(points) for line, points in expected['series'].items()}
+    assert actual['indicator']['d'] is None and actual['signal'] == 'NEUTRAL'
+
+
+def test_columns_format():
+    candles = synthetic_candles(300)
+    adapter = IndicatorAdapter()
+    points = adapter.calculate_indicators_for_instances('EURUSD_otc', candles, INSTANCES)
+    columns = adapter.calculate_indicators_for_instances('EURUSD_otc', candles, INSTANCES, series_format='columns')
+    assert columns['series_format'] == 'columns'
+    assert _without_timestamp(columns) == _without_timestamp(columnar_result(points))
+    assert columns['series']['SMA-20']['time'] == [p['time'] for p in points['series']['SMA-20']]
+
+    # Cached payloads are kept per format; repeats return the same object
+    cache = IndicatorCache()
+    cached = cache.calculate('EURUSD_otc', candles, INSTANCES, series_format='columns')
+    assert _without_timestamp(cached) == _without_timestamp(columns)
+    assert cache.calculate('EURUSD_otc', candles, INSTANCES, series_format='columns') is cached
+    assert 'series_format' not in cache.calculate('EURUSD_otc', candles, INSTANCES)
+
+
+def test_benchmark_reports_every_variant():
+    results = run_benchmark([200], repeat=1)
+    assert set(results[200]) == {'legacy', 'points', 'columns'}
+    assert results[200]['columns']['json_bytes'] < results[200]['points']['json_bytes']
+    assert set(run_benchmark([200], repeat=1, legacy_max=100)[200]) == {'points', 'columns'}
@@ -0,0 +1,102 @@
+"""
+Tests for compute-once indicator evaluation (strategies/indicator_planner.py).
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.indicator_adapter import IndicatorAdapter
+from strategies.indicator_planner import SUPPORTED_TYPES, IndicatorPlanner, request_key, resolve_params
+from strategies.technical_indicators import TechnicalIndicatorsPipeline
+
+T0 = 1700000040
+
+INSTANCES = {
+    'SMA-20': {'type': 'sma', 'params': {'period': 20}},
+    'SMA-50': {'type': 'sma', 'params': {'period': 50}},
+    'EMA-12': {'type': 'ema', 'params': {'period': 12}},
+    'WMA-10': {'type': 'wma', 'params': {'period': 10}},
+    'RSI-14': {'type': 'rsi', 'params': {'period': 14}},
+    'MACD': {'type': 'macd', 'params': {'fast': 12, 'slow': 26, 'signal': 9}},
+    'BB-20': {'type': 'bollinger', 'params': {'period': 20, 'std_dev': 2}},
+    'STOCH': {'type': 'stochastic', 'params': {'k': 14, 'd': 3}},
+    'WR': {'type': 'williams_r', 'params': {'period': 14}},
+    'ROC': {'type': 'roc', 'params': {'period': 10}},
+    'STC': {'type': 'schaff_tc', 'params': {'fast': 10, 'slow': 20}},
+    'DEM': {'type': 'demarker', 'params': {'period': 14}},
+    'CCI': {'type': 'cci', 'params': {'period': 20}},
+    'ATR': {'type': 'atr', 'params': {'period': 14}},
+    'ST': {'type': 'supertrend', 'params': {'period': 10, 'multiplier': 3.0}},
+}
+
+# Indicators the pipeline only computes through pandas-ta or TA-Lib
+LIBRARY_COLUMNS = {'rsi': 'rsi_14', 'macd': 'macd', 'bollinger': 'bb_upper', 'stochastic': 'stoch_k',
+                   'williams_r': 'williams_r', 'roc': 'roc_10'}
+
+
+def _frame(n=300, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-3, n))
+    open_ = close + rng.normal(0, 5e-4, n)
+    high = np.maximum(open_, close) + rng.uniform(0, 1e-3, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 1e-3, n)
+    return pd.DataFrame({'timestamp': T0 + np.arange(n) * 60, 'open': open_, 'close': close,
+                         'high': high, 'low': low, 'volume': np.zeros(n, dtype=np.int64)})
+
+
+def test_matches_a_full_pipeline_run_per_instance():
+    df = _frame()
+    planner = IndicatorPlanner(df)
+    columns = planner.evaluate(INSTANCES)
+    assert sorted({c['type'] for c in INSTANCES.values()}) == SUPPORTED_TYPES
+
+    for name, config in INSTANCES.items():
+        pipeline = TechnicalIndicatorsPipeline()
+        pipeline.params = resolve_params(config['type'], config['params'])
+        full = pipeline.calculate_indicators(df.copy())
+        if columns[name] is None:
+            # Library-backed indicator without pandas-ta / TA-Lib: the pipeline has no column either
+            assert LIBRARY_COLUMNS[config['type']] not in full.columns
+            continue
+        for column, series in columns[name].items():
+            pd.testing.assert_series_equal(series, full[column], check_names=False)
+
+
+def test_identical_requests_and_intermediates_are_shared():
+    planner = IndicatorPlanner(_frame())
+    columns = planner.evaluate({
+        'A': {'type': 'sma', 'params': {'period': 20}},
+        'B': {'type': 'sma', 'params': {}},  # 20 is the pipeline default
+        'C': {'type': 'atr', 'params': {'period': 14}},
+        'D': {'type': 'supertrend', 'params': {}},
+        'E': {'type': 'cci', 'params': {'period': 20}},
+        'F': {'type': 'cci', 'params': {'period': 14}},
+        'G': {'type': 'unknown', 'params': {}},
+    })
+    assert columns['A'] is columns['B']
+    assert columns['G'] is None
+    assert request_key('sma', {'period': 20}) == request_key('sma', {})
+    assert request_key('sma', {'period': 20}) != request_key('ema', {'period': 20})
+    # sma, atr, supertrend, cci x2 ran; supertrend reused the ATR and the second CCI the typical price
+    assert planner.kernel_runs == 5
+    assert planner.shared_hits >= 2
+
+
+def test_adapter_output_shape_is_unchanged():
+    df = _frame(120)
+    candles = [[int(t), o, c, h, l] for t, o, c, h, l in
+               zip(df['timestamp'], df['open'], df['close'], df['high'], df['low'])]
+    result = IndicatorAdapter().calculate_indicators_for_instances('EURUSD_otc', candles, {
+        'SMA-20': {'type': 'sma', 'params': {'period': 20}},
+        'CCI-20': {'type': 'cci', 'params': {'period': 20}},
+    })
+    assert set(result['indicators']) == {'SMA-20', 'CCI-20'}
+    sma = result['series']['SMA-20']
+    assert len(sma) == 101 and sma[0]['time'] == T0 + 19 * 60
+    assert result['indicators']['SMA-20']['value'] == sma[-1]['value']
+    assert result['signals']['CCI-20'] in ('BUY', 'SELL', 'NEUTRAL')
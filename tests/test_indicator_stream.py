@@ -0,0 +1,166 @@
+"""
+Tests for live indicator deltas (backend/indicator_stream.py) on subscribed candle streams.
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.frame_ingest import FrameIngestPipeline
+from backend.indicator_stream import IndicatorStream
+from backend.subscriptions import SubscriptionManager
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+from strategies.indicator_adapter import IndicatorAdapter
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+T0 = 1700006400
+ROOM = "candles:EURUSDOTC:60"
+INSTANCES = {
+    'SMA-5': {'type': 'sma', 'params': {'period': 5}},
+    'SMA-5b': {'type': 'sma', 'params': {'period': 5}},
+    'CCI': {'type': 'cci', 'params': {'period': 5}},
+    'MACD': {'type': 'macd', 'params': {'fast': 3, 'slow': 6, 'signal': 3}},
+    'PATTERN': {'type': 'unknown'},
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _setup(provisional_interval=0.0):
+    streamer = RealtimeDataStreaming()
+    subs = SubscriptionManager()
+    subs.subscribe("a", "EURUSD_OTC", 60)
+    streamer.set_focus_assets(subs.assets())
+    clock = FakeClock()
+    stream = IndicatorStream(provisional_interval=provisional_interval, clock=clock)
+    events = []
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda e, d, **kw: events.append((e, d, kw.get('to'))),
+                                   extract_candle=lambda a: None, subscriptions=subs, indicator_stream=stream)
+    return streamer, stream, pipeline, events, clock
+
+
+def _prices(n, seed=3):
+    return (1.1 + np.cumsum(np.random.default_rng(seed).normal(0, 1e-3, n))).tolist()
+
+
+def _deltas(events):
+    return [(d, room) for e, d, room in events if e == 'indicators_calculated']
+
+
+def test_untracked_streams_get_no_deltas():
+    streamer, stream, pipeline, events, _ = _setup()
+    pipeline.process_payload([["EURUSD_otc", T0, 1.1]])
+    assert [e for e, _, _ in events] == ['candle_update']
+    assert stream.update("EURUSD_otc", 60, []) is None
+
+
+def test_deltas_follow_ticks_and_closes():
+    streamer, stream, pipeline, events, _ = _setup()
+    prices = _prices(60)
+    for i, price in enumerate(prices[:30]):
+        pipeline.process_payload([["EURUSD_otc", T0 + i * 60, price]])
+
+    candles = streamer.get_timeframe_candles("EURUSD_otc", 60)
+    assert stream.track("EURUSD_otc", 60, INSTANCES, candles) == 4
+    assert stream.stats()['indicators'] == 3  # SMA-5 and SMA-5b share one
+    assert stream.tracked() == [ROOM]
+
+    events.clear()
+    pipeline.process_payload([["EURUSD_otc", T0 + 29 * 60 + 30, prices[29] + 0.01]])
+    (delta, room), = _deltas(events)
+    assert room == ROOM and delta['delta'] is True and delta['closed'] == 0
+    assert delta['latest_timestamp'] == T0 + 29 * 60 and delta['latest_price'] == prices[29] + 0.01
+    assert set(delta['indicators']) == {'SMA-5', 'SMA-5b', 'CCI', 'MACD'}
+    assert [p['time'] for p in delta['series']['SMA-5']] == [T0 + 29 * 60]
+    assert set(delta['series']['MACD']) == {'macd', 'signal', 'histogram'}
+    assert delta['indicators']['MACD']['type'] == 'macd' and delta['signals']['MACD'] in ('BUY', 'SELL')
+    assert delta['signals']['CCI'] in ('BUY', 'SELL', 'NEUTRAL')
+
+    for i, price in enumerate(prices[30:], start=30):
+        events.clear()
+        pipeline.process_payload([["EURUSD_otc", T0 + i * 60, price]])
+        (delta, _), = _deltas(events)
+        # The previous candle closes: its final value, then the new forming candle
+        assert delta['closed'] == 1
+        assert [p['time'] for p in delta['series']['SMA-5']] == [T0 + (i - 1) * 60, T0 + i * 60]
+
+    # Committed and provisional points agree with a full recompute
+    candles = streamer.get_timeframe_candles("EURUSD_otc", 60)
+    full = IndicatorAdapter().calculate_indicators_for_instances("EURUSD_otc", candles, INSTANCES)
+    for name in ('SMA-5', 'CCI'):
+        np.testing.assert_allclose([p['value'] for p in delta['series'][name]],
+                                   [p['value'] for p in full['series'][name][-2:]], rtol=1e-9)
+        assert delta['indicators'][name]['value'] == delta['series'][name][-1]['value']
+    assert stream.stats()['commits'] == 30 and stream.stats()['reseeds'] == 0
+
+
+def test_provisional_deltas_are_rate_limited():
+    streamer, stream, pipeline, events, clock = _setup(provisional_interval=1.0)
+    for i, price in enumerate(_prices(10)):
+        pipeline.process_payload([["EURUSD_otc", T0 + i * 60, price]])
+    stream.track("EURUSD_otc", 60, {'SMA-3': {'type': 'sma', 'params': {'period': 3}}},
+                 streamer.get_timeframe_candles("EURUSD_otc", 60))
+
+    events.clear()
+    for second in range(1, 5):
+        clock.now += 0.3
+        pipeline.process_payload([["EURUSD_otc", T0 + 9 * 60 + second, 1.2]])
+    assert len(_deltas(events)) == 1  # the first, then held back for a second
+    assert stream.stats()['provisional_skipped'] == 3
+
+    # A close is never held back
+    events.clear()
+    clock.now += 0.1
+    pipeline.process_payload([["EURUSD_otc", T0 + 10 * 60, 1.3]])
+    (delta, _), = _deltas(events)
+    assert delta['closed'] == 1
+
+
+def test_reloaded_history_reseeds():
+    streamer, stream, pipeline, events, _ = _setup()
+    for i, price in enumerate(_prices(10)):
+        pipeline.process_payload([["EURUSD_otc", T0 + i * 60, price]])
+    stream.track("EURUSD_otc", 60, {'SMA-3': {'type': 'sma', 'params': {'period': 3}}},
+                 streamer.get_timeframe_candles("EURUSD_otc", 60))
+
+    # History reloaded over the same candles (e.g. a historical seed)
+    streamer.candle_store.replace("EURUSD_otc", 60, [[T0 + i * 60, 2.0, 2.0, 2.0, 2.0] for i in range(10)])
+    delta = stream.update("EURUSD_otc", 60, streamer.get_timeframe_candles("EURUSD_otc", 60))
+    assert stream.stats()['reseeds'] == 1 and delta['closed'] == 0
+    assert delta['series']['SMA-3'] == [{'time': T0 + 9 * 60, 'value': 2.0}]
+
+
+def test_retain_and_untrack():
+    stream = IndicatorStream()
+    rows = [[T0 + i * 60, 1.0, 1.0 + i, 1.0 + i, 1.0] for i in range(30)]
+    sma = {'SMA-5': {'type': 'sma', 'params': {'period': 5}}}
+    stream.track("EURUSD_otc", 60, sma, rows)
+    stream.track("EURUSD_otc", 300, sma, rows)
+    stream.track("GBPUSD_otc", 60, sma, rows)
+    assert stream.track("GBPUSD_otc", 300, {'X': {'type': 'unknown'}}, rows) == 0
+
+    assert stream.retain([ROOM, "candles:GBPUSDOTC:60"]) == ["candles:EURUSDOTC:300"]
+    stream.untrack("EURUSD_OTC")
+    assert stream.tracked() == ["candles:GBPUSDOTC:60"]
+    stream.reset()
+    assert stream.tracked() == []
+
+
+def test_format_latest_matches_batch_entries():
+    adapter = IndicatorAdapter()
+    assert adapter.format_latest('rsi', {'period': 14}, {'value': 25.0}) == {
+        'indicator': {'value': 25.0, 'type': 'rsi', 'period': 14}, 'signal': 'BUY'}
+    assert adapter.format_latest('sma', {'period': 5}, {'value': None}) == {
+        'indicator': {'value': None, 'type': 'sma', 'period': 5}}
+    stochastic = adapter.format_latest('stochastic', {}, {'k': 85.0, 'd': 90.0})
+    assert stochastic['signal'] == 'SELL' and stochastic['indicator']['type'] == 'stochastic'
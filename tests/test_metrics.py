@@ -0,0 +1,94 @@
+"""
+Tests for the metrics registry and hot-path instrumentation (backend/metrics.py).
+"""
+
+import base64
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import metrics
+from backend.frame_ingest import FrameIngestPipeline
+from backend.metrics import MetricsRegistry
+from backend.stage_pipeline import StagedIngest
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+ASSET = "EURUSD_otc"
+T0 = 1700000040
+
+
+@pytest.fixture
+def enabled_registry():
+    metrics.REGISTRY.reset()
+    metrics.REGISTRY.enable()
+    yield metrics.REGISTRY
+    metrics.REGISTRY.enable(False)
+    metrics.REGISTRY.reset()
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry()
+    counter = registry.counter('x_total', 'x')
+    histogram = registry.histogram('x_seconds', 'x')
+    counter.inc()
+    histogram.observe(0.5)
+    with histogram.time():
+        pass
+    assert counter.value() == 0 and histogram.count() == 0
+    assert histogram.time() is histogram.time()  # shared no-op, nothing allocated
+
+
+def test_text_exposition_and_quantiles():
+    registry = MetricsRegistry(enabled=True)
+    ticks = registry.counter('t_ticks_total', 'Ticks')
+    depth = registry.gauge('t_depth', 'Depth')
+    latency = registry.histogram('t_seconds', 'Latency', buckets=(0.1, 1.0))
+    ticks.inc(asset='EURUSD_otc')
+    ticks.inc(2, asset='EURUSD_otc')
+    depth.set(7, stage='emit')
+    for value in (0.05, 0.05, 0.5, 2.0):
+        latency.observe(value, stage='ingest')
+
+    text = registry.render()
+    assert '# TYPE t_ticks_total counter' in text
+    assert 't_ticks_total{asset="EURUSD_otc"} 3' in text
+    assert 't_depth{stage="emit"} 7' in text
+    assert 't_seconds_bucket{stage="ingest",le="0.1"} 2' in text
+    assert 't_seconds_bucket{stage="ingest",le="1"} 3' in text
+    assert 't_seconds_bucket{stage="ingest",le="+Inf"} 4' in text
+    assert 't_seconds_count{stage="ingest"} 4' in text
+
+    assert latency.quantile(0.5, stage='ingest') == pytest.approx(0.1)
+    assert latency.quantile(0.7, stage='ingest') == pytest.approx(0.1 + 0.9 * 0.8)
+    assert registry.histogram('t_seconds', 'again') is latency
+    with pytest.raises(ValueError):
+        registry.counter('t_seconds', 'clash')
+
+
+def test_pipeline_instrumentation(enabled_registry):
+    events = []
+    staged = StagedIngest(emit=lambda event, data, **kw: events.append(event))
+    streamer = RealtimeDataStreaming()
+    streamer.set_asset_focus(ASSET)
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=staged.emit,
+                                   extract_candle=lambda a: {'asset': a, 'close': streamer.get_latest_candle(a)[2]})
+    staged.attach(pipeline.process_payload_data)
+    for i in range(9):
+        staged.submit(base64.b64encode(json.dumps([[ASSET, T0 + i * 20, 1.0 + i]]).encode()).decode())
+    staged.drain()
+    staged.stats()
+
+    assert metrics.FRAMES_TOTAL.value(kind='ticks') == 9
+    assert metrics.TICKS_TOTAL.value(asset=ASSET) == 9
+    assert metrics.FRAME_DECODE_SECONDS.count() == 9 and metrics.CANDLE_UPDATE_SECONDS.count() == 9
+    assert metrics.CANDLES_CLOSED_TOTAL.value(timeframe=60) == 2
+    assert metrics.EMITS_TOTAL.value(event='candle_closed') == events.count('candle_closed') == 2
+    assert metrics.STAGE_LAG_SECONDS.count(stage='ingest') == 9
+    assert 'quflx_stage_queue_depth{stage="emit"} 0' in enabled_registry.render()
+    assert enabled_registry.latency_summary()['quflx_frame_decode_seconds']['all']['count'] == 9
@@ -0,0 +1,116 @@
+"""
+Tests for multi-timeframe candle aggregation from a single tick stream.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.frame_ingest import FrameIngestPipeline
+from capabilities.base import Ctx
+from capabilities.candle_store import format_timeframes, parse_timeframes, resample_candles
+from capabilities.data_streaming import RealtimeDataStreaming
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+ASSET = "EURUSD_otc"
+T0 = 1700006400  # aligned to 4h
+
+
+class _Recorder:
+    def __init__(self):
+        self.candles = []
+        self.events = []
+
+    def add_tick(self, *args):
+        pass
+
+    def add_candle(self, **kwargs):
+        self.candles.append((kwargs['timeframe_minutes'], kwargs['candle_ts']))
+
+    def emit(self, event, data):
+        self.events.append((event, data))
+
+
+def test_parse_timeframes():
+    assert parse_timeframes("1m, 5m,15m,1h,4h") == (60, 300, 900, 3600, 14400)
+    assert parse_timeframes(["5m", 60, "5m"]) == (60, 300)
+    assert parse_timeframes("") == ()
+    with pytest.raises(ValueError):
+        parse_timeframes("7m")
+
+
+def test_format_timeframes_round_trips():
+    assert format_timeframes((60, 300, 900, 3600, 14400)) == "1m,5m,15m,1h,4h"
+    assert parse_timeframes(format_timeframes((60, 90, 3600))) == (60, 90, 3600)
+
+
+def test_resample_candles():
+    one_minute = [[T0 + i * 60, 1.0 + i, 1.5 + i, 2.0 + i, 0.5 + i] for i in range(10)]
+    assert resample_candles(one_minute, 300).tolist() == [
+        [T0, 1.0, 5.5, 6.0, 0.5],
+        [T0 + 300, 6.0, 10.5, 11.0, 5.5],
+    ]
+
+
+def test_each_tick_updates_every_timeframe():
+    streamer = RealtimeDataStreaming()
+    streamer.set_timeframes("1m,5m,1h")
+    for i in range(12):
+        streamer._process_realtime_update([[ASSET, T0 + i * 30, 1.0 + i * 0.1]], CTX)
+
+    assert streamer.get_timeframes() == [60, 300, 3600]
+    assert len(streamer.get_timeframe_candles(ASSET, 60)) == 6
+    assert streamer.get_timeframe_candles(ASSET, 300).to_list() == [[T0, 1.0, 1.9, 1.9, 1.0], [T0 + 300, 2.0, 2.1, 2.1, 2.0]]
+    assert streamer.get_timeframe_candles("EURUSDOTC", 3600).to_list() == [[T0, 1.0, 2.1, 2.1, 1.0]]
+    assert streamer.get_timeframe_candles(ASSET, 900) == []
+
+
+def test_history_seeds_every_timeframe():
+    streamer = RealtimeDataStreaming()
+    streamer.set_timeframes("1m,5m")
+    history = [[T0 + i * 10, 1.0 + i * 0.01] for i in range(90)]
+    streamer._process_historical_data({"asset": ASSET, "period": 60, "history": history}, CTX)
+
+    assert len(streamer.get_timeframe_candles(ASSET, 60)) == 15
+    five = streamer.get_timeframe_candles(ASSET, 300).to_list()
+    assert [c[0] for c in five] == [T0, T0 + 300, T0 + 600]
+    assert five[0][1:] == pytest.approx([1.0, 1.29, 1.29, 1.0])
+
+
+def test_closed_candles_persisted_and_emitted_per_timeframe():
+    streamer = RealtimeDataStreaming()
+    streamer.set_timeframes("1m,5m")
+    streamer.set_asset_focus(ASSET)
+    recorder = _Recorder()
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=recorder.emit, extract_candle=lambda a: None,
+                                   persistence_manager=recorder, collect_stream_mode='candle')
+
+    for i in range(11):
+        pipeline.process_payload([[ASSET, T0 + i * 60, 1.0 + i]])
+
+    assert [c for c in recorder.candles if c[0] == 1] == [(1, T0 + i * 60) for i in range(10)]
+    assert [c for c in recorder.candles if c[0] == 5] == [(5, T0), (5, T0 + 300)]
+
+    closed = [(d['timeframe'], d['timestamp']) for e, d in recorder.events if e == 'candle_closed']
+    # Every close is emitted once per timeframe
+    assert [c for c in closed if c[0] == 60] == [(60, T0 + i * 60) for i in range(10)]
+    assert [c for c in closed if c[0] == 300] == [(300, T0), (300, T0 + 300)]
+
+
+def test_history_load_does_not_replay_closed_candles():
+    streamer = RealtimeDataStreaming()
+    streamer.set_timeframes("1m,5m")
+    streamer.set_asset_focus(ASSET)
+    recorder = _Recorder()
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=recorder.emit, extract_candle=lambda a: None)
+
+    history = [[T0 + i * 10, 1.0] for i in range(600)]
+    pipeline.process_payload({"asset": ASSET, "period": 60, "history": history})
+    assert len(streamer.get_timeframe_candles(ASSET, 60)) == 100
+    pipeline.process_payload([[ASSET, T0 + 6000, 1.1]])
+
+    closed = [(d['timeframe'], d['timestamp']) for e, d in recorder.events if e == 'candle_closed']
+    assert closed == [(60, T0 + 5940), (300, T0 + 5700)]
@@ -0,0 +1,157 @@
+"""
+Tests for the staged ingest pipeline (backend/stage_pipeline.py).
+"""
+
+import base64
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.frame_ingest import FrameIngestPipeline
+from backend.stage_pipeline import POLICY_DROP_NEWEST, POLICY_DROP_OLDEST, PipelineStage, StagedIngest
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+ASSET = "EURUSD_otc"
+T0 = 1700000040
+
+
+def _frame(i):
+    return base64.b64encode(json.dumps([[ASSET, T0 + i * 20, 1.0 + i * 0.01]]).encode()).decode()
+
+
+def test_merge_keeps_one_queued_item_per_key():
+    seen = []
+    stage = PipelineStage('emit', seen.append, maxsize=10)
+    for i in range(5):
+        stage.put(('candle_update', i), key='EURUSD')
+    stage.put(('candle_closed', 0))
+    stage.drain()
+
+    assert seen == [('candle_update', 4), ('candle_closed', 0)]
+    assert stage.stats()['merged'] == 4
+
+
+def test_close_keeps_its_place_between_updates():
+    sent = []
+    staged = StagedIngest(emit=lambda event, data, **kw: sent.append((event, data['timestamp'], kw.get('to'))))
+    room = 'candles:EURUSDOTC:60'
+    for event, ts in (('candle_update', T0), ('candle_closed', T0), ('candle_update', T0 + 60),
+                      ('candle_update', T0 + 60)):
+        staged.emit(event, {'asset': ASSET, 'timeframe': 60, 'timestamp': ts}, to=room)
+    # Another stream's close does not seal this one
+    staged.emit('candle_update', {'asset': 'GBPUSD_otc', 'timeframe': 60, 'timestamp': T0}, to='candles:GBPUSDOTC:60')
+    staged.emit('candle_closed', {'asset': 'GBPUSD_otc', 'timeframe': 60, 'timestamp': T0}, to='candles:GBPUSDOTC:60')
+    staged.emit('candle_update', {'asset': ASSET, 'timeframe': 60, 'timestamp': T0 + 60}, to=room)
+    staged.drain()
+
+    assert sent == [
+        ('candle_update', T0, room),
+        ('candle_closed', T0, room),
+        ('candle_update', T0 + 60, room),
+        ('candle_update', T0, 'candles:GBPUSDOTC:60'),
+        ('candle_closed', T0, 'candles:GBPUSDOTC:60'),
+    ]
+    assert staged.emit_stage.stats()['merged'] == 2
+
+
+def test_overflow_policies():
+    newest = PipelineStage('persist', lambda item: None, maxsize=2, policy=POLICY_DROP_NEWEST)
+    assert [newest.put(i) for i in range(4)] == [True, True, False, False]
+    assert newest.dropped == 2
+
+    seen = []
+    oldest = PipelineStage('emit', seen.append, maxsize=2, policy=POLICY_DROP_OLDEST)
+    oldest.put('close', droppable=False)
+    for i in range(3):
+        oldest.put(i)
+    oldest.drain()
+    # The non-droppable close survives; the oldest droppable items were evicted
+    assert seen == ['close', 2]
+    assert oldest.dropped == 2
+
+    with pytest.raises(ValueError):
+        PipelineStage('x', print, policy='spill')
+
+
+def test_block_policy_applies_backpressure():
+    release = threading.Event()
+    stage = PipelineStage('ingest', lambda item: release.wait(1), maxsize=1)
+    stage.start()
+    try:
+        stage.put(1)  # taken by the worker, which then waits
+        time.sleep(0.05)
+        stage.put(2)  # fills the queue
+        threading.Timer(0.1, release.set).start()
+        started = time.monotonic()
+        assert stage.put(3)
+        assert time.monotonic() - started >= 0.05
+        assert stage.stats()['blocked_ms'] > 0
+    finally:
+        release.set()
+        stage.stop()
+    assert stage.processed == 3 and stage.dropped == 0
+
+
+def test_slow_emit_does_not_hold_up_ingest():
+    class SlowSocket:
+        def __init__(self):
+            self.events = []
+
+        def emit(self, event, data, **kwargs):
+            time.sleep(0.02)
+            self.events.append((event, data))
+
+    socket = SlowSocket()
+    staged = StagedIngest(emit=socket.emit)
+    streamer = RealtimeDataStreaming()
+    streamer.set_asset_focus(ASSET)
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=staged.emit,
+                                   extract_candle=lambda a: {'asset': a, 'close': streamer.get_latest_candle(a)[2]})
+    staged.attach(pipeline.process_payload_data)
+    staged.start()
+    try:
+        for i in range(30):
+            staged.submit(_frame(i))
+        deadline = time.monotonic() + 2
+        while staged.ingest_stage.processed < 30 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # All frames became candles long before the slow client saw them
+        assert len(streamer.get_all_candles(ASSET)) == 10
+        assert staged.emit_stage.stats()['merged'] > 0
+    finally:
+        staged.stop()
+
+    stats = staged.stats()
+    assert set(stats['stages']) == {'ingest', 'emit'}
+    closes = [d['timestamp'] for e, d in socket.events if e == 'candle_closed']
+    assert closes == [T0 + i * 60 for i in range(9)]
+
+
+def test_persistence_writes_run_on_their_own_stage():
+    class Manager:
+        def __init__(self):
+            self.rows = []
+
+        def add_tick(self, asset, timestamp_str, price):
+            self.rows.append(('tick', price))
+
+        def add_candle(self, **kwargs):
+            self.rows.append(('candle', kwargs['candle_ts']))
+
+    manager = Manager()
+    staged = StagedIngest(emit=lambda *a, **k: None, persistence_manager=manager)
+    staged.persistence.add_tick(ASSET, "2023-11-14 22:14:00", 1.1)
+    staged.persistence.add_candle(asset=ASSET, timeframe_minutes=1, candle_ts=T0, open_price=1, close_price=1,
+                                  high_price=1, low_price=1)
+    assert manager.rows == []
+    staged.drain()
+    assert manager.rows == [('tick', 1.1), ('candle', T0)]
+    assert staged.stats()['stages']['persist']['processed'] == 2
@@ -0,0 +1,69 @@
+"""
+Tests for lazy optional-dependency loading and the --profile-startup import
+breakdown (backend/startup_profile.py). Import checks run in a fresh
+interpreter so modules already loaded by other tests do not hide eager imports.
+"""
+
+import builtins
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.startup_profile import ImportProfiler
+from strategies import technical_indicators as ti
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _fresh_python(code):
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_profiler_breakdown_and_restore():
+    original = builtins.__import__
+    assert ImportProfiler.from_argv(['streaming_server.py']).report() == ''
+    assert builtins.__import__ is original
+
+    profiler = ImportProfiler.from_argv(['streaming_server.py', '--profile-startup'])
+    assert builtins.__import__ is not original
+    sys.modules.pop('tests.benchmarks.bench_batch_indicators', None)
+    import tests.benchmarks.bench_batch_indicators  # noqa: F401
+    from . import test_candle_store  # noqa: F401  (relative imports resolve through the hook)
+    profiler.mark('imports')
+    report = profiler.report()
+    assert builtins.__import__ is original
+    assert profiler.self_seconds['tests'] > 0 and profiler.import_counts['tests'] >= 1
+    assert all(seconds >= 0 for seconds in profiler.self_seconds.values())
+    assert [phase for phase, _ in profiler.phases] == ['imports']
+    assert '[Startup]   tests' in report and 'Ready to bind' in report
+
+
+def test_optional_backends_resolve_on_first_use():
+    out = _fresh_python(
+        "import sys\n"
+        "from strategies import technical_indicators as ti\n"
+        "print('loaded', 'pandas_ta' in sys.modules or 'talib' in sys.modules)\n"
+        "print('flags', ti.TALIB_AVAILABLE == ti.talib.available, ti.PANDAS_TA_AVAILABLE == ti.ta.available)\n"
+    )
+    lines = out.splitlines()
+    # Nothing probed (and no TA-Lib warning) until an availability flag is read
+    assert lines[0] == 'loaded False'
+    assert lines[-1] == 'flags True True'
+
+    assert ti.TechnicalIndicatorsPipeline().get_indicator_summary()['libraries_available'] == {
+        'pandas_ta': ti.ta.available, 'talib': ti.talib.available}
+
+
+def test_capabilities_package_defers_selenium():
+    out = _fresh_python(
+        "import sys\n"
+        "import capabilities, capabilities.candle_store, capabilities.frame_decoder\n"
+        "print('selenium' in sys.modules, 'pandas' in sys.modules)\n"
+        "from capabilities import Ctx, frame_decoder\n"
+        "print(callable(capabilities.RealtimeDataStreaming) or capabilities.RealtimeDataStreaming is None)\n"
+    )
+    assert out.splitlines() == ['False False', 'True']
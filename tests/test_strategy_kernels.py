@@ -0,0 +1,124 @@
+"""
+Tests for the shared strategy indicator kernels (strategies/kernels.py)
+against pandas and the replaced helpers in tests/benchmarks/bench_strategy_kernels.py.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies import kernels
+from strategies.advanced import AdvancedStrategies
+from strategies.base import BaseStrategy
+from strategies.neural_beast_strategy import NeuralBeastQuantumFusion
+from strategies.quantum_flux_strategy import QuantumFluxStrategy
+from tests.benchmarks.bench_strategy_kernels import (
+    legacy_atr, legacy_bollinger, legacy_cutler_rsi, legacy_ema, legacy_macd, legacy_sma,
+    legacy_stochastic_k, legacy_wilder_rsi, run_benchmark, synthetic_ohlc,
+)
+
+# Around the 64-value scan block and its second level
+SIZES = [16, 50, 64, 65, 130, 500, 5000]
+
+
+def test_full_series_match_pandas():
+    high, low, close = (np.array(v) for v in synthetic_ohlc(500))
+    s = pd.Series(close)
+    np.testing.assert_allclose(kernels.sma(close, 20), s.rolling(20).mean(), rtol=1e-12)
+    np.testing.assert_allclose(kernels.ema(close, 12), s.ewm(span=12, adjust=False).mean(), rtol=1e-12)
+    upper, middle, lower = kernels.bollinger(close, 20, 2.0)
+    std = s.rolling(20).std(ddof=0)
+    np.testing.assert_allclose(upper, s.rolling(20).mean() + 2 * std, rtol=1e-12)
+    np.testing.assert_allclose(lower, s.rolling(20).mean() - 2 * std, rtol=1e-12)
+
+    line, signal, histogram = kernels.macd(close)
+    expected = s.ewm(span=12, adjust=False).mean() - s.ewm(span=26, adjust=False).mean()
+    np.testing.assert_allclose(line, expected, atol=1e-14)
+    np.testing.assert_allclose(signal, expected.ewm(span=9, adjust=False).mean(), atol=1e-14)
+    np.testing.assert_allclose(histogram, line - signal)
+
+    k, d = kernels.stochastic(high, low, close, 14, 3)
+    highest, lowest = pd.Series(high).rolling(14).max(), pd.Series(low).rolling(14).min()
+    np.testing.assert_allclose(k, 100 * (s - lowest) / (highest - lowest), rtol=1e-12)
+    np.testing.assert_allclose(d, pd.Series(k).rolling(3).mean(), rtol=1e-12)
+
+    prev_close = pd.Series(close).shift(1)
+    tr = np.maximum(high - low, np.maximum((high - prev_close).abs(), (low - prev_close).abs()))
+    np.testing.assert_allclose(kernels.true_range(high, low, close), tr)
+    np.testing.assert_allclose(kernels.atr(high, low, close, 14), tr.rolling(14).mean(), rtol=1e-12)
+
+
+def test_last_values_match_full_series():
+    for n in SIZES:
+        high, low, close = synthetic_ohlc(n)
+        assert kernels.sma_last(close, 14) == kernels.sma(close, 14)[-1]
+        assert kernels.ema_last(close, 14) == kernels.ema(close, 14)[-1]
+        assert kernels.rsi_last(close) == kernels.rsi(close)[-1]
+        np.testing.assert_allclose(kernels.cutler_rsi_last(close), kernels.cutler_rsi(close)[-1], rtol=1e-12)
+        assert kernels.macd_last(close) == tuple(series[-1] for series in kernels.macd(close))
+        np.testing.assert_allclose(kernels.bollinger_last(close, 14),
+                                   [band[-1] for band in kernels.bollinger(close, 14)], rtol=1e-12)
+        np.testing.assert_allclose(kernels.stochastic_last(high, low, close),
+                                   [line[-1] for line in kernels.stochastic(high, low, close)], rtol=1e-12)
+        np.testing.assert_allclose(kernels.atr_last(high, low, close), kernels.atr(high, low, close)[-1],
+                                   rtol=1e-12)
+
+        # A full series is every prefix's last value (to rounding: the scan blocks move with n)
+        np.testing.assert_allclose(kernels.ema(close, 21)[-2], kernels.ema_last(close[:-1], 21), rtol=1e-14)
+
+
+def test_kernels_match_the_replaced_helpers():
+    for n in SIZES:
+        high, low, close = synthetic_ohlc(n)
+        assert kernels.sma_last(close, 10) == legacy_sma(close, 10)
+        assert kernels.cutler_rsi_last(close, 14) == legacy_cutler_rsi(close, 14)
+        assert kernels.bollinger_last(close, 14) == legacy_bollinger(close, 14)
+        assert kernels.stochastic_last(high, low, close)[0] == legacy_stochastic_k(high, low, close)
+        assert kernels.atr_last(high, low, close) == legacy_atr(high, low, close)
+        for period in (2, 5, 21):
+            np.testing.assert_allclose(kernels.ema_last(close, period), legacy_ema(close, period), rtol=1e-13)
+        np.testing.assert_allclose(kernels.rsi_last(close), legacy_wilder_rsi(close), rtol=1e-11)
+        np.testing.assert_allclose(kernels.macd_last(close)[:2], legacy_macd(close), atol=1e-15)
+
+
+def test_edge_cases():
+    flat = [1.0] * 30
+    assert kernels.rsi_last(flat) == 100.0 and kernels.cutler_rsi_last(flat) == 100.0
+    assert kernels.stochastic_last(flat, flat, flat) == (50.0, 50.0)
+    assert kernels.bollinger_last(flat) == (1.0, 1.0, 1.0)
+    assert np.isnan(kernels.rsi_last(flat[:10])) and np.isnan(kernels.sma_last(flat[:3], 5))
+    assert np.isnan(kernels.stochastic_last(flat[:15], flat[:15], flat[:15])[1])
+    assert kernels.ema([], 5).size == 0 and np.isnan(kernels.ema_last([], 5))
+    rising = np.arange(1.0, 40.0)
+    assert kernels.rsi_last(rising) == 100.0
+    assert np.all(np.isnan(kernels.rsi(rising)[:14])) and np.all(kernels.rsi(rising)[14:] == 100.0)
+
+
+def test_strategies_share_the_kernels():
+    _, _, close = synthetic_ohlc(200)
+    assert AdvancedStrategies.calculate_ema(close, 13) == BaseStrategy.calculate_ema(close, 13) \
+        == kernels.ema_last(close, 13)
+    assert BaseStrategy.calculate_rsi(close[:10]) == 50.0
+    assert BaseStrategy.calculate_rsi(close, 7) == legacy_cutler_rsi(close, 7)
+
+    beast = NeuralBeastQuantumFusion()
+    np.testing.assert_allclose(beast.calculate_macd(close), legacy_macd(close), atol=1e-15)
+    np.testing.assert_allclose(beast.calculate_rsi(close), legacy_wilder_rsi(close), rtol=1e-11)
+
+    # The MACD signal line is an EMA of the MACD line, no longer macd * 0.9
+    flux = QuantumFluxStrategy()
+    line, signal, histogram = flux._calculate_macd(np.array(close), 12, 26, 9)
+    assert (line, signal, histogram) == kernels.macd_last(close)
+    assert signal != line * 0.9
+    candles = [{'close': c} for c in close]
+    assert flux.generate_signal(candles).indicators['ema_12'] == kernels.ema_last(close, 12)
+
+
+def test_benchmark_reports_every_signal():
+    results = run_benchmark([50], repeat=1, number=1)
+    assert set(results[50]) == {'sma', 'ema', 'rsi_cutler', 'rsi_wilder', 'macd', 'bollinger', 'stochastic', 'atr'}
+    assert all(row['kernel_us'] > 0 for row in results[50].values())
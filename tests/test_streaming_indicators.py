@@ -0,0 +1,122 @@
+"""
+Tests for incremental indicators (strategies/streaming_indicators.py) against batch results.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from strategies.indicator_planner import IndicatorPlanner
+from strategies.streaming_indicators import SUPPORTED_TYPES, create_stream
+
+# Types with a manual kernel in the planner: compared with IndicatorPlanner directly
+PLANNER_INSTANCES = {
+    'SMA-20': ('sma', {'period': 20}),
+    'EMA-12': ('ema', {'period': 12}),
+    'WMA-10': ('wma', {'period': 10}),
+    'STC': ('schaff_tc', {'fast': 10, 'slow': 20}),
+    'DEM': ('demarker', {'period': 14}),
+    'CCI': ('cci', {'period': 20}),
+    'ATR': ('atr', {'period': 14}),
+    'ST': ('supertrend', {'period': 10, 'multiplier': 3.0}),
+}
+
+
+def _frame(n=400, seed=5):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 1e-3, n))
+    open_ = close + rng.normal(0, 5e-4, n)
+    high = np.maximum(open_, close) + rng.uniform(0, 1e-3, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 1e-3, n)
+    df = pd.DataFrame({'timestamp': 1700000040 + np.arange(n) * 60, 'open': open_, 'close': close,
+                       'high': high, 'low': low})
+    # Flat stretch: zero ranges and constant windows
+    df.loc[200:230, ['open', 'close', 'high', 'low']] = 1.1
+    return df
+
+
+def _run(indicator_type, params, df):
+    """Commit every candle, checking the provisional update agrees with the commit"""
+    stream = create_stream(indicator_type, params)
+    out = {field: [] for field in stream.fields}
+    for high, low, close in zip(df['high'], df['low'], df['close']):
+        # A tick that later gets overwritten must leave no trace
+        stream.update(high * 1.01, low * 0.99, close * 1.005)
+        provisional = stream.update(high, low, close)
+        final = stream.commit(high, low, close)
+        np.testing.assert_array_equal(np.array(provisional, dtype=float), np.array(final, dtype=float))
+        for field, value in zip(stream.fields, final):
+            out[field].append(value)
+    return {field: np.array(values, dtype=float) for field, values in out.items()}
+
+
+def _assert_close(actual, expected, rtol=1e-9):
+    expected = np.asarray(expected, dtype=float)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual[~np.isnan(actual)], expected[~np.isnan(expected)], rtol=rtol, atol=1e-12)
+
+
+@pytest.mark.parametrize('name', sorted(PLANNER_INSTANCES))
+def test_matches_the_planner(name):
+    df = _frame()
+    indicator_type, params = PLANNER_INSTANCES[name]
+    expected = IndicatorPlanner(df).compute(indicator_type, params)
+    _assert_close(_run(indicator_type, params, df)['value'], next(iter(expected.values())))
+
+
+def _seeded_ema(series, length):
+    """pandas-ta ema: SMA seed, then ewm(span, adjust=False)"""
+    series = series.loc[series.first_valid_index():].copy()
+    seed = series.iloc[:length].mean()
+    series.iloc[:length - 1] = np.nan
+    series.iloc[length - 1] = seed
+    return series.ewm(span=length, adjust=False).mean()
+
+
+def test_library_indicators_follow_pandas_ta_definitions():
+    df = _frame()
+    close, high, low = df['close'], df['high'], df['low']
+
+    change = close.diff()
+    gains = change.clip(lower=0).ewm(alpha=1 / 14, min_periods=14).mean()
+    losses = change.clip(upper=0).ewm(alpha=1 / 14, min_periods=14).mean().abs()
+    _assert_close(_run('rsi', {'period': 14}, df)['value'], 100 * gains / (gains + losses))
+
+    macd = (_seeded_ema(close, 12) - _seeded_ema(close, 26)).reindex(df.index)
+    signal = _seeded_ema(macd, 9).reindex(df.index)
+    out = _run('macd', {'fast': 12, 'slow': 26, 'signal': 9}, df)
+    _assert_close(out['macd'], macd)
+    _assert_close(out['signal'], signal)
+    _assert_close(out['histogram'], macd - signal)
+
+    middle = close.rolling(20).mean()
+    deviation = close.rolling(20).std(ddof=0)
+    out = _run('bollinger', {'period': 20, 'std_dev': 2}, df)
+    _assert_close(out['middle'], middle)
+    _assert_close(out['upper'], middle + 2 * deviation, rtol=1e-7)
+
+    lowest, highest = low.rolling(14).min(), high.rolling(14).max()
+    flat = (highest - lowest == 0).to_numpy()
+    k = (100 * (close - lowest) / (highest - lowest).replace(0, np.finfo(float).eps)).rolling(3).mean()
+    out = _run('stochastic', {'k': 14, 'd': 3}, df)
+    _assert_close(out['k'], k)
+    _assert_close(out['d'], k.rolling(3).mean())
+
+    williams = 100 * ((close - lowest) / (highest - lowest) - 1)
+    williams[flat] = np.nan
+    _assert_close(_run('williams_r', {'period': 14}, df)['value'], williams)
+    _assert_close(_run('roc', {'period': 10}, df)['value'], 100 * close.diff(10) / close.shift(10))
+
+
+def test_factory():
+    assert set(SUPPORTED_TYPES) == {t for t, _ in PLANNER_INSTANCES.values()} | {
+        'rsi', 'macd', 'bollinger', 'stochastic', 'williams_r', 'roc'}
+    assert create_stream('unknown') is None
+    # Frontend params map onto pipeline params (defaults fill the rest)
+    assert create_stream('sma', {'period': 5}).window.n == 5
+    assert create_stream('sma').window.n == 20
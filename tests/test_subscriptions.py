@@ -0,0 +1,121 @@
+"""
+Tests for per-client (asset, timeframe) subscriptions and room-targeted emission.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.emit_coalescer import CandleEmitCoalescer
+from backend.frame_ingest import FrameIngestPipeline
+from backend.subscriptions import SubscriptionManager, room_name
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+T0 = 1700006400
+
+
+def test_rooms_follow_subscribers():
+    subs = SubscriptionManager()
+    assert subs.subscribe("a", "EURUSD_OTC", 60) == "candles:EURUSDOTC:60"
+    subs.subscribe("a", "EURUSD_OTC", 300)
+    subs.subscribe("b", "eurusd_otc", 60)
+    subs.subscribe("b", "GBPUSD_otc", 60)
+
+    assert subs.rooms_for("EURUSD_otc") == [(60, room_name("EURUSD_otc", 60)), (300, room_name("EURUSD_otc", 300))]
+    assert subs.members("candles:EURUSDOTC:60") == {"a", "b"}
+    assert subs.assets() == ["EURUSD_OTC", "GBPUSD_otc"]
+
+    assert subs.unsubscribe("a", "EURUSD_OTC", 300) == ["candles:EURUSDOTC:300"]
+    assert subs.rooms_for("EURUSDOTC") == [(60, "candles:EURUSDOTC:60")]
+    assert subs.remove_client("b") == ["candles:EURUSDOTC:60", "candles:GBPUSDOTC:60"]
+    assert subs.assets() == ["EURUSD_OTC"]
+    subs.remove_client("a")
+    assert not subs.has_subscribers() and subs.snapshot() == {}
+
+
+def test_focus_on_several_assets():
+    streamer = RealtimeDataStreaming()
+    streamer.set_focus_assets(["EURUSD_OTC", "GBPUSD_OTC"])
+    for i, asset in enumerate(["EURUSD_otc", "GBPUSD_otc", "USDJPY_otc"]):
+        streamer._process_realtime_update([[asset, T0 + i, 1.0 + i]], CTX)
+
+    assert sorted(streamer.candle_store.assets()) == ["EURUSD_otc", "GBPUSD_otc"]
+    assert streamer.get_current_asset() == "EURUSD_OTC"
+    streamer.set_focus_assets([])
+    assert streamer.ASSET_FOCUS_MODE is False
+
+
+def test_updates_and_closes_go_to_matching_rooms_only():
+    streamer = RealtimeDataStreaming()
+    streamer.set_timeframes("1m,5m")
+    subs = SubscriptionManager()
+    subs.subscribe("a", "EURUSD_OTC", 60)
+    subs.subscribe("b", "EURUSD_OTC", 300)
+    subs.subscribe("b", "GBPUSD_OTC", 60)
+    streamer.set_focus_assets(subs.assets())
+
+    events = []
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda e, d, **kw: events.append((e, d, kw.get('to'))),
+                                   extract_candle=lambda a: None, subscriptions=subs)
+    pipeline.process_payload([["EURUSD_otc", T0, 1.0], ["GBPUSD_otc", T0, 2.0]])
+    pipeline.process_payload([["EURUSD_otc", T0 + 60, 1.1]])
+    pipeline.process_payload([["USDJPY_otc", T0 + 60, 150.0]])
+
+    updates = [(d['asset'], d['timeframe'], room) for e, d, room in events if e == 'candle_update']
+    assert updates == [
+        ("EURUSD_otc", 60, "candles:EURUSDOTC:60"),
+        ("EURUSD_otc", 300, "candles:EURUSDOTC:300"),
+        ("GBPUSD_otc", 60, "candles:GBPUSDOTC:60"),
+        ("EURUSD_otc", 60, "candles:EURUSDOTC:60"),
+        ("EURUSD_otc", 300, "candles:EURUSDOTC:300"),
+    ]
+    closes = [(d['timeframe'], d['timestamp'], room) for e, d, room in events if e == 'candle_closed']
+    assert closes == [(60, T0, "candles:EURUSDOTC:60")]
+
+
+def test_multi_asset_frame_persists_each_tick():
+    class Persistence:
+        def __init__(self):
+            self.ticks = []
+
+        def add_tick(self, asset, timestamp_str, price):
+            self.ticks.append((asset, timestamp_str, price))
+
+    streamer = RealtimeDataStreaming()
+    subs = SubscriptionManager()
+    subs.subscribe("a", "EURUSD_OTC", 60)
+    subs.subscribe("a", "GBPUSD_OTC", 60)
+    streamer.set_focus_assets(subs.assets())
+    persistence = Persistence()
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda e, d, **kw: None, extract_candle=lambda a: None,
+                                   persistence_manager=persistence, collect_stream_mode="tick", subscriptions=subs)
+    pipeline.process_payload([["EURUSD_otc", T0, 1.1], ["EURUSD_otc", T0 + 1, 1.2],
+                              ["GBPUSD_otc", T0 + 2, 1.3], ["USDJPY_otc", T0 + 3, 150.0]])
+
+    assert persistence.ticks == [
+        ("EURUSD_otc", "2023-11-15 00:00:00", 1.1),
+        ("EURUSD_otc", "2023-11-15 00:00:01", 1.2),
+        ("GBPUSD_otc", "2023-11-15 00:00:02", 1.3),
+    ]
+
+
+def test_coalescer_throttles_per_room():
+    subs = SubscriptionManager()
+    subs.subscribe("a", "EURUSD_OTC", 60)
+    subs.subscribe("fast", "GBPUSD_OTC", 60)
+    sent = []
+    emitter = CandleEmitCoalescer(lambda e, d, **kw: sent.append((d['asset'], kw)), interval=1.0,
+                                  clock=lambda: 0.0, members=subs.members)
+    emitter.set_client_interval("fast", 0.05)
+
+    emitter('candle_update', {'asset': 'EURUSD_otc', 'timeframe': 60, 'timestamp': T0}, to="candles:EURUSDOTC:60")
+    emitter('candle_update', {'asset': 'GBPUSD_otc', 'timeframe': 60, 'timestamp': T0}, to="candles:GBPUSDOTC:60")
+
+    assert sent == [
+        ('EURUSD_otc', {'to': "candles:EURUSDOTC:60", 'skip_sid': ['fast']}),
+        ('GBPUSD_otc', {'to': "candles:GBPUSDOTC:60", 'skip_sid': ['fast']}),
+        ('GBPUSD_otc', {'to': 'fast'}),
+    ]
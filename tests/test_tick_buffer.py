@@ -0,0 +1,81 @@
+"""
+Tests for the bounded tick ring buffer (capabilities/tick_buffer.py).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+from capabilities.tick_buffer import TickBuffer
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+T0 = 1700000000
+
+
+def test_wraparound_keeps_newest_ticks_in_order():
+    buf = TickBuffer(capacity=5)
+    nbytes = buf.nbytes
+    for i in range(12):
+        buf.append("EURUSD_otc", T0 + i, 1.0 + i)
+
+    assert len(buf) == 5
+    assert buf.total == 12
+    assert buf.nbytes == nbytes
+    assert buf.last()["ts"].tolist() == [T0 + i for i in range(7, 12)]
+    assert buf.last(2)["price"].tolist() == [11.0, 12.0]
+    assert len(buf.last(0)) == 0
+
+
+def test_last_n_for_one_asset():
+    buf = TickBuffer(capacity=8)
+    for i in range(10):
+        buf.append("EURUSD_otc" if i % 2 else "GBPUSD_otc", T0 + i, float(i))
+
+    assert buf.prices("EURUSD_otc").tolist() == [3.0, 5.0, 7.0, 9.0]
+    assert buf.prices("GBPUSD_otc", 2).tolist() == [6.0, 8.0]
+    assert len(buf.last(5, "AUDUSD_otc")) == 0
+    assert buf.latest("EURUSD_otc") == {"asset": "EURUSD_otc", "timestamp": T0 + 9, "price": 9.0}
+
+
+def test_raw_payloads_only_kept_when_enabled():
+    buf = TickBuffer(capacity=3)
+    buf.append("EURUSD_otc", T0, 1.1, raw=[["EURUSD_otc", T0, 1.1]])
+    assert buf.to_records() == [{
+        "timestamp": "2023-11-14T22:13:20Z",
+        "asset": "EURUSD_otc",
+        "price": 1.1,
+        "raw_timestamp": T0,
+    }]
+
+    buf = TickBuffer(capacity=3, keep_raw=True)
+    for i in range(4):
+        buf.append("EURUSD_otc", T0 + i, 1.1, raw=i)
+    assert [r["raw_payload"] for r in buf.to_records()] == [1, 2, 3]
+
+
+def test_clear_and_invalid_capacity():
+    buf = TickBuffer(capacity=3)
+    buf.append("EURUSD_otc", T0, 1.1)
+    buf.clear()
+    assert len(buf) == 0 and buf.assets() == []
+    with pytest.raises(ValueError):
+        TickBuffer(capacity=0)
+
+
+def test_streamer_records_ticks_in_buffer():
+    streamer = RealtimeDataStreaming()
+    for i in range(3):
+        streamer._process_realtime_update([["EURUSD_otc", T0 + i, 1.1 + i]], CTX)
+
+    assert len(streamer.tick_buffer) == 3
+    assert [r["price"] for r in streamer.realtime_asset_data] == [1.1, 2.1, 3.1]
+    assert [r["raw_timestamp"] for r in streamer.get_recent_ticks("EURUSDOTC", 2)] == [T0 + 1, T0 + 2]
+    assert streamer.get_recent_ticks("GBPUSD_otc") == []
+
+    streamer._reset_run_state({})
+    assert streamer.realtime_asset_data == []
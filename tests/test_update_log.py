@@ -0,0 +1,96 @@
+"""
+Tests for the sequence-numbered update log used by resume_stream (backend/update_log.py).
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.frame_ingest import FrameIngestPipeline
+from backend.subscriptions import SubscriptionManager
+from backend.update_log import UpdateLog
+from capabilities.base import Ctx
+from capabilities.data_streaming import RealtimeDataStreaming
+
+CTX = Ctx(driver=None, artifacts_root=None, debug=False, dry_run=False, verbose=False)
+ROOM = "candles:EURUSDOTC:60"
+T0 = 1700006400
+
+
+def _candle(ts, close):
+    return {'asset': 'EURUSD_otc', 'timestamp': ts, 'close': close}
+
+
+def test_deltas_keep_latest_state_per_candle():
+    log = UpdateLog(capacity=10)
+    assert log.record(ROOM, 'candle_update', _candle(T0, 1.0)) == 1
+    log.record(ROOM, 'candle_update', _candle(T0, 1.1))
+    log.record(ROOM, 'candle_closed', _candle(T0, 1.2))
+    log.record(ROOM, 'candle_update', _candle(T0 + 60, 1.3))
+
+    deltas = log.since(ROOM, 1, log.epoch)
+    assert [(d['seq'], d['event'], d['candle']['close']) for d in deltas] == [
+        (3, 'candle_closed', 1.2),
+        (4, 'candle_update', 1.3),
+    ]
+    assert deltas[0]['candle']['seq'] == 3
+    assert log.since(ROOM, 4) == []
+    assert log.head(ROOM) == 4
+
+
+def test_snapshot_needed_when_gap_exceeds_buffer_or_epoch_changes():
+    log = UpdateLog(capacity=3)
+    for i in range(5):
+        log.record(ROOM, 'candle_closed', _candle(T0 + i * 60, 1.0))
+
+    assert log.since(ROOM, 1) is None  # candles 2 and 3 were evicted
+    assert [d['seq'] for d in log.since(ROOM, 2)] == [3, 4, 5]
+    assert log.since(ROOM, 9) is None  # ahead of the log: from another epoch
+    assert log.since(ROOM, 2, epoch='stale') is None
+    assert log.since("candles:GBPUSDOTC:60", 0) == []
+
+    epoch = log.epoch
+    log.reset()
+    assert log.epoch != epoch and log.head(ROOM) == 0
+
+
+def test_held_stream_keeps_logging_while_client_is_away():
+    streamer = RealtimeDataStreaming()
+    subs = SubscriptionManager()
+    log = UpdateLog()
+    subs.subscribe("a", "EURUSD_OTC", 60)
+    streamer.set_focus_assets(subs.assets())
+    sent = []
+    pipeline = FrameIngestPipeline(streamer, CTX, emit=lambda e, d, **kw: sent.append(d['seq']),
+                                   extract_candle=lambda a: None, subscriptions=subs, update_log=log)
+
+    pipeline.process_payload([["EURUSD_otc", T0, 1.0]])
+    last_seen = sent[-1]
+
+    # Flaky connection: the stream is held, ingest continues into the log
+    subs.remove_client("a", hold_seconds=30)
+    assert subs.assets() == ["EURUSD_OTC"] and not subs.has_subscribers()
+    pipeline.process_payload([["EURUSD_otc", T0 + 30, 1.1]])
+    pipeline.process_payload([["EURUSD_otc", T0 + 60, 1.2]])
+
+    subs.subscribe("a2", "EURUSD_OTC", 60)
+    deltas = log.since(ROOM, last_seen, log.epoch)
+    assert [(d['event'], d['candle']['timestamp'], d['candle']['close']) for d in deltas] == [
+        ('candle_closed', T0, 1.1),
+        ('candle_update', T0 + 60, 1.2),
+    ]
+    assert subs.held() == []
+
+
+def test_held_streams_expire():
+    subs = SubscriptionManager()
+    subs.subscribe("a", "EURUSD_OTC", 60)
+    subs.subscribe("b", "GBPUSD_OTC", 60)
+    subs.remove_client("a", hold_seconds=5)
+    subs.remove_client("b")
+
+    assert subs.assets() == ["EURUSD_OTC"]
+    assert subs.expire_held() == []
+    assert subs.expire_held(now=float('inf')) == [ROOM]
+    assert subs.assets() == [] and subs.rooms_for("EURUSD_OTC") == []
@@ -4,6 +4,7 @@ This package contains utility modules for testing:
 - selenium_helpers: Selenium WebDriver utilities and controls
 - trade_helpers: Trading interface interaction utilities
 - performance_helpers: Performance monitoring and benchmarking utilities
+- fake_cdp_server: In-process Chrome DevTools endpoint for CDP ingest tests
 
 Migrated from API-test-space for production use.
 """
@@ -11,5 +12,6 @@ Migrated from API-test-space for production use.
 __all__ = [
     'selenium_helpers',
     'trade_helpers',
-    'performance_helpers'
+    'performance_helpers',
+    'fake_cdp_server'
 ]
\ No newline at end of file
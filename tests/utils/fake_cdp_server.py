@@ -0,0 +1,225 @@
+"""Fake Chrome DevTools endpoint for QuantumFlux Testing.
+
+Serves just enough of Chrome's remote debugging interface to exercise
+CDP-based ingest without a browser:
+- GET /json returns a single PocketOption page target
+- The target's webSocketDebuggerUrl accepts a WebSocket upgrade
+- Commands are answered with an empty result
+- push_frame() / push_event() send Network.* events to every connected client
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import socket
+import socketserver
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def _encode_text_frame(text: str) -> bytes:
+    """Encode an unmasked server-to-client text frame"""
+    data = text.encode("utf-8")
+    header = bytearray([0x81])
+    length = len(data)
+    if length < 126:
+        header.append(length)
+    elif length < 65536:
+        header.append(126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(127)
+        header += struct.pack("!Q", length)
+    return bytes(header) + data
+
+
+def _recv_exact(sock: socket.socket, n: int) -> bytes:
+    buf = b""
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            raise ConnectionError("client closed")
+        buf += chunk
+    return buf
+
+
+def _read_client_frame(sock: socket.socket) -> Optional[str]:
+    """Read one masked client frame; returns None on close frames"""
+    b1, b2 = _recv_exact(sock, 2)
+    opcode = b1 & 0x0F
+    length = b2 & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", _recv_exact(sock, 2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", _recv_exact(sock, 8))[0]
+    mask = _recv_exact(sock, 4) if b2 & 0x80 else b"\x00\x00\x00\x00"
+    payload = bytes(b ^ mask[i % 4] for i, b in enumerate(_recv_exact(sock, length)))
+    if opcode == 0x8:
+        return None
+    return payload.decode("utf-8", errors="replace")
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    server: "_Server"
+
+    def handle(self):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            chunk = self.request.recv(4096)
+            if not chunk:
+                return
+            request += chunk
+
+        head = request.split(b"\r\n\r\n", 1)[0].decode("latin-1")
+        lines = head.split("\r\n")
+        path = lines[0].split(" ")[1]
+        headers = {k.strip().lower(): v.strip() for k, v in (l.split(":", 1) for l in lines[1:] if ":" in l)}
+
+        if headers.get("upgrade", "").lower() == "websocket":
+            self._handle_websocket(headers)
+        elif path.startswith("/json"):
+            body = json.dumps(self.server.owner.targets()).encode("utf-8")
+            self.request.sendall(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+                + body
+            )
+        else:
+            self.request.sendall(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+
+    def _handle_websocket(self, headers: Dict[str, str]):
+        accept = base64.b64encode(
+            hashlib.sha1((headers["sec-websocket-key"] + _WS_GUID).encode("latin-1")).digest()
+        ).decode("latin-1")
+        self.request.sendall(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode("latin-1")
+        )
+
+        owner = self.server.owner
+        owner._register(self.request)
+        try:
+            while True:
+                text = _read_client_frame(self.request)
+                if text is None:
+                    break
+                command = json.loads(text)
+                owner.commands.append(command)
+                owner._send(self.request, {"id": command.get("id"), "result": {}})
+        except (ConnectionError, OSError, ValueError):
+            pass
+        finally:
+            owner._unregister(self.request)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    owner: "FakeCDPServer"
+
+
+class FakeCDPServer:
+    """In-process stand-in for Chrome's DevTools endpoint on an ephemeral port"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, page_url: str = "https://pocketoption.com/en/cabinet/demo-quick-high-low/"):
+        self._server = _Server((host, port), _Handler)
+        self._server.owner = self
+        self.host, self.port = self._server.server_address[:2]
+        self.page_url = page_url
+        self.commands: List[Dict[str, Any]] = []
+        self._clients: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "FakeCDPServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self) -> "FakeCDPServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.disconnect_clients()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def targets(self) -> List[Dict[str, Any]]:
+        ws_base = f"ws://{self.host}:{self.port}/devtools"
+        return [
+            {"id": "BG", "type": "background_page", "url": "chrome-extension://fake/bg.html",
+             "webSocketDebuggerUrl": f"{ws_base}/page/BG"},
+            {"id": "PAGE", "type": "page", "url": self.page_url,
+             "webSocketDebuggerUrl": f"{ws_base}/page/PAGE"},
+        ]
+
+    @property
+    def client_count(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def wait_for_subscription(self, timeout: float = 5.0) -> bool:
+        """Block until a client has sent Network.enable"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if any(c.get("method") == "Network.enable" for c in self.commands):
+                return True
+            time.sleep(0.01)
+        return False
+
+    def push_event(self, method: str, params: Dict[str, Any]):
+        self._broadcast({"method": method, "params": params})
+
+    def push_frame(self, payload: Any, opcode: int = 2):
+        """Push a webSocketFrameReceived event; payload is JSON-encoded (and base64'd for opcode 2)"""
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        payload_data = base64.b64encode(text.encode("utf-8")).decode("ascii") if opcode == 2 else text
+        self.push_event("Network.webSocketFrameReceived", {
+            "requestId": "1000.1",
+            "timestamp": time.time(),
+            "response": {"opcode": opcode, "mask": False, "payloadData": payload_data},
+        })
+
+    def disconnect_clients(self):
+        with self._lock:
+            clients, self._clients = self._clients, []
+        for sock in clients:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+                sock.close()
+            except OSError:
+                pass
+
+    def _broadcast(self, message: Dict[str, Any]):
+        with self._lock:
+            clients = list(self._clients)
+        for sock in clients:
+            self._send(sock, message)
+
+    def _send(self, sock: socket.socket, message: Dict[str, Any]):
+        try:
+            with self._send_lock:
+                sock.sendall(_encode_text_frame(json.dumps(message)))
+        except OSError:
+            self._unregister(sock)
+
+    def _register(self, sock: socket.socket):
+        with self._lock:
+            self._clients.append(sock)
+
+    def _unregister(self, sock: socket.socket):
+        with self._lock:
+            if sock in self._clients:
+                self._clients.remove(sock)